@@ -1,27 +1,31 @@
-import re
-
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
-
-# Ajouter l'import useState
-if 'useState' not in content:
-    content = content.replace(
-        "import { Container, Row, Col, Card, ListGroup, Badge, Button } from 'react-bootstrap';",
-        "import { useState } from 'react';\nimport { Container, Row, Col, Card, ListGroup, Badge, Button } from 'react-bootstrap';"
-    )
-
-# Ajouter le state showBalance après la déclaration du composant
-pattern = r"(const Profile = \(\) => \{\s*const \{ user, logout \} = useAuth\(\);)"
-replacement = r"\1\n    const [showBalance, setShowBalance] = useState(false);"
-
-content = re.sub(pattern, replacement, content)
-
-# Ajouter l'affichage du solde après l'ID dans la carte de profil
-# Chercher la section avec l'ID
-id_pattern = r'(<div className="d-flex align-items-center justify-content-center">\s*<span className="me-2" style=\{\{ fontSize: \'1\.2rem\' \}\}>🆔</span>\s*<small className="mb-0"[^>]*>\s*\{user\.id \|\| \'N/A\'\}\s*</small>\s*</div>)'
-
-balance_html = r'''\1
+from codemod import PROFILE, run, transform
+from patterns import register
+
+# Les deux motifs ignorent un state ou un solde déjà ajouté : relancer le script ne les duplique pas
+COMPONENT_START = register("add_balance_display.component_start", r"(const Profile = \(\) => \{\s*const \{ user, logout \} = useAuth\(\);)"
+                           r"(?!\s*const \[showBalance, setShowBalance\])")
+ID_BLOCK = register("add_balance_display.id_block", r'(<div className="d-flex align-items-center justify-content-center">\s*<span className="me-2" style=\{\{ fontSize: \'1\.2rem\' \}\}>🆔</span>\s*<small className="mb-0"[^>]*>\s*\{user\.id \|\| \'N/A\'\}\s*</small>\s*</div>)'
+                    r'(?!\s*<div className="d-flex align-items-center justify-content-center mt-2">\s*'
+                    r'<span className="me-2" style=\{\{ fontSize: \'1\.2rem\' \}\}>💰)')
+
+
+@transform(PROFILE, "Balance display with toggle added to Profile.jsx!", version=2)
+def add_balance_display(content):
+    # Ajouter l'import useState
+    if 'useState' not in content:
+        content = content.replace(
+            "import { Container, Row, Col, Card, ListGroup, Badge, Button } from 'react-bootstrap';",
+            "import { useState } from 'react';\nimport { Container, Row, Col, Card, ListGroup, Badge, Button } from 'react-bootstrap';"
+        )
+
+    # Ajouter le state showBalance après la déclaration du composant
+    replacement = r"\1\n    const [showBalance, setShowBalance] = useState(false);"
+
+    content = COMPONENT_START.sub(replacement, content)
+
+    # Ajouter l'affichage du solde après l'ID dans la carte de profil
+    # Chercher la section avec l'ID
+    balance_html = r'''\1
                             <div className="d-flex align-items-center justify-content-center mt-2">
                                 <span className="me-2" style={{ fontSize: '1.2rem' }}>💰</span>
                                 <small className="mb-0" style={{ fontFamily: 'monospace', color: '#6c757d' }}>
@@ -34,10 +38,9 @@ balance_html = r'''\1
                                 ></i>
                             </div>'''
 
-content = re.sub(id_pattern, balance_html, content)
+    content = ID_BLOCK.sub(balance_html, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Balance display with toggle added to Profile.jsx!")
+if __name__ == "__main__":
+    run(["add_balance_display"])
@@ -1,17 +1,17 @@
-import re
+from codemod import AUTH_CONTEXT, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\context\AuthContext.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+NEW_USER = register("add_balance_register.new_user", r"(const newUser = \{[^}]*id: generateUserId\(\),[^}]*name,[^}]*email,[^}]*role: 'client')\s*\};")
 
-# Ajouter balance à la fonction register
-pattern = r"(const newUser = \{[^}]*id: generateUserId\(\),[^}]*name,[^}]*email,[^}]*role: 'client')\s*\};"
-replacement = r"\1,\n            balance: 0\n        };"
 
-content = re.sub(pattern, replacement, content)
+@transform(AUTH_CONTEXT, "Balance added to register function!")
+def add_balance_register(content):
+    # Ajouter balance à la fonction register
+    replacement = r"\1,\n            balance: 0\n        };"
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\context\AuthContext.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+    content = NEW_USER.sub(replacement, content)
+    return content
 
-print("Balance added to register function!")
+
+if __name__ == "__main__":
+    run(["add_balance_register"])
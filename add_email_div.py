@@ -1,17 +1,51 @@
-import re
+from codemod import PROFILE, run, transform
+from jsx_index import JSXIndex
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    lines = f.readlines()
+OPEN = '<div className="mb-2">'
 
-# Trouver et corriger la ligne 318 (index 317)
-for i in range(len(lines)):
-    if i == 317:  # Ligne 318
-        # Ajouter le div d'ouverture manquant
-        lines[i] = '                                    <div className="mb-2">\r\n' + lines[i]
 
-# Écrire le fichier corrigé
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.writelines(lines)
+def _problems(content):
+    return len(JSXIndex(content).problems())
 
-print("Missing div tag added for Email field!")
+
+@transform(PROFILE, "Missing div tag added for Email field!", version=3)
+def add_email_div(content):
+    # Pas de libellé Email : inutile de construire l'index
+    if "Email</small>" not in content:
+        return content
+    index = JSXIndex(content)
+    before = len(index.problems())
+
+    # Trouver le libellé Email qui n'est plus dans son <div className="mb-2">
+    for label in reversed(index.find_text("small.text-muted", "Email")):
+        parent = label.parent
+        if parent is not None and parent.tag == "div" and "mb-2" in parent.classes:
+            continue
+        line = index.line_start(label.start)
+        indent = content[line:label.start]
+        opening = content[:line] + indent[4:] + OPEN + "\n" + content[line:]
+        # Le </div> orphelin laissé par l'ancien bloc ferme le div ajouté : l'ouvrante seule suffit
+        if _problems(opening) < before:
+            content = opening
+            before = _problems(content)
+            continue
+        # Sinon, entourer le libellé et sa valeur (l'élément qui le suit) d'un div complet
+        block = label
+        siblings = parent.children if parent is not None else index.elements
+        following = [e for e in siblings if e.start >= label.end and e.end is not None]
+        if following and not content[label.end:following[0].start].strip():
+            block = following[0]
+        if block.end is None:
+            continue
+        end = content.find("\n", block.end)
+        end = len(content) if end == -1 else end + 1
+        wrapped = (content[:line] + indent[4:] + OPEN + "\n" + content[line:end]
+                   + indent[4:] + "</div>\n" + content[end:])
+        if _problems(wrapped) <= before:
+            content = wrapped
+
+    return content
+
+
+if __name__ == "__main__":
+    run(["add_email_div"])
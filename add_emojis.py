@@ -1,33 +1,33 @@
-import re
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+AVATAR_ICON = register("add_emojis.avatar_icon", r'<i className="bi bi-person-circle" style={{ fontSize: \'4rem\', color: \'#ff6000\' }}></i>')
+PERSON_ICON = register("add_emojis.person_icon", r'<i className="bi bi-person-fill me-2" style={{ color: \'#ff6000\' }}></i>')
+FINGERPRINT_ICON = register("add_emojis.fingerprint_icon", r'<i className="bi bi-fingerprint me-2" style={{ color: \'#ff6000\' }}></i>')
 
-# Remplacer les icônes par des emojis dans la carte de profil
-# Remplacer l'icône avatar par un emoji
-content = re.sub(
-    r'<i className="bi bi-person-circle" style={{ fontSize: \'4rem\', color: \'#ff6000\' }}></i>',
-    '<div style={{ fontSize: \'4rem\' }}>👤</div>',
-    content
-)
 
-# Remplacer l'icône personne par un emoji
-content = re.sub(
-    r'<i className="bi bi-person-fill me-2" style={{ color: \'#ff6000\' }}></i>',
-    '<span className="me-2" style={{ fontSize: \'1.2rem\' }}>👤</span>',
-    content
-)
+@transform(PROFILE, "Icons replaced with emojis!")
+def add_emojis(content):
+    # Remplacer les icônes par des emojis dans la carte de profil
+    # Remplacer l'icône avatar par un emoji
+    content = AVATAR_ICON.sub(
+        '<div style={{ fontSize: \'4rem\' }}>👤</div>',
+        content
+    )
 
-# Remplacer l'icône empreinte digitale par un emoji
-content = re.sub(
-    r'<i className="bi bi-fingerprint me-2" style={{ color: \'#ff6000\' }}></i>',
-    '<span className="me-2" style={{ fontSize: \'1.2rem\' }}>🆔</span>',
-    content
-)
+    # Remplacer l'icône personne par un emoji
+    content = PERSON_ICON.sub(
+        '<span className="me-2" style={{ fontSize: \'1.2rem\' }}>👤</span>',
+        content
+    )
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+    # Remplacer l'icône empreinte digitale par un emoji
+    content = FINGERPRINT_ICON.sub(
+        '<span className="me-2" style={{ fontSize: \'1.2rem\' }}>🆔</span>',
+        content
+    )
+    return content
 
-print("Icons replaced with emojis!")
+
+if __name__ == "__main__":
+    run(["add_emojis"])
@@ -1,18 +1,21 @@
-import re
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+# Sans effet si la ligne ID suit déjà (guillemets échappés ou non, avant ou après fix_quotes) :
+# relancer le script ne la duplique pas
+NAME_EMAIL = register("add_id_to_header.name_email", r'(<h5 className="fw-bold mb-1">{user\.name}</h5>\s*<p className="text-muted small mb-0">{user\.email}</p>)'
+                      r"(?!\s*<p className=\"small mb-0\" style=\{\{ fontFamily: \\?'monospace\\?', color: \\?'#ff6000)")
 
-# Trouver et modifier la carte de profil supérieure
-# Chercher la section avec user.name et user.email
-pattern = r'(<h5 className="fw-bold mb-1">{user\.name}</h5>\s*<p className="text-muted small mb-0">{user\.email}</p>)'
-replacement = r'\1\n                            <p className="small mb-0" style={{ fontFamily: \'monospace\', color: \'#ff6000\', marginTop: \'4px\' }}>\n                                ID: {user.id || \'N/A\'}\n                            </p>'
 
-content = re.sub(pattern, replacement, content)
+@transform(PROFILE, "ID added to profile header card!", version=2)
+def add_id_to_header(content):
+    # Trouver et modifier la carte de profil supérieure
+    # Chercher la section avec user.name et user.email
+    replacement = r'\1\n                            <p className="small mb-0" style={{ fontFamily: \'monospace\', color: \'#ff6000\', marginTop: \'4px\' }}>\n                                ID: {user.id || \'N/A\'}\n                            </p>'
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+    content = NAME_EMAIL.sub(replacement, content)
+    return content
 
-print("ID added to profile header card!")
+
+if __name__ == "__main__":
+    run(["add_id_to_header"])
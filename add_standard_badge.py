@@ -1,21 +1,21 @@
-import re
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+HEADER_ID = register("add_standard_badge.header_id", r'(<p className="small mb-0" style={{ fontFamily: \'monospace\', color: \'#ff6000\', marginTop: \'4px\' }}>\s*ID: {user\.id \|\| \'N/A\'}\s*</p>)')
 
-# Trouver et modifier la carte de profil pour ajouter le badge
-# Chercher la section après l'ID
-pattern = r'(<p className="small mb-0" style={{ fontFamily: \'monospace\', color: \'#ff6000\', marginTop: \'4px\' }}>\s*ID: {user\.id \|\| \'N/A\'}\s*</p>)'
-replacement = r'''\1
+
+@transform(PROFILE, "Standard badge added to profile card!")
+def add_standard_badge(content):
+    # Trouver et modifier la carte de profil pour ajouter le badge
+    # Chercher la section après l'ID
+    replacement = r'''\1
                             <div className="mt-2">
                                 <span className="badge bg-secondary">Standard</span>
                             </div>'''
 
-content = re.sub(pattern, replacement, content)
+    content = HEADER_ID.sub(replacement, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Standard badge added to profile card!")
+if __name__ == "__main__":
+    run(["add_standard_badge"])
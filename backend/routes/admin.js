@@ -2,6 +2,7 @@ const express = require('express');
 const router = express.Router();
 const fs = require('fs').promises;
 const path = require('path');
+const { writeJsonAtomic, withFileLock } = require('../utils/jsonStore');
 const nodemailer = require('nodemailer');
 const { sendEmail, emailTemplates } = require('../utils/emailService');
 
@@ -21,7 +22,7 @@ async function getUsers() {
 
 // Helper function to save users
 async function saveUsers(users) {
-    await fs.writeFile(USERS_FILE, JSON.stringify({ users }, null, 2));
+    await writeJsonAtomic(USERS_FILE, { users });
 }
 
 // POST /api/admin/wallet/email-notification - Send email notification for wallet credit (detached from DB)
@@ -49,7 +50,7 @@ router.post('/wallet/email-notification', async (req, res) => {
 });
 
 // POST /api/admin/wallet/credit - Credit user wallet (Admin only)
-router.post('/wallet/credit', async (req, res) => {
+router.post('/wallet/credit', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { email, userId, amount, description } = req.body;
 
@@ -120,7 +121,7 @@ router.post('/wallet/credit', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 // GET /api/admin/wallet/users - Get all users with balances
 router.get('/wallet/users', async (req, res) => {
@@ -239,32 +240,42 @@ router.post('/order-refund', async (req, res) => {
             return res.status(400).json({ success: false, message: 'Invalid order data for refund' });
         }
 
-        const users = await getUsers();
-        let userIndex = users.findIndex(u => u.email === order.email);
-
-        if (userIndex === -1) {
-            return res.status(404).json({ success: false, message: 'Customer not found in wallet system' });
-        }
+        // Only the balance update holds the users.json lock, not the email below
+        const refund = await withFileLock(USERS_FILE, async () => {
+            const users = await getUsers();
+            const userIndex = users.findIndex(u => u.email === order.email);
 
-        const user = users[userIndex];
-        const refundAmount = parseFloat(order.total);
-        const oldBalance = user.walletBalance || 0;
+            if (userIndex === -1) {
+                return null;
+            }
 
-        // Update balance
-        user.walletBalance += refundAmount;
+            const user = users[userIndex];
+            const refundAmount = parseFloat(order.total);
+            const oldBalance = user.walletBalance || 0;
+
+            // Update balance
+            user.walletBalance += refundAmount;
+
+            // Add transaction
+            user.transactions.push({
+                id: `refund_${Date.now()}`,
+                type: 'credit',
+                amount: refundAmount,
+                date: new Date().toISOString(),
+                description: `Remboursement Commande #${order.id}`,
+                balanceAfter: user.walletBalance
+            });
 
-        // Add transaction
-        user.transactions.push({
-            id: `refund_${Date.now()}`,
-            type: 'credit',
-            amount: refundAmount,
-            date: new Date().toISOString(),
-            description: `Remboursement Commande #${order.id}`,
-            balanceAfter: user.walletBalance
+            users[userIndex] = user;
+            await saveUsers(users);
+            return { user, oldBalance };
         });
 
-        users[userIndex] = user;
-        await saveUsers(users);
+        if (!refund) {
+            return res.status(404).json({ success: false, message: 'Customer not found in wallet system' });
+        }
+
+        const { user, oldBalance } = refund;
 
         // Send enhanced email with balance info
         console.log(`📩 Sending refund email to ${user.email}`);
@@ -282,7 +293,7 @@ router.post('/order-refund', async (req, res) => {
 });
 
 // PUT /api/admin/users/:id - Update user (Admin only)
-router.put('/users/:id', async (req, res) => {
+router.put('/users/:id', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { id } = req.params;
         const updatedData = req.body;
@@ -305,10 +316,10 @@ router.put('/users/:id', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 // DELETE /api/admin/users/:email - Delete user (Admin only)
-router.delete('/users/:email', async (req, res) => {
+router.delete('/users/:email', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { email } = req.params;
         const users = await getUsers();
@@ -330,6 +341,6 @@ router.delete('/users/:email', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 module.exports = router;
@@ -2,6 +2,7 @@ const express = require('express');
 const router = express.Router();
 const fs = require('fs').promises;
 const path = require('path');
+const { writeJsonAtomic, withFileLock } = require('../utils/jsonStore');
 const { sendEmail, emailTemplates } = require('../utils/emailService');
 
 const USERS_FILE = path.join(__dirname, '../data/users.json');
@@ -16,11 +17,11 @@ async function getUsers() {
 }
 
 async function saveUsers(users) {
-    await fs.writeFile(USERS_FILE, JSON.stringify({ users }, null, 2));
+    await writeJsonAtomic(USERS_FILE, { users });
 }
 
 // POST /api/auth/register
-router.post('/register', async (req, res) => {
+router.post('/register', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { name, email, password } = req.body;
         const normalizedEmail = email.toLowerCase();
@@ -53,10 +54,10 @@ router.post('/register', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 // POST /api/auth/login
-router.post('/login', async (req, res) => {
+router.post('/login', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { email, password } = req.body;
         const normalizedEmail = email.toLowerCase();
@@ -102,6 +103,6 @@ router.post('/login', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 module.exports = router;
@@ -2,6 +2,7 @@ const express = require('express');
 const router = express.Router();
 const fs = require('fs').promises;
 const path = require('path');
+const { writeJsonAtomic, withFileLock } = require('../utils/jsonStore');
 const { sendEmail, emailTemplates } = require('../utils/emailService');
 
 const ORDERS_FILE = path.join(__dirname, '../data/orders.json');
@@ -18,7 +19,7 @@ async function getOrders() {
 
 // Helper to save orders
 async function saveOrders(orders) {
-    await fs.writeFile(ORDERS_FILE, JSON.stringify({ orders }, null, 2));
+    await writeJsonAtomic(ORDERS_FILE, { orders });
 }
 
 // GET /api/orders - Get all orders
@@ -44,7 +45,7 @@ router.get('/user/:email', async (req, res) => {
 });
 
 // POST /api/orders - Create new order
-router.post('/', async (req, res) => {
+router.post('/', (req, res) => withFileLock(ORDERS_FILE, async () => {
     try {
         const newOrder = req.body;
         const orders = await getOrders();
@@ -71,10 +72,10 @@ router.post('/', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 // PUT /api/orders/:id/status - Update order status
-router.put('/:id/status', async (req, res) => {
+router.put('/:id/status', (req, res) => withFileLock(ORDERS_FILE, async () => {
     try {
         const { id } = req.params;
         const { status, note, admin, trackingNumber } = req.body;
@@ -117,10 +118,10 @@ router.put('/:id/status', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 // PUT /api/orders/:id - Update full order (e.g. for cancellation details)
-router.put('/:id', async (req, res) => {
+router.put('/:id', (req, res) => withFileLock(ORDERS_FILE, async () => {
     try {
         const { id } = req.params;
         const updates = req.body;
@@ -138,6 +139,6 @@ router.put('/:id', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 module.exports = router;
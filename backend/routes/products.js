@@ -2,6 +2,7 @@ const express = require('express');
 const router = express.Router();
 const fs = require('fs').promises;
 const path = require('path');
+const { writeJsonAtomic, withFileLock } = require('../utils/jsonStore');
 
 const PRODUCTS_FILE = path.join(__dirname, '../data/products.json');
 
@@ -18,7 +19,7 @@ async function getProducts() {
 
 // Helper to save products
 async function saveProducts(products) {
-    await fs.writeFile(PRODUCTS_FILE, JSON.stringify({ products }, null, 2));
+    await writeJsonAtomic(PRODUCTS_FILE, { products });
 }
 
 // GET /api/products - Get all products
@@ -32,7 +33,7 @@ router.get('/', async (req, res) => {
 });
 
 // POST /api/products - Create a product
-router.post('/', async (req, res) => {
+router.post('/', (req, res) => withFileLock(PRODUCTS_FILE, async () => {
     try {
         const newProduct = req.body;
         const products = await getProducts();
@@ -49,10 +50,10 @@ router.post('/', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 // PUT /api/products/:id - Update a product
-router.put('/:id', async (req, res) => {
+router.put('/:id', (req, res) => withFileLock(PRODUCTS_FILE, async () => {
     try {
         const { id } = req.params;
         const updatedData = req.body;
@@ -71,10 +72,10 @@ router.put('/:id', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 // DELETE /api/products/:id - Delete a product
-router.delete('/:id', async (req, res) => {
+router.delete('/:id', (req, res) => withFileLock(PRODUCTS_FILE, async () => {
     try {
         const { id } = req.params;
         let products = await getProducts();
@@ -91,6 +92,6 @@ router.delete('/:id', async (req, res) => {
     } catch (error) {
         res.status(500).json({ message: error.message });
     }
-});
+}));
 
 module.exports = router;
@@ -2,6 +2,7 @@ const express = require('express');
 const router = express.Router();
 const fs = require('fs').promises;
 const path = require('path');
+const { writeJsonAtomic, withFileLock } = require('../utils/jsonStore');
 const { sendEmail, emailTemplates } = require('../utils/emailService');
 
 const USERS_FILE = path.join(__dirname, '../data/users.json');
@@ -18,7 +19,7 @@ async function getUsers() {
 
 // Helper function to save users
 async function saveUsers(users) {
-    await fs.writeFile(USERS_FILE, JSON.stringify({ users }, null, 2));
+    await writeJsonAtomic(USERS_FILE, { users });
 }
 
 // Helper function to find or create user
@@ -41,7 +42,7 @@ async function findOrCreateUser(email) {
 }
 
 // GET /api/wallet/balance - Get user wallet balance
-router.get('/balance', async (req, res) => {
+router.get('/balance', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { email } = req.query;
 
@@ -59,10 +60,10 @@ router.get('/balance', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 // POST /api/wallet/pay - Pay with wallet balance
-router.post('/pay', async (req, res) => {
+router.post('/pay', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { email, amount, orderId } = req.body;
 
@@ -113,10 +114,10 @@ router.post('/pay', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 // GET /api/wallet/transactions - Get user transaction history
-router.get('/transactions', async (req, res) => {
+router.get('/transactions', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { email } = req.query;
 
@@ -133,10 +134,10 @@ router.get('/transactions', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 // POST /api/wallet/transfer - Transfer balance between users
-router.post('/transfer', async (req, res) => {
+router.post('/transfer', (req, res) => withFileLock(USERS_FILE, async () => {
     try {
         const { fromEmail, toEmail, amount, description } = req.body;
 
@@ -224,6 +225,6 @@ router.post('/transfer', async (req, res) => {
     } catch (error) {
         res.status(500).json({ success: false, message: error.message });
     }
-});
+}));
 
 module.exports = router;
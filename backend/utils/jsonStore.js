@@ -0,0 +1,46 @@
+const fs = require('fs').promises;
+const path = require('path');
+
+// Write a JSON data file atomically: the full content goes to a temporary file in the
+// same folder, is flushed to disk, then renamed over the target. A concurrent reader
+// sees either the old or the new file, never a truncated one (which getUsers() & co.
+// would read as an empty list and the next save would then wipe).
+async function writeJsonAtomic(file, data) {
+    const tmp = path.join(path.dirname(file), `.${path.basename(file)}.${process.pid}.${Date.now()}.${Math.random().toString(36).slice(2)}.tmp`);
+    const handle = await fs.open(tmp, 'w');
+    try {
+        await handle.writeFile(JSON.stringify(data, null, 2));
+        await handle.sync();
+    } catch (error) {
+        await handle.close();
+        await fs.unlink(tmp).catch(() => {});
+        throw error;
+    }
+    await handle.close();
+    try {
+        await fs.rename(tmp, file);
+    } catch (error) {
+        await fs.unlink(tmp).catch(() => {});
+        throw error;
+    }
+}
+
+// Run fn while holding the lock of a data file. An atomic write alone does not stop two
+// requests from both reading the old content and the last save dropping the other's
+// update: every read-modify-write of a file goes through its own queue instead. Keyed by
+// absolute path, so all the routes saving users.json share one queue.
+const queues = new Map();
+
+function withFileLock(file, fn) {
+    const key = path.resolve(file);
+    const run = (queues.get(key) || Promise.resolve()).then(() => fn());
+    // The next caller waits for this one, whether it succeeded or failed
+    const tail = run.catch(() => {});
+    queues.set(key, tail);
+    tail.then(() => {
+        if (queues.get(key) === tail) queues.delete(key);
+    });
+    return run;
+}
+
+module.exports = { writeJsonAtomic, withFileLock };
@@ -0,0 +1,228 @@
+import argparse
+import contextlib
+import io
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+from codemod import discover, get_transform, read_file
+from jsx_index import JSXIndex
+
+# Pages réelles servant de modèle aux fichiers synthétiques
+SHAPES = {
+    "profile": "src/pages/Profile.jsx",
+    "product_details": "src/pages/ProductDetails.jsx",
+    "checkout": "src/pages/Checkout.jsx",
+}
+
+# Ancienne carte de profil (avec un guillemet échappé comme ceux que corrige fix_quotes) :
+# c'est ce que la plupart des scripts cherchent à modifier
+LEGACY_CARD = '''<Card className="shadow-sm border-0 mb-3">
+    <Card.Body className="text-center py-4">
+        <div className="mb-3">
+            <i className="bi bi-person-circle" style={{ fontSize: '4rem', color: '#ff6000' }}></i>
+        </div>
+        <h5 className="fw-bold mb-1">{user.name}</h5>
+        <p className="text-muted small mb-0">{user.email}</p>
+        <div className="d-flex align-items-center justify-content-center">
+            <i className="bi bi-fingerprint me-2" style={{ color: '#ff6000' }}></i>
+            <small className="mb-0" style={{ fontFamily: 'monospace', color: \\'#6c757d\\' }}>
+                {user.id || 'N/A'}
+            </small>
+        </div>
+    </Card.Body>
+</Card>
+<Card.Body className="p-3">
+    <div className="mb-2">
+        <small className="text-muted d-block">ID Compte</small>
+        <strong>{user.id || 'N/A'}</strong>
+    </div>
+    <div className="mb-2">
+        <small className="text-muted d-block">Email</small>
+        <strong>{user.email}</strong>
+    </div>
+</Card.Body>
+'''
+
+HEADER = '''import { useState } from 'react';
+import { Container, Row, Col, Card, ListGroup, Badge, Button } from 'react-bootstrap';
+import { useAuth } from '../context/AuthContext';
+
+const Profile = () => {
+    const { user, logout } = useAuth();
+    const generateUserId = () => { return Date.now().toString(); };
+
+    return (
+        <div className="synthetic">
+'''
+
+FOOTER = '''        </div>
+    );
+};
+
+export default Profile;
+'''
+
+# Ouvrants des motifs .*? en DOTALL, sans fermeture : chaque recherche parcourt la fin du fichier
+ADVERSARIAL_ANCHORS = [
+    '<Card className="shadow-sm border-0 mb-3">',
+    '<Card.Body className="text-center py-4">',
+    '<Card.Body className="p-3">',
+    '<div className="mb-2">',
+]
+
+
+def page_fragment(path):
+    # Le plus grand élément de premier niveau de la page (en pratique le JSX du return)
+    index = JSXIndex(read_file(path))
+    roots = [e for e in index.elements if e.depth == 0 and e.end is not None]
+    return index.outer(max(roots, key=lambda e: e.end - e.start))
+
+
+def nest(fragment, depth):
+    for level in range(depth):
+        fragment = f'<div className="nest-{level}">\n{fragment}\n</div>'
+    return fragment
+
+
+def synthetic_file(fragment, lines, depth):
+    # Répéter le fragment (et une ancienne carte) jusqu'à atteindre le nombre de lignes voulu
+    block = nest(fragment + "\n" + LEGACY_CARD, depth) + "\n"
+    block_lines = block.count("\n")
+    copies = max(1, lines // block_lines)
+    return HEADER + block * copies + FOOTER
+
+
+def adversarial_file(lines):
+    filler = '<p className="text-muted">Lorem ipsum {user.name} dolor sit amet</p>\n'
+    step = max(1, lines // 10)
+    out = [HEADER]
+    for i in range(lines):
+        if i % step == 0:
+            out.append(ADVERSARIAL_ANCHORS[(i // step) % len(ADVERSARIAL_ANCHORS)] + "\n")
+        out.append(filler)
+    out.append(FOOTER)
+    return "".join(out)
+
+
+def time_transform(func, content, repeat):
+    best = None
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(content)
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(func, content):
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        try:
+            func(content)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+
+def run_benchmarks(names, sizes, depths, repeat):
+    funcs = [get_transform(name) for name in names]
+    results = []
+    for shape, path in SHAPES.items():
+        fragment = page_fragment(path)
+        for lines in sizes:
+            for depth in depths:
+                content = synthetic_file(fragment, lines, depth)
+                size = len(content.encode("utf-8"))
+                for func in funcs:
+                    seconds = time_transform(func, content, repeat)
+                    results.append({
+                        "transform": func.__name__,
+                        "shape": shape,
+                        "lines": content.count("\n"),
+                        "depth": depth,
+                        "bytes": size,
+                        "seconds": seconds,
+                        "mb_per_s": size / seconds / 1e6 if seconds else None,
+                        "peak_kb": peak_memory(func, content) / 1024,
+                    })
+
+    worst_case = []
+    for lines in sizes:
+        content = adversarial_file(lines)
+        for func in funcs:
+            worst_case.append({
+                "transform": func.__name__,
+                "lines": content.count("\n"),
+                "bytes": len(content.encode("utf-8")),
+                "seconds": time_transform(func, content, repeat),
+            })
+    return results, worst_case
+
+
+def result_key(row):
+    return f"{row['transform']}/{row.get('shape', 'adversarial')}/{row['lines']}/{row.get('depth', 0)}"
+
+
+def compare(previous, current, threshold, min_delta):
+    # Comparer deux fichiers JSON : lister les mesures plus lentes que le seuil
+    # (les écarts de moins de min_delta secondes sont du bruit)
+    before = {result_key(r): r["seconds"] for r in previous["results"] + previous["worst_case"]}
+    regressions = []
+    for row in current["results"] + current["worst_case"]:
+        old = before.get(result_key(row))
+        if old and row["seconds"] > old * (1 + threshold) and row["seconds"] - old > min_delta:
+            regressions.append((result_key(row), old, row["seconds"]))
+    return regressions
+
+
+def print_summary(results, worst_case):
+    # Une ligne par transformation : débit moyen, pic mémoire, pire cas
+    print(f"{'transform':<28} {'MB/s':>9} {'peak KB':>10} {'worst ms':>10}")
+    for name in dict.fromkeys(r["transform"] for r in results):
+        rows = [r for r in results if r["transform"] == name]
+        rates = [r["mb_per_s"] for r in rows if r["mb_per_s"]]
+        worst = max(r["seconds"] for r in worst_case if r["transform"] == name)
+        print(f"{name:<28} {sum(rates) / len(rates):>9.1f} {max(r['peak_kb'] for r in rows):>10.0f} {worst * 1000:>10.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark codemod transforms on synthetic JSX pages")
+    parser.add_argument("names", nargs="*", help="transforms to benchmark (default: all)")
+    parser.add_argument("--sizes", default="200,1000,10000", help="comma-separated line counts")
+    parser.add_argument("--depths", default="1,8", help="comma-separated nesting depths")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per case (the best is kept)")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="previous JSON results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2, help="slowdown ratio reported as a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args()
+
+    names = args.names or discover()
+    sizes = [int(s) for s in args.sizes.split(",")]
+    depths = [int(d) for d in args.depths.split(",")]
+    results, worst_case = run_benchmarks(names, sizes, depths, args.repeat)
+    data = {"python": platform.python_version(), "results": results, "worst_case": worst_case}
+
+    print_summary(results, worst_case)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+        regressions = compare(previous, data, args.threshold, args.min_delta_ms / 1000)
+        for key, old, new in regressions:
+            print(f"  slower  {key}: {old * 1000:.2f} ms -> {new * 1000:.2f} ms")
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+
+import safe_io
+from safe_io import ROOT, relative_path
+
+HISTORY_FILE = os.path.join(ROOT, "build_history.jsonl")
+# Fichiers écrits par build_runner.cjs pour un même build
+RUNNER_LOGS = ["build_stdout.txt", "build_stderr.txt", "build_error.txt"]
+# Sorties console complètes (npm run build > build_log.txt, node --trace-uncaught, DEBUG=vite:*) :
+# chacune est un build à part entière
+CONSOLE_LOGS = ["build_log.txt", "build_trace.txt", "build_debug.txt"]
+
+ANSI = re.compile(r"\x1b\[[0-9;]*m")
+# dist/assets/index-C3yKQZqa.js   143.41 kB │ gzip: 46.08 kB │ map: 345.00 kB
+# (le séparateur │ peut arriver mal décodé depuis une console Windows, d'où le .{1,4}?)
+CHUNK = re.compile(
+    r"(?P<name>dist/[^\s]+)\s+(?P<size>[\d.,]+)\s*kB(?:\s*.{1,4}?\s*gzip:\s*(?P<gzip>[\d.,]+)\s*kB)?"
+    r"(?:\s*.{1,4}?\s*map:\s*(?P<map>[\d.,]+)\s*kB)?"
+)
+MODULES = re.compile(r"(\d+) modules transformed")
+DURATION = re.compile(r"(?P<state>built|Build failed) in (?P<value>[\d.]+)\s*(?P<unit>ms|s)(?![a-z])")
+VITE_VERSION = re.compile(r"vite v(\d+\.\d+\.\d+)")
+LOCATED_ERROR = re.compile(r"(?P<file>(?:[A-Za-z]:)?[^\s:][^:\n]*?\.\w+):(?P<line>\d+):(?P<column>\d+): ERROR: (?P<message>[^\n]+)")
+PLUGIN_ERROR = re.compile(r"error during build:\s*\[(?P<plugin>[\w:-]+)\]\s*(?P<message>[^\n]+)")
+LARGE_CHUNKS = re.compile(r"Some chunks are larger than (\d+) kB")
+# Hash de contenu ajouté par Vite aux noms de fichiers (index-C3yKQZqa.js -> index.js)
+CONTENT_HASH = re.compile(r"-[\w-]{8}(?=\.\w+$)")
+
+
+def read_log(path):
+    # Les logs redirigés par PowerShell sont en UTF-16 ; les autres en UTF-8
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        text = raw.decode("utf-16")
+    else:
+        text = raw.decode("utf-8", errors="replace")
+    lines = text.replace("\r\n", "\n").split("\n")
+    if is_wrapped(lines):
+        # Console PowerShell : lignes coupées à largeur fixe, espaces de fin conservés.
+        # On recolle tout ; les changements de couleur ANSI servent de fins de message.
+        return ANSI.sub("\n", "".join(lines))
+    return ANSI.sub("", "\n".join(lines))
+
+
+def is_wrapped(lines):
+    # Enregistrement d'erreur PowerShell (NativeCommandError) rendu à largeur fixe :
+    # une même longueur de ligne domine, et elle est courte
+    if not any("CategoryInfo" in line for line in lines):
+        return False
+    lengths = [len(ANSI.sub("", line)) for line in lines if line.strip()]
+    width = max(set(lengths), key=lengths.count)
+    return width <= 80 and lengths.count(width) * 4 >= len(lengths)
+
+
+def kb(value):
+    return float(value.replace(",", "")) if value else None
+
+
+def parse_log(text):
+    result = {"ok": None, "ms": None, "modules": None, "vite": None, "chunks": {}, "errors": [], "warnings": []}
+    m = VITE_VERSION.search(text)
+    if m:
+        result["vite"] = m.group(1)
+    modules = [int(n) for n in MODULES.findall(text)]
+    if modules:
+        result["modules"] = max(modules)
+    for m in DURATION.finditer(text):
+        value = float(m.group("value"))
+        result["ms"] = value * 1000 if m.group("unit") == "s" else value
+        result["ok"] = m.group("state") == "built"
+    for m in CHUNK.finditer(text):
+        name = CONTENT_HASH.sub("", m.group("name"))
+        result["chunks"][name] = {"kb": kb(m.group("size")), "gzip_kb": kb(m.group("gzip"))}
+    for m in LOCATED_ERROR.finditer(text):
+        result["errors"].append({
+            "file": relative_path(m.group("file")), "line": int(m.group("line")),
+            "column": int(m.group("column")), "message": m.group("message").strip(),
+        })
+    if not result["errors"]:
+        for m in PLUGIN_ERROR.finditer(text):
+            result["errors"].append({"plugin": m.group("plugin"), "message": m.group("message").strip()})
+    if result["errors"] and result["ok"] is None:
+        result["ok"] = False
+    m = LARGE_CHUNKS.search(text)
+    if m:
+        result["warnings"].append(f"chunks larger than {m.group(1)} kB after minification")
+    return result
+
+
+def merge(results):
+    # Plusieurs fichiers d'un même build (stdout, stderr, ...) -> une seule mesure
+    run = {"ok": None, "ms": None, "modules": None, "vite": None, "chunks": {}, "errors": [], "warnings": []}
+    for r in results:
+        for field in ("ok", "ms", "modules", "vite"):
+            if run[field] is None:
+                run[field] = r[field]
+        if r["ok"] is False:
+            run["ok"] = False
+        run["chunks"].update(r["chunks"])
+        for error in r["errors"]:
+            if error not in run["errors"]:
+                run["errors"].append(error)
+        for warning in r["warnings"]:
+            if warning not in run["warnings"]:
+                run["warnings"].append(warning)
+    return run
+
+
+def record(paths, history=HISTORY_FILE):
+    texts = [read_log(path) for path in paths]
+    run = merge(parse_log(text) for text in texts)
+    digest = hashlib.sha256("\0".join(texts).encode("utf-8")).hexdigest()[:16]
+    # Horodatage du build : le fichier de log le plus récent
+    run["time"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(max(os.path.getmtime(p) for p in paths)))
+    run["hash"] = digest
+    # Lecture et ajout sous le même verrou : deux builds simultanés n'ajoutent pas deux fois le même log
+    with safe_io.locked(history):
+        runs = load_history(history)
+        if any(r.get("hash") == digest for r in runs):
+            return run, runs, False
+        with open(history, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run, ensure_ascii=False, separators=(",", ":")) + "\n")
+    return run, runs, True
+
+
+def load_history(history=HISTORY_FILE):
+    if not os.path.exists(history):
+        return []
+    with open(history, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def regressions(previous, current, threshold, min_delta_kb, min_delta_ms):
+    # Croissance au-delà du seuil par chunk (taille gzip si connue), nouveaux chunks, durée et nombre de modules
+    found = []
+    for name, chunk in current["chunks"].items():
+        field = "gzip_kb" if chunk.get("gzip_kb") is not None else "kb"
+        old = previous["chunks"].get(name)
+        if old is None:
+            if chunk[field] > min_delta_kb:
+                found.append(f"new chunk {name}: {chunk[field]:.2f} kB")
+            continue
+        if old.get(field) and chunk[field] > old[field] * (1 + threshold) and chunk[field] - old[field] > min_delta_kb:
+            found.append(f"{name}: {old[field]:.2f} -> {chunk[field]:.2f} kB ({'gzip' if field == 'gzip_kb' else 'raw'})")
+    total_old = sum(c.get("gzip_kb") or c["kb"] for c in previous["chunks"].values())
+    total_new = sum(c.get("gzip_kb") or c["kb"] for c in current["chunks"].values())
+    if total_old and total_new > total_old * (1 + threshold) and total_new - total_old > min_delta_kb:
+        found.append(f"total: {total_old:.2f} -> {total_new:.2f} kB")
+    if previous["ms"] and current["ms"] and current["ms"] > previous["ms"] * (1 + threshold) \
+            and current["ms"] - previous["ms"] > min_delta_ms:
+        found.append(f"build time: {previous['ms']:.0f} -> {current['ms']:.0f} ms")
+    if previous["modules"] and current["modules"] and current["modules"] > previous["modules"] * (1 + threshold):
+        found.append(f"modules: {previous['modules']} -> {current['modules']}")
+    return found
+
+
+def print_run(label, run, top=10):
+    state = {True: "ok", False: "FAILED", None: "unknown"}[run["ok"]]
+    ms = f"{run['ms']:.0f} ms" if run["ms"] is not None else "? ms"
+    print(f"{label}: {state}, {ms}, {run['modules'] if run['modules'] is not None else '?'} module(s), "
+          f"{len(run['chunks'])} chunk(s)")
+    chunks = sorted(run["chunks"].items(), key=lambda item: -(item[1].get("gzip_kb") or item[1]["kb"]))
+    for name, chunk in chunks[:top]:
+        gzip = f"{chunk['gzip_kb']:>9.2f} kB gzip" if chunk.get("gzip_kb") is not None else ""
+        print(f"  {name:<50} {chunk['kb']:>9.2f} kB {gzip}")
+    for error in run["errors"]:
+        where = f"{error['file']}:{error['line']}:{error['column']}" if "file" in error else error["plugin"]
+        print(f"  error  {where}: {error['message']}")
+    for warning in run["warnings"]:
+        print(f"  warning  {warning}")
+
+
+def default_builds():
+    # Logs présents à la racine, un groupe par build, du plus ancien au plus récent
+    existing = [os.path.join(ROOT, name) for name in RUNNER_LOGS + CONSOLE_LOGS if os.path.exists(os.path.join(ROOT, name))]
+    runner = [p for p in existing if os.path.basename(p) in RUNNER_LOGS]
+    builds = ([runner] if runner else []) + [[p] for p in existing if p not in runner]
+    return sorted(builds, key=lambda paths: max(os.path.getmtime(p) for p in paths))
+
+
+def record_build(paths, args):
+    # Ajouter un build à l'historique et le comparer au dernier build réussi ; True si échec ou régression
+    run, runs, added = record(paths, args.history)
+    print_run(f"{run['time']} ({', '.join(os.path.basename(p) for p in paths)})", run, args.top)
+    if not added:
+        print("Already recorded (same logs)")
+        return False
+    # Comparer au dernier build réussi (les builds en échec n'ont pas de chunks)
+    previous = next((r for r in reversed(runs) if r["ok"] and r["chunks"]), None)
+    if run["ok"] and previous:
+        found = regressions(previous, run, args.threshold, args.min_delta_kb, args.min_delta_ms)
+        for line in found:
+            print(f"  regression  {line}")
+        if found:
+            return True
+    return run["ok"] is False
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse Vite build logs into a bundle-size and build-time history")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("parse", help="print what each log file contains")
+    p.add_argument("files", nargs="+")
+
+    r = sub.add_parser("record", help="append one build (made of one or more log files) to the history")
+    r.add_argument("files", nargs="*", help=f"log files of the same build (default: {', '.join(RUNNER_LOGS)} "
+                                            f"as one build, then each of {', '.join(CONSOLE_LOGS)} present)")
+    r.add_argument("--threshold", type=float, default=0.1, help="growth ratio reported as a regression")
+    r.add_argument("--min-delta-kb", type=float, default=1.0, help="ignore size growth smaller than this")
+    r.add_argument("--min-delta-ms", type=float, default=500.0, help="ignore build time growth smaller than this")
+
+    h = sub.add_parser("history", help="print the recorded builds")
+    h.add_argument("--last", type=int, default=10)
+    for command in (p, r, h):
+        command.add_argument("--top", type=int, default=10, help="largest chunks to list")
+        command.add_argument("--history", default=HISTORY_FILE, help="history file (JSON lines)")
+    args = parser.parse_args()
+
+    if args.command == "parse":
+        for path in args.files:
+            print_run(path, parse_log(read_log(path)), args.top)
+    elif args.command == "record":
+        builds = [args.files] if args.files else default_builds()
+        if not builds:
+            parser.error("no log files")
+        failed = False
+        for paths in builds:
+            failed = record_build(paths, args) or failed
+        if failed:
+            raise SystemExit(1)
+    else:
+        for run in load_history(args.history)[-args.last:]:
+            print_run(run["time"], run, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,318 @@
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+
+import safe_io
+from migrate_users import ALPHABET, ID_LENGTH, IdAllocator, IdSet, iter_array
+
+# NumPy n'est nécessaire que pour les gros volumes ; sans lui, IdAllocator et IdSet (pur Python)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Bornes [bas, haut) des codes entiers de chaque format :
+# alnum : generateUserId qu'écrirait update_id_generator.py, 8 caractères parmi 36, codés comme int(id, 36) dans IdSet
+# digits : 8 chiffres avec zéros en tête, comme generateUserId (src/pages/admin/AdminUsers.jsx) ;
+# routes/auth.js et routes/products.js tirent dans le sous-espace [10^7, 10^8)
+RANGES = {
+    "alnum": (0, len(ALPHABET) ** ID_LENGTH),
+    "digits": (0, 10 ** ID_LENGTH),
+}
+# Chiffres base 36 dans l'ordre de int(x, 36) : même code entier que IdSet pour un ID donné
+DIGITS36 = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+SIZES = [10 ** 5, 10 ** 6, 10 ** 7, 10 ** 8]
+# Au-delà, le benchmark pur Python demanderait plusieurs Go (un int Python par ID) : tailles ignorées sans NumPy
+PURE_MAX = 10 ** 7
+CHUNK = 10 ** 7
+
+
+def parse_count(text):
+    # 100000 ou 1e5
+    try:
+        value = int(float(text))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a count: {text!r}") from None
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"count must be positive: {text!r}")
+    return value
+
+
+def load_taken(paths):
+    # IDs déjà attribués, lus en flux ; la clé du tableau est le nom du fichier (users.json -> "users")
+    taken = IdSet()
+    for path in paths:
+        key = os.path.splitext(os.path.basename(path))[0]
+        for record in iter_array(path, key):
+            if isinstance(record, dict) and record.get("id") is not None:
+                taken.add(str(record["id"]))
+    return taken
+
+
+def taken_codes(taken, id_format):
+    # Codes entiers triés des IDs de l'IdSet qui tombent dans l'espace du format.
+    # IdSet range les IDs tout en chiffres dans sa bitmap, qui couvre exactement l'espace digits ;
+    # en alnum, ce sont aussi des IDs que generateUserId peut tirer
+    numbers = np.flatnonzero(np.unpackbits(np.frombuffer(taken.bits, dtype=np.uint8), bitorder="little"))
+    if id_format == "digits":
+        return numbers.astype(np.uint64)
+    # "01234567" relu en base 36, comme int(id, 36)
+    codes = np.zeros(len(numbers), dtype=np.uint64)
+    for p in range(ID_LENGTH - 1, -1, -1):
+        codes = codes * np.uint64(36) + (numbers // 10 ** p % 10).astype(np.uint64)
+    codes = np.concatenate((codes, np.fromiter(taken.alnum, dtype=np.uint64, count=len(taken.alnum))))
+    codes.sort()
+    return codes
+
+
+def taken_count(taken, id_format):
+    numbers = int.from_bytes(taken.bits, "little").bit_count()
+    if id_format == "digits":
+        return numbers
+    return numbers + len(taken.alnum)
+
+
+_halves = {}
+# Une ligne : deux demi-IDs de 4 octets puis le saut de ligne, sans alignement
+LINE = None if np is None else np.dtype([("high", "V4"), ("low", "V4"), ("newline", "u1")])
+
+
+def half_table(base):
+    # Les base^4 écritures de 4 caractères (1,7 million en base 36, 6,7 Mo) : un ID = deux lectures de table
+    if base not in _halves:
+        digits = np.frombuffer(DIGITS36.encode("ascii"), dtype=np.uint8)[:base]
+        n = np.arange(base ** 4)
+        chars = np.stack([digits[n // base ** p % base] for p in (3, 2, 1, 0)], axis=1)
+        _halves[base] = np.ascontiguousarray(chars).view("V4").ravel()
+    return _halves[base]
+
+
+def to_lines(codes, id_format):
+    # Codes -> b"ID\n" à la suite, sans boucle Python : une division par base^4 puis deux demi-IDs en table
+    base = 36 if id_format == "alnum" else 10
+    table = half_table(base)
+    high, low = np.divmod(codes, np.uint64(base ** (ID_LENGTH // 2)))
+    out = np.empty(len(codes), dtype=LINE)
+    out["high"] = table[high]
+    out["low"] = table[low]
+    out["newline"] = ord("\n")
+    return out.tobytes()
+
+
+class BulkIds:
+    # IDs uniques générés par lots, au format du frontend (alnum) ou du backend (digits).
+    # Index de dédoublonnage en mémoire : tableau trié des codes (NumPy) ou IdSet (pur Python)
+
+    def __init__(self, taken=None, id_format="digits", seed=None, use_numpy=True):
+        self.id_format = id_format
+        self.low, self.high = RANGES[id_format]
+        self.taken = taken if taken is not None else IdSet()
+        self.numpy = use_numpy and np is not None
+        self.used = taken_count(self.taken, id_format)
+        self.rejected = 0
+        if self.numpy:
+            self.rng = np.random.default_rng(seed)
+            self.index = taken_codes(self.taken, id_format)
+        else:
+            self.allocator = IdAllocator(self.taken, id_format, seed=seed, digits_from=self.low)
+
+    def free(self):
+        return self.high - self.low - self.used
+
+    def lines(self, n):
+        # n IDs inédits, un par ligne (octets ASCII)
+        if n > self.free():
+            raise ValueError(f"only {self.free()} {self.id_format} ID(s) left, {n} requested")
+        if not self.numpy:
+            ids = [self.allocator.allocate() for _ in range(n)]
+            self.rejected = self.allocator.rejected
+            self.used += n
+            return "".join(i + "\n" for i in ids).encode("ascii")
+        batches = []
+        need = n
+        while need:
+            draw = self.rng.integers(self.low, self.high, size=need, dtype=np.uint64)
+            # Premier tirage de chaque code, puis rejet de ceux déjà dans l'index (recherche dichotomique)
+            codes, first = np.unique(draw, return_index=True)
+            pos = np.searchsorted(self.index, codes)
+            seen = pos < len(self.index)
+            seen[seen] = self.index[pos[seen]] == codes[seen]
+            fresh = codes[~seen]
+            # Ordre du tirage conservé : la sortie ne doit pas être triée
+            batches.append(draw[np.sort(first[~seen])])
+            self.rejected += need - len(fresh)
+            need -= len(fresh)
+            # Fusion de deux suites triées : le tri stable (timsort) la fait en temps linéaire
+            self.index = np.sort(np.concatenate((self.index, fresh)), kind="stable")
+        self.used += n
+        return to_lines(np.concatenate(batches), self.id_format)
+
+    def generate(self, n):
+        return self.lines(n).decode("ascii").split()
+
+
+def expected_collisions(n, space):
+    # Tirages qui répètent un ID déjà tiré : n - E[IDs distincts] = n - S(1 - (1 - 1/S)^n)
+    return n + space * math.expm1(n * math.log1p(-1 / space))
+
+
+def any_collision(n, space):
+    # Paradoxe des anniversaires : P(au moins une collision parmi n tirages)
+    return -math.expm1(-n * (n - 1) / (2 * space))
+
+
+def users_for(p, space):
+    # Nombre de tirages pour lequel P(au moins une collision) atteint p
+    return math.sqrt(2 * space * -math.log1p(-p))
+
+
+def _draw_numpy(n, id_format, seed):
+    # Tirages bruts par tranches (la mémoire temporaire de integers() reste bornée), puis tri en place :
+    # les collisions sont les voisins égaux
+    low, high = RANGES[id_format]
+    rng = np.random.default_rng(seed)
+    codes = np.empty(n, dtype=np.uint64)
+    start = time.perf_counter()
+    for i in range(0, n, CHUNK):
+        codes[i:i + CHUNK] = rng.integers(low, high, size=min(CHUNK, n - i), dtype=np.uint64)
+    draw = time.perf_counter() - start
+    start = time.perf_counter()
+    for i in range(0, n, CHUNK):
+        to_lines(codes[i:i + CHUNK], id_format)
+    encode = time.perf_counter() - start
+    start = time.perf_counter()
+    codes.sort()
+    collisions = int(np.count_nonzero(codes[1:] == codes[:-1]))
+    dedup = time.perf_counter() - start
+    return collisions, draw, encode, dedup
+
+
+def _draw_pure(n, id_format, seed):
+    # Mêmes tirages que migrate_users (lots de IdAllocator), dédoublonnés par IdSet
+    allocator = IdAllocator(None, id_format, batch_size=min(n, 10 ** 6), seed=seed, digits_from=RANGES["digits"][0])
+    start = time.perf_counter()
+    ids = []
+    while len(ids) < n:
+        allocator._refill()
+        ids += allocator.batch
+    del ids[n:]
+    draw = time.perf_counter() - start
+    start = time.perf_counter()
+    "".join(i + "\n" for i in ids).encode("ascii")
+    encode = time.perf_counter() - start
+    start = time.perf_counter()
+    seen = IdSet()
+    collisions = sum(not seen.add(i) for i in ids)
+    dedup = time.perf_counter() - start
+    return collisions, draw, encode, dedup
+
+
+def bench(sizes, formats, seed=0, use_numpy=True):
+    use_numpy = use_numpy and np is not None
+    results = []
+    for id_format in formats:
+        low, high = RANGES[id_format]
+        space = high - low
+        for n in sizes:
+            row = {"format": id_format, "ids": n, "space": space, "backend": "numpy" if use_numpy else "python",
+                   "expected": expected_collisions(n, space), "p_any": any_collision(n, space)}
+            if not use_numpy and n > PURE_MAX:
+                row["skipped"] = f"needs NumPy above {PURE_MAX:.0e} IDs"
+                results.append(row)
+                continue
+            collisions, draw, encode, dedup = (_draw_numpy if use_numpy else _draw_pure)(n, id_format, seed)
+            row.update(collisions=collisions, rate=collisions / n, draw_s=draw, encode_s=encode, dedup_s=dedup,
+                       ids_per_s=n / (draw + encode + dedup))
+            results.append(row)
+    return results
+
+
+def print_bench(results):
+    print(f"{'format':<7} {'IDs':>11} {'collisions':>11} {'expected':>13} {'rate':>10} {'P(any)':>8} "
+          f"{'draw':>8} {'encode':>8} {'dedup':>8} {'IDs/s':>11}")
+    for row in results:
+        head = f"{row['format']:<7} {row['ids']:>11,} "
+        if "skipped" in row:
+            print(f"{head}{'':>11} {row['expected']:>13,.1f} {'':>10} {row['p_any']:>8.3f}  skipped ({row['skipped']})")
+            continue
+        print(f"{head}{row['collisions']:>11,} {row['expected']:>13,.1f} {row['rate']:>10.2e} {row['p_any']:>8.3f} "
+              f"{row['draw_s']:>7.2f}s {row['encode_s']:>7.2f}s {row['dedup_s']:>7.2f}s {row['ids_per_s']:>11,.0f}")
+
+
+def print_space(users, lengths):
+    # Dimensionnement : pour chaque alphabet et longueur, risque de collision à la taille de la base
+    print(f"{'alphabet':<9} {'length':>6} {'space':>10} {'1% after':>10} {'50% after':>10}  "
+          + "  ".join(f"{f'retry@{n:.0e}':>11}" for n in users))
+    for name, size in (("alnum", len(ALPHABET)), ("digits", 10)):
+        for length in lengths:
+            space = size ** length
+            # Probabilité qu'un nouvel ID tiré tombe sur l'un des n existants (une relance de generateUserId)
+            retries = "  ".join(f"{min(n / space, 1):>11.2e}" for n in users)
+            print(f"{name:<9} {length:>6} {space:>10.2e} {users_for(0.01, space):>10.3g} "
+                  f"{users_for(0.5, space):>10.3g}  {retries}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate user and product IDs in bulk and measure collision rates")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    generate_parser = commands.add_parser("generate", help="write N new unique IDs, one per line")
+    generate_parser.add_argument("count", type=parse_count, help="number of IDs (e.g. 1e6)")
+    generate_parser.add_argument("--id-format", choices=sorted(RANGES), default="digits",
+                                 help="digits: AdminUsers.jsx, routes/auth.js and routes/products.js "
+                                      "(default), alnum: update_id_generator.py")
+    generate_parser.add_argument("--existing", nargs="+", default=[],
+                                 help="JSON files whose IDs must not be reused (e.g. backend/data/users.json)")
+    generate_parser.add_argument("--output", help="write the IDs here instead of stdout")
+    generate_parser.add_argument("--seed", type=int, help="random seed for reproducible runs")
+    generate_parser.add_argument("--chunk", type=parse_count, default=10 ** 6, help="IDs generated per batch")
+    generate_parser.add_argument("--no-numpy", action="store_true", help="use the pure-Python generator")
+
+    bench_parser = commands.add_parser("bench", help="measure collisions and throughput at growing sizes")
+    bench_parser.add_argument("--sizes", type=parse_count, nargs="+", default=SIZES, help="IDs per run (default: 1e5 to 1e8)")
+    bench_parser.add_argument("--id-format", choices=sorted(RANGES), nargs="+", default=["digits", "alnum"])
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--no-numpy", action="store_true", help="benchmark the pure-Python generator")
+    bench_parser.add_argument("--json", metavar="FILE", help="also write the results as JSON")
+
+    space_parser = commands.add_parser("space", help="collision odds for other ID lengths and user counts")
+    space_parser.add_argument("--users", type=parse_count, nargs="+", default=[10 ** 4, 10 ** 5, 10 ** 6, 10 ** 7])
+    space_parser.add_argument("--lengths", type=int, nargs="+", default=[6, 8, 10, 12])
+    args = parser.parse_args()
+
+    if args.command == "space":
+        print_space(args.users, args.lengths)
+        return
+
+    if args.command == "bench":
+        if not args.no_numpy and np is None:
+            print("NumPy not installed: benchmarking the pure-Python generator", file=sys.stderr)
+        results = bench(args.sizes, args.id_format, args.seed, not args.no_numpy)
+        print_bench(results)
+        if args.json:
+            safe_io.atomic_write(args.json, json.dumps({"python": platform.python_version(), "numpy": np.__version__ if np else None,
+                                                        "results": results}, indent=2))
+        return
+
+    start = time.perf_counter()
+    taken = load_taken(args.existing)
+    existing = taken.size
+    generator = BulkIds(taken, args.id_format, args.seed, not args.no_numpy)
+    if args.count > generator.free():
+        parser.error(f"only {generator.free()} {args.id_format} ID(s) left in the ID space")
+    with safe_io.atomic_open(args.output, "wb") if args.output else open(sys.stdout.fileno(), "wb", closefd=False) as out:
+        for i in range(0, args.count, args.chunk):
+            out.write(generator.lines(min(args.chunk, args.count - i)))
+    elapsed = time.perf_counter() - start
+    print(f"{args.count} {args.id_format} ID(s) in {elapsed:.2f} s ({args.count / elapsed:,.0f}/s, "
+          f"{'numpy' if generator.numpy else 'python'}), {existing} existing, "
+          f"{generator.rejected} colliding candidate(s) rejected", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,247 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import unicodedata
+from array import array
+from bisect import bisect_left, bisect_right
+
+import safe_io
+from safe_io import ROOT
+
+PRODUCTS_FILE = os.path.join(ROOT, "backend", "data", "products.json")
+SHARDS_DIR = os.path.join(ROOT, "public", "catalog")
+
+# Colonnes catégorielles, encodées par dictionnaire (valeur -> petit entier)
+CATEGORICAL = ("category", "subcategory", "brand")
+# Code des produits sans valeur : hors de portée des codes réels (un par valeur distincte)
+MISSING = 0xFFFFFFFF
+# Tris proposés : prix croissant ou décroissant
+SORTS = ("price", "price-desc")
+
+
+def slugify(value):
+    # "Maison & Meuble" -> "maison-meuble", "Électronique" -> "electronique"
+    ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", ascii_value.lower()).strip("-") or "other"
+
+
+def shard_names(categories):
+    # Nom de fichier de chaque catégorie ; si deux catégories donnent le même slug ("Jeux & Jouets",
+    # "Jeux - Jouets"), chacune reçoit un suffixe tiré de son nom exact, stable d'une génération à l'autre
+    slugs = {category: slugify(category) for category in categories}
+    counts = {}
+    for slug in slugs.values():
+        counts[slug] = counts.get(slug, 0) + 1
+    names = {}
+    for category, slug in slugs.items():
+        if counts[slug] > 1:
+            slug += "-" + hashlib.sha1(category.encode("utf-8")).hexdigest()[:8]
+        names[category] = f"category-{slug}.json"
+    return names
+
+
+class Catalog:
+    # Catalogue chargé une fois en colonnes : codes catégoriels, prix, et le reste de chaque
+    # produit gardé en JSON compact, décodé seulement pour les résultats renvoyés
+
+    def __init__(self, products):
+        self.size = len(products)
+        self.ids = [str(p.get("id", "")) for p in products]
+        self.prices = array("d", (float(p.get("price") or 0) for p in products))
+        self.payloads = [json.dumps(p, ensure_ascii=False, separators=(",", ":")) for p in products]
+
+        # Colonnes catégorielles + index secondaires (valeur -> numéros de ligne triés)
+        self.values = {}
+        self.codes = {}
+        self.indexes = {}
+        for column in CATEGORICAL:
+            values = []
+            lookup = {}
+            codes = array("I")
+            index = {}
+            for row, p in enumerate(products):
+                value = p.get(column)
+                if value is None:
+                    codes.append(MISSING)
+                    continue
+                # Les marques sont comparées sans tenir compte de la casse (comme Shop.jsx)
+                key = value.lower() if column == "brand" else value
+                if key not in lookup:
+                    lookup[key] = len(values)
+                    values.append(value)
+                codes.append(lookup[key])
+                index.setdefault(key, array("I")).append(row)
+            self.values[column] = values
+            self.codes[column] = codes
+            self.indexes[column] = index
+
+        # Index trié sur le prix : numéros de ligne par prix croissant, et les prix correspondants
+        self.by_price = array("I", sorted(range(self.size), key=self.prices.__getitem__))
+        self.sorted_prices = array("d", (self.prices[row] for row in self.by_price))
+
+    @classmethod
+    def load(cls, path=PRODUCTS_FILE):
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data["products"] if isinstance(data, dict) else data)
+
+    def value(self, column, row):
+        code = self.codes[column][row]
+        return None if code == MISSING else self.values[column][code]
+
+    def product(self, row):
+        return json.loads(self.payloads[row])
+
+    def _price_rows(self, min_price, max_price):
+        lo = 0 if min_price is None else bisect_left(self.sorted_prices, min_price)
+        hi = self.size if max_price is None else bisect_right(self.sorted_prices, max_price)
+        return self.by_price[lo:hi]
+
+    def select(self, category=None, subcategory=None, brand=None, min_price=None, max_price=None, sort=None):
+        # Numéros de ligne correspondant aux filtres, en partant de l'index le plus sélectif
+        filters = {"category": category, "subcategory": subcategory,
+                   "brand": brand.lower() if brand else None}
+        candidates = []
+        for column, value in filters.items():
+            if value is not None:
+                candidates.append(self.indexes[column].get(value, array("I")))
+        price_filtered = min_price is not None or max_price is not None
+
+        if not candidates:
+            rows = self._price_rows(min_price, max_price) if price_filtered or sort else range(self.size)
+            rows = list(rows)
+            if sort == "price-desc":
+                rows.reverse()
+            return rows
+
+        candidates.sort(key=len)
+        rows = candidates[0]
+        for other in candidates[1:]:
+            keep = set(other)
+            rows = [row for row in rows if row in keep]
+        if price_filtered:
+            lo = float("-inf") if min_price is None else min_price
+            hi = float("inf") if max_price is None else max_price
+            rows = [row for row in rows if lo <= self.prices[row] <= hi]
+        rows = list(rows)
+        if sort in SORTS:
+            rows.sort(key=self.prices.__getitem__, reverse=sort == "price-desc")
+        return rows
+
+    def query(self, page=1, per_page=20, **filters):
+        if page < 1 or per_page < 1:
+            raise ValueError(f"page and per_page must be at least 1 (got page={page}, per_page={per_page})")
+        rows = self.select(**filters)
+        start = (page - 1) * per_page
+        return {
+            "total": len(rows),
+            "page": page,
+            "per_page": per_page,
+            "products": [self.product(row) for row in rows[start:start + per_page]],
+        }
+
+    def facets(self, rows=None):
+        # Nombre de produits par valeur de chaque colonne catégorielle
+        rows = range(self.size) if rows is None else rows
+        counts = {column: {} for column in CATEGORICAL}
+        for row in rows:
+            for column in CATEGORICAL:
+                value = self.value(column, row)
+                if value is not None:
+                    counts[column][value] = counts[column].get(value, 0) + 1
+        return counts
+
+    def build_shards(self, out_dir=SHARDS_DIR):
+        # Un fichier JSON par catégorie + un index, servables tels quels en statique.
+        # Tous les fichiers sont préparés puis renommés en un seul lot : l'index ne pointe jamais vers un
+        # fichier d'une autre génération. Les shards absents du nouvel index sont ensuite supprimés
+        os.makedirs(out_dir, exist_ok=True)
+        index_file = os.path.join(out_dir, "index.json")
+        manifest = {"total": self.size, "categories": {}}
+        names = shard_names(self.indexes["category"])
+        staged = []
+        with safe_io.locked(index_file):
+            try:
+                for category, rows in self.indexes["category"].items():
+                    staged.append(self._stage_shard(out_dir, category, rows, names[category], manifest))
+                staged.append(safe_io.stage(index_file,
+                                            json.dumps(manifest, ensure_ascii=False, separators=(",", ":"))))
+            except BaseException:
+                safe_io.discard(staged)
+                raise
+            safe_io.commit(staged)
+            removed = remove_stale_shards(out_dir, set(names.values()))
+        return manifest, removed
+
+    def _stage_shard(self, out_dir, category, rows, filename, manifest):
+        rows = list(rows)
+        products = ",".join(self.payloads[row] for row in rows)
+        prices = [self.prices[row] for row in rows]
+        facets = self.facets(rows)
+        manifest["categories"][category] = {
+            "file": filename,
+            "count": len(rows),
+            "min_price": min(prices),
+            "max_price": max(prices),
+            "subcategories": facets["subcategory"],
+            "brands": facets["brand"],
+        }
+        return safe_io.stage(os.path.join(out_dir, filename),
+                             f'{{"category":{json.dumps(category, ensure_ascii=False)},"products":[{products}]}}')
+
+
+def remove_stale_shards(out_dir, keep):
+    # Shards d'une génération précédente (catégorie disparue ou renommée), que plus aucun index ne référence
+    removed = []
+    for name in sorted(os.listdir(out_dir)):
+        if name.startswith("category-") and name.endswith(".json") and name not in keep:
+            os.remove(os.path.join(out_dir, name))
+            removed.append(name)
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Indexed queries and static shards for backend/data/products.json")
+    parser.add_argument("--products", default=PRODUCTS_FILE, help="products.json to load")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    q = sub.add_parser("query", help="filtered, paginated lookup")
+    q.add_argument("--category")
+    q.add_argument("--subcategory")
+    q.add_argument("--brand")
+    q.add_argument("--min-price", type=float)
+    q.add_argument("--max-price", type=float)
+    q.add_argument("--sort", choices=SORTS)
+    q.add_argument("--page", type=int, default=1)
+    q.add_argument("--per-page", type=int, default=20)
+
+    s = sub.add_parser("shards", help="write per-category JSON shards")
+    s.add_argument("--out", default=SHARDS_DIR)
+
+    sub.add_parser("facets", help="product counts per category, subcategory and brand")
+    args = parser.parse_args()
+    if args.command == "query" and (args.page < 1 or args.per_page < 1):
+        parser.error("--page and --per-page must be at least 1")
+
+    catalog = Catalog.load(args.products)
+    if args.command == "query":
+        result = catalog.query(
+            page=args.page, per_page=args.per_page, category=args.category, subcategory=args.subcategory,
+            brand=args.brand, min_price=args.min_price, max_price=args.max_price, sort=args.sort,
+        )
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif args.command == "shards":
+        manifest, removed = catalog.build_shards(args.out)
+        for category, info in manifest["categories"].items():
+            print(f"  {info['file']:<40} {info['count']:>6} product(s)  {category}")
+        for name in removed:
+            print(f"  {name:<40} removed (no longer in the index)")
+        print(f"{len(manifest['categories'])} shard(s) written to {args.out}, {len(removed)} stale shard(s) removed")
+    else:
+        print(json.dumps(catalog.facets(), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
 import re
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Remplacer la carte de profil avec un layout horizontal
-old_card_body = r'<Card\.Body className="text-center py-4">.*?</Card\.Body>'
+CARD_BODY = register("change_profile_layout.card_body", r'<Card\.Body className="text-center py-4">.*?</Card\.Body>', re.DOTALL)
 
-new_card_body = '''<Card.Body className="py-3 px-3">
+
+@transform(PROFILE, "Profile card layout changed to horizontal!")
+def change_profile_layout(content):
+    # Remplacer la carte de profil avec un layout horizontal
+    new_card_body = '''<Card.Body className="py-3 px-3">
                             <div className="d-flex align-items-start">
                                 <div className="me-3" style={{ fontSize: '3rem' }}>👤</div>
                                 <div className="flex-grow-1">
@@ -36,10 +38,9 @@ new_card_body = '''<Card.Body className="py-3 px-3">
                             </div>
                         </Card.Body>'''
 
-content = re.sub(old_card_body, new_card_body, content, flags=re.DOTALL)
+    content = CARD_BODY.sub(new_card_body, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Profile card layout changed to horizontal!")
+if __name__ == "__main__":
+    run(["change_profile_layout"])
@@ -0,0 +1,128 @@
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+from codemod import CHAIN, discover, get_transform, glob_paths, read_file
+
+
+def fixpoint(funcs, content, max_iterations):
+    # Appliquer les fonctions jusqu'à stabilité ; renvoie le nombre de passes, ou None si pas de convergence
+    for i in range(1, max_iterations + 1):
+        result = content
+        for func in funcs:
+            result = func(result)
+        if result == content:
+            return i - 1
+        content = result
+    return None
+
+
+def check_content(names, content, max_iterations):
+    funcs = {name: get_transform(name) for name in names}
+    once = {name: func(content) for name, func in funcs.items()}
+
+    report = {"not_idempotent": {}, "not_commuting": [], "chain_passes": None}
+    for name, func in funcs.items():
+        # Idempotence : t(t(x)) == t(x) ; sinon, combien de passes avant le point fixe
+        if func(once[name]) != once[name]:
+            report["not_idempotent"][name] = fixpoint([func], once[name], max_iterations)
+
+    # Deux transformations sans effet sur ce fichier commutent forcément : on ne teste que les autres
+    active = [name for name in names if once[name] != content]
+    for a, b in itertools.combinations(active, 2):
+        if funcs[a](once[b]) != funcs[b](once[a]):
+            report["not_commuting"].append((a, b))
+
+    report["chain_passes"] = fixpoint(list(funcs.values()), content, max_iterations)
+    return report
+
+
+def not_idempotent(names, inputs):
+    # {nom: [libellés]} des transformations pour lesquelles t(t(x)) != t(x) sur l'une des entrées {libellé: contenu}
+    found = {}
+    for name in names:
+        func = get_transform(name)
+        for label, content in inputs.items():
+            once = func(content)
+            if func(once) != once:
+                found.setdefault(name, []).append(label)
+    return found
+
+
+def _check_file(names, label, max_iterations, content=None):
+    try:
+        if content is None:
+            content = read_file(label)
+        return label, check_content(names, content, max_iterations), None
+    except Exception as e:
+        return label, None, f"{type(e).__name__}: {e}"
+
+
+def synthetic_inputs():
+    # Pages synthétiques contenant l'ancienne carte de profil, pour que les scripts aient de quoi agir
+    from bench_codemods import SHAPES, page_fragment, synthetic_file
+
+    return {f"<synthetic:{shape}>": synthetic_file(page_fragment(path), 200, 1) for shape, path in SHAPES.items()}
+
+
+def check(names, pattern, max_iterations, workers=None, synthetic=False):
+    inputs = {path: None for path in glob_paths(pattern)}
+    if synthetic:
+        inputs.update(synthetic_inputs())
+
+    summary = {"files": len(inputs), "not_idempotent": {}, "not_commuting": {}, "chain_unstable": [], "errors": {}}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(_check_file, names, label, max_iterations, content)
+            for label, content in inputs.items()
+        ]
+        for future in futures:
+            label, report, error = future.result()
+            if error:
+                summary["errors"][label] = error
+                continue
+            for name, passes in report["not_idempotent"].items():
+                summary["not_idempotent"].setdefault(name, {})[label] = passes
+            for pair in report["not_commuting"]:
+                summary["not_commuting"].setdefault(pair, []).append(label)
+            if report["chain_passes"] is None or report["chain_passes"] > 1:
+                summary["chain_unstable"].append((label, report["chain_passes"]))
+    return summary
+
+
+def print_summary(summary, max_iterations):
+    for name, files in sorted(summary["not_idempotent"].items()):
+        print(f"not idempotent   {name}")
+        for label, passes in files.items():
+            state = f"stable after {passes + 1} runs" if passes is not None else f"no fixpoint in {max_iterations} runs"
+            print(f"    {label}: {state}")
+    for (a, b), files in sorted(summary["not_commuting"].items()):
+        print(f"not commuting    {a} / {b}: {', '.join(files)}")
+    for label, passes in summary["chain_unstable"]:
+        state = f"{passes} passes" if passes is not None else f"no fixpoint in {max_iterations} passes"
+        print(f"chain unstable   {label}: {state}")
+    for label, error in summary["errors"].items():
+        print(f"error            {label}: {error}")
+    print(f"{summary['files']} file(s): {len(summary['not_idempotent'])} non-idempotent transform(s), "
+          f"{len(summary['not_commuting'])} non-commuting pair(s), {len(summary['chain_unstable'])} unstable file(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check codemod transforms for idempotency and commutativity")
+    parser.add_argument("names", nargs="*", help="transforms to check, in chain order (default: the usual chain)")
+    parser.add_argument("--all", action="store_true", help="check every registered transform")
+    parser.add_argument("--glob", dest="pattern", default="src/**/*.jsx", help="files to check")
+    parser.add_argument("--max-iterations", type=int, default=5, help="bound on fixpoint iterations")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--synthetic", action="store_true", help="also check synthetic pages with the legacy profile card")
+    args = parser.parse_args()
+
+    names = discover() if args.all else (args.names or CHAIN)
+    summary = check(names, args.pattern, args.max_iterations, args.workers, args.synthetic)
+    print_summary(summary, args.max_iterations)
+    if summary["not_idempotent"] or summary["chain_unstable"] or summary["errors"]:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,22 @@
 import re
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Supprimer tous les caractères littéraux `r`n
-content = content.replace("`r`n", "")
+DUPLICATED_ID = register("clean_profile.duplicated_id", r'(<Card\.Body className="p-3">)(.*?)(<div className="mb-2">\s*<small className="text-muted d-block">Email</small>)', re.DOTALL)
 
-# Pattern pour trouver la section Card.Body et nettoyer les duplications
-pattern = r'(<Card\.Body className="p-3">)(.*?)(<div className="mb-2">.*?<small className="text-muted d-block">Email</small>)'
-replacement = r'\1\n                                    <div className="mb-2">\n                                        <small className="text-muted d-block">ID Compte</small>\n                                        <strong className="small" style={{ fontFamily: \'monospace\', color: \'#ff6000\' }}>\n                                            {user.id || \'N/A\'}\n                                        </strong>\n                                    </div>\n                                    \3'
 
-content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+@transform(PROFILE, "File cleaned successfully!", version=2)
+def clean_profile(content):
+    # Supprimer tous les caractères littéraux `r`n
+    content = content.replace("`r`n", "")
 
-# Écrire le fichier nettoyé
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+    # Pattern pour trouver la section Card.Body et nettoyer les duplications
+    replacement = r'\1\n                                    <div className="mb-2">\n                                        <small className="text-muted d-block">ID Compte</small>\n                                        <strong className="small" style={{ fontFamily: \'monospace\', color: \'#ff6000\' }}>\n                                            {user.id || \'N/A\'}\n                                        </strong>\n                                    </div>\n                                    \3'
 
-print("File cleaned successfully!")
+    content = DUPLICATED_ID.sub(replacement, content)
+    return content
+
+
+if __name__ == "__main__":
+    run(["clean_profile"])
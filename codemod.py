@@ -0,0 +1,402 @@
+import argparse
+import cProfile
+import difflib
+import glob
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import patterns
+import safe_io
+from profiling import Timings
+from safe_io import ROOT
+
+# Fichiers modifiés par les scripts de correction
+PROFILE = os.path.join("src", "pages", "Profile.jsx")
+PROFILE_LAYOUT = os.path.join("src", "components", "ProfileLayout.jsx")
+WALLET = os.path.join("src", "pages", "Wallet.jsx")
+AUTH_CONTEXT = os.path.join("src", "context", "AuthContext.jsx")
+APP = os.path.join("src", "App.jsx")
+
+# Cache persistant : (hash du contenu, transformation/version) -> hash du résultat
+CACHE_FILE = os.path.join(ROOT, ".codemod_cache.json")
+
+# Chaîne habituelle appliquée sur Profile.jsx
+CHAIN = [
+    "add_emojis",
+    "add_id_to_header",
+    "add_standard_badge",
+    "add_balance_display",
+    "improve_profile_card",
+    "fix_quotes",
+    "fix_all_quotes",
+    "final_fix",
+    "shorten_id",
+    "fix_extra_brace",
+]
+
+# Transformations enregistrées : nom du script -> fonction(content) -> content
+TRANSFORMS = {}
+
+
+def transform(target, message, version=1):
+    # Enregistrer une fonction comme transformation d'un fichier cible
+    # La version inclut un hash du code source : modifier le script invalide le cache
+    def decorator(func):
+        source = inspect.getsource(func).encode("utf-8")
+        func.target = target
+        func.message = message
+        func.version = f"{version}-{hashlib.sha256(source).hexdigest()[:12]}"
+        TRANSFORMS[func.__name__] = func
+        return func
+    return decorator
+
+
+def get_transform(name):
+    # Importer le script correspondant si la transformation n'est pas encore connue
+    if name not in TRANSFORMS:
+        func = getattr(importlib.import_module(name), name, None)
+        if not hasattr(func, "target"):
+            raise KeyError(f"Unknown transform: {name}")
+        TRANSFORMS[name] = func
+    return TRANSFORMS[name]
+
+
+def discover():
+    # Noms de tous les scripts de la racine qui déclarent une transformation
+    names = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "*.py"))):
+        with open(path, "r", encoding="utf-8") as f:
+            if "\n@transform(" in f.read():
+                names.append(os.path.splitext(os.path.basename(path))[0])
+    return names
+
+
+def read_file(path):
+    with open(os.path.join(ROOT, path), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+def stage_file(path, content):
+    # Écrire le nouveau contenu (fsync compris) dans un fichier temporaire à côté de la cible
+    return safe_io.stage(os.path.join(ROOT, path), content)[1]
+
+
+def commit_files(staged, expected=None):
+    # Renommer tous les temporaires sous verrou, en un seul lot.
+    # expected : {chemin: hash lu} ; un fichier modifié entre-temps par un autre processus lève ConflictError
+    safe_io.commit(
+        [(os.path.join(ROOT, path), tmp) for path, tmp in staged],
+        {os.path.join(ROOT, path): digest for path, digest in expected.items()} if expected else None,
+    )
+
+
+def discard_files(staged):
+    safe_io.discard(staged)
+
+
+def write_file(path, content, expected=None):
+    # expected : hash des octets lus (safe_io.read_text) ; ConflictError si le fichier a changé depuis
+    commit_files([(path, stage_file(path, content))], {path: expected} if expected else None)
+
+
+def content_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_cache():
+    if not os.path.exists(CACHE_FILE):
+        return {}
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Cache illisible : on repart de zéro
+        return {}
+
+
+def save_cache(cache):
+    # Fusion avec le cache sur disque sous verrou : deux exécutions parallèles gardent leurs entrées
+    with safe_io.locked(CACHE_FILE):
+        merged = load_cache()
+        merged.update(cache)
+        safe_io.atomic_write(CACHE_FILE, json.dumps(merged, separators=(",", ":")))
+
+
+def apply_transforms(funcs, content, cache=None, new_entries=None, timings=None, path=None):
+    # Appliquer les transformations en sautant celles déjà connues comme sans effet
+    current = content_hash(content) if cache is not None else None
+    for func in funcs:
+        if cache is not None:
+            key = f"{current}:{func.__name__}:{func.version}"
+            if cache.get(key) == current:
+                if timings is not None:
+                    timings.skipped(path, func.__name__)
+                continue
+        if timings is not None:
+            content = timings.call(path, func, content)
+        else:
+            content = func(content)
+        if cache is not None:
+            current = content_hash(content)
+            cache[key] = current
+            if new_entries is not None:
+                new_entries[key] = current
+    return content
+
+
+def _read(path, timings):
+    # (contenu, hash des octets lus), le hash sert à détecter une écriture concurrente au moment du commit
+    start = time.perf_counter()
+    content, digest = safe_io.read_text(os.path.join(ROOT, path))
+    if timings is not None:
+        timings.read(path, content, time.perf_counter() - start)
+    return content, digest
+
+
+def _stage(path, content, timings):
+    if timings is None:
+        return stage_file(path, content)
+    start = time.perf_counter()
+    tmp = stage_file(path, content)
+    timings.wrote(path, content, time.perf_counter() - start)
+    return tmp
+
+
+def glob_paths(pattern):
+    return sorted(
+        os.path.relpath(p, ROOT)
+        for p in glob.glob(os.path.join(ROOT, pattern), recursive=True)
+    )
+
+
+def plan(names, pattern=None):
+    # Couples (fichier, transformations) : tous les fichiers du glob, sinon la cible de chaque script
+    funcs = [get_transform(name) for name in names]
+    if pattern:
+        return [(path, funcs) for path in glob_paths(pattern)]
+
+    # Regrouper les transformations par fichier en gardant l'ordre demandé
+    by_target = {}
+    for func in funcs:
+        by_target.setdefault(func.target, []).append(func)
+    return list(by_target.items())
+
+
+def diff_hunks(path, original, content):
+    # Diff unifié d'un fichier, produit un hunk à la fois (l'en-tête accompagne le premier)
+    name = path.replace(os.sep, "/")
+    header = []
+    hunk = []
+    for line in difflib.unified_diff(
+        original.splitlines(keepends=True), content.splitlines(keepends=True), f"a/{name}", f"b/{name}"
+    ):
+        if not line.endswith("\n"):
+            line += "\n\\ No newline at end of file\n"
+        if line.startswith("@@") and hunk:
+            yield path, "".join(header + hunk)
+            header = []
+            hunk = []
+        if line.startswith(("---", "+++")) and not hunk:
+            header.append(line)
+        else:
+            hunk.append(line)
+    if hunk:
+        yield path, "".join(header + hunk)
+
+
+def dry_run(names, pattern=None, use_cache=True):
+    # Générateur de diffs : un seul fichier modifié en mémoire à la fois, rien n'est écrit
+    cache = load_cache() if use_cache else None
+    for path, funcs in plan(names, pattern):
+        original = read_file(path)
+        content = apply_transforms(funcs, original, cache)
+        if content != original:
+            yield from diff_hunks(path, original, content)
+    if cache is not None:
+        save_cache(cache)
+
+
+def apply(names, pattern=None, use_cache=True, timings=None):
+    # Étape 1 : chaque fichier modifié est écrit dans un temporaire (un fichier en mémoire à la fois)
+    # Étape 2 : tous les temporaires sont renommés ; en cas d'erreur aucune source n'est touchée
+    cache = load_cache() if use_cache else None
+    staged = []
+    expected = {}
+    try:
+        for path, funcs in plan(names, pattern):
+            original, expected[path] = _read(path, timings)
+            content = apply_transforms(funcs, original, cache, timings=timings, path=path)
+            # Écrire seulement si les octets changent, pour ne pas déclencher le HMR de Vite
+            if content != original:
+                staged.append((path, _stage(path, content, timings)))
+    except BaseException:
+        discard_files(staged)
+        raise
+    commit_files(staged, expected)
+    if cache is not None:
+        save_cache(cache)
+    return [path for path, _ in staged]
+
+
+def run(names, use_cache=True, timings=None):
+    # Lire chaque fichier une seule fois, tout appliquer en mémoire, écrire au plus une fois
+    # puis afficher une ligne de mesures par script
+    timings = Timings() if timings is None else timings
+    changed = apply(names, use_cache=use_cache, timings=timings)
+    for line in timings.summary():
+        print(line)
+    return changed
+
+
+# Cache chargé une fois par processus du pool
+_worker_cache = None
+
+
+def _init_worker(use_cache):
+    global _worker_cache
+    _worker_cache = load_cache() if use_cache else None
+
+
+def _apply_file(names, path):
+    # Exécuté dans un processus du pool : un résultat par fichier, jamais d'exception
+    new_entries = {}
+    timings = Timings()
+    patterns.reset()
+    try:
+        original, digest = _read(path, timings)
+        funcs = [get_transform(name) for name in names]
+        content = apply_transforms(funcs, original, _worker_cache, new_entries, timings, path)
+        tmp = _stage(path, content, timings) if content != original else None
+        return {"path": path, "staged": tmp, "hash": digest, "error": None, "cache": new_entries,
+                "patterns": patterns.stats(), "timings": timings.to_dict()}
+    except Exception as e:
+        return {"path": path, "staged": None, "error": f"{type(e).__name__}: {e}", "cache": new_entries,
+                "patterns": patterns.stats(), "timings": timings.to_dict()}
+
+
+def run_glob(names, pattern, workers=None, use_cache=True, timings=None):
+    # Appliquer les mêmes transformations à tous les fichiers du glob, répartis sur un pool
+    return run_files(names, glob_paths(pattern), workers, use_cache, timings)
+
+
+def run_files(names, paths, workers=None, use_cache=True, timings=None):
+    # Les processus préparent des fichiers temporaires ; tout est renommé à la fin s'il n'y a aucune erreur
+    for name in names:
+        get_transform(name)
+
+    report = {"files": len(paths), "changed": [], "unchanged": [], "errors": {}, "patterns": {}}
+    if not paths:
+        return report
+
+    cache = load_cache() if use_cache else None
+    staged = []
+    expected = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(use_cache,)) as pool:
+        results = pool.map(_apply_file, [names] * len(paths), paths, chunksize=max(1, len(paths) // 64))
+        for result in results:
+            if cache is not None:
+                cache.update(result["cache"])
+            patterns.merge_stats(report["patterns"], result["patterns"])
+            if timings is not None:
+                timings.merge(result["timings"])
+            if result["error"]:
+                report["errors"][result["path"]] = result["error"]
+            elif result["staged"]:
+                staged.append((result["path"], result["staged"]))
+                expected[result["path"]] = result["hash"]
+                report["changed"].append(result["path"])
+            else:
+                report["unchanged"].append(result["path"])
+
+    if not report["errors"]:
+        try:
+            commit_files(staged, expected)
+            staged = []
+        except safe_io.ConflictError as e:
+            report["errors"]["(commit)"] = str(e)
+    if report["errors"]:
+        discard_files(staged)
+        report["unchanged"] += report["changed"]
+        report["changed"] = []
+    if cache is not None:
+        save_cache(cache)
+    return report
+
+
+def print_report(report):
+    for path in report["changed"]:
+        print(f"  changed  {path}")
+    for path, error in report["errors"].items():
+        print(f"  error    {path}: {error}")
+    print(f"{report['files']} file(s): {len(report['changed'])} changed, "
+          f"{len(report['unchanged'])} unchanged, {len(report['errors'])} error(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply codemod scripts in a single pass per file")
+    parser.add_argument("names", nargs="*", help="transforms to apply, in order (default: the usual chain)")
+    parser.add_argument("--glob", dest="pattern", help="apply the transforms to every file matching this glob, e.g. 'src/pages/**/*.jsx'")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes for --glob")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the no-op cache")
+    parser.add_argument("--stats", action="store_true", help="print per-pattern match counts and timings")
+    parser.add_argument("--dry-run", action="store_true", help="print unified diffs instead of writing files")
+    parser.add_argument("--profile", metavar="FILE", help="write a cProfile dump (parent process only)")
+    parser.add_argument("--flamegraph", metavar="FILE", help="write per-transform timings as collapsed stacks")
+    args = parser.parse_args()
+
+    profiler = cProfile.Profile() if args.profile else None
+    if profiler:
+        profiler.enable()
+    try:
+        _main(parser, args)
+    finally:
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile)
+
+
+def _main(parser, args):
+    if args.dry_run:
+        names = args.names or CHAIN
+        hunks = 0
+        for _, hunk in dry_run(names, args.pattern, use_cache=not args.no_cache):
+            sys.stdout.write(hunk)
+            hunks += 1
+        print(f"{hunks} hunk(s), nothing written", file=sys.stderr)
+        return
+
+    timings = Timings()
+    failed = False
+    if args.pattern:
+        if not args.names:
+            parser.error("--glob needs at least one transform name")
+        report = run_glob(args.names, args.pattern, args.workers, use_cache=not args.no_cache, timings=timings)
+        for line in timings.summary(group_files=True):
+            print(line)
+        print_report(report)
+        stats = report["patterns"]
+        failed = bool(report["errors"])
+    else:
+        try:
+            changed = run(args.names or CHAIN, use_cache=not args.no_cache, timings=timings)
+        except safe_io.ConflictError as e:
+            raise SystemExit(f"error: {e}, nothing written")
+        print(f"{len(changed)} file(s) written")
+        stats = None
+
+    if args.stats:
+        patterns.print_stats(stats)
+    if args.flamegraph:
+        safe_io.atomic_write(args.flamegraph, "\n".join(timings.collapsed_stacks()) + "\n")
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,828 @@
+import argparse
+import json
+import os
+import re
+import sys
+from difflib import SequenceMatcher
+
+from codemod import ROOT, commit_files, diff_hunks, discard_files, stage_file
+from find_duplicates import (
+    K, MIN_TOKENS, SOURCE_DIR, STRING, THRESHOLD, TOKEN, WINDOW, find_clusters, find_sources, load_sources,
+)
+from jsx_index import JSXIndex
+from remove_unused_imports import IMPORT, build_import, parse_clause, prune_imports, used_names
+
+COMPONENT_DIR = os.path.join("src", "components")
+
+ATTR_NAME = re.compile(r"[\w$:.-]+")
+IDENTIFIER = re.compile(r"[A-Za-z_$][\w$]*")
+TEMPLATE_EXPR = re.compile(r"\$\{([^}]*)\}")
+NUMBER = re.compile(r"\d[\w.]*")
+# Fonctions de traduction (extract_strings.py) : leurs clés restent littérales aux sites d'appel
+LOOKUPS = ("t", "translate")
+# const { t } = useLanguage() : le composant extrait appelle le même hook plutôt que de recevoir t en prop
+HOOK_CALL = re.compile(r"\bconst\s*\{([^}]*)\}\s*=\s*(use[A-Z][\w$]*)\(\s*\)")
+
+# Noms liés : déclarations, déstructurations et paramètres de fonctions fléchées
+DECLARED = re.compile(r"\b(?:const|let|var|function)\s+([A-Za-z_$][\w$]*)")
+DESTRUCTURED = re.compile(r"\b(?:const|let|var)\s*[{\[]([^}\]]*)[}\]]")
+PARAMS = re.compile(r"\(([^()]*)\)\s*=>|\bfunction\s*[\w$]*\s*\(([^()]*)\)")
+SINGLE_PARAM = re.compile(r"([A-Za-z_$][\w$]*)\s*=>")
+# Nom d'une prop déduit du contexte : clé d'objet (background: '...') ou attribut (className="...")
+KEY_BEFORE = re.compile(r"([A-Za-z_$][\w$]*)\s*:\s*$")
+ATTR_BEFORE = re.compile(r"([\w$-]+)\s*=\s*$")
+# Props interprétées par React
+RESERVED = {"key": "itemKey", "ref": "itemRef"}
+
+
+class ExtractError(Exception):
+    pass
+
+
+def skip_braces(content, i, jumps):
+    # Position après l'accolade fermante correspondant à content[i] == "{"
+    # (chaînes, commentaires /* */ et // et éléments JSX imbriqués sautés)
+    depth = 0
+    quote = None
+    n = len(content)
+    start = i
+    while i < n:
+        c = content[i]
+        if quote:
+            if c == "\\":
+                i += 1
+            elif c == quote:
+                quote = None
+        elif i != start and i in jumps:
+            i = jumps[i]
+            continue
+        elif content.startswith("/*", i):
+            i = content.find("*/", i + 2)
+            i = n if i == -1 else i + 2
+            continue
+        elif content.startswith("//", i) and content[i - 1] != ":":
+            # Commentaire de fin de ligne (pas une URL http://) : ses apostrophes n'ouvrent pas de chaîne
+            i = content.find("\n", i)
+            i = n if i == -1 else i
+            continue
+        elif c in "\"'`":
+            quote = c
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        i += 1
+    return n
+
+
+def jsx_regions(source, root):
+    # Conteneurs {...}, textes JSX et attributs de l'élément et de tous ses descendants
+    content = source.content
+    elements = [e for e in source.index.elements if e.end is not None and root.start <= e.start and e.end <= root.end]
+    jumps = {e.start: e.end for e in elements}
+    containers = []
+    texts = []
+    attributes = []
+    for e in elements:
+        i = content.find(e.tag, e.start) + len(e.tag)
+        end = e.open_end - (2 if content[e.open_end - 2] == "/" else 1)
+        while i < end:
+            c = content[i]
+            if c.isspace():
+                i += 1
+                continue
+            if c == "{":
+                close = skip_braces(content, i, jumps)
+                containers.append((i, close))
+                attributes.append(("...", i, close, False))
+                i = close
+                continue
+            m = ATTR_NAME.match(content, i)
+            if not m:
+                i += 1
+                continue
+            j = m.end()
+            while j < end and content[j].isspace():
+                j += 1
+            if j < end and content[j] == "=":
+                j += 1
+                while j < end and content[j].isspace():
+                    j += 1
+                if content[j] in "\"'":
+                    close = content.find(content[j], j + 1) + 1
+                else:
+                    close = skip_braces(content, j, jumps)
+                    containers.append((j, close))
+                attributes.append((m.group(), i, close, False))
+                i = close
+            else:
+                attributes.append((m.group(), i, m.end(), False))
+                i = m.end()
+        # Zone d'attributs complète (pour un attribut absent de cette copie)
+        attributes.append(("", content.find(e.tag, e.start) + len(e.tag), end, True))
+        if e.self_closing:
+            continue
+
+        i = e.open_end
+        run = None
+        while i < e.close_start:
+            if i in jumps:
+                if run is not None and content[run:i].strip():
+                    texts.append((run, i))
+                run = None
+                i = jumps[i]
+                continue
+            if content[i] == "{":
+                if run is not None and content[run:i].strip():
+                    texts.append((run, i))
+                run = None
+                close = skip_braces(content, i, jumps)
+                containers.append((i, close))
+                i = close
+                continue
+            if run is None:
+                run = i
+            i += 1
+        if run is not None and content[run:e.close_start].strip():
+            texts.append((run, e.close_start))
+    return {"containers": containers, "texts": texts, "attributes": attributes}
+
+
+class Copy:
+    # Une occurrence du groupe : jetons de l'élément et régions JSX
+
+    def __init__(self, source, element):
+        self.source = source
+        self.element = element
+        self.ts, self.te = source.token_range(element.start, element.end)
+        self.texts = source.texts[self.ts:self.te]
+        self.regions = jsx_regions(source, element)
+        self.elements = [e for e in source.index.elements
+                         if e.end is not None and element.start <= e.start and e.end <= element.end]
+        self.jumps = {e.start: e.end for e in self.elements}
+        # Noms liés dans l'élément (paramètres de .map(), variables locales de callbacks)
+        self.bound = bound_names(source.content[element.start:element.end])
+
+    def start(self, t):
+        return self.source.starts[self.ts + t]
+
+    def end(self, t):
+        return self.source.ends[self.ts + t]
+
+    def tokens_in(self, cs, ce):
+        # Indices (relatifs) des jetons compris dans [cs, ce)
+        first = next((t for t in range(len(self.texts)) if self.start(t) >= cs), len(self.texts))
+        last = first
+        while last < len(self.texts) and self.end(last) <= ce:
+            last += 1
+        return first, last
+
+
+def differing_ranges(base, copy):
+    # Correspondance jeton de la base -> jeton de la copie, et plages de la base qui diffèrent
+    mapping = [-1] * len(base.texts)
+    ranges = []
+    for op, i1, i2, j1, j2 in SequenceMatcher(None, base.texts, copy.texts, autojunk=False).get_opcodes():
+        if op == "equal":
+            for d in range(i2 - i1):
+                mapping[i1 + d] = j1 + d
+        else:
+            ranges.append((i1, i2))
+    return mapping, ranges
+
+
+def merge_ranges(ranges):
+    merged = []
+    for i, j in sorted(ranges):
+        if merged and i <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], j))
+        else:
+            merged.append((i, j))
+    return merged
+
+
+def closing_brace(text, i):
+    # Fin de l'accolade ouverte en text[i] ; None si elle n'est pas refermée
+    close = skip_braces(text + " ", i, {})
+    return close if close <= len(text) else None
+
+
+def balanced(text):
+    # Parenthèses, crochets et accolades équilibrés (chaînes et gabarits comptent pour un jeton)
+    depth = 0
+    for m in TOKEN.finditer(text):
+        c = m.group()
+        if c in "([{":
+            depth += 1
+        elif c in ")]}":
+            depth -= 1
+            if depth < 0:
+                return False
+    return depth == 0
+
+
+def parse_attributes(text):
+    # 'a="x" b={y} c {...d}' -> [("a", '"x"'), ("b", "{y}"), ("c", None), ("...", "{...d}")] ;
+    # None si text n'est pas une suite d'attributs JSX
+    found = []
+    i = 0
+    n = len(text)
+    while i < n:
+        if text[i].isspace():
+            i += 1
+            continue
+        if text[i] == "{":
+            close = closing_brace(text, i)
+            if close is None or not text[i + 1:close - 1].strip().startswith("..."):
+                return None
+            found.append(("...", text[i:close]))
+            i = close
+            continue
+        m = ATTR_NAME.match(text, i)
+        if not m:
+            return None
+        j = m.end()
+        while j < n and text[j].isspace():
+            j += 1
+        if j >= n or text[j] != "=":
+            found.append((m.group(), None))
+            i = m.end()
+            continue
+        j += 1
+        while j < n and text[j].isspace():
+            j += 1
+        if j < n and text[j] in "\"'":
+            close = text.find(text[j], j + 1) + 1
+        elif j < n and text[j] == "{":
+            close = closing_brace(text, j)
+        else:
+            close = None
+        if not close:
+            return None
+        found.append((m.group(), text[j:close]))
+        i = close
+    return found
+
+
+def balanced_children(text):
+    # Suite d'enfants JSX complète : éléments fermés, conteneurs {...} refermés, pas d'accolade orpheline
+    wrapped = "<div>" + text + "</div>"
+    index = JSXIndex(wrapped)
+    if index.problems() or not index.elements or index.elements[0].end != len(wrapped):
+        return False
+    root = index.elements[0]
+    jumps = {e.start: e.end for e in index.elements[1:] if e.end is not None}
+    i = root.open_end
+    while i < root.close_start:
+        if i in jumps:
+            i = jumps[i]
+        elif wrapped[i] == "{":
+            close = skip_braces(wrapped, i, jumps)
+            if close > root.close_start:
+                return False
+            i = close
+        elif wrapped[i] == "}":
+            return False
+        else:
+            i += 1
+    return True
+
+
+def child_nodes(content, e, jumps):
+    # Enfants directs de e : éléments, conteneurs {...} et textes non vides, [(début, fin)]
+    nodes = []
+    run = None
+    i = e.open_end
+    while i < e.close_start:
+        if i in jumps or content[i] == "{":
+            if run is not None and content[run:i].strip():
+                nodes.append((run, i))
+            run = None
+            end = jumps[i] if i in jumps else skip_braces(content, i, jumps)
+            nodes.append((i, end))
+            i = end
+            continue
+        if run is None:
+            run = i
+        i += 1
+    if run is not None and content[run:e.close_start].strip():
+        nodes.append((run, e.close_start))
+    return nodes
+
+
+def candidates(base, i, j):
+    # Plages paramétrables qui couvrent la différence [i, j), de la plus étroite à la plus large :
+    # (nature, début, fin, nom de prop par défaut)
+    texts = base.texts
+    if j > i:
+        cs, ce = base.start(i), base.end(j - 1)
+    else:
+        cs = ce = base.end(i - 1)
+    regions = base.regions
+    # t('clé') : l'appel entier devient la prop, la clé reste littérale au site d'appel (extract_strings la voit)
+    if j - i == 1 and STRING.fullmatch(texts[i]) and i >= 2 and texts[i - 2] in LOOKUPS \
+            and texts[i - 1] == "(" and j < len(texts) and texts[j] == ")":
+        yield "expression", i - 2, j + 1, "label"
+    if j - i == 1 and STRING.fullmatch(texts[i]):
+        yield "string", i, j, None
+    if j - i == 1 and NUMBER.fullmatch(texts[i]):
+        yield "expression", i, j, None
+    for s, e in regions["texts"]:
+        if s <= cs and ce <= e:
+            first, last = base.tokens_in(s, e)
+            yield "text", min(first, i), max(last, j), "text"
+    # Conteneurs {...} autour de la différence, du plus proche au plus large
+    around = sorted(((s, e) for s, e in regions["containers"] if s < cs and ce < e), key=lambda c: c[1] - c[0])
+    for s, e in around:
+        first, last = base.tokens_in(s, e)
+        yield "container", min(first + 1, i), max(last - 1, j), None
+    # Attribut unique, puis suite d'attributs de la même balise
+    for _, area_start, area_end, area in regions["attributes"]:
+        if not area or not (area_start <= cs and ce <= area_end):
+            continue
+        touched = [(s, e) for name, s, e, whole in regions["attributes"]
+                   if not whole and area_start <= s and e <= area_end and s < ce and cs < e]
+        if len(touched) == 1:
+            first, last = base.tokens_in(*touched[0])
+            yield "attribute", min(first, i), max(last, j), None
+        elif not touched and j == i:
+            yield "attribute", i, j, None
+        if touched:
+            first, _ = base.tokens_in(min(s for s, _ in touched), area_end)
+            _, last = base.tokens_in(area_start, max(e for _, e in touched))
+            yield "attributes", min(first, i), max(last, j), "props"
+        else:
+            yield "attributes", i, j, "props"
+    # Enfants de l'élément le plus proche, puis de ses ancêtres
+    content = base.source.content
+    holders = sorted((e for e in base.elements if not e.self_closing and e.open_end <= cs and ce <= e.close_start),
+                     key=lambda e: -e.start)
+    for e in holders:
+        nodes = [(s, end) for s, end in child_nodes(content, e, base.jumps) if s < ce and cs < end or s < cs < end]
+        if nodes:
+            first, last = base.tokens_in(nodes[0][0], nodes[-1][1])
+            yield "children", min(first, i), max(last, j), "content"
+        elif j == i:
+            yield "children", i, j, "content"
+
+
+def copy_value(base, copy, mapping, i, j):
+    # (texte, position) de la copie qui correspond à la plage [i, j) de la base ; None si les bords ne s'alignent pas
+    if i < 1 or j >= len(base.texts) or mapping[i - 1] == -1 or mapping[j] == -1:
+        return None
+    cs = copy.end(mapping[i - 1])
+    return copy.source.content[cs:copy.start(mapping[j])], cs
+
+
+def fits(copy, kind, text, cs):
+    # La valeur d'une copie a-t-elle la forme attendue par la nature de la plage ?
+    core = text.strip()
+    content = copy.source.content
+    if kind == "string":
+        return bool(STRING.fullmatch(core))
+    if kind == "text":
+        return bool(core) and not any(c in core for c in "<>{}")
+    if kind == "expression":
+        ok = bool(core) and balanced(core)
+    elif kind == "container":
+        ok = content[cs - 1] == "{" and skip_braces(content, cs - 1, {}) == cs + len(text) + 1
+    elif kind == "attribute":
+        attrs = parse_attributes(core)
+        ok = not core or (attrs is not None and len(attrs) == 1 and attrs[0][0] != "...")
+    elif kind == "attributes":
+        ok = parse_attributes(core) is not None
+    else:
+        ok = balanced_children(text)
+    # Une variable liée dans l'élément (paramètre de .map()...) n'existe pas au site d'appel
+    return bool(ok) and not ((used_identifiers(core, []) - bound_names(core)) & copy.bound)
+
+
+def attribute_names(row):
+    return {parse_attributes(v.strip())[0][0] for v in row if v.strip()}
+
+
+def find_slots(base, copies):
+    # Plages qui diffèrent, élargies jusqu'à ce que toutes les copies y aient une valeur de la bonne forme :
+    # ([(nature, début, fin, nom par défaut)], [[valeur de chaque copie, base comprise]])
+    identity = list(range(len(base.texts)))
+    mappings = [identity]
+    ranges = []
+    for copy in copies:
+        mapping, diff = differing_ranges(base, copy)
+        mappings.append(mapping)
+        ranges += diff
+    everyone = [base] + copies
+    slots = merge_ranges(ranges)
+    while True:
+        chosen = []
+        for i, j in slots:
+            for kind, ci, cj, hint in candidates(base, i, j):
+                found = [copy_value(base, copy, mapping, ci, cj) for copy, mapping in zip(everyone, mappings)]
+                if any(v is None for v in found) or not all(fits(c, kind, *v) for c, v in zip(everyone, found)):
+                    continue
+                row = [text for text, _ in found]
+                if kind == "attribute" and len(attribute_names(row)) != 1:
+                    continue
+                chosen.append(((kind, ci, cj, hint), row))
+                break
+            else:
+                cs = base.start(i) if j > i else base.end(i - 1)
+                raise ExtractError(f"the copies differ in structure near {base.source.path}:{base.source.line_of(cs)}")
+        widened = [(slot[1], slot[2]) for slot, _ in chosen]
+        if merge_ranges(widened) == widened:
+            return [slot for slot, _ in chosen], [row for _, row in chosen]
+        slots = merge_ranges(widened)
+
+
+def choose_copies(copies):
+    # Base : la copie qui s'aligne avec le plus d'autres ; une copie qui ne s'aligne pas avec le groupe reste en place
+    def aligns(base, group):
+        try:
+            find_slots(base, group)
+        except ExtractError:
+            return False
+        return True
+
+    best = None
+    for base in copies:
+        others = [c for c in copies if c is not base and aligns(base, [c])]
+        if best is None or len(others) > len(best[1]):
+            best = base, others
+    base, others = best
+    group = []
+    for copy in others:
+        if aligns(base, group + [copy]):
+            group.append(copy)
+    if not group:
+        # Aucune paire ne s'aligne : l'erreur de la première paire explique pourquoi
+        find_slots(copies[0], copies[1:2])
+    return base, group, [c for c in copies if c is not base and c not in group]
+
+
+def prop_name(base, kind, i, j, values, hint):
+    content = base.source.content
+    before = content[:base.start(i)] if j > i else content[:base.end(i - 1)]
+    if kind == "attribute":
+        return attribute_names(values).pop()
+    if kind in ("container", "expression"):
+        before = before.rstrip()
+        before = before[:-1] if before.endswith("{") else before
+    m = KEY_BEFORE.search(before[-80:]) or ATTR_BEFORE.search(before[-80:])
+    if m and kind not in ("attributes", "children"):
+        return m.group(1)
+    return hint or "value"
+
+
+def camel(name):
+    parts = re.split(r"[^\w$]+", name)
+    return parts[0] + "".join(p[:1].upper() + p[1:] for p in parts[1:])
+
+
+def unique(name, taken):
+    name = RESERVED.get(name, camel(name))
+    candidate = name
+    n = 2
+    while candidate in taken:
+        candidate = f"{name}{n}"
+        n += 1
+    taken.add(candidate)
+    return candidate
+
+
+def split_names(text):
+    # "a, b: c, d = 1, ...rest" -> ["a", "c", "d", "rest"]
+    names = []
+    for part in text.split(","):
+        part = part.split("=")[0]
+        part = part.split(":")[-1]
+        part = part.strip().lstrip(".").strip("{}[] \t\n")
+        if IDENTIFIER.fullmatch(part):
+            names.append(part)
+    return names
+
+
+def bound_names(text):
+    names = set(DECLARED.findall(text)) | set(SINGLE_PARAM.findall(text))
+    for m in DESTRUCTURED.finditer(text):
+        names.update(split_names(m.group(1)))
+    for m in PARAMS.finditer(text):
+        names.update(split_names(m.group(1) or m.group(2) or ""))
+    return names
+
+
+def imports_of(content):
+    # Liaisons importées : nom local -> (source, nom importé ou "default" / "*")
+    bindings = {}
+    for m in IMPORT.finditer(content):
+        default, namespace, named = parse_clause(m.group("clause"))
+        source = m.group("source")[1:-1]
+        if default:
+            bindings[default] = (source, "default")
+        if namespace:
+            bindings[namespace] = (source, "*")
+        for imported, local in named or []:
+            bindings[local] = (source, imported)
+    return bindings
+
+
+def used_identifiers(body, texts):
+    # Identifiants référencés par le code : ni accès de propriété, ni nom d'attribut, ni texte JSX
+    used = set()
+    tokens = [(m.start(), m.group()) for m in TOKEN.finditer(body)]
+    for n, (pos, text) in enumerate(tokens):
+        if text.startswith("`"):
+            for expr in TEMPLATE_EXPR.findall(text):
+                used |= used_identifiers(expr, [])
+            continue
+        if not IDENTIFIER.fullmatch(text) or any(s <= pos < e for s, e in texts):
+            continue
+        previous = tokens[n - 1][1] if n else ""
+        following = [t for _, t in tokens[n + 1:n + 3]]
+        if previous == ".":
+            continue
+        if following[:1] == ["="] and following[1:2] not in (["="], [">"]):
+            continue
+        used.add(text)
+    return used
+
+
+def relative_import(from_file, to_file):
+    rel = os.path.relpath(os.path.splitext(to_file)[0], os.path.dirname(from_file)).replace(os.sep, "/")
+    return rel if rel.startswith(".") else "./" + rel
+
+
+def reindent(text, indent):
+    # Décaler un bloc pour que sa ligne la moins indentée (hors première) commence à indent
+    lines = text.split("\n")
+    rest = [line for line in lines[1:] if line.strip()]
+    if not rest:
+        return text
+    shift = min(len(line) - len(line.lstrip()) for line in rest)
+    return "\n".join([lines[0]] + [indent + line[shift:] if line.strip() else "" for line in lines[1:]])
+
+
+def leading_space(content, offset):
+    # Indentation de la ligne qui contient offset
+    line_start = content.rfind("\n", 0, offset) + 1
+    line = content[line_start:offset]
+    return line[:len(line) - len(line.lstrip())]
+
+
+def attribute_value(kind, value):
+    # Valeur passée au site d'appel sous forme d'attribut JSX
+    if kind == "string":
+        literal = value.strip()
+        inner = literal[1:-1]
+        if literal[0] != "`" and "\\" not in inner and '"' not in inner:
+            return f'"{inner}"'
+        return "{" + literal + "}"
+    if kind == "text":
+        text = " ".join(value.split())
+        return f'"{text}"' if '"' not in text else "{" + json.dumps(text, ensure_ascii=False) + "}"
+    return "{" + value.strip() + "}"
+
+
+def attribute_entry(name, raw):
+    # Attribut JSX -> entrée d'objet pour une prop {...props} : a="x" -> a: "x", b -> b: true, {...c} -> ...c
+    if name == "...":
+        return raw[1:-1].strip()
+    key = name if IDENTIFIER.fullmatch(name) else json.dumps(name)
+    if raw is None:
+        return f"{key}: true"
+    if raw[0] in "\"'":
+        return f"{key}: {json.dumps(raw[1:-1], ensure_ascii=False)}"
+    return f"{key}: {raw[1:-1].strip()}"
+
+
+def children_value(value):
+    # Enfants passés en prop : texte seul, expression {...}, élément unique ou fragment ; None si vide
+    text = value.strip()
+    if not text:
+        return None
+    if not any(c in text for c in "<>{}"):
+        # Comme JSX : l'espace qui touche une autre valeur sur la même ligne est rendu (« {total} FCFA »)
+        lead, trail = value[:len(value) - len(value.lstrip())], value[len(value.rstrip()):]
+        text = (" " if lead and "\n" not in lead else "") + " ".join(text.split()) + (" " if trail and "\n" not in trail else "")
+        return f'"{text}"' if '"' not in text else "{" + json.dumps(text, ensure_ascii=False) + "}"
+    if text.startswith("{") and closing_brace(text, 0) == len(text):
+        return text
+    index = JSXIndex(text)
+    if index.elements and index.elements[0].start == 0 and index.elements[0].end == len(text):
+        return "{" + text + "}"
+    return "{<>" + text + "</>}"
+
+
+def hook_bindings(outside, free, imports):
+    # Noms libres fournis par un hook importé : {hook: ["t", "NoTranslate"]} pour const { t, NoTranslate } = useLanguage()
+    hooks = {}
+    for m in HOOK_CALL.finditer(outside):
+        if m.group(2) not in imports:
+            continue
+        for part in m.group(1).split(","):
+            local = split_names(part)
+            if local and local[0] in free:
+                hooks.setdefault(m.group(2), []).append(part.strip())
+    return hooks
+
+
+def plan_extraction(sources, cluster, name, component_dir=COMPONENT_DIR, prop_names=None):
+    base, others, skipped = choose_copies([Copy(sources[si], e) for si, e in cluster["locations"]])
+    copies = [base] + others
+    # Valeurs de chaque différence, copie par copie (la base comprise)
+    slots, values = find_slots(base, others)
+    content = base.source.content
+
+    taken = set()
+    names = []
+    attr_names = []
+    for n, ((kind, i, j, hint), row) in enumerate(zip(slots, values)):
+        wanted = prop_names[n] if prop_names and n < len(prop_names) else prop_name(base, kind, i, j, row, hint)
+        attr_names.append(prop_name(base, kind, i, j, row, hint) if kind == "attribute" else None)
+        names.append(unique(wanted, taken))
+
+    # Corps du composant : la base, chaque différence remplacée par sa prop.
+    # Les identifiants libres se cherchent sur la base où les différences sont masquées (mêmes positions)
+    start, end = base.element.start, base.element.end
+    original = content[start:end]
+    body = original
+    blanked = original
+    values_in_attrs = {e for name, s, e, area in base.regions["attributes"] if not area and name != "..."}
+    for (kind, i, j, _), prop, attr in sorted(zip(slots, names, attr_names), key=lambda s: -s[0][1]):
+        cs = base.end(i - 1) - start
+        ce = base.start(j) - start
+        segment = body[cs:ce]
+        core = segment.strip()
+        if kind == "string":
+            replacement = "{" + prop + "}" if base.end(i) in values_in_attrs else prop
+        elif kind in ("text", "children"):
+            replacement = "{" + prop + "}"
+        elif kind in ("container", "expression"):
+            replacement = prop
+        elif kind == "attributes":
+            replacement = "{..." + prop + "}"
+        else:
+            replacement = f"{attr}={{{prop}}}"
+        if core:
+            segment = segment.replace(core, replacement, 1)
+        elif kind == "children":
+            segment = replacement + segment
+        else:
+            segment = f" {replacement}{segment}"
+        body = body[:cs] + segment + body[ce:]
+        blanked = blanked[:cs] + " " * (ce - cs) + blanked[ce:]
+
+    # Mots du texte JSX : pas des variables
+    text_spans = [(s - start, e - start) for s, e in base.regions["texts"]]
+    base_imports = imports_of(content)
+    outside = content[:start] + content[end:]
+    free = used_identifiers(blanked, text_spans) - bound_names(blanked) - set(names)
+    hooks = hook_bindings(outside, free, base_imports)
+    hooked = {split_names(entry)[0] for entries in hooks.values() for entry in entries}
+    imported = sorted(n for n in free | set(hooks) if n in base_imports)
+    passed = sorted(n for n in free - hooked if n not in base_imports and n in bound_names(outside))
+    for copy in copies[1:]:
+        other = copy.source.content
+        other_outside = other[:copy.element.start] + other[copy.element.end:]
+        missing = [n for n in passed if n not in bound_names(other_outside) and n not in imports_of(other)]
+        if missing:
+            raise ExtractError(f"{copy.source.path} has no {', '.join(missing)} in scope")
+    props = passed + names
+
+    # Fichier du composant
+    path = os.path.join(component_dir, name + ".jsx")
+    by_source = {}
+    for local in imported:
+        source, imported_name = base_imports[local]
+        if source.startswith("."):
+            target = os.path.normpath(os.path.join(os.path.dirname(base.source.path), source))
+            source = relative_import(path, target)
+        by_source.setdefault(source, []).append((imported_name, local))
+    statements = []
+    for source, bindings in by_source.items():
+        default = next((local for i, local in bindings if i == "default"), None)
+        namespace = next((local for i, local in bindings if i == "*"), None)
+        named = [(i, local) for i, local in bindings if i not in ("default", "*")] or None
+        statements.append(build_import(default, namespace, named, f"'{source}'", ";"))
+    indent = leading_space(content, start)
+    lines = body.split("\n")
+    markup = "\n".join(["        " + lines[0]] + [
+        "        " + (line[len(indent):] if line.startswith(indent) else line.lstrip()) if line.strip() else ""
+        for line in lines[1:]
+    ])
+    signature = "({ " + ", ".join(props) + " })" if props else "()"
+    hook_lines = "".join(f"    const {{ {', '.join(entries)} }} = {hook}();\n" for hook, entries in hooks.items())
+    component = (
+        ("\n".join(statements) + "\n\n" if statements else "")
+        + f"const {name} = {signature} => {{\n" + (hook_lines + "\n" if hook_lines else "")
+        + f"    return (\n{markup}\n    );\n}};\n\nexport default {name};\n"
+    )
+
+    # Sites d'appel : chaque copie remplacée par <Name ... />
+    edits = {}
+    for c, copy in enumerate(copies):
+        source = copy.source
+        indent = leading_space(source.content, copy.element.start)
+        attrs = [f"{n}={{{n}}}" for n in passed]
+        for (kind, i, j, _), prop, row in zip(slots, names, values):
+            value = row[c]
+            if kind == "attribute":
+                if value.strip():
+                    (_, raw), = parse_attributes(value.strip())
+                    attrs.append(prop + ("=" + raw if raw else ""))
+                continue
+            if kind == "attributes":
+                entries = [attribute_entry(n, raw) for n, raw in parse_attributes(value.strip())]
+                if entries:
+                    attrs.append(f"{prop}={{{{ {', '.join(entries)} }}}}")
+                continue
+            if kind == "children":
+                children = children_value(value)
+                if children is not None:
+                    attrs.append(f"{prop}={reindent(children, indent + '    ')}")
+                continue
+            attrs.append(f"{prop}={reindent(attribute_value(kind, value), indent + '    ')}")
+        tag = f"<{name} {' '.join(attrs)} />" if attrs else f"<{name} />"
+        if len(indent) + len(tag) > 100 or "\n" in tag:
+            tag = f"<{name}\n" + "".join(f"{indent}    {a}\n" for a in attrs) + f"{indent}/>"
+        edits.setdefault(source.path, []).append((copy.element.start, copy.element.end, tag))
+
+    files = {path: component}
+    originals = {s.path: s.content for s in sources}
+    for rel, spans in edits.items():
+        text = originals[rel]
+        for s, e, tag in sorted(spans, reverse=True):
+            text = text[:s] + tag + text[e:]
+        statement = f"import {name} from '{relative_import(rel, path)}';\n"
+        found = IMPORT.finditer(text)
+        at = found[-1].end() if found else 0
+        if found and not text[:at].endswith("\n"):
+            statement = "\n" + statement
+        text = text[:at] + statement + text[at:]
+        # Les imports qui ne servaient qu'au bloc extrait disparaissent ; ceux déjà inutilisés restent
+        original = originals[rel]
+        already_unused = set(imports_of(original)) - used_names(original)
+        files[rel] = prune_imports(text, used_names(text) | already_unused)
+    return files, props, imported, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract a cluster of duplicated JSX into a shared component")
+    parser.add_argument("paths", nargs="*", default=[SOURCE_DIR], help="files or folders to scan (default: src)")
+    parser.add_argument("--cluster", type=int, required=True, help="cluster number from find_duplicates.py")
+    parser.add_argument("--name", required=True, help="component name, e.g. StatCard")
+    parser.add_argument("--dir", default=COMPONENT_DIR, help="folder of the new component")
+    parser.add_argument("--props", nargs="+", help="names for the props that differ between copies, in order")
+    parser.add_argument("--dry-run", action="store_true", help="print unified diffs instead of writing files")
+    parser.add_argument("--k", type=int, default=K)
+    parser.add_argument("--window", type=int, default=WINDOW)
+    parser.add_argument("--min-tokens", type=int, default=MIN_TOKENS)
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = parser.parse_args()
+
+    if not re.fullmatch(r"[A-Z][A-Za-z0-9]*", args.name):
+        parser.error("--name must be a PascalCase component name")
+    path = os.path.join(args.dir, args.name + ".jsx")
+    if os.path.exists(os.path.join(ROOT, path)):
+        parser.error(f"{path} already exists")
+
+    sources = load_sources(find_sources(args.paths), args.k, args.window)
+    clusters = find_clusters(sources, args.min_tokens, args.threshold)
+    if not 1 <= args.cluster <= len(clusters):
+        parser.error(f"--cluster must be between 1 and {len(clusters)}")
+    try:
+        files, props, imported, skipped = plan_extraction(sources, clusters[args.cluster - 1], args.name, args.dir, args.props)
+    except ExtractError as e:
+        raise SystemExit(f"Cannot extract cluster {args.cluster}: {e}")
+
+    originals = {s.path: s.content for s in sources}
+    if args.dry_run:
+        for rel, text in files.items():
+            for _, hunk in diff_hunks(rel, originals.get(rel, ""), text):
+                sys.stdout.write(hunk)
+        for copy in skipped:
+            print(f"left in place: {copy.source.path}:{copy.source.line_of(copy.element.start)}", file=sys.stderr)
+        print("nothing written", file=sys.stderr)
+        return
+
+    os.makedirs(os.path.join(ROOT, args.dir), exist_ok=True)
+    staged = []
+    try:
+        for rel, text in files.items():
+            staged.append((rel, stage_file(rel, text)))
+    except BaseException:
+        discard_files(staged)
+        raise
+    commit_files(staged)
+    print(f"{path}: props {', '.join(props) or '(none)'}; imports {', '.join(imported) or '(none)'}")
+    for rel in files:
+        if rel != path:
+            print(f"  rewrote  {rel}")
+    for copy in skipped:
+        print(f"  left in place  {copy.source.path}:{copy.source.line_of(copy.element.start)} (does not align with the others)")
+    print("Component extracted!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,601 @@
+import argparse
+import ast
+import html
+import json
+import os
+import re
+import sys
+import time
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+from codemod import ROOT, commit_files, diff_hunks, discard_files, read_file, stage_file
+from extract_component import jsx_regions, relative_import, skip_braces
+from find_duplicates import find_sources
+from import_graph import ENTRY, Graph
+from jsx_index import JSXIndex
+from remove_unused_imports import IMPORT, build_import, parse_clause
+
+SOURCE_DIRS = [os.path.join("src", "pages"), os.path.join("src", "components")]
+CONTEXT_FILE = os.path.join("src", "context", "LanguageContext.jsx")
+LOCALES_DIR = os.path.join("src", "locales")
+# Le français est la langue des sources et sert de repli ; les autres langues du menu de Navbar.jsx passent
+# par Google Translate tant qu'elles n'ont pas de bundle traduit (ajouter leur code ici avec les fichiers)
+SOURCE_LOCALE = "fr"
+LOCALES = ["fr"]
+# shell : clés des modules du chunk d'entrée, importées statiquement par LanguageContext.jsx ;
+# pages : clés des seules pages lazy(), chargées par import() au démarrage
+SHELL = "shell"
+NAMESPACES = [SHELL, "pages"]
+
+# Attributs affichés à l'utilisateur
+UI_ATTRIBUTES = {"placeholder", "title", "alt", "aria-label", "label"}
+# Contenu jamais traduit : prix et identifiants entourés de <NoTranslate>, styles et scripts
+NO_TRANSLATE_TAGS = {"NoTranslate", "style", "script", "code", "pre"}
+NO_TRANSLATE_ATTR = re.compile(r"""\btranslate=["']no["']""")
+# Marque affichée telle quelle dans toutes les langues
+BRANDS = {"TRYMYDAY"}
+
+LETTER = re.compile(r"[^\W\d_]")
+WORD = re.compile(r"[^\W\d_]+")
+# t('clé') / t('clé', {...}) déjà en place (translate('clé') quand le fichier lie déjà t à autre chose)
+LOOKUP = re.compile(r"""\b(?:t|translate)\(\s*'([\w.-]+)'\s*[,)]""")
+STRING = r"'(?:\\.|[^'\\\n])*'" + r'|"(?:\\.|[^"\\\n])*"'
+# Libellés d'objets construits dans un composant : { label: 'Mon portefeuille', ... }, setMessage({ text: '...' })
+PROPERTY = re.compile(r"(?<![\w$.])(?:label|title|text|message|subtitle)\s*:\s*(" + STRING + ")")
+# alert('...') / window.confirm(`... ${x}`) avec un seul argument littéral
+DIALOG = re.compile(r"\b(?:window\.)?(?:alert|confirm)\(\s*(" + STRING + r"|`(?:\\.|[^`\\])*`)\s*\)")
+PLACEHOLDER = re.compile(r"\{\w+\}")
+TEMPLATE_VALUE = re.compile(r"\$\{([^{}]*)\}")
+# Chaînes des branches d'un ternaire ou d'un repli dans une valeur interpolée : cond ? 'articles' : 'article'
+BRANCH = re.compile(r"(?<=[?:|])(\s*)(" + STRING + ")")
+# Valeur interpolable : pas de JSX, de fonction ni d'appel t() ; chaîne de propriétés -> nom du paramètre
+JSX_IN_VALUE = re.compile(r"<[A-Za-z>/]|=>|\bfunction\b")
+METHOD_CALL = re.compile(r"\??\.[\w$]+\([^()]*\)")
+FALLBACK = re.compile(r"\s*(?:\|\||\?\?)\s*(?:\d+|" + STRING + r")\s*$")
+PROPERTY_CHAIN = re.compile(r"[\w$]+(?:\??\.[\w$]+|\[\d+\])*")
+
+# Jamais traduits : adresses e-mail d'exemple, URL, noms de langue dans leur propre langue (« AR - العربية »),
+# codes (FCFA, CVV, XXX), exemples de saisie sans mot (« Ex: ORD-123456 »)
+EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+URL = re.compile(r"\b(?:https?://|www\.)")
+SELF_NAME = re.compile(r"^\W*[A-Z]{2}\s*[-–]\s*\S")
+SAMPLE = re.compile(r"^\W*ex\s*:", re.IGNORECASE)
+CODE = re.compile(r"[A-Z]{1,4}|[Xx]+")
+# Ligatures que NFKD ne décompose pas : « CŒUR » -> coeur et non cur
+LIGATURES = str.maketrans({"œ": "oe", "Œ": "OE", "æ": "ae", "Æ": "AE", "ß": "ss"})
+# Composants : const Nom = (...) => { / function Nom(...) { ; un corps entre parenthèses n'accueille pas de hook
+COMPONENT = re.compile(
+    r"^(?:export\s+(?:default\s+)?)?(?:const\s+(?P<arrow>[A-Z][\w$]*)\s*=\s*(?:\([^()]*\)|[\w$]+)\s*=>\s*"
+    r"|function\s+(?P<function>[A-Z][\w$]*)\s*\([^()]*\)\s*)(?P<body>[{(])",
+    re.MULTILINE,
+)
+HOOK = re.compile(r"const\s*\{(?P<names>[^}]*)\}\s*=\s*useLanguage\(\s*\)")
+# t déjà lié dans le fichier (paramètre, variable) : la fonction de traduction s'appellera translate
+BINDS_T = re.compile(r"\b(?:const|let|var)\s+t\b|[(,]\s*t\s*[,)=]|\bt\s*=>")
+# Un élément JSX racine suit un opérateur, une parenthèse ou return ; sinon c'est du HTML dans une chaîne
+JSX_BEFORE = re.compile(r"(?:[(\[{,?:=&|]|=>|\breturn)\s*$")
+
+MAX_KEY = 32
+
+
+class SourceFile:
+    # Fichier indexé (même interface que find_duplicates.Source pour jsx_regions)
+
+    def __init__(self, path, content):
+        self.path = path
+        self.content = content
+        self.index = JSXIndex(content)
+
+
+def jsx_roots(source):
+    content = source.content
+    for e in source.index.elements:
+        if e.parent is None and e.end is not None and JSX_BEFORE.search(content[max(0, e.start - 40):e.start]):
+            yield e
+
+
+def worth_translating(text):
+    # text : message sans ses paramètres {nom}
+    if not LETTER.search(text) or EMAIL.search(text) or URL.search(text) or SELF_NAME.match(text):
+        return False
+    if SAMPLE.match(text):
+        return any(w != w.upper() and len(w) > 1 for w in WORD.findall(SAMPLE.sub("", text)))
+    words = [w for w in WORD.findall(text) if w.upper() not in BRANDS]
+    return not all(CODE.fullmatch(w) or len(w) < 2 for w in words)
+
+
+def jsx_text(raw):
+    # Espaces du texte JSX tels que React les rend : lignes rognées, lignes vides supprimées, jointes par un espace
+    lines = raw.split("\n")
+    parts = []
+    for i, line in enumerate(lines):
+        if i > 0:
+            line = line.lstrip()
+        if i < len(lines) - 1:
+            line = line.rstrip()
+        if line:
+            parts.append(line)
+    return html.unescape(re.sub(r"\s+", " ", " ".join(parts)))
+
+
+def value_name(expr):
+    # Nom du paramètre : dernière propriété (length -> count), value pour une expression quelconque
+    chain = FALLBACK.sub("", METHOD_CALL.sub("", expr)).strip()
+    if chain.startswith("(") and chain.endswith(")"):
+        chain = chain[1:-1].strip()
+    if not PROPERTY_CHAIN.fullmatch(chain):
+        return "value"
+    name = re.findall(r"[\w$]+", chain)[-1].replace("$", "")
+    if name.isdigit():
+        return "value"
+    return "count" if name == "length" else name
+
+
+def container_kind(expr):
+    # Conteneur {…} d'un message : espace, chaîne, valeur interpolée, ou coupure (JSX, commentaire, t())
+    body = re.sub(r"/\*.*?\*/", "", expr, flags=re.DOTALL).strip()
+    if not body:
+        return "break", None
+    if re.fullmatch(STRING, body):
+        try:
+            return "literal", ast.literal_eval(body)
+        except (ValueError, SyntaxError):
+            return "break", None
+    if JSX_IN_VALUE.search(body) or LOOKUP.search(body):
+        return "break", None
+    return "value", body
+
+
+def build_message(pieces):
+    # [(type, début, fin, texte)] -> (message, paramètres, début, fin) ou None si rien à traduire
+    while pieces and pieces[0][0] == "raw" and not pieces[0][3].strip():
+        pieces = pieces[1:]
+    while pieces and pieces[-1][0] == "raw" and not pieces[-1][3].strip():
+        pieces = pieces[:-1]
+    if not pieces:
+        return None
+    values = []
+    names = {}
+    message = ""
+    text_only = ""
+    for kind, _, _, text in pieces:
+        if kind == "value":
+            if text not in names:
+                base = name = value_name(text)
+                n = 2
+                while name in names.values():
+                    name = f"{base}{n}"
+                    n += 1
+                names[text] = name
+                values.append((name, text))
+            message += "{" + names[text] + "}"
+            continue
+        text = jsx_text(text) if kind == "raw" else text
+        message += text
+        text_only += text
+    if not worth_translating(text_only):
+        return None
+    # Les espaces en tête et en fin restent dans la source, hors de l'appel t()
+    first, last = pieces[0], pieces[-1]
+    start = first[1] + (len(first[3]) - len(first[3].lstrip()) if first[0] == "raw" else 0)
+    end = last[2] - (len(last[3]) - len(last[3].rstrip()) if last[0] == "raw" else 0)
+    return " ".join(message.split()), tuple(values), start, end
+
+
+def element_messages(content, e, jumps):
+    # Messages entiers parmi les enfants de e : textes et valeurs {…} consécutifs, coupés par un élément enfant
+    messages = []
+    pieces = []
+
+    def flush():
+        found = build_message(pieces)
+        if found:
+            messages.append(found)
+        pieces.clear()
+
+    i = e.open_end
+    while i < e.close_start:
+        if i in jumps:
+            flush()
+            i = jumps[i]
+            continue
+        if content[i] == "{":
+            close = skip_braces(content, i, jumps)
+            kind, value = container_kind(content[i + 1:close - 1])
+            if kind == "break":
+                flush()
+            else:
+                pieces.append((kind, i, close, value))
+            i = close
+            continue
+        if content[i] == "<":
+            # Fragment <> ou </> (non indexé)
+            flush()
+            i = content.find(">", i, e.close_start) + 1 or e.close_start
+            continue
+        stops = [p for p in (content.find("{", i, e.close_start), content.find("<", i, e.close_start)) if p != -1]
+        stop = min(stops) if stops else e.close_start
+        pieces.append(("raw", i, stop, content[i:stop]))
+        i = stop
+    flush()
+    return messages
+
+
+def dialog_message(literal):
+    # Chaîne ou gabarit `… ${x} …` -> (message, paramètres) ; gabarit avec échappements ou ${} imbriqués ignoré
+    if not literal.startswith("`"):
+        try:
+            value = ast.literal_eval(literal)
+        except (ValueError, SyntaxError):
+            return None
+        return (value, ()) if worth_translating(value) else None
+    body = literal[1:-1]
+    if "\\" in body or "\n" in body or "${" in TEMPLATE_VALUE.sub("", body):
+        return None
+    pieces = []
+    pos = 0
+    for m in TEMPLATE_VALUE.finditer(body):
+        pieces.append(("literal", 0, 0, body[pos:m.start()]))
+        kind, value = container_kind(m.group(1))
+        if kind != "value":
+            return None
+        pieces.append(("value", 0, 0, value))
+        pos = m.end()
+    pieces.append(("literal", 0, 0, body[pos:]))
+    found = build_message([p for p in pieces if p[3]])
+    return found[:2] if found else None
+
+
+def untranslated_ranges(source):
+    ranges = []
+    for e in source.index.elements:
+        if e.end is None or e.self_closing:
+            continue
+        if e.tag in NO_TRANSLATE_TAGS or "notranslate" in e.classes or NO_TRANSLATE_ATTR.search(e.attrs):
+            ranges.append((e.start, e.end))
+    return ranges
+
+
+def components(content, jumps):
+    # [(nom, accolade ouvrante, fin du corps)] ; corps entre parenthèses : accolade à None
+    found = []
+    for m in COMPONENT.finditer(content):
+        name = m.group("arrow") or m.group("function")
+        if m.group("body") == "{":
+            found.append((name, m.start("body"), skip_braces(content, m.start("body"), jumps)))
+        else:
+            found.append((name, None, m.end()))
+    return found
+
+
+def scan_file(path):
+    # Messages JSX, attributs d'interface, dialogues et libellés d'objets du fichier :
+    # [(type, début, fin, message, composant, ((paramètre, expression), ...))]
+    source = SourceFile(path, read_file(path))
+    content = source.content
+    skip = untranslated_ranges(source)
+    jumps = {e.start: e.end for e in source.index.elements if e.end is not None}
+    owners = components(content, jumps)
+
+    def owner(pos):
+        for n, (_, brace, end) in enumerate(owners):
+            if brace is not None and brace < pos < end:
+                return n
+        return None
+
+    def translatable(pos):
+        return not any(s <= pos < e for s, e in skip)
+
+    sites = []
+    texts = []
+    for root in jsx_roots(source):
+        regions = jsx_regions(source, root)
+        texts += regions["texts"]
+        for e in source.index.elements:
+            if e.end is None or e.self_closing or not root.start <= e.start < root.end:
+                continue
+            for value, values, s, end in element_messages(content, e, jumps):
+                if translatable(s):
+                    sites.append(("text", s, end, value, owner(s), values))
+        for name, s, e, whole in regions["attributes"]:
+            if whole or name not in UI_ATTRIBUTES:
+                continue
+            literal = content[s:e].split("=", 1)[-1].strip()
+            if literal[:1] not in "\"'" or not translatable(s):
+                continue
+            value = html.unescape(literal[1:-1])
+            if worth_translating(value):
+                sites.append(("attribute", e - len(literal), e, value, owner(s), ()))
+    for m in DIALOG.finditer(content):
+        if any(s <= m.start() < e for s, e in texts):
+            continue
+        found = dialog_message(m.group(1))
+        if found:
+            sites.append(("dialog", m.start(1), m.end(1), found[0], owner(m.start()), found[1]))
+    for m in PROPERTY.finditer(content):
+        if any(s <= m.start() < e for s, e in texts) or not translatable(m.start()):
+            continue
+        try:
+            value = ast.literal_eval(m.group(1))
+        except (ValueError, SyntaxError):
+            continue
+        if worth_translating(value):
+            sites.append(("property", m.start(1), m.end(1), value, owner(m.start()), ()))
+    sites.sort(key=lambda site: site[1])
+    return {
+        "path": path,
+        "sites": sites,
+        "lookups": LOOKUP.findall(content),
+        "components": owners,
+        "alias": "translate" if BINDS_T.search(content) else "t",
+        "problems": len(source.index.problems()),
+    }
+
+
+def branches(expr):
+    # Chaînes à traduire dans une valeur interpolée : [(début, fin, texte)] relatifs à l'expression
+    found = []
+    for m in BRANCH.finditer(expr):
+        value = ast.literal_eval(m.group(2))
+        if worth_translating(value):
+            found.append((m.start(2), m.end(2), value))
+    return found
+
+
+def site_texts(site):
+    # Le message du site puis les chaînes de ses paramètres
+    yield site[3]
+    for _, expr in site[5]:
+        for _, _, value in branches(expr):
+            yield value
+
+
+def slug(text):
+    ascii_text = unicodedata.normalize("NFKD", text.translate(LIGATURES)).encode("ascii", "ignore").decode("ascii").lower()
+    words = re.findall(r"[a-z0-9]+", ascii_text)
+    key = ""
+    for word in words:
+        if key and len(key) + 1 + len(word) > MAX_KEY:
+            break
+        key = f"{key}_{word}" if key else word[:MAX_KEY]
+    return key or "text"
+
+
+def bundle_path(locale, namespace):
+    return os.path.join(LOCALES_DIR, locale, f"{namespace}.json")
+
+
+def load_bundle(locale):
+    # Toutes les clés publiées de la langue, espaces de noms confondus
+    bundle = {}
+    for namespace in NAMESPACES:
+        try:
+            bundle.update(json.loads(read_file(bundle_path(locale, namespace))))
+        except (FileNotFoundError, ValueError):
+            pass
+    return bundle
+
+
+def assign_keys(results, existing):
+    # Une clé par texte distinct, toutes pages confondues ; les clés déjà publiées sont conservées
+    by_text = {}
+    for key, text in sorted(existing.items()):
+        by_text.setdefault(text, key)
+    taken = set(existing)
+    keys = {}
+    for result in results:
+        for value in (text for site in result["sites"] for text in site_texts(site)):
+            if value in keys:
+                continue
+            key = by_text.get(value)
+            if key is None:
+                base = key = slug(PLACEHOLDER.sub(" ", value))
+                n = 2
+                while key in taken:
+                    key = f"{base}_{n}"
+                    n += 1
+            taken.add(key)
+            keys[value] = key
+    return keys
+
+
+def used_keys(result, keys):
+    return {keys[text] for site in result["sites"] for text in site_texts(site)} | set(result["lookups"])
+
+
+def build_bundles(results, keys, existing, shell_files):
+    # {(langue, espace): bundle} : texte source de chaque clé utilisée, bundles des autres langues limités aux
+    # clés utilisées ; une clé va dans le shell dès qu'un module du chunk d'entrée s'en sert
+    source = {key: value for value, key in keys.items()}
+    shell = set()
+    missing = []
+    for result in results:
+        if os.path.normpath(result["path"]) in shell_files:
+            shell |= used_keys(result, keys)
+        for key in result["lookups"]:
+            if key not in source:
+                if key in existing:
+                    source[key] = existing[key]
+                else:
+                    source[key] = key.split(".")[-1]
+                    missing.append(key)
+    bundles = {}
+    for locale in LOCALES:
+        texts = source if locale == SOURCE_LOCALE else load_bundle(locale)
+        for namespace in NAMESPACES:
+            bundles[locale, namespace] = {key: texts[key] for key in sorted(source)
+                                          if key in texts and (key in shell) == (namespace == SHELL)}
+    return bundles, missing
+
+
+def encode_bundle(bundle):
+    return json.dumps(bundle, ensure_ascii=False, separators=(",", ":"), sort_keys=True) + "\n"
+
+
+def add_import(path, content):
+    # useLanguage importé depuis LanguageContext (ajouté à un import existant du module si possible)
+    source = relative_import(path, CONTEXT_FILE)
+    for m in IMPORT.finditer(content):
+        if m.group("source")[1:-1] == source:
+            default, namespace, named = parse_clause(m.group("clause"))
+            if namespace:
+                break
+            named = list(named or [])
+            if any(local == "useLanguage" for _, local in named):
+                return content
+            named.append(("useLanguage", "useLanguage"))
+            newline = "\n" if m.group(0).endswith("\n") else ""
+            statement = build_import(default, namespace, named, m.group("source"), m.group("semi"))
+            return content[:m.start()] + statement + newline + content[m.end():]
+    statement = f"import {{ useLanguage }} from '{source}';\n"
+    found = list(IMPORT.finditer(content))
+    at = found[-1].end() if found else 0
+    if found and not content[:at].endswith("\n"):
+        statement = "\n" + statement
+    return content[:at] + statement + content[at:]
+
+
+def hook_edit(content, brace, end, alias):
+    # Édition qui rend la fonction de traduction disponible dans le corps [brace, end)
+    binding = "t" if alias == "t" else "t: translate"
+    m = HOOK.search(content, brace, end)
+    if m:
+        names = [n.strip() for n in m.group("names").split(",") if n.strip()]
+        if any(n == binding or n.split(":")[0].strip() == "t" for n in names):
+            return None
+        return m.start("names"), m.end("names"), " " + ", ".join(names + [binding]) + " "
+    line_end = content.find("\n", brace) + 1
+    first = re.compile(r"[ \t]*(?=\S)").search(content, line_end, end)
+    indent = first.group() if first else "    "
+    return line_end, line_end, f"{indent}const {{ {binding} }} = useLanguage();\n"
+
+
+def lookup_call(alias, keys, value, values):
+    # t('clé') ou t('clé', { count: items.length, ... }) ; les chaînes des ternaires passent aussi par t()
+    if not values:
+        return f"{alias}('{keys[value]}')"
+    params = []
+    for name, expr in values:
+        for start, end, text in reversed(branches(expr)):
+            expr = expr[:start] + f"{alias}('{keys[text]}')" + expr[end:]
+        params.append(name if expr == name else f"{name}: {expr}")
+    return f"{alias}('{keys[value]}', {{ {', '.join(params)} }})"
+
+
+def rewrite_file(result, keys):
+    # Sites remplacés par t('clé') dans les composants à corps entre accolades ; (contenu, sites ignorés)
+    path = result["path"]
+    content = read_file(path)
+    alias = result["alias"]
+    edits = []
+    hooked = set()
+    skipped = 0
+    for kind, start, end, value, owner, values in result["sites"]:
+        if owner is None:
+            skipped += 1
+            continue
+        call = lookup_call(alias, keys, value, values)
+        edits.append((start, end, "{" + call + "}" if kind in ("text", "attribute") else call))
+        hooked.add(owner)
+    for owner in hooked:
+        _, brace, end = result["components"][owner]
+        edit = hook_edit(content, brace, end, alias)
+        if edit:
+            edits.append(edit)
+    if not edits:
+        return content, skipped
+    for start, end, text in sorted(edits, key=lambda edit: edit[0], reverse=True):
+        content = content[:start] + text + content[end:]
+    content = add_import(path, content)
+    if len(JSXIndex(content).problems()) != result["problems"]:
+        raise ValueError(f"{path}: rewrite would unbalance the JSX, nothing written")
+    return content, skipped
+
+
+def scan(paths, workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(scan_file, paths, chunksize=max(1, len(paths) // 64)))
+
+
+def print_summary(results, keys, bundles, missing, skipped, elapsed):
+    sites = [site for result in results for site in result["sites"]]
+    by_kind = {}
+    for kind, *_ in sites:
+        by_kind[kind] = by_kind.get(kind, 0) + 1
+    raw_bytes = sum(len(site[3].encode("utf-8")) for site in sites)
+    unique_bytes = sum(len(value.encode("utf-8")) for value in keys)
+    kinds = ", ".join(f"{n} {kind}" for kind, n in sorted(by_kind.items()))
+    lookups = sum(len(result["lookups"]) for result in results)
+    totals = {namespace: len(bundles[SOURCE_LOCALE, namespace]) for namespace in NAMESPACES}
+    print(f"Scanned {len(results)} file(s) in {elapsed:.2f} s: {len(sites)} inline string(s)"
+          f"{f' ({kinds})' if kinds else ''}, {len(keys)} distinct, {lookups} t() lookup(s) "
+          f"-> {sum(totals.values())} key(s)")
+    print(f"Deduplication: {raw_bytes / 1024:.1f} KB of strings -> {unique_bytes / 1024:.1f} KB")
+    for locale in LOCALES:
+        for namespace in NAMESPACES:
+            bundle = bundles[locale, namespace]
+            size = len(encode_bundle(bundle).encode("utf-8"))
+            print(f"  {bundle_path(locale, namespace).replace(os.sep, '/'):<28} {size / 1024:>6.1f} KB  "
+                  f"{len(bundle)}/{totals[namespace]} key(s) translated")
+    for key in missing:
+        print(f"  missing source text for t('{key}')")
+    if skipped:
+        print(f"{skipped} string(s) left inline: outside a component with a {{...}} body")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Extract UI strings into per-locale JSON bundles and rewrite them to t('key')")
+    parser.add_argument("paths", nargs="*", default=SOURCE_DIRS, help="files or folders to scan (default: src/pages src/components)")
+    parser.add_argument("--rewrite", action="store_true", help="replace the strings by t('key') lookups in the sources")
+    parser.add_argument("--dry-run", action="store_true", help="print the diffs instead of writing anything")
+    parser.add_argument("--workers", type=int, help="parallel scanner processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = scan(find_sources(args.paths), args.workers)
+    existing = load_bundle(SOURCE_LOCALE)
+    keys = assign_keys(results, existing)
+    bundles, missing = build_bundles(results, keys, existing, Graph().reachable(ENTRY))
+
+    files = {bundle_path(*name): encode_bundle(bundle) for name, bundle in bundles.items()}
+    skipped = 0
+    for result in results:
+        if args.rewrite:
+            content, n = rewrite_file(result, keys)
+            files[result["path"]] = content
+            skipped += n
+        else:
+            skipped += sum(1 for site in result["sites"] if site[4] is None)
+    print_summary(results, keys, bundles, missing, skipped, time.perf_counter() - start)
+
+    changed = {}
+    for path, content in files.items():
+        try:
+            original = read_file(path)
+        except FileNotFoundError:
+            original = ""
+        if content != original:
+            changed[path] = (original, content)
+    if args.dry_run:
+        for path, (original, content) in sorted(changed.items()):
+            for _, hunk in diff_hunks(path, original, content):
+                sys.stdout.write(hunk)
+        print("nothing written", file=sys.stderr)
+        return
+
+    for locale in LOCALES:
+        os.makedirs(os.path.join(ROOT, LOCALES_DIR, locale), exist_ok=True)
+    staged = []
+    try:
+        for path, (_, content) in sorted(changed.items()):
+            staged.append((path, stage_file(path, content)))
+    except BaseException:
+        discard_files(staged)
+        raise
+    commit_files(staged)
+    print(f"{len(changed)} file(s) written")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,19 @@
-import re
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+ESCAPED_QUOTES = register("final_fix.escaped_quotes", r"\\'([^']*)\\'")
+EMPTY_DIVS = register("final_fix.empty_divs", r'(\s+<div className="mb-2">\s+){2,}')
 
-# Corriger TOUS les guillemets échappés incorrectement
-content = re.sub(r"\\'([^']*)\\'", r"'\1'", content)
 
-# Nettoyer les divs vides dupliquées
-content = re.sub(r'(\s+<div className="mb-2">\s+){2,}', r'\1', content)
+@transform(PROFILE, "All escaped quotes fixed and empty divs cleaned!")
+def final_fix(content):
+    # Corriger TOUS les guillemets échappés incorrectement
+    content = ESCAPED_QUOTES.sub(r"'\1'", content)
 
-# Écrire le fichier corrigé
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+    # Nettoyer les divs vides dupliquées
+    content = EMPTY_DIVS.sub(r'\1', content)
+    return content
 
-print("All escaped quotes fixed and empty divs cleaned!")
+
+if __name__ == "__main__":
+    run(["final_fix"])
@@ -0,0 +1,302 @@
+import argparse
+import heapq
+import json
+import os
+import re
+import time
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import deque
+
+from codemod import ROOT, read_file
+from jsx_index import JSXIndex
+
+SOURCE_DIR = "src"
+EXTENSIONS = (".jsx", ".js")
+
+# Jetons : chaînes (sur une ligne), gabarits `...`, commentaires, identifiants, nombres, ponctuation
+TOKEN = re.compile(
+    r"""/\*.*?\*/|//[^\n]*|'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`|[A-Za-z_$][\w$]*|\d[\w.]*|\S""",
+    re.DOTALL,
+)
+STRING = re.compile(r"""'(?:\\.|[^'\\\n])*'|"(?:\\.|[^"\\\n])*"|`(?:\\.|[^`\\])*`""")
+
+# Hachage glissant de Karp-Rabin sur k jetons
+MODULUS = (1 << 61) - 1
+BASE = 1_000_003
+
+# Défauts : k-grammes de 12 jetons, fenêtre de 8 (toute copie de 19 jetons ou plus partage une empreinte)
+K = 12
+WINDOW = 8
+MIN_TOKENS = 40
+THRESHOLD = 0.5
+# Taille de l'esquisse par élément (plus petites empreintes) et seau maximal avant de l'ignorer (code passe-partout)
+SKETCH = 8
+MAX_BUCKET = 64
+
+
+class Source:
+    # Fichier découpé en jetons, empreintes retenues par winnowing et index JSX
+
+    def __init__(self, path, content, k=K, window=WINDOW):
+        self.path = path
+        self.content = content
+        self.k = k
+        self.starts = []
+        self.ends = []
+        self.texts = []
+        for m in TOKEN.finditer(content):
+            text = m.group()
+            if text.startswith(("/*", "//")):
+                continue
+            self.starts.append(m.start())
+            self.ends.append(m.end())
+            self.texts.append(text)
+        self.fp_positions, self.fp_hashes = winnow(kgram_hashes(self.texts, k), window)
+        self.index = JSXIndex(content)
+
+    def token_range(self, start, end):
+        # Jetons entièrement compris dans [start, end)
+        return bisect_left(self.starts, start), bisect_left(self.starts, end)
+
+    def fingerprints(self, start, end):
+        ts, te = self.token_range(start, end)
+        lo = bisect_left(self.fp_positions, ts)
+        hi = bisect_right(self.fp_positions, te - self.k)
+        return set(self.fp_hashes[lo:hi])
+
+    def line_of(self, offset):
+        return self.index.line_of(offset)
+
+
+def kgram_hashes(texts, k):
+    # Hash de chaque fenêtre de k jetons, mis à jour en O(1) par jeton.
+    # Les chaînes ne comptent que par leur guillemet : deux copies qui ne diffèrent
+    # que par leurs classes, couleurs ou libellés restent des quasi-doublons
+    if len(texts) < k:
+        return []
+    values = [zlib.crc32((t[0] if t[0] in "'\"`" else t).encode("utf-8")) for t in texts]
+    top = pow(BASE, k - 1, MODULUS)
+    h = 0
+    for v in values[:k]:
+        h = (h * BASE + v) % MODULUS
+    hashes = [h]
+    for i in range(k, len(values)):
+        h = ((h - values[i - k] * top) * BASE + values[i]) % MODULUS
+        hashes.append(h)
+    return hashes
+
+
+def winnow(hashes, window):
+    # Winnowing (Schleimer et al.) : minimum le plus à droite de chaque fenêtre, retenu quand il change.
+    # File monotone : chaque hash entre et sort une fois, d'où un coût linéaire
+    positions = []
+    selected = []
+    candidates = deque()
+    for i, h in enumerate(hashes):
+        while candidates and hashes[candidates[-1]] >= h:
+            candidates.pop()
+        candidates.append(i)
+        if candidates[0] <= i - window:
+            candidates.popleft()
+        if i >= window - 1 or i == len(hashes) - 1:
+            best = candidates[0]
+            if not positions or positions[-1] != best:
+                positions.append(best)
+                selected.append(hashes[best])
+    return positions, selected
+
+
+def find_sources(paths=(SOURCE_DIR,)):
+    found = []
+    for path in paths:
+        if os.path.isfile(os.path.join(ROOT, path)):
+            found.append(path)
+            continue
+        for folder, dirs, files in os.walk(os.path.join(ROOT, path)):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(EXTENSIONS):
+                    found.append(os.path.relpath(os.path.join(folder, name), ROOT))
+    return found
+
+
+def load_sources(paths, k=K, window=WINDOW):
+    return [Source(path, read_file(path), k, window) for path in paths]
+
+
+def candidates(sources, min_tokens):
+    # Éléments JSX fermés assez grands pour valoir une extraction
+    members = []
+    for si, source in enumerate(sources):
+        for element in source.index.elements:
+            if element.end is None:
+                continue
+            ts, te = source.token_range(element.start, element.end)
+            if te - ts >= min_tokens:
+                fps = source.fingerprints(element.start, element.end)
+                if fps:
+                    members.append((si, element, fps))
+    return members
+
+
+def contains(a, b):
+    return a.start <= b.start and b.end <= a.end
+
+
+class Groups:
+    # Union-find des éléments similaires, avec la plus faible similarité retenue par groupe
+
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.lowest = {}
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b, score):
+        ra, rb = self.find(a), self.find(b)
+        self.parent[rb] = ra
+        self.lowest[ra] = min(score, self.lowest.get(ra, 1.0), self.lowest.pop(rb, 1.0))
+
+
+def group_similar(members, threshold, sketch=SKETCH, max_bucket=MAX_BUCKET):
+    # Candidats : éléments qui partagent une des plus petites empreintes de leur esquisse.
+    # Deux éléments déjà dans le même groupe ne sont pas recomparés : n copies identiques
+    # coûtent n comparaisons et non n²
+    buckets = {}
+    for m, (_, _, fps) in enumerate(members):
+        for h in heapq.nsmallest(sketch, fps):
+            buckets.setdefault(h, []).append(m)
+
+    groups = Groups(len(members))
+    for bucket in buckets.values():
+        if len(bucket) > max_bucket:
+            continue
+        for x in range(1, len(bucket)):
+            b = bucket[x]
+            sb, eb, fb = members[b]
+            for a in bucket[:x]:
+                if groups.find(a) == groups.find(b):
+                    break
+                sa, ea, fa = members[a]
+                # Tailles trop différentes : la similarité ne peut pas atteindre le seuil
+                if min(len(fa), len(fb)) < threshold * max(len(fa), len(fb)):
+                    continue
+                if sa == sb and (contains(ea, eb) or contains(eb, ea)):
+                    continue
+                score = len(fa & fb) / len(fa | fb)
+                if score >= threshold:
+                    groups.union(a, b, score)
+                    break
+    return groups
+
+
+def enclosing(locations):
+    # Pour chaque emplacement (fichier, élément, étiquette) : étiquettes des emplacements qui le contiennent.
+    # Balayage par fichier trié sur le début, pile des éléments ouverts
+    found = {}
+    stack = []
+    for si, e, label in sorted(locations, key=lambda loc: (loc[0], loc[1].start, -loc[1].end)):
+        while stack and (stack[-1][0] != si or stack[-1][1].end < e.end):
+            stack.pop()
+        found[(si, e.start, e.end, label)] = [outer_label for _, _, outer_label in stack]
+        stack.append((si, e, label))
+    return found
+
+
+def find_clusters(sources, min_tokens=MIN_TOKENS, threshold=THRESHOLD):
+    members = candidates(sources, min_tokens)
+    groups = group_similar(members, threshold)
+
+    by_root = {}
+    for m in range(len(members)):
+        by_root.setdefault(groups.find(m), []).append(m)
+    by_root = {root: group for root, group in by_root.items() if len(group) > 1}
+
+    # Un élément et son ancêtre dans le même groupe : garder l'ancêtre
+    locations = [(members[m][0], members[m][1], root) for root, group in by_root.items() for m in group]
+    outer = enclosing(locations)
+    kept = {}
+    for si, e, root in locations:
+        if root not in outer[(si, e.start, e.end, root)]:
+            kept.setdefault(root, []).append((si, e))
+    kept = {root: locs for root, locs in kept.items() if len(locs) > 1}
+
+    # Groupe dont toutes les copies sont à l'intérieur des copies d'autres groupes : redondant
+    outer = enclosing([(si, e, root) for root, locs in kept.items() for si, e in locs])
+    clusters = []
+    for root, locs in kept.items():
+        if all(any(label != root for label in outer[(si, e.start, e.end, root)]) for si, e in locs):
+            continue
+        locs.sort(key=lambda loc: (sources[loc[0]].path, loc[1].start))
+        sizes = [e.end - e.start for _, e in locs]
+        clusters.append({
+            "locations": locs,
+            "bytes": sum(sizes),
+            "duplicated": sum(sizes) - max(sizes),
+            "similarity": groups.lowest.get(root, 1.0),
+        })
+    clusters.sort(key=lambda c: (-c["duplicated"], sources[c["locations"][0][0]].path, c["locations"][0][1].start))
+    return clusters
+
+
+def describe(sources, cluster):
+    return [
+        {
+            "path": sources[si].path.replace(os.sep, "/"),
+            "tag": e.tag,
+            "start_line": sources[si].line_of(e.start),
+            "end_line": sources[si].line_of(e.end - 1),
+            "bytes": e.end - e.start,
+        }
+        for si, e in cluster["locations"]
+    ]
+
+
+def print_clusters(sources, clusters, top):
+    for n, cluster in enumerate(clusters[:top], 1):
+        print(f"#{n}  {len(cluster['locations'])} copies, {cluster['duplicated'] / 1024:.1f} KB duplicated, "
+              f">= {cluster['similarity'] * 100:.0f}% similar")
+        for loc in describe(sources, cluster):
+            print(f"    {loc['path']}:{loc['start_line']}-{loc['end_line']}  <{loc['tag']}>  ({loc['bytes'] / 1024:.1f} KB)")
+    total = sum(c["duplicated"] for c in clusters)
+    print(f"{len(clusters)} cluster(s), {total / 1024:.1f} KB duplicated in total")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find near-duplicate JSX elements with winnowing fingerprints")
+    parser.add_argument("paths", nargs="*", default=[SOURCE_DIR], help="files or folders to scan (default: src)")
+    parser.add_argument("--k", type=int, default=K, help="tokens per hashed k-gram")
+    parser.add_argument("--window", type=int, default=WINDOW, help="winnowing window, in k-grams")
+    parser.add_argument("--min-tokens", type=int, default=MIN_TOKENS, help="ignore smaller elements")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="minimum fingerprint similarity (0-1)")
+    parser.add_argument("--top", type=int, default=10, help="clusters to list")
+    parser.add_argument("--show", type=int, metavar="N", help="print the first copy of cluster N")
+    parser.add_argument("--json", metavar="FILE", help="write every cluster as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    sources = load_sources(find_sources(args.paths), args.k, args.window)
+    clusters = find_clusters(sources, args.min_tokens, args.threshold)
+    print_clusters(sources, clusters, args.top)
+    tokens = sum(len(s.texts) for s in sources)
+    print(f"Scanned {len(sources)} file(s), {tokens} tokens in {time.perf_counter() - start:.2f} s")
+
+    if args.show:
+        if not 1 <= args.show <= len(clusters):
+            parser.error(f"--show must be between 1 and {len(clusters)}")
+        si, e = clusters[args.show - 1]["locations"][0]
+        print(sources[si].index.outer(e))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([dict(similarity=round(c["similarity"], 3), duplicated=c["duplicated"], locations=describe(sources, c))
+                       for c in clusters], f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,15 @@
-import re
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+ESCAPED_QUOTE = register("fix_all_quotes.escaped_quote", r"\\'")
 
-# Corriger TOUS les guillemets échappés incorrectement avec regex plus robuste
-content = re.sub(r"\\'", "'", content)
 
-# Écrire le fichier corrigé
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+@transform(PROFILE, "All escaped quotes fixed!")
+def fix_all_quotes(content):
+    # Corriger TOUS les guillemets échappés incorrectement avec regex plus robuste
+    content = ESCAPED_QUOTE.sub("'", content)
+    return content
 
-print("All escaped quotes fixed!")
+
+if __name__ == "__main__":
+    run(["fix_all_quotes"])
@@ -1,21 +1,23 @@
-import re
+from codemod import PROFILE, run, transform
+from jsx_index import JSXIndex
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    lines = f.readlines()
 
-# Trouver et corriger les lignes 317-318
-for i in range(len(lines)):
-    # Ligne 317: supprimer le div orphelin
-    if i == 316:  # Index 316 = ligne 317
-        lines[i] = lines[i].replace('</div> <div className="mb-2">', '</div>')
-    # Ligne 318: supprimer le div orphelin
-    elif i == 317:  # Index 317 = ligne 318
-        if '<div className="mb-2">' in lines[i] and '<small' not in lines[i]:
-            lines[i] = ''
+@transform(PROFILE, "Unclosed div tags fixed!", version=2)
+def fix_divs(content):
+    # Pas plus de <div que de </div> : aucun orphelin à supprimer, inutile de construire l'index
+    if "mb-2" not in content or content.count("<div") <= content.count("</div>"):
+        return content
+    index = JSXIndex(content)
 
-# Écrire le fichier corrigé
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.writelines(lines)
+    # Supprimer les <div className="mb-2"> orphelins signalés par l'index
+    # (en partant de la fin pour garder les positions valides)
+    orphans = [e for e in index.unclosed if e.tag == "div" and "mb-2" in e.classes]
+    for element in sorted(orphans, key=lambda e: e.start, reverse=True):
+        start, end = index.line_span(element.start, element.open_end)
+        content = content[:start] + content[end:]
 
-print("Unclosed div tags fixed!")
+    return content
+
+
+if __name__ == "__main__":
+    run(["fix_divs"])
@@ -1,15 +1,12 @@
-cd backend
-import re
+from codemod import PROFILE, run, transform
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
 
-# Corriger l'accolade supplémentaire
-content = content.replace("{user.id ? user.id.slice(-8) : 'N/A'}}", "{user.id ? user.id.slice(-8) : 'N/A'}")
+@transform(PROFILE, "Extra brace removed!")
+def fix_extra_brace(content):
+    # Corriger l'accolade supplémentaire
+    content = content.replace("{user.id ? user.id.slice(-8) : 'N/A'}}", "{user.id ? user.id.slice(-8) : 'N/A'}")
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Extra brace removed!")
+if __name__ == "__main__":
+    run(["fix_extra_brace"])
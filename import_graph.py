@@ -0,0 +1,290 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+
+import safe_io
+from codemod import APP, ROOT, read_file
+from jsx_index import JSXIndex
+from remove_unused_imports import IMPORT as STATIC_IMPORT, parse_clause
+
+ENTRY = os.path.join("src", "main.jsx")
+CACHE_FILE = os.path.join(ROOT, ".import_graph_cache.json")
+# Changer l'analyse des imports invalide le cache
+CACHE_VERSION = 1
+
+# Extensions essayées pour un import relatif sans extension (même ordre que Vite)
+RESOLVE_EXTENSIONS = [".jsx", ".js", ".tsx", ".ts", ".json"]
+
+# import X from '...' / export { X } from '...' / import '...' / import('...')
+IMPORT = re.compile(
+    r"""^[ \t]*(?:import|export)\s+(?:[\w*{}\s,$]+?\s+from\s+)?(?P<quote>['"])(?P<static>[^'"]+)(?P=quote)"""
+    r"""|\bimport\(\s*(?P<q2>['"])(?P<dynamic>[^'"]+)(?P=q2)\s*\)""",
+    re.MULTILINE,
+)
+# <Route path="x" element={<Page />}> et <Route index element={<Page />} />
+ROUTE_PATH = re.compile(r"""\bpath=(?:"([^"]*)"|'([^']*)')""")
+ROUTE_ELEMENT = re.compile(r"\belement=\{\s*<\s*([A-Z][\w.]*)")
+ROUTE_INDEX = re.compile(r"(?<![\w-])index(?![\w-])")
+# const X = lazy(() => import('...')) ; const A = lazy(() => import('...').then(m => ({ default: m.A })))
+LAZY_CONST = re.compile(
+    r"""^const\s+(?P<local>[\w$]+)\s*=\s*lazy\(\s*\(\)\s*=>\s*import\(\s*(?P<quote>['"])(?P<source>[^'"]+)(?P=quote)\s*\)"""
+    r"""(?:\.then\(\s*\w+\s*=>\s*\(\{\s*default:\s*\w+\.(?P<named>[\w$]+)\s*\}\)\s*\))?""",
+    re.MULTILINE,
+)
+
+
+def file_hash(content):
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return cache.get("files", {}) if cache.get("version") == CACHE_VERSION else {}
+
+
+def save_cache(files):
+    safe_io.atomic_write(CACHE_FILE, json.dumps({"version": CACHE_VERSION, "files": files}, sort_keys=True))
+
+
+def parse_imports(content):
+    # Spécificateurs importés : [(spécificateur, "static" | "dynamic")]
+    found = []
+    for m in IMPORT.finditer(content):
+        if m.group("static"):
+            found.append((m.group("static"), "static"))
+        else:
+            found.append((m.group("dynamic"), "dynamic"))
+    return found
+
+
+def package_name(spec):
+    # 'react-dom/client' -> react-dom ; '@stripe/stripe-js' -> @stripe/stripe-js
+    parts = spec.split("/")
+    return "/".join(parts[:2]) if spec.startswith("@") else parts[0]
+
+
+def resolve(importer, spec):
+    # Chemin relatif au dépôt d'un import relatif ; None si introuvable
+    base = os.path.normpath(os.path.join(os.path.dirname(importer), spec))
+    candidates = [base] + [base + ext for ext in RESOLVE_EXTENSIONS]
+    candidates += [os.path.join(base, "index" + ext) for ext in RESOLVE_EXTENSIONS]
+    for candidate in candidates:
+        if os.path.isfile(os.path.join(ROOT, candidate)):
+            return candidate
+    return None
+
+
+def package_weight(name):
+    # Taille du point d'entrée du paquet si node_modules est installé, sinon None
+    folder = os.path.join(ROOT, "node_modules", name)
+    try:
+        with open(os.path.join(folder, "package.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    entry = meta.get("module") or meta.get("main") or "index.js"
+    path = os.path.join(folder, entry)
+    for candidate in (path, path + ".js", os.path.join(path, "index.js")):
+        if os.path.isfile(candidate):
+            return os.path.getsize(candidate)
+    return None
+
+
+class Graph:
+    # Graphe des modules atteignables depuis l'entrée : fichiers du dépôt et paquets npm ("npm:nom")
+
+    def __init__(self, entry=ENTRY, use_cache=True):
+        self.entry = entry
+        self.edges = {}
+        self.weights = {}
+        self.unresolved = []
+        self.parsed = 0
+        self.cached = 0
+        cache = load_cache() if use_cache else {}
+        fresh = {}
+        todo = [entry]
+        while todo:
+            path = todo.pop()
+            if path in self.edges:
+                continue
+            self.edges[path] = []
+            if path.startswith("npm:"):
+                self.weights[path] = package_weight(path[4:])
+                continue
+            full = os.path.join(ROOT, path)
+            self.weights[path] = os.path.getsize(full)
+            if not path.endswith((".js", ".jsx", ".ts", ".tsx")):
+                continue
+            content = read_file(path)
+            digest = file_hash(content)
+            entry_cache = cache.get(path)
+            if entry_cache and entry_cache["hash"] == digest:
+                imports = entry_cache["imports"]
+                self.cached += 1
+            else:
+                imports = parse_imports(content)
+                self.parsed += 1
+            fresh[path] = {"hash": digest, "imports": imports}
+            for spec, kind in imports:
+                if spec.startswith("."):
+                    target = resolve(path, spec)
+                    if target is None:
+                        self.unresolved.append((path, spec))
+                        continue
+                elif spec.startswith("/"):
+                    # Fichier de public/, servi tel quel
+                    continue
+                else:
+                    target = "npm:" + package_name(spec)
+                self.edges[path].append((target, kind))
+                todo.append(target)
+        if use_cache:
+            save_cache(fresh)
+
+    def reachable(self, start, skip=(), follow=()):
+        # Modules chargés avec start : imports statiques, plus les arêtes de follow (import() compté comme
+        # statique) ; arêtes de skip ignorées
+        seen = {start}
+        todo = [start]
+        while todo:
+            path = todo.pop()
+            for target, kind in self.edges.get(path, []):
+                edge = (path, target)
+                if (kind == "static" or edge in follow) and target not in seen and edge not in skip:
+                    seen.add(target)
+                    todo.append(target)
+        return seen
+
+    def weight(self, modules):
+        return sum(self.weights.get(m) or 0 for m in modules)
+
+
+def app_imports(content):
+    # Nom local -> (source, nom importé) pour chaque import d'App.jsx, pages lazy() comprises
+    bindings = {}
+    for m in LAZY_CONST.finditer(content):
+        bindings[m.group("local")] = (m.group("source"), m.group("named") or "default")
+    for m in STATIC_IMPORT.finditer(content):
+        default, _, named = parse_clause(m.group("clause"))
+        source = m.group("source")[1:-1]
+        if default:
+            bindings[default] = (source, "default")
+        for imported, local in named or []:
+            bindings[local] = (source, imported)
+    return bindings
+
+
+def parse_routes(content):
+    # Routes d'App.jsx : chemin complet (routes imbriquées comprises) et composant affiché
+    index = JSXIndex(content)
+    routes = []
+    for element in index.find("Route"):
+        m = ROUTE_ELEMENT.search(element.attrs)
+        if not m:
+            continue
+        parts = []
+        node = element
+        while node is not None:
+            if node.tag == "Route":
+                p = ROUTE_PATH.search(node.attrs)
+                if p:
+                    parts.append(p.group(1) if p.group(1) is not None else p.group(2))
+            node = node.parent
+        path = "/".join(reversed(parts)).replace("//", "/") or "/"
+        if not path.startswith("/") and path != "*":
+            path = "/" + path
+        routes.append({"path": path, "component": m.group(1), "index": bool(ROUTE_INDEX.search(element.attrs))})
+    return routes
+
+
+def route_report(graph, app=APP, lazy=None):
+    # Poids atteignable de chaque route et part qui ne sert qu'à elle (hors tronc commun).
+    # lazy : modules de pages à charger par import() (None : ceux qu'App.jsx charge déjà ainsi).
+    # Le bundle « avant » compte toutes les pages en statique, pour que le gain reste visible une fois
+    # App.jsx réécrit
+    content = read_file(app)
+    bindings = app_imports(content)
+    routes = parse_routes(content)
+    modules = {}
+    for route in routes:
+        source = bindings.get(route["component"], (None, None))[0]
+        route["module"] = resolve(app, source) if source and source.startswith(".") else None
+        if route["module"]:
+            modules[route["module"]] = True
+
+    skip = {(app, m) for m in modules}
+    shell = graph.reachable(graph.entry, skip)
+    dynamic = {target for target, kind in graph.edges.get(app, []) if kind == "dynamic"}
+    for route in routes:
+        module = route["module"]
+        route["lazy"] = module in (dynamic if lazy is None else lazy)
+        if module is None:
+            route["reachable"] = route["own"] = 0
+            route["packages"] = []
+            continue
+        reach = graph.reachable(module)
+        own = reach - shell
+        route["reachable"] = graph.weight(reach)
+        route["own"] = graph.weight(own)
+        route["packages"] = sorted(m[4:] for m in own if m.startswith("npm:"))
+
+    before = graph.reachable(graph.entry, follow=skip)
+    if lazy is None:
+        after = graph.reachable(graph.entry)
+    else:
+        split = {(app, m) for m in lazy}
+        after = graph.reachable(graph.entry, skip=split, follow=skip - split)
+    return routes, before, after
+
+
+def print_routes(graph, routes, before, after):
+    print(f"{'route':<32} {'component':<24} {'reachable':>10} {'own':>10}")
+    for route in routes:
+        mark = "  lazy" if route["lazy"] else ""
+        packages = f"  + {', '.join(route['packages'])}" if route["packages"] else ""
+        print(f"{route['path']:<32} {route['component']:<24} {route['reachable'] / 1024:>7.1f} KB "
+              f"{route['own'] / 1024:>7.1f} KB{mark}{packages}")
+    moved = before - after
+    unmeasured = sorted(m[4:] for m in moved if m.startswith("npm:") and graph.weights.get(m) is None)
+    size_before = graph.weight(before)
+    size_after = graph.weight(after)
+    saved = size_before - size_after
+    percent = 100 * saved / size_before if size_before else 0
+    print(f"Initial bundle (source bytes): {size_before / 1024:.1f} KB -> {size_after / 1024:.1f} KB "
+          f"(-{saved / 1024:.1f} KB, -{percent:.1f}%), {len(moved)} module(s) moved to route chunks")
+    if unmeasured:
+        print(f"Packages also leaving the initial bundle (not measured, node_modules missing): {', '.join(unmeasured)}")
+    for importer, spec in graph.unresolved:
+        print(f"  unresolved  {importer}: {spec}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the src/ import graph and weigh each route of App.jsx")
+    parser.add_argument("--entry", default=ENTRY, help="entry module (default: src/main.jsx)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update .import_graph_cache.json")
+    parser.add_argument("--json", metavar="FILE", help="write the graph and the route weights as JSON")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    graph = Graph(args.entry, use_cache=not args.no_cache)
+    routes, before, after = route_report(graph)
+    print_routes(graph, routes, before, after)
+    print(f"{len(graph.edges)} module(s), {graph.parsed} parsed, {graph.cached} from cache "
+          f"in {time.perf_counter() - start:.3f} s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({
+                "modules": {m: {"bytes": graph.weights[m], "imports": graph.edges[m]} for m in sorted(graph.edges)},
+                "routes": routes,
+            }, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,15 @@
 import re
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Remplacer toute la section de la carte de profil avec de meilleures icônes et alignement
-old_card_body = r'<Card\.Body className="text-center py-4">.*?</Card\.Body>'
+CARD_BODY = register("improve_profile_card.card_body", r'<Card\.Body className="text-center py-4">.*?</Card\.Body>', re.DOTALL)
 
-new_card_body = '''<Card.Body className="text-center py-4">
+
+@transform(PROFILE, "Profile card updated with better icons and alignment!")
+def improve_profile_card(content):
+    # Remplacer toute la section de la carte de profil avec de meilleures icônes et alignement
+    new_card_body = '''<Card.Body className="text-center py-4">
                             <div className="mb-3">
                                 <div style={{ fontSize: '4rem' }}>👤</div>
                             </div>
@@ -34,10 +36,9 @@ new_card_body = '''<Card.Body className="text-center py-4">
                             </div>
                         </Card.Body>'''
 
-content = re.sub(old_card_body, new_card_body, content, flags=re.DOTALL)
+    content = CARD_BODY.sub(new_card_body, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Profile card updated with better icons and alignment!")
+if __name__ == "__main__":
+    run(["improve_profile_card"])
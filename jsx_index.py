@@ -0,0 +1,236 @@
+import re
+import sys
+
+from codemod import read_file
+
+# Nom de balise JSX : div, Card.Body, Form.Control...
+TAG_NAME = re.compile(r"[A-Za-z][\w-]*(?:\.[A-Za-z][\w-]*)*")
+# Balises HTML sans fermeture (rencontrées dans les gabarits d'impression en chaîne)
+VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+CLASS_NAME = re.compile(r"""\bclassName=(?:"([^"]*)"|'([^']*)'|\{`([^`$]*)`\})""")
+
+
+class Element:
+    # Élément JSX : positions de la balise ouvrante / fermante, classes et profondeur
+
+    def __init__(self, tag, start, open_end, depth, parent, attrs):
+        self.tag = tag
+        self.start = start
+        self.open_end = open_end
+        self.close_start = None
+        self.end = None
+        self.depth = depth
+        self.parent = parent
+        self.attrs = attrs
+        self.children = []
+        match = CLASS_NAME.search(attrs)
+        self.class_name = next((g for g in match.groups() if g is not None), None) if match else None
+        self.classes = set(self.class_name.split()) if self.class_name else set()
+
+    @property
+    def self_closing(self):
+        return self.close_start == self.open_end
+
+    def __repr__(self):
+        classes = "".join(f".{c}" for c in sorted(self.classes))
+        return f"<{self.tag}{classes} {self.start}:{self.end} depth={self.depth}>"
+
+
+class JSXIndex:
+    # Index construit en une seule passe : balises, classes, imbrication et balises orphelines
+
+    def __init__(self, content):
+        self.content = content
+        self.elements = []
+        self.by_tag = {}
+        self.by_class = {}
+        # Balises ouvertes jamais fermées et balises fermantes sans ouvrante
+        self.unclosed = []
+        self.stray_closes = []
+        self._line_starts = None
+        self._scan()
+
+    def _scan(self):
+        content = self.content
+        stack = []
+        pos = content.find("<")
+        while pos != -1:
+            end = self._scan_tag(content, pos, stack)
+            pos = content.find("<", end)
+        self.unclosed.extend(stack)
+
+    def _scan_tag(self, content, pos, stack):
+        i = pos + 1
+        closing = content.startswith("/", i)
+        if closing:
+            i += 1
+
+        # Fragments <> et </>
+        if content.startswith(">", i):
+            return i + 1
+
+        # Prettier laisse parfois "< Modal ...>" : espace toléré devant un composant
+        j = i
+        while j < len(content) and content[j] in " \t":
+            j += 1
+        if j > i and content[j:j + 1].isupper():
+            i = j
+
+        name = TAG_NAME.match(content, i)
+        # Un nom suivi d'autre chose qu'un espace, > ou / n'est pas une balise (ex. i<n;)
+        if not name or (name.end() < len(content) and content[name.end()] not in " \t\r\n>/{"):
+            return i
+        tag = name.group()
+
+        if closing:
+            close_end = content.find(">", name.end())
+            if close_end == -1:
+                return len(content)
+            self._close(tag, pos, close_end + 1, stack)
+            return close_end + 1
+
+        attrs_end, self_closing = self._scan_attributes(content, name.end())
+        parent = stack[-1] if stack else None
+        element = Element(tag, pos, attrs_end, len(stack), parent, content[name.end():attrs_end])
+        self.elements.append(element)
+        self.by_tag.setdefault(tag, []).append(element)
+        for cls in element.classes:
+            self.by_class.setdefault(cls, []).append(element)
+        if parent is not None:
+            parent.children.append(element)
+
+        if self_closing or tag in VOID_TAGS:
+            element.close_start = element.end = attrs_end
+        else:
+            stack.append(element)
+        return attrs_end
+
+    def _scan_attributes(self, content, i):
+        # Avancer jusqu'au > de la balise en sautant les chaînes et les expressions {...}
+        braces = 0
+        quote = None
+        n = len(content)
+        while i < n:
+            c = content[i]
+            if quote:
+                if c == "\\":
+                    i += 1
+                elif c == quote:
+                    quote = None
+            elif c in "\"'`":
+                quote = c
+            elif c == "{":
+                braces += 1
+            elif c == "}":
+                braces -= 1
+            elif braces == 0 and c == ">":
+                return i + 1, content[i - 1] == "/"
+            i += 1
+        return n, False
+
+    def _close(self, tag, close_start, close_end, stack):
+        # Fermer la balise ouverte correspondante ; les balises intermédiaires restent orphelines
+        for k in range(len(stack) - 1, -1, -1):
+            if stack[k].tag == tag:
+                self.unclosed.extend(stack[k + 1:])
+                element = stack[k]
+                element.close_start = close_start
+                element.end = close_end
+                del stack[k:]
+                return
+        self.stray_closes.append((tag, close_start, close_end))
+
+    def find(self, selector):
+        # Sélecteurs simples : "Card.Body", "div.mb-2", ".mb-2", "Card.Body.text-center"
+        tag_parts = []
+        classes = []
+        for part in selector.split("."):
+            if not part:
+                continue
+            if classes or (tag_parts and not part[0].isupper()) or (not tag_parts and selector.startswith(".")):
+                classes.append(part)
+            else:
+                tag_parts.append(part)
+        tag = ".".join(tag_parts) or None
+
+        if classes:
+            candidates = self.by_class.get(classes[0], [])
+        else:
+            candidates = self.by_tag.get(tag, [])
+        return [
+            e for e in candidates
+            if (tag is None or e.tag == tag) and all(c in e.classes for c in classes)
+        ]
+
+    def find_text(self, selector, text):
+        # Éléments du sélecteur dont le contenu contient le texte (ex. le span 🆔)
+        return [e for e in self.find(selector) if text in self.inner(e)]
+
+    def inner(self, element):
+        if element.end is None:
+            return ""
+        return self.content[element.open_end:element.close_start]
+
+    def outer(self, element):
+        return self.content[element.start:element.end if element.end is not None else element.open_end]
+
+    def line_of(self, offset):
+        # Numéro de ligne (1-based) d'une position, par recherche dichotomique
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer("\n", self.content)]
+        lo, hi = 0, len(self._line_starts)
+        while lo + 1 < hi:
+            mid = (lo + hi) // 2
+            if self._line_starts[mid] <= offset:
+                lo = mid
+            else:
+                hi = mid
+        return lo + 1
+
+    def line_start(self, offset):
+        return self.content.rfind("\n", 0, offset) + 1
+
+    def line_span(self, start, end):
+        # Zone à supprimer pour retirer [start, end) sans laisser de ligne vide ni d'espace en trop
+        content = self.content
+        first = self.line_start(start)
+        last = content.find("\n", end)
+        last = len(content) if last == -1 else last + 1
+        before_blank = not content[first:start].strip()
+        after_blank = not content[end:last].strip()
+        if before_blank and after_blank:
+            return first, last
+        if before_blank:
+            # Garder l'indentation pour ce qui suit sur la même ligne
+            while end < last and content[end] in " \t":
+                end += 1
+        elif after_blank:
+            while start > first and content[start - 1] in " \t":
+                start -= 1
+        return start, end
+
+    def problems(self):
+        found = [(self.line_of(e.start), f"unclosed <{e.tag}>") for e in self.unclosed]
+        found += [(self.line_of(start), f"stray </{tag}>") for tag, start, _ in self.stray_closes]
+        return sorted(found)
+
+
+def main():
+    # Vérifier l'équilibre des balises des fichiers passés en argument
+    paths = sys.argv[1:]
+    if not paths:
+        print("usage: python jsx_index.py src/pages/Profile.jsx [...]")
+        raise SystemExit(2)
+    status = 0
+    for path in paths:
+        index = JSXIndex(read_file(path))
+        problems = index.problems()
+        print(f"{path}: {len(index.elements)} elements, {len(problems)} problem(s)")
+        for line, message in problems:
+            print(f"  line {line}: {message}")
+        status = status or bool(problems)
+    raise SystemExit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+import argparse
+import os
+import re
+import sys
+
+from codemod import APP, diff_hunks, read_file, write_file
+from import_graph import ENTRY, IMPORT as ANY_IMPORT, LAZY_CONST, Graph, print_routes, resolve, route_report
+from jsx_index import JSXIndex
+from remove_unused_imports import IMPORT, build_import, parse_clause
+
+# Pages lourdes chargées à la demande par défaut (--min-kb : choix par poids propre à la place)
+PAGES = ["ProductDetails", "Checkout"]
+# Dossiers toujours découpés : le back-office ne sert jamais aux clients
+LAZY_DIRS = [os.path.join("src", "pages", "admin")]
+# Page d'accueil : toujours dans le bundle initial
+EAGER_PATHS = {"/", "*"}
+
+FALLBACK = '<div className="text-center py-5"><div className="spinner-border text-warning" role="status"></div></div>'
+
+
+def choose(routes, min_kb=None, pages=PAGES, eager=()):
+    # Modules à charger par import() : ceux des dossiers découpés, puis choisis par nom,
+    # ou par poids propre (code que seule la route utilise) si min_kb est donné
+    lazy = set()
+    for route in routes:
+        module = route["module"]
+        if module is None or route["path"] in EAGER_PATHS or route["component"] in eager:
+            continue
+        if any(module.startswith(d + os.sep) for d in LAZY_DIRS):
+            lazy.add(module)
+        elif min_kb is not None:
+            if route["own"] >= min_kb * 1024:
+                lazy.add(module)
+        elif route["component"] in pages or os.path.splitext(os.path.basename(module))[0] in pages:
+            lazy.add(module)
+    # Un module reste statique si une route gardée en statique l'affiche aussi
+    for route in routes:
+        if route["module"] in lazy and (route["path"] in EAGER_PATHS or route["component"] in eager):
+            lazy.discard(route["module"])
+    return lazy
+
+
+def lazy_import(local, imported, source):
+    if imported == "default":
+        return f"const {local} = lazy(() => import('{source}'));"
+    return f"const {local} = lazy(() => import('{source}').then(m => ({{ default: m.{imported} }})));"
+
+
+def static_import(source, bindings):
+    # import X from '...' / import X, { A, B as C } from '...' pour les liaisons [(nom importé, nom local)]
+    default = next((local for imported, local in bindings if imported == "default"), None)
+    named = [(imported, local) for imported, local in bindings if imported != "default"]
+    return build_import(default, None, named or None, f"'{source}'", ";")
+
+
+def leading_comments(content, pos):
+    # Début des lignes de commentaire // juste au-dessus de pos (« // Admin Imports »), pos sinon
+    while pos > 0:
+        line = content.rfind("\n", 0, pos - 1) + 1
+        if not content[line:pos].lstrip().startswith("//"):
+            break
+        pos = line
+    return pos
+
+
+def rewrite_app(content, lazy, app=APP):
+    # Pages choisies en const X = lazy(() => import(...)), regroupées en un bloc après le dernier import ;
+    # les pages lazy() qui ne sont plus choisies redeviennent des imports statiques, avec les autres pages.
+    # Les commentaires placés au-dessus d'une déclaration la suivent
+    lazy_pages = []
+    static_pages = {}
+    edits = []
+    for match in LAZY_CONST.finditer(content):
+        source = match.group("source")
+        start = leading_comments(content, match.start())
+        end = content.find("\n", match.end())
+        end = len(content) if end == -1 else end + 1
+        edits.append((start, end))
+        comment = content[start:match.start()]
+        binding = (match.group("named") or "default", match.group("local"))
+        if resolve(app, source) in lazy:
+            lazy_pages.append((match.start(), comment, source, binding))
+        else:
+            static_pages.setdefault(source, []).append((comment, binding))
+    for match in IMPORT.finditer(content):
+        source = match.group("source")[1:-1]
+        if not source.startswith(".") or resolve(app, source) not in lazy:
+            continue
+        default, namespace, named = parse_clause(match.group("clause"))
+        if namespace:
+            continue
+        start = leading_comments(content, match.start())
+        edits.append((start, match.end()))
+        comment = content[start:match.start()]
+        bindings = ([("default", default)] if default else []) + list(named or [])
+        lazy_pages += [(match.start(), comment if i == 0 else "", source, binding) for i, binding in enumerate(bindings)]
+    if not edits:
+        return content
+
+    for start, end in sorted(edits, reverse=True):
+        content = content[:start] + content[end:]
+    restored = "".join("".join(comment for comment, _ in pages) + static_import(source, [b for _, b in pages]) + "\n"
+                       for source, pages in static_pages.items())
+    block = ""
+    for _, comment, source, (imported, local) in sorted(lazy_pages, key=lambda page: page[0]):
+        block += ("\n" if comment and block else "") + comment + lazy_import(local, imported, source) + "\n"
+
+    # Imports statiques restaurés après le dernier import relatif, bloc lazy() après le dernier import
+    # (imports à effet de bord compris : import './x.css')
+    def line_after(matches):
+        if not matches:
+            return 0
+        end = matches[-1].end()
+        return end if content[end - 1] == "\n" else content.find("\n", end) + 1 or len(content)
+
+    relative = line_after([m for m in IMPORT.finditer(content) if m.group("source")[1] == "."])
+    content = content[:relative] + restored + content[relative:]
+    at = line_after([m for m in ANY_IMPORT.finditer(content) if m.group("static")])
+    head = content[:at] + ("\n" + block if block else "")
+    # Lignes vides laissées par les déclarations retirées
+    head = re.sub(r"\n{3,}", "\n\n", head)
+    tail = content[at:].lstrip("\n")
+    updated = head + "\n" + tail
+    if not block:
+        return updated
+    return wrap_routes(add_react_imports(updated))
+
+
+def add_react_imports(content):
+    # lazy et Suspense ajoutés à l'import de 'react' (créé en tête s'il n'existe pas)
+    for match in IMPORT.finditer(content):
+        if match.group("source")[1:-1] == "react":
+            default, namespace, named = parse_clause(match.group("clause"))
+            named = list(named or [])
+            for name in ("lazy", "Suspense"):
+                if all(local != name for _, local in named):
+                    named.append((name, name))
+            newline = "\n" if match.group(0).endswith("\n") else ""
+            statement = build_import(default, namespace, named, match.group("source"), match.group("semi"))
+            return content[:match.start()] + statement + newline + content[match.end():]
+    bom = "﻿" if content.startswith("﻿") else ""
+    return bom + "import { lazy, Suspense } from 'react';\n" + content[len(bom):]
+
+
+def wrap_routes(content):
+    # <Routes> entouré d'un <Suspense> (une seule fois) : les pages lazy() affichent un spinner au chargement
+    index = JSXIndex(content)
+    for routes in index.find("Routes"):
+        node = routes.parent
+        while node is not None and node.tag != "Suspense":
+            node = node.parent
+        if node is not None or routes.end is None:
+            continue
+        line_start = index.line_start(routes.start)
+        indent = content[line_start:routes.start]
+        block = content[line_start:routes.end]
+        inner = "\n".join("    " + line if line.strip() else line for line in block.split("\n"))
+        wrapped = f"{indent}<Suspense fallback={{{FALLBACK}}}>\n{inner}\n{indent}</Suspense>"
+        return content[:line_start] + wrapped + content[routes.end:]
+    return content
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load the heavy pages of App.jsx with React.lazy and Suspense")
+    parser.add_argument("--pages", nargs="+", default=PAGES,
+                        help=f"pages to split besides admin/ (component or file names, default: {' '.join(PAGES)})")
+    parser.add_argument("--min-kb", type=float, help="split pages whose own code weighs at least this instead")
+    parser.add_argument("--eager", nargs="+", default=[], help="pages that must stay in the initial bundle")
+    parser.add_argument("--entry", default=ENTRY, help="entry module (default: src/main.jsx)")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update .import_graph_cache.json")
+    parser.add_argument("--dry-run", action="store_true", help="print the App.jsx diff instead of writing it")
+    args = parser.parse_args()
+
+    graph = Graph(args.entry, use_cache=not args.no_cache)
+    routes, _, _ = route_report(graph)
+    lazy = choose(routes, args.min_kb, set(args.pages), set(args.eager))
+    routes, before, after = route_report(graph, lazy=lazy)
+    print_routes(graph, routes, before, after)
+
+    original = read_file(APP)
+    content = rewrite_app(original, lazy)
+    if content == original:
+        print("App.jsx already up to date")
+        return
+    if args.dry_run:
+        for _, hunk in diff_hunks(APP, original, content):
+            sys.stdout.write(hunk)
+        print("nothing written", file=sys.stderr)
+        return
+    write_file(APP, content)
+    print(f"{len(lazy)} page module(s) now loaded on demand")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+import argparse
+import json
+import os
+import shutil
+import time
+from contextlib import contextmanager
+
+import safe_io
+from migrate_users import iter_array
+from safe_io import ROOT
+
+DATA_DIR = os.path.join(ROOT, "backend", "data")
+USERS_FILE = os.path.join(DATA_DIR, "users.json")
+ORDERS_FILE = os.path.join(DATA_DIR, "orders.json")
+LEDGER_DIR = os.path.join(DATA_DIR, "ledger")
+
+# Organisation du dossier ledger :
+#   events.jsonl            journal courant, une ligne par événement, uniquement en ajout
+#   segments/*.jsonl        journaux mis de côté par le compacteur, pas encore intégrés à un snapshot
+#   snapshot-<n>/           users.jsonl, orders.jsonl et index.json (position de chaque enregistrement)
+#   CURRENT                 nom du snapshot en vigueur (remplacé atomiquement)
+#
+# Verrous : CURRENT (exclusif) pour compact et convert ; VIEW partagé par les lecteurs le temps d'ouvrir
+# snapshot et journaux, exclusif pendant que compact ou convert les renomment ou les suppriment
+#
+# Événements (champ "type") :
+#   user.created   {"user": {...}}  (walletBalance = solde d'ouverture, sans transactions)
+#   user.updated   {"id": ..., "changes": {...}}
+#   wallet.tx      {"user": id, "tx": {"id", "type": credit|debit, "amount", "date", "description", "balanceAfter"}}
+#   order.created  {"order": {...}}
+#   order.updated  {"id": ..., "changes": {...}}
+EVENTS = "events.jsonl"
+SEGMENTS = "segments"
+CURRENT = "CURRENT"
+VIEW = "VIEW"
+SNAPSHOT_PREFIX = "snapshot-"
+
+COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+
+def append(event, ledger=LEDGER_DIR):
+    # Un seul write() en O_APPEND par événement : les écrivains concurrents ne s'entremêlent pas.
+    # Verrou partagé entre écrivains, exclusif pendant que le compacteur met le journal de côté
+    os.makedirs(ledger, exist_ok=True)
+    line = (COMPACT(event) + "\n").encode("utf-8")
+    events = os.path.join(ledger, EVENTS)
+    with safe_io.locked(events, shared=True):
+        _append(events, line)
+
+
+def _append(events, line):
+    fd = os.open(events, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        # Après une écriture interrompue, ne pas coller l'événement à la ligne incomplète
+        size = os.fstat(fd).st_size
+        if size and os.pread(fd, 1, size - 1) != b"\n":
+            line = b"\n" + line
+        os.write(fd, line)
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def read_events(f, problems=None):
+    # f : journal ouvert en binaire. Une ligne illisible (écriture interrompue) est signalée dans problems et ignorée
+    for no, line in enumerate(f, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            if problems is None:
+                raise ValueError(f"{f.name}:{no}: {e}") from None
+            problems.append(f"{os.path.basename(f.name)}:{no}: torn line skipped")
+
+
+def signed(tx):
+    return tx["amount"] if tx["type"] == "credit" else -tx["amount"]
+
+
+class State:
+    # État obtenu en rejouant le journal ; les incohérences sont notées au lieu d'interrompre le rejeu
+
+    def __init__(self):
+        self.users = {}
+        self.orders = {}
+        self.events = 0
+        self.problems = []
+
+    def apply(self, event):
+        self.events += 1
+        kind = event.get("type")
+        if kind == "user.created":
+            user = dict(event["user"])
+            user.setdefault("walletBalance", 0)
+            user["transactions"] = []
+            if user["id"] in self.users:
+                self.problems.append(f"user {user['id']} created twice")
+            self.users[user["id"]] = user
+        elif kind == "user.updated":
+            if event["id"] not in self.users:
+                self.problems.append(f"update of unknown user {event['id']}")
+                return
+            self.users[event["id"]].update(event["changes"])
+        elif kind == "wallet.tx":
+            user = self.users.get(event["user"])
+            if user is None:
+                self.problems.append(f"transaction {event['tx'].get('id')} for unknown user {event['user']}")
+                return
+            tx = event["tx"]
+            user["walletBalance"] += signed(tx)
+            if tx.get("balanceAfter") != user["walletBalance"]:
+                self.problems.append(
+                    f"user {user['id']} transaction {tx.get('id')}: balanceAfter {tx.get('balanceAfter')}, "
+                    f"replayed balance {user['walletBalance']}"
+                )
+            if user["walletBalance"] < 0:
+                self.problems.append(f"user {user['id']} negative balance after {tx.get('id')}")
+            user["transactions"].append(tx)
+        elif kind == "order.created":
+            order = event["order"]
+            if order["id"] in self.orders:
+                self.problems.append(f"order {order['id']} created twice")
+            self.orders[order["id"]] = order
+        elif kind == "order.updated":
+            if event["id"] not in self.orders:
+                self.problems.append(f"update of unknown order {event['id']}")
+                return
+            self.orders[event["id"]].update(event["changes"])
+        else:
+            self.problems.append(f"unknown event type {kind!r}")
+
+
+def current_snapshot(ledger):
+    try:
+        with open(os.path.join(ledger, CURRENT), "r", encoding="utf-8") as f:
+            name = f.read().strip()
+    except FileNotFoundError:
+        return None, {"folded": []}
+    with open(os.path.join(ledger, name, "index.json"), "r", encoding="utf-8") as f:
+        return name, json.load(f)
+
+
+def pending_segments(ledger, folded):
+    folder = os.path.join(ledger, SEGMENTS)
+    if not os.path.isdir(folder):
+        return []
+    return [os.path.join(folder, name) for name in sorted(os.listdir(folder))
+            if name.endswith(".jsonl") and name not in folded]
+
+
+def load_snapshot(snapshot, state):
+    for kind, records in (("users", state.users), ("orders", state.orders)):
+        for line in snapshot[kind]:
+            record = json.loads(line)
+            records[record["id"]] = record
+
+
+def logs_after(ledger, index):
+    # Segments non intégrés au snapshot, puis journal courant, dans l'ordre
+    logs = pending_segments(ledger, index["folded"])
+    if os.path.exists(os.path.join(ledger, EVENTS)):
+        logs.append(os.path.join(ledger, EVENTS))
+    return logs
+
+
+@contextmanager
+def view(ledger):
+    # Snapshot et journaux ouverts sous verrou partagé : une fois ouverts, compact() ou convert --force peuvent
+    # les renommer ou les supprimer sans couper la lecture en cours (les descripteurs restent valides)
+    files = []
+    try:
+        with safe_io.locked(os.path.join(ledger, VIEW), shared=True):
+            name, index = current_snapshot(ledger)
+            snapshot = {}
+            if name:
+                for kind in ("users", "orders"):
+                    snapshot[kind] = open(os.path.join(ledger, name, f"{kind}.jsonl"), "rb")
+                    files.append(snapshot[kind])
+            logs = []
+            for path in logs_after(ledger, index):
+                try:
+                    logs.append(open(path, "rb"))
+                except FileNotFoundError:
+                    continue
+                files.append(logs[-1])
+        yield name, index, snapshot, logs
+    finally:
+        for f in files:
+            f.close()
+
+
+def replay(ledger=LEDGER_DIR):
+    state = State()
+    with view(ledger) as (name, index, snapshot, logs):
+        if name:
+            load_snapshot(snapshot, state)
+        for f in logs:
+            for event in read_events(f, state.problems):
+                state.apply(event)
+    return state, index
+
+
+def _write_records(path, records):
+    # Un enregistrement par ligne ; renvoie {id: [position, longueur]} pour la lecture directe
+    offsets = {}
+    position = 0
+    with open(path, "wb") as f:
+        for key, record in records.items():
+            data = (COMPACT(record) + "\n").encode("utf-8")
+            offsets[key] = [position, len(data)]
+            position += f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    return offsets
+
+
+def compact(ledger=LEDGER_DIR, keep_segments=False):
+    # Un seul compacteur à la fois (verrou sur CURRENT)
+    with safe_io.locked(os.path.join(ledger, CURRENT)):
+        return _compact(ledger, keep_segments)
+
+
+def _compact(ledger, keep_segments):
+    # 1. mettre le journal courant de côté (rename atomique : les ajouts suivants recréent events.jsonl).
+    # Le verrou exclusif attend la fin des ajouts en cours, aucun ne peut atterrir dans le segment après sa lecture
+    events = os.path.join(ledger, EVENTS)
+    os.makedirs(os.path.join(ledger, SEGMENTS), exist_ok=True)
+    with safe_io.locked(os.path.join(ledger, VIEW), events):
+        if os.path.exists(events) and os.path.getsize(events):
+            os.replace(events, os.path.join(ledger, SEGMENTS, f"{time.time_ns():020d}.jsonl"))
+
+    # 2. rejouer snapshot + segments (sans le nouveau journal courant)
+    state = State()
+    with view(ledger) as (previous, index, snapshot, logs):
+        segments = [f.name for f in logs if f.name != events]
+        if previous:
+            load_snapshot(snapshot, state)
+        for f in logs:
+            if f.name != events:
+                for event in read_events(f, state.problems):
+                    state.apply(event)
+
+    # 3. écrire le nouveau snapshot dans son propre dossier, puis basculer CURRENT
+    generation = int(previous.split("-")[1]) + 1 if previous else 1
+    name = f"{SNAPSHOT_PREFIX}{generation:06d}"
+    folder = os.path.join(ledger, name)
+    os.makedirs(folder, exist_ok=True)
+    new_index = {
+        "generation": generation,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        # Seuls les segments encore présents doivent être exclus des rejeux suivants
+        "folded": [name for name in index["folded"] if os.path.exists(os.path.join(ledger, SEGMENTS, name))]
+        + [os.path.basename(path) for path in segments],
+        "events": index.get("events", 0) + state.events,
+        "users": _write_records(os.path.join(folder, "users.jsonl"), state.users),
+        "orders": _write_records(os.path.join(folder, "orders.jsonl"), state.orders),
+        "emails": {user["email"]: key for key, user in state.users.items() if user.get("email")},
+    }
+    safe_io.atomic_write(os.path.join(folder, "index.json"),
+                         json.dumps(new_index, ensure_ascii=False, separators=(",", ":")))
+
+    # 4. bascule de CURRENT puis nettoyage (ancien snapshot, segments intégrés), à l'abri des lecteurs
+    # qui ouvrent leurs fichiers ; ceux qui les ont déjà ouverts terminent leur lecture sur l'ancienne génération
+    with safe_io.locked(os.path.join(ledger, VIEW)):
+        safe_io.atomic_write(os.path.join(ledger, CURRENT), name + "\n")
+        if previous:
+            shutil.rmtree(os.path.join(ledger, previous))
+        if not keep_segments:
+            for path in segments:
+                os.remove(path)
+    return name, new_index, state
+
+
+def subject(event):
+    # ("users" | "orders", id) de l'enregistrement concerné par un événement
+    kind = event.get("type", "")
+    if kind == "user.created":
+        return "users", event["user"]["id"]
+    if kind == "wallet.tx":
+        return "users", event["user"]
+    if kind == "order.created":
+        return "orders", event["order"]["id"]
+    return ("orders" if kind.startswith("order.") else "users"), event.get("id")
+
+
+def lookup(kind, key, ledger=LEDGER_DIR):
+    # Lecture directe d'un enregistrement via l'index de positions, puis des événements plus récents le concernant
+    state = State()
+    with view(ledger) as (name, index, snapshot, logs):
+        if name:
+            if kind == "users" and key not in index["users"]:
+                key = index["emails"].get(key, key)
+            entry = index[kind].get(key)
+            if entry:
+                snapshot[kind].seek(entry[0])
+                getattr(state, kind)[key] = json.loads(snapshot[kind].read(entry[1]))
+        for f in logs:
+            for event in read_events(f, state.problems):
+                # Utilisateur créé après le snapshot et cherché par email
+                if event["type"] == "user.created" and event["user"].get("email") == key:
+                    key = event["user"]["id"]
+                if subject(event) == (kind, key):
+                    state.apply(event)
+    return getattr(state, kind).get(key)
+
+
+def convert(users_file=USERS_FILE, orders_file=ORDERS_FILE, ledger=LEDGER_DIR, force=False):
+    # Transformer les fichiers JSON actuels en journal d'événements.
+    # Verrou sur CURRENT : pas de compactage pendant la conversion
+    with safe_io.locked(os.path.join(ledger, CURRENT)):
+        return _convert(users_file, orders_file, ledger, force)
+
+
+def _convert(users_file, orders_file, ledger, force):
+    events = os.path.join(ledger, EVENTS)
+    if not force and (os.path.exists(events) or os.path.exists(os.path.join(ledger, CURRENT))):
+        raise SystemExit(f"{ledger} already holds a ledger (use --force to start over)")
+    os.makedirs(ledger, exist_ok=True)
+    counts = {"users": 0, "transactions": 0, "orders": 0}
+    out = safe_io.AtomicFile(events)
+    try:
+        for user in iter_array(users_file, "users"):
+            transactions = user.pop("transactions", None) or []
+            # Solde d'ouverture : celui qui précède la première transaction connue
+            if transactions:
+                user["walletBalance"] = transactions[0].get("balanceAfter", 0) - signed(transactions[0])
+            out.write(COMPACT({"type": "user.created", "user": user}) + "\n")
+            for tx in transactions:
+                out.write(COMPACT({"type": "wallet.tx", "user": user["id"], "tx": tx}) + "\n")
+            counts["users"] += 1
+            counts["transactions"] += len(transactions)
+        if os.path.exists(orders_file):
+            for order in iter_array(orders_file, "orders"):
+                out.write(COMPACT({"type": "order.created", "order": order}) + "\n")
+                counts["orders"] += 1
+        staged = out.finish()
+    except BaseException:
+        out.discard()
+        raise
+    # Repartir de zéro : nouveau journal, plus de snapshot ni de segments (sinon rejoués en double)
+    with safe_io.locked(os.path.join(ledger, VIEW), events):
+        safe_io.commit([staged])
+        if os.path.exists(os.path.join(ledger, CURRENT)):
+            os.remove(os.path.join(ledger, CURRENT))
+        for name in os.listdir(ledger):
+            if name.startswith(SNAPSHOT_PREFIX) or name == SEGMENTS:
+                shutil.rmtree(os.path.join(ledger, name))
+    return counts
+
+
+def verify(ledger=LEDGER_DIR, users_file=None, orders_file=None):
+    # Rejouer et contrôler les soldes ; éventuellement comparer avec les fichiers JSON d'origine
+    state, _ = replay(ledger)
+    problems = list(state.problems)
+    for key, user in state.users.items():
+        balance = 0
+        transactions = user.get("transactions", [])
+        if transactions:
+            balance = transactions[0].get("balanceAfter", 0) - signed(transactions[0])
+        for tx in transactions:
+            balance += signed(tx)
+        if transactions and balance != user["walletBalance"]:
+            problems.append(f"user {key}: balance {user['walletBalance']} but transactions sum to {balance}")
+    if users_file:
+        expected = {user["id"]: user for user in iter_array(users_file, "users")}
+        for key in expected.keys() | state.users.keys():
+            if expected.get(key) != state.users.get(key):
+                problems.append(f"user {key} differs from {os.path.relpath(users_file, ROOT)}")
+    if orders_file and os.path.exists(orders_file):
+        expected = {order["id"]: order for order in iter_array(orders_file, "orders")}
+        for key in expected.keys() | state.orders.keys():
+            if expected.get(key) != state.orders.get(key):
+                problems.append(f"order {key} differs from {os.path.relpath(orders_file, ROOT)}")
+    return state, problems
+
+
+def export(state, users_out, orders_out):
+    # Réécrire le format attendu par les routes actuelles ({ users } / { orders }, indentation 2)
+    staged = []
+    try:
+        for path, key, records in ((users_out, "users", state.users), (orders_out, "orders", state.orders)):
+            staged.append(safe_io.stage(path, json.dumps({key: list(records.values())}, ensure_ascii=False, indent=2)))
+    except BaseException:
+        safe_io.discard(staged)
+        raise
+    safe_io.commit(staged)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Append-only JSONL ledger for orders and wallet transactions")
+    parser.add_argument("--ledger", default=LEDGER_DIR, help="ledger directory (default: backend/data/ledger)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    c = sub.add_parser("convert", help="turn users.json and orders.json into an event log")
+    c.add_argument("--users", default=USERS_FILE)
+    c.add_argument("--orders", default=ORDERS_FILE)
+    c.add_argument("--force", action="store_true", help="overwrite an existing ledger")
+
+    a = sub.add_parser("append", help="append one event given as JSON")
+    a.add_argument("event")
+
+    k = sub.add_parser("compact", help="fold the log into a new snapshot with an offset index")
+    k.add_argument("--keep-segments", action="store_true", help="keep folded log segments")
+
+    v = sub.add_parser("verify", help="replay the log and check balances")
+    v.add_argument("--users", help="also compare with this users.json")
+    v.add_argument("--orders", help="also compare with this orders.json")
+
+    s = sub.add_parser("show", help="print one user or order using the offset index")
+    s.add_argument("kind", choices=["user", "order"])
+    s.add_argument("key", help="ID (or email for users)")
+
+    e = sub.add_parser("export", help="write users.json / orders.json from the replayed state")
+    e.add_argument("--users", default=USERS_FILE)
+    e.add_argument("--orders", default=ORDERS_FILE)
+    args = parser.parse_args()
+
+    if args.command == "convert":
+        counts = convert(args.users, args.orders, args.ledger, args.force)
+        print(f"{counts['users']} user(s), {counts['transactions']} transaction(s), "
+              f"{counts['orders']} order(s) written to {os.path.join(args.ledger, EVENTS)}")
+    elif args.command == "append":
+        event = json.loads(args.event)
+        if "type" not in event:
+            parser.error("event needs a 'type' field")
+        append(event, args.ledger)
+    elif args.command == "compact":
+        start = time.perf_counter()
+        name, index, state = compact(args.ledger, args.keep_segments)
+        print(f"{name}: {len(index['users'])} user(s), {len(index['orders'])} order(s), "
+              f"{state.events} event(s) folded in {time.perf_counter() - start:.2f} s")
+        for problem in state.problems:
+            print(f"  warning: {problem}")
+    elif args.command == "verify":
+        state, problems = verify(args.ledger, args.users, args.orders)
+        for problem in problems:
+            print(f"  {problem}")
+        print(f"{len(state.users)} user(s), {len(state.orders)} order(s), {state.events} event(s) replayed: "
+              f"{len(problems)} problem(s)")
+        if problems:
+            raise SystemExit(1)
+    elif args.command == "show":
+        record = lookup(args.kind + "s", args.key, args.ledger)
+        if record is None:
+            raise SystemExit(f"{args.kind} {args.key} not found")
+        print(json.dumps(record, ensure_ascii=False, indent=2))
+    else:
+        state, _ = replay(args.ledger)
+        export(state, args.users, args.orders)
+        print(f"Exported {len(state.users)} user(s) to {args.users} and {len(state.orders)} order(s) to {args.orders}")
+
+
+if __name__ == "__main__":
+    main()
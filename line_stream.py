@@ -0,0 +1,137 @@
+import argparse
+import hashlib
+import mmap
+import os
+
+import safe_io
+from codemod import ROOT
+
+# Mode streaming pour les correcteurs ligne par ligne (remove_duplicates, fix_divs, add_email_div) :
+# le fichier est lu ligne à ligne (mmap ou itérateur bufferisé) et réécrit dans un temporaire,
+# la mémoire utilisée ne dépend pas de la taille du fichier.
+#
+# Une opération est une fonction qui reçoit un itérateur de (numéro de ligne, ligne) et produit
+# des (numéro, ligne) ; les lignes insérées ont le numéro None. Les numéros sont ceux du fichier
+# d'origine (1-based), comme les "ligne 318" des anciens scripts.
+
+
+def insert_before(line_no, text):
+    def op(lines):
+        for no, line in lines:
+            if no == line_no:
+                yield None, text
+            yield no, line
+    return op
+
+
+def replace_in_line(line_no, old, new):
+    def op(lines):
+        for no, line in lines:
+            yield no, line.replace(old, new) if no == line_no else line
+    return op
+
+
+def drop_line(line_no, predicate=None):
+    def op(lines):
+        for no, line in lines:
+            if no == line_no and (predicate is None or predicate(line)):
+                continue
+            yield no, line
+    return op
+
+
+def skip_repeated_blocks(predicate, end_marker="</div>", keep=1):
+    # Garder les `keep` premiers blocs qui commencent par une ligne satisfaisant predicate,
+    # sauter les suivants jusqu'à la ligne contenant end_marker (incluse)
+    def op(lines):
+        seen = 0
+        skipping = False
+        for no, line in lines:
+            if skipping:
+                if end_marker in line:
+                    skipping = False
+                continue
+            if predicate(line):
+                seen += 1
+                if seen > keep:
+                    skipping = end_marker not in line
+                    continue
+            yield no, line
+    return op
+
+
+# Équivalents streaming des correcteurs ligne par ligne d'origine
+PRESETS = {
+    "remove_duplicates": lambda: [
+        skip_repeated_blocks(lambda line: "ID Compte" in line and "<small" in line),
+    ],
+    "fix_divs": lambda: [
+        replace_in_line(317, '</div> <div className="mb-2">', "</div>"),
+        drop_line(318, lambda line: '<div className="mb-2">' in line and "<small" not in line),
+    ],
+    "add_email_div": lambda: [
+        insert_before(318, '                                    <div className="mb-2">\n'),
+    ],
+}
+
+
+def read_lines(path, use_mmap=False):
+    # Lignes du fichier (fins de ligne conservées), sans jamais charger le fichier entier
+    if use_mmap and os.path.getsize(path) > 0:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for raw in iter(mm.readline, b""):
+                yield raw.decode("utf-8")
+        return
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        yield from f
+
+
+def stream_file(path, ops, use_mmap=False):
+    # Appliquer les opérations en flux ; remplacer le fichier seulement si son contenu change.
+    # Verrou tenu de la lecture au renommage : un autre outil ne peut pas écrire entre les deux
+    full = os.path.join(ROOT, path)
+    after = hashlib.sha256()
+    with safe_io.locked(full), safe_io.atomic_open(full, newline="") as out:
+        lines = enumerate(read_lines(full, use_mmap), start=1)
+        for op in ops:
+            lines = op(lines)
+        for _, line in lines:
+            out.write(line)
+            after.update(line.encode("utf-8"))
+        # Le hash de l'original est calculé par une seconde lecture, elle aussi en flux
+        if safe_io.file_hash(full) == after.hexdigest():
+            out.abandon()
+            return False
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Constant-memory line fixers for large JSX files")
+    parser.add_argument("path", help="file to fix, relative to the repository root")
+    parser.add_argument("presets", nargs="*", help=f"streaming fixers to apply in order ({', '.join(PRESETS)})")
+    parser.add_argument("--insert-before", nargs=2, action="append", default=[], metavar=("LINE", "TEXT"))
+    parser.add_argument("--replace-in-line", nargs=3, action="append", default=[], metavar=("LINE", "OLD", "NEW"))
+    parser.add_argument("--drop-line", type=int, action="append", default=[], metavar="LINE")
+    parser.add_argument("--mmap", action="store_true", help="read the file through mmap")
+    args = parser.parse_args()
+
+    ops = []
+    for name in args.presets:
+        if name not in PRESETS:
+            parser.error(f"unknown preset: {name}")
+        ops += PRESETS[name]()
+    for line_no, text in args.insert_before:
+        ops.append(insert_before(int(line_no), text + "\n"))
+    for line_no, old, new in args.replace_in_line:
+        ops.append(replace_in_line(int(line_no), old, new))
+    for line_no in args.drop_line:
+        ops.append(drop_line(line_no))
+    if not ops:
+        parser.error("nothing to do")
+
+    changed = stream_file(args.path, ops, use_mmap=args.mmap)
+    print(f"{args.path}: {'rewritten' if changed else 'unchanged'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import argparse
+import json
+import os
+import re
+import time
+
+from codemod import print_report, run_files
+from migrate_users import iter_array
+from profiling import Timings
+from safe_io import ROOT, relative_path
+
+REPORT_FILE = os.path.join(ROOT, "lint_results.json")
+
+# Règles ESLint corrigées automatiquement : ruleId -> transformations à appliquer aux fichiers signalés
+FIXERS = {
+    "no-unused-vars": ["remove_unused_imports"],
+}
+
+
+def iter_results(path=REPORT_FILE):
+    # Un résultat de fichier à la fois ; le champ "source" (copie complète du fichier) est jeté aussitôt
+    for entry in iter_array(path, "results"):
+        entry.pop("source", None)
+        yield entry
+
+
+def analyze(path=REPORT_FILE):
+    summary = {"files": 0, "errors": 0, "warnings": 0, "rules": {}, "by_file": {}, "by_line": {}}
+    for entry in iter_results(path):
+        summary["files"] += 1
+        messages = entry.get("messages", [])
+        if not messages:
+            continue
+        rel = relative_path(entry["filePath"])
+        file_entry = summary["by_file"].setdefault(rel, {"errors": 0, "warnings": 0, "rules": {}})
+        for m in messages:
+            # ruleId absent : erreur d'analyse (fatal)
+            rule = m.get("ruleId") or "(parse error)"
+            level = "errors" if m.get("severity") == 2 else "warnings"
+            summary[level] += 1
+            file_entry[level] += 1
+            rule_entry = summary["rules"].setdefault(rule, {"errors": 0, "warnings": 0, "files": set()})
+            rule_entry[level] += 1
+            rule_entry["files"].add(rel)
+            file_entry["rules"][rule] = file_entry["rules"].get(rule, 0) + 1
+            summary["by_line"].setdefault((rel, m.get("line", 0)), []).append((rule, m.get("message", "")))
+    return summary
+
+
+def fix_batches(summary):
+    # Regrouper les fichiers par lot de transformations (une passe du pool par lot)
+    batches = {}
+    for rule, names in FIXERS.items():
+        entry = summary["rules"].get(rule)
+        if entry:
+            batches.setdefault(tuple(names), set()).update(entry["files"])
+    return {names: sorted(p for p in paths if os.path.exists(os.path.join(ROOT, p))) for names, paths in batches.items()}
+
+
+def to_json(summary):
+    return {
+        "files": summary["files"],
+        "errors": summary["errors"],
+        "warnings": summary["warnings"],
+        "rules": {rule: dict(e, files=sorted(e["files"])) for rule, e in summary["rules"].items()},
+        "by_file": summary["by_file"],
+        "by_line": [
+            {"file": rel, "line": line, "messages": [{"rule": r, "message": m} for r, m in messages]}
+            for (rel, line), messages in sorted(summary["by_line"].items())
+        ],
+    }
+
+
+def print_summary(summary, top, show_lines=None):
+    rules = sorted(summary["rules"].items(), key=lambda item: -(item[1]["errors"] + item[1]["warnings"]))
+    print("By rule:")
+    for rule, e in rules[:top]:
+        print(f"  {rule:<45} {e['errors']:>5} error(s) {e['warnings']:>5} warning(s) in {len(e['files'])} file(s)")
+    files = sorted(summary["by_file"].items(), key=lambda item: -(item[1]["errors"] + item[1]["warnings"]))
+    print("By file:")
+    for rel, e in files[:top]:
+        worst = max(e["rules"], key=e["rules"].get)
+        print(f"  {rel:<45} {e['errors']:>5} error(s) {e['warnings']:>5} warning(s)  (mostly {worst})")
+    if show_lines:
+        print(f"Lines in {show_lines}:")
+        for (rel, line), messages in sorted(summary["by_line"].items()):
+            if os.path.normpath(rel) == os.path.normpath(show_lines):
+                for rule, message in messages:
+                    print(f"  {line:>5}  {rule:<40} {message}")
+    print(f"{summary['files']} file(s) linted: {summary['errors']} error(s), {summary['warnings']} warning(s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize an ESLint JSON report and run the matching codemod fixers")
+    parser.add_argument("report", nargs="?", default=REPORT_FILE, help="ESLint JSON output (default: lint_results.json)")
+    parser.add_argument("--top", type=int, default=15, help="rows per table")
+    parser.add_argument("--lines", metavar="FILE", help="list every finding of one file by line")
+    parser.add_argument("--json", metavar="FILE", help="write the aggregates as JSON")
+    parser.add_argument("--fix", action="store_true", help="apply the codemod fixers to the reported files")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes for --fix")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update the codemod no-op cache")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = analyze(args.report)
+    print_summary(summary, args.top, args.lines)
+    print(f"Analyzed in {time.perf_counter() - start:.2f} s")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(to_json(summary), f, ensure_ascii=False, indent=2)
+
+    if args.fix:
+        failed = False
+        for names, paths in fix_batches(summary).items():
+            print(f"Fixing {len(paths)} file(s) with {', '.join(names)}")
+            timings = Timings()
+            report = run_files(list(names), paths, args.workers, use_cache=not args.no_cache, timings=timings)
+            print_report(report)
+            failed = failed or bool(report["errors"])
+        if failed:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
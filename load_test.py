@@ -0,0 +1,739 @@
+import argparse
+import asyncio
+import contextlib
+import json
+import math
+import os
+import random
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+import safe_io
+from safe_io import ROOT
+
+BACKEND_DIR = os.path.join(ROOT, "backend")
+DATA_DIR = os.path.join(BACKEND_DIR, "data")
+# Fichiers de données et clé de leur tableau (même forme que les routes Express)
+DATA_FILES = {"products.json": "products", "orders.json": "orders", "users.json": "users"}
+
+HOST = "127.0.0.1"
+# Scénarios tirés à chaque tour d'un utilisateur virtuel, avec leur poids par défaut
+MIX = {"browse": 6, "checkout": 2, "topup": 1, "account": 1}
+TOPUPS = [5000, 10000, 25000, 50000]
+SHIPPING = 1000
+PASSWORD = "loadtest"
+REASONS = {200: "OK", 201: "Created", 400: "Bad Request", 401: "Unauthorized", 404: "Not Found",
+           500: "Internal Server Error"}
+
+
+def now_ms():
+    return int(time.time() * 1000)
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+class StandIn:
+    # Remplaçant Python du serveur Express : mêmes routes, mêmes fichiers, même lecture-modification-écriture
+    # sous le verrou du fichier (withFileLock). fs.promises passe aussi par un pool de threads : sans verrou
+    # (locked=False, l'ancien serveur), les courses restent visibles
+
+    def __init__(self, data_dir, locked=True):
+        self.data_dir = data_dir
+        self.locks = {name: asyncio.Lock() for name in DATA_FILES} if locked else {}
+        self.routes = {
+            ("GET", "/api/health"): self.health,
+            ("GET", "/api/products"): self.products,
+            ("GET", "/api/orders"): self.orders,
+            ("POST", "/api/orders"): self.create_order,
+            ("GET", "/api/wallet/balance"): self.balance,
+            ("POST", "/api/wallet/pay"): self.pay,
+            ("GET", "/api/wallet/transactions"): self.transactions,
+            ("POST", "/api/admin/wallet/credit"): self.credit,
+            ("POST", "/api/auth/register"): self.register,
+            ("POST", "/api/auth/login"): self.login,
+        }
+        # Routes enveloppées dans withFileLock côté Express : fichier dont elles tiennent le verrou
+        self.writes = {
+            ("POST", "/api/orders"): "orders.json",
+            ("GET", "/api/wallet/balance"): "users.json",
+            ("POST", "/api/wallet/pay"): "users.json",
+            ("GET", "/api/wallet/transactions"): "users.json",
+            ("POST", "/api/admin/wallet/credit"): "users.json",
+            ("POST", "/api/auth/register"): "users.json",
+            ("POST", "/api/auth/login"): "users.json",
+        }
+
+    def _read(self, name):
+        try:
+            with open(os.path.join(self.data_dir, name), "r", encoding="utf-8") as f:
+                return json.load(f)[DATA_FILES[name]]
+        except (OSError, ValueError, KeyError, TypeError):
+            # Comme getUsers() / getOrders() : fichier illisible -> liste vide
+            return []
+
+    def _write(self, name, items):
+        # Comme writeJsonAtomic (backend/utils/jsonStore.js) : temporaire puis renommage, sans verrou
+        safe_io.atomic_write(os.path.join(self.data_dir, name),
+                             json.dumps({DATA_FILES[name]: items}, ensure_ascii=False, indent=2), lock=False)
+
+    async def load(self, name):
+        return await asyncio.to_thread(self._read, name)
+
+    async def save(self, name, items):
+        await asyncio.to_thread(self._write, name, items)
+
+    async def dispatch(self, method, target, raw):
+        url = urlsplit(target)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        try:
+            body = json.loads(raw) if raw else {}
+        except ValueError:
+            return 400, {"message": "Invalid JSON body"}
+        handler = self.routes.get((method, url.path))
+        lock = self.locks.get(self.writes.get((method, url.path))) or contextlib.nullcontext()
+        try:
+            if handler:
+                async with lock:
+                    return await handler(query, body)
+            if method == "GET" and url.path.startswith("/api/orders/user/"):
+                return await self.user_orders(unquote(url.path[len("/api/orders/user/"):]))
+        except Exception as e:
+            return 500, {"message": str(e)}
+        return 404, {"message": f"Cannot {method} {url.path}"}
+
+    async def health(self, query, body):
+        return 200, {"status": "ok", "message": "Server is running"}
+
+    async def products(self, query, body):
+        return 200, await self.load("products.json")
+
+    async def orders(self, query, body):
+        return 200, await self.load("orders.json")
+
+    async def user_orders(self, email):
+        return 200, [o for o in await self.load("orders.json") if o.get("email") == email]
+
+    async def create_order(self, query, body):
+        orders = await self.load("orders.json")
+        if not body.get("items"):
+            return 400, {"message": "Order must have items"}
+        body.setdefault("id", str(now_ms()))
+        body.setdefault("date", datetime.now().strftime("%d/%m/%Y"))
+        body.setdefault("status", "En attente")
+        orders.append(body)
+        await self.save("orders.json", orders)
+        return 201, body
+
+    async def find_or_create_user(self, email):
+        users = await self.load("users.json")
+        user = next((u for u in users if u.get("email") == email), None)
+        if user is None:
+            user = {"id": f"user_{now_ms()}", "email": email, "walletBalance": 0, "transactions": []}
+            users.append(user)
+            await self.save("users.json", users)
+        return user
+
+    async def balance(self, query, body):
+        if not query.get("email"):
+            return 400, {"success": False, "message": "Email required"}
+        user = await self.find_or_create_user(query["email"])
+        return 200, {"success": True, "balance": user["walletBalance"], "email": user["email"]}
+
+    async def transactions(self, query, body):
+        if not query.get("email"):
+            return 400, {"success": False, "message": "Email required"}
+        user = await self.find_or_create_user(query["email"])
+        return 200, {"success": True, "transactions": user["transactions"][::-1]}
+
+    async def pay(self, query, body):
+        email, amount = body.get("email"), body.get("amount")
+        if not email or not amount:
+            return 400, {"success": False, "message": "Email and amount required"}
+        users = await self.load("users.json")
+        user = next((u for u in users if u.get("email") == email), None)
+        if user is None:
+            return 404, {"success": False, "message": "User not found"}
+        if user["walletBalance"] < amount:
+            return 400, {"success": False, "message": "Insufficient balance",
+                         "balance": user["walletBalance"], "required": amount}
+        user["walletBalance"] -= amount
+        tx = {"id": f"tx_{now_ms()}", "type": "debit", "amount": amount, "date": now_iso(),
+              "description": f"Order payment {body.get('orderId') or ''}", "balanceAfter": user["walletBalance"]}
+        user["transactions"].append(tx)
+        await self.save("users.json", users)
+        return 200, {"success": True, "message": "Payment successful", "newBalance": user["walletBalance"],
+                     "transactionId": tx["id"]}
+
+    async def credit(self, query, body):
+        email, user_id, amount = body.get("email"), body.get("userId"), body.get("amount")
+        if (not email and not user_id) or not amount:
+            return 400, {"success": False, "message": "Identifiant (Email ou ID) et montant requis"}
+        if amount <= 0:
+            return 400, {"success": False, "message": "Amount must be positive"}
+        users = await self.load("users.json")
+        user = next((u for u in users if user_id and u.get("id") == user_id), None)
+        if user is None and user_id and not email:
+            return 404, {"success": False, "message": "Utilisateur non trouvé avec cet ID"}
+        if user is None:
+            user = next((u for u in users if u.get("email") == email), None)
+        if user is None:
+            user = {"id": f"user_{now_ms()}", "email": email, "walletBalance": 0, "transactions": []}
+            users.append(user)
+        user["walletBalance"] += amount
+        user["transactions"].append({"id": f"tx_{now_ms()}", "type": "credit", "amount": amount, "date": now_iso(),
+                                     "description": body.get("description") or "Admin credit",
+                                     "balanceAfter": user["walletBalance"]})
+        await self.save("users.json", users)
+        return 200, {"success": True, "message": "Balance credited successfully",
+                     "user": {"email": user["email"], "newBalance": user["walletBalance"]}}
+
+    async def register(self, query, body):
+        email = body["email"].lower()
+        users = await self.load("users.json")
+        if any(u.get("email", "").lower() == email for u in users):
+            return 400, {"message": "Email already exists"}
+        user = {"id": str(random.randint(10000000, 99999999)), "name": body.get("name"), "email": email,
+                "password": body.get("password"), "role": "client", "walletBalance": 0,
+                "joined": now_iso()[:10], "transactions": []}
+        users.append(user)
+        await self.save("users.json", users)
+        return 201, user
+
+    async def login(self, query, body):
+        email = body["email"].lower()
+        users = await self.load("users.json")
+        user = next((u for u in users if u.get("email", "").lower() == email), None)
+        if user is None or (user.get("password") and user["password"] != body.get("password")):
+            return 401, {"message": "Invalid credentials"}
+        return 200, dict(user, balance=user.get("walletBalance"))
+
+    async def handle(self, reader, writer):
+        # HTTP/1.1 minimal : corps par Content-Length, connexion gardée ouverte sauf "Connection: close"
+        try:
+            while True:
+                line = await reader.readline()
+                if not line.strip():
+                    break
+                method, target, _ = line.decode("latin-1").split(" ", 2)
+                headers = await read_headers(reader)
+                length = int(headers.get("content-length", 0))
+                raw = await reader.readexactly(length) if length else b""
+                status, payload = await self.dispatch(method, target, raw)
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                keep = headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\nContent-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep else 'close'}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+async def read_headers(reader):
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+async def serve(port, data_dir, locked=True):
+    server = await asyncio.start_server(StandIn(data_dir, locked).handle, HOST, port)
+    port = server.sockets[0].getsockname()[1]
+    print(f"Stand-in backend running on http://{HOST}:{port} (data: {data_dir}"
+          f"{'' if locked else ', no file locks'})", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+class Stats:
+    # Latences et statuts par point d'accès, erreurs de transport (délai dépassé, connexion coupée)
+
+    def __init__(self):
+        self.latencies = {}
+        self.statuses = {}
+        self.errors = {}
+
+    def record(self, name, status, seconds):
+        self.latencies.setdefault(name, []).append(seconds)
+        counts = self.statuses.setdefault(name, {})
+        counts[status] = counts.get(status, 0) + 1
+
+    def error(self, name, exc):
+        key = f"{name}: {type(exc).__name__}"
+        self.errors[key] = self.errors.get(key, 0) + 1
+
+    def requests(self):
+        return sum(len(v) for v in self.latencies.values()) + sum(self.errors.values())
+
+
+def percentile(values, p):
+    # Rang le plus proche sur une liste triée
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def summarize(stats, elapsed):
+    endpoints = {}
+    for name in sorted(stats.latencies):
+        values = sorted(stats.latencies[name])
+        endpoints[name] = {
+            "count": len(values),
+            "rps": len(values) / elapsed,
+            "p50": percentile(values, 50), "p90": percentile(values, 90),
+            "p99": percentile(values, 99), "max": values[-1],
+            "statuses": {str(k): v for k, v in sorted(stats.statuses[name].items())},
+        }
+    return {"seconds": elapsed, "requests": stats.requests(), "rps": stats.requests() / elapsed,
+            "endpoints": endpoints, "errors": dict(stats.errors)}
+
+
+class Client:
+    # Connexion HTTP/1.1 persistante d'un utilisateur virtuel, rouverte après une erreur
+
+    def __init__(self, host, port, stats, timeout):
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.timeout = timeout
+        self.reader = self.writer = None
+
+    def close(self):
+        if self.writer:
+            self.writer.close()
+        self.reader = self.writer = None
+
+    async def request(self, name, method, path, body=None):
+        # (statut, JSON) ; (None, None) si la requête n'a pas abouti
+        start = time.perf_counter()
+        try:
+            status, payload = await asyncio.wait_for(self.exchange(method, path, body), self.timeout)
+        except (OSError, asyncio.TimeoutError, asyncio.IncompleteReadError, ValueError) as e:
+            self.close()
+            self.stats.error(name, e)
+            return None, None
+        self.stats.record(name, status, time.perf_counter() - start)
+        return status, payload
+
+    async def exchange(self, method, path, body):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        data = json.dumps(body).encode("utf-8") if body is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}:{self.port}\r\nAccept: application/json\r\n"
+        if body is not None:
+            head += f"Content-Type: application/json\r\nContent-Length: {len(data)}\r\n"
+        self.writer.write((head + "\r\n").encode("latin-1") + data)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        if not status_line:
+            raise ConnectionResetError("connection closed by server")
+        status = int(status_line.split()[1])
+        headers = await read_headers(self.reader)
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            raw = b""
+            while True:
+                size = int((await self.reader.readline()).split(b";")[0], 16)
+                chunk = await self.reader.readexactly(size + 2)
+                if not size:
+                    break
+                raw += chunk[:-2]
+            await read_headers(self.reader)
+        else:
+            raw = await self.reader.readexactly(int(headers.get("content-length", 0)))
+        if headers.get("connection", "").lower() == "close":
+            self.close()
+        if "json" in headers.get("content-type", ""):
+            return status, json.loads(raw)
+        return status, raw.decode("utf-8", "replace")
+
+
+class Expected:
+    # Écritures confirmées par le serveur : elles doivent se retrouver dans les fichiers après le run.
+    # Un compte dont une écriture est restée sans réponse est incertain : son solde exact n'est pas vérifié
+
+    def __init__(self):
+        self.orders = set()
+        self.accounts = {}
+        self.uncertain = set()
+
+    def account(self, email):
+        return self.accounts.setdefault(email, {"credit": 0, "debit": 0, "tx": 0})
+
+
+class VirtualUser:
+    # Parcours d'un client : compte, catalogue, panier (local, comme le localStorage du site), commande, recharge
+
+    def __init__(self, number, run_id, client, rng, catalog, expected, think):
+        self.number = number
+        self.client = client
+        self.rng = rng
+        self.catalog = catalog
+        self.expected = expected
+        self.think = think
+        self.email = f"loadtest-{run_id}-{number}@example.com"
+        self.run_id = run_id
+        self.cart = []
+        self.orders = 0
+
+    async def write(self, name, method, path, body, ok, email=None):
+        # Requête qui modifie les données (du compte email, le sien par défaut) : confirmée, refusée ou incertaine
+        status, payload = await self.client.request(name, method, path, body)
+        if status is None or status >= 500:
+            self.expected.uncertain.add(email or self.email)
+        return status, payload, status == ok
+
+    async def run(self, deadline, names, weights):
+        _, _, created = await self.write("POST /api/auth/register", "POST", "/api/auth/register",
+                                         {"name": f"Load Test {self.number}", "email": self.email,
+                                          "password": PASSWORD}, 201)
+        self.expected.account(self.email)
+        if not created:
+            self.expected.uncertain.add(self.email)
+        while time.perf_counter() < deadline:
+            await getattr(self, self.rng.choices(names, weights)[0])()
+            if self.think:
+                await asyncio.sleep(self.rng.expovariate(1 / self.think))
+        self.client.close()
+
+    async def browse(self):
+        status, products = await self.client.request("GET /api/products", "GET", "/api/products")
+        if status == 200 and isinstance(products, list) and products:
+            self.catalog[:] = products
+        if self.catalog:
+            for product in self.rng.sample(self.catalog, min(len(self.catalog), self.rng.randint(0, 2))):
+                self.cart.append({"id": product.get("id"), "name": product.get("name"),
+                                  "price": product.get("price") or 0, "quantity": self.rng.randint(1, 2),
+                                  "image": product.get("image")})
+        if self.rng.random() < 0.3:
+            await self.client.request("GET /api/orders/user/:email", "GET",
+                                      f"/api/orders/user/{quote(self.email)}")
+
+    async def checkout(self):
+        if not self.cart and self.catalog:
+            product = self.rng.choice(self.catalog)
+            self.cart.append({"id": product.get("id"), "name": product.get("name"),
+                              "price": product.get("price") or 0, "quantity": 1, "image": product.get("image")})
+        if not self.cart:
+            return
+        self.orders += 1
+        order_id = f"order_{self.run_id}_{self.number}_{self.orders}"
+        subtotal = sum(item["price"] * item["quantity"] for item in self.cart)
+        order = {"id": order_id, "customerName": f"Load Test {self.number}", "email": self.email,
+                 "date": now_iso(), "status": "En attente", "subtotal": subtotal, "shippingCost": SHIPPING,
+                 "total": subtotal + SHIPPING, "paymentMethod": "wallet", "items": self.cart}
+        _, _, placed = await self.write("POST /api/orders", "POST", "/api/orders", order, 201)
+        self.cart = []
+        if not placed:
+            return
+        self.expected.orders.add(order_id)
+        status, balance = await self.client.request("GET /api/wallet/balance", "GET",
+                                                    f"/api/wallet/balance?email={quote(self.email)}")
+        if status != 200 or balance.get("balance", 0) < order["total"]:
+            return
+        _, _, paid = await self.write("POST /api/wallet/pay", "POST", "/api/wallet/pay",
+                                      {"email": self.email, "amount": order["total"], "orderId": order_id}, 200)
+        if paid:
+            account = self.expected.account(self.email)
+            account["debit"] += order["total"]
+            account["tx"] += 1
+
+    async def topup(self):
+        amount = self.rng.choice(TOPUPS)
+        _, _, credited = await self.write("POST /api/admin/wallet/credit", "POST", "/api/admin/wallet/credit",
+                                          {"email": self.email, "amount": amount, "description": "Load test"}, 200)
+        if credited:
+            account = self.expected.account(self.email)
+            account["credit"] += amount
+            account["tx"] += 1
+        await self.client.request("GET /api/wallet/transactions", "GET",
+                                  f"/api/wallet/transactions?email={quote(self.email)}")
+
+    async def contend(self):
+        # Recharge du compte partagé par tous les utilisateurs virtuels : lancée par tous en même temps, une
+        # lecture-modification-écriture sans verrou y perd des crédits confirmés (vu par check_data)
+        email = f"loadtest-{self.run_id}-shared@example.com"
+        amount = self.rng.choice(TOPUPS)
+        _, _, credited = await self.write("POST /api/admin/wallet/credit (shared)", "POST", "/api/admin/wallet/credit",
+                                          {"email": email, "amount": amount, "description": "Load test"}, 200, email)
+        if credited:
+            account = self.expected.account(email)
+            account["credit"] += amount
+            account["tx"] += 1
+
+    async def account(self):
+        await self.client.request("POST /api/auth/login", "POST", "/api/auth/login",
+                                  {"email": self.email, "password": PASSWORD})
+        await self.client.request("GET /api/wallet/balance", "GET", f"/api/wallet/balance?email={quote(self.email)}")
+
+
+async def run_stage(host, port, users, duration, mix, think, timeout, rng, catalog, expected, run_id, first):
+    stats = Stats()
+    names = list(mix)
+    weights = [mix[n] for n in names]
+    start = time.perf_counter()
+    deadline = start + duration
+    vus = [VirtualUser(first + n, run_id, Client(host, port, stats, timeout), random.Random(rng.random()),
+                       catalog, expected, think) for n in range(users)]
+    await asyncio.gather(*(vu.contend() for vu in vus))
+    await asyncio.gather(*(vu.run(deadline, names, weights) for vu in vus))
+    return summarize(stats, time.perf_counter() - start)
+
+
+def print_stage(users, report):
+    print(f"\n{users} virtual user(s): {report['requests']} request(s) in {report['seconds']:.1f} s, "
+          f"{report['rps']:.1f} req/s")
+    print(f"{'endpoint':<40} {'count':>7} {'req/s':>7} {'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}  statuses")
+    for name, e in report["endpoints"].items():
+        statuses = " ".join(f"{k}:{v}" for k, v in e["statuses"].items())
+        print(f"{name:<40} {e['count']:>7} {e['rps']:>7.1f} {e['p50'] * 1000:>8.1f} {e['p90'] * 1000:>8.1f} "
+              f"{e['p99'] * 1000:>8.1f} {e['max'] * 1000:>8.1f}  {statuses}")
+    for key, count in sorted(report["errors"].items()):
+        print(f"  error  {key} x{count}")
+
+
+def duplicates(values):
+    seen = set()
+    repeated = set()
+    for value in values:
+        if value in seen:
+            repeated.add(value)
+        seen.add(value)
+    return sorted(repeated, key=str)
+
+
+def check_data(data_dir, expected):
+    # Contrôles après le run : {catégorie: [détails]}, vide si les fichiers sont cohérents
+    problems = {}
+
+    def problem(kind, detail):
+        problems.setdefault(kind, []).append(detail)
+
+    loaded = {}
+    for name, key in DATA_FILES.items():
+        try:
+            with open(os.path.join(data_dir, name), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            problem("unreadable file", f"{name}: {e}")
+            continue
+        if not isinstance(data, dict) or not isinstance(data.get(key), list):
+            problem("unreadable file", f'{name}: no "{key}" array')
+            continue
+        loaded[key] = data[key]
+
+    if "orders" in loaded:
+        ids = [o.get("id") for o in loaded["orders"] if isinstance(o, dict)]
+        for order_id in duplicates(ids):
+            problem("duplicate order id", str(order_id))
+        for order_id in sorted(expected.orders - set(ids)):
+            problem("lost order", order_id)
+
+    if "users" in loaded:
+        users = [u for u in loaded["users"] if isinstance(u, dict)]
+        for user_id in duplicates(u.get("id") for u in users):
+            problem("duplicate user id", str(user_id))
+        for email in duplicates(str(u.get("email", "")).lower() for u in users):
+            problem("duplicate user email", email)
+        txs = [tx.get("id") for u in users for tx in u.get("transactions") or [] if isinstance(tx, dict)]
+        for tx_id in duplicates(txs):
+            problem("duplicate transaction id", str(tx_id))
+        by_email = {}
+        for user in users:
+            history = user.get("transactions") or []
+            if history and history[-1].get("balanceAfter") != user.get("walletBalance"):
+                problem("balance out of sync with history",
+                        f"{user.get('email')}: {user.get('walletBalance')} vs balanceAfter {history[-1].get('balanceAfter')}")
+            by_email.setdefault(user.get("email"), user)
+        for email, account in sorted(expected.accounts.items()):
+            if email in expected.uncertain:
+                continue
+            user = by_email.get(email)
+            if user is None:
+                problem("lost account", email)
+                continue
+            balance = account["credit"] - account["debit"]
+            if user.get("walletBalance") != balance:
+                problem("lost wallet update", f"{email}: {user.get('walletBalance')} stored, {balance} acknowledged")
+            if len(user.get("transactions") or []) != account["tx"]:
+                problem("lost transaction", f"{email}: {len(user.get('transactions') or [])} stored, "
+                                            f"{account['tx']} acknowledged")
+    return problems
+
+
+def print_checks(problems, expected):
+    print(f"\nData checks ({len(expected.orders)} acknowledged order(s), {len(expected.accounts)} account(s), "
+          f"{len(expected.uncertain)} left unverified after errors):")
+    if not problems:
+        print("  ok: files parse, no duplicate ids, no lost orders or wallet updates (shared account included)")
+        return
+    for kind, details in sorted(problems.items()):
+        print(f"  {kind}: {len(details)}")
+        for detail in details[:5]:
+            print(f"      {detail}")
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+def start_server(kind, data_dir):
+    port = free_port()
+    if kind == "express":
+        if not os.path.isdir(os.path.join(BACKEND_DIR, "node_modules")):
+            raise SystemExit("backend/node_modules missing: run npm install in backend/ or use --server standin")
+        cmd = ["node", "server.js"]
+        cwd = BACKEND_DIR
+    else:
+        cmd = [sys.executable, os.path.abspath(__file__), "serve", "--port", str(port), "--data-dir", data_dir]
+        if kind == "standin-unlocked":
+            cmd.append("--unlocked")
+        cwd = ROOT
+    env = dict(os.environ, PORT=str(port))
+    process = subprocess.Popen(cmd, cwd=cwd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return process, port
+
+
+async def wait_ready(host, port, process=None, timeout=15):
+    client = Client(host, port, Stats(), 2)
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if process is not None and process.poll() is not None:
+            raise SystemExit(f"server exited with code {process.returncode}")
+        status, _ = await client.request("health", "GET", "/api/health")
+        if status == 200:
+            client.close()
+            return
+        await asyncio.sleep(0.1)
+    raise SystemExit(f"server not answering on http://{host}:{port}/api/health")
+
+
+def parse_mix(text):
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in MIX:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r} (choose from {', '.join(MIX)})")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+async def load_test(args, host, port, expected):
+    run_id = f"{now_ms():x}"
+    rng = random.Random(args.seed)
+    catalog = []
+    stages = []
+    first = 0
+    for users in args.users:
+        report = await run_stage(host, port, users, args.duration, args.mix, args.think, args.timeout, rng,
+                                 catalog, expected, run_id, first)
+        first += users
+        print_stage(users, report)
+        stages.append(dict(report, users=users))
+    return stages
+
+
+def run(args):
+    # Serveur externe : ses fichiers de données ne sont connus que si --data-dir est donné ;
+    # sinon ni sauvegarde, ni contrôles, ni restauration (backend/data n'est peut-être pas le sien)
+    data_dir = args.data_dir
+    if args.url:
+        url = urlsplit(args.url)
+        host, port, process = url.hostname, url.port or 80, None
+    else:
+        data_dir = data_dir or DATA_DIR
+        if args.server == "express" and os.path.abspath(data_dir) != DATA_DIR:
+            raise SystemExit("the Express server always writes backend/data: drop --data-dir")
+        process, port = start_server(args.server, data_dir)
+        host = HOST
+
+    # Copie des fichiers de données, remise en place après le run
+    backup = tempfile.mkdtemp(prefix="load_test_") if data_dir else None
+    for name in DATA_FILES if data_dir else ():
+        shutil.copy2(os.path.join(data_dir, name), backup)
+    expected = Expected()
+    problems = {}
+    try:
+        asyncio.run(wait_ready(host, port, process))
+        print(f"Load testing http://{host}:{port} "
+              f"({'external server' if process is None else args.server}), stages: {args.users} user(s), "
+              f"{args.duration:g} s each")
+        stages = asyncio.run(load_test(args, host, port, expected))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+        if data_dir is None:
+            print("\nData checks skipped: pass --data-dir with the external server's data folder to enable them")
+        else:
+            problems = check_data(data_dir, expected)
+            print_checks(problems, expected)
+            if args.keep_data:
+                print(f"Data files left as written by the run (backup in {backup})")
+            else:
+                for name in DATA_FILES:
+                    shutil.copy2(os.path.join(backup, name), os.path.join(data_dir, name))
+                shutil.rmtree(backup)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"stages": stages, "problems": problems}, f, ensure_ascii=False, indent=2)
+    return 1 if problems else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay shopping scenarios against the backend and check the data files")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the load test (starts the Python stand-in by default)")
+    run_parser.add_argument("--server", choices=["standin", "standin-unlocked", "express"], default="standin",
+                            help="backend to start: the Python stand-in, the stand-in without file locks "
+                                 "(to see the data checks catch lost writes) or node backend/server.js")
+    run_parser.add_argument("--url", help="test an already running backend instead (e.g. http://localhost:3001)")
+    run_parser.add_argument("--data-dir", help="data files used by the server (default: backend/data; "
+                                               "with --url, data checks only run when this is given)")
+    run_parser.add_argument("--users", type=int, nargs="+", default=[10, 50], help="virtual users, one stage per value")
+    run_parser.add_argument("--duration", type=float, default=10, help="seconds per stage")
+    run_parser.add_argument("--mix", type=parse_mix, default=dict(MIX),
+                            help="scenario weights, e.g. browse=6,checkout=2,topup=1,account=1")
+    run_parser.add_argument("--think", type=float, default=0.1, help="mean pause between scenarios, in seconds (0: none)")
+    run_parser.add_argument("--timeout", type=float, default=10, help="seconds before a request counts as an error")
+    run_parser.add_argument("--seed", type=int, help="random seed for reproducible scenario sequences")
+    run_parser.add_argument("--keep-data", action="store_true", help="leave the data files as the run left them")
+    run_parser.add_argument("--json", metavar="FILE", help="write the stage reports and data checks as JSON")
+
+    serve_parser = commands.add_parser("serve", help="run only the Python stand-in backend")
+    serve_parser.add_argument("--port", type=int, default=3001, help="port to listen on (0: any free port)")
+    serve_parser.add_argument("--data-dir", default=DATA_DIR, help="data files to serve (default: backend/data)")
+    serve_parser.add_argument("--unlocked", action="store_true", help="serve without file locks, like the old routes")
+    args = parser.parse_args()
+
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.port, args.data_dir, not args.unlocked))
+        except KeyboardInterrupt:
+            pass
+        return
+    sys.exit(run(args))
+
+
+if __name__ == "__main__":
+    main()
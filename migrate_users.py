@@ -0,0 +1,338 @@
+import argparse
+import json
+import os
+import random
+import re
+import shutil
+import time
+
+import safe_io
+from safe_io import ROOT
+
+USERS_FILE = os.path.join(ROOT, "backend", "data", "users.json")
+
+# Format alnum : alphabet et longueur du generateUserId qu'écrirait update_id_generator.py (non appliqué)
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+ID_LENGTH = 8
+ALNUM_ID = re.compile(r"[A-Z0-9]{8}")
+# Format digits : routes/auth.js tire dans [10^7, 10^8), generateUserId (src/pages/admin/AdminUsers.jsx)
+# tire 8 chiffres dans '0123456789' et peut produire des zéros en tête ; les deux sont valides
+DIGIT_ID = re.compile(r"[0-9]{8}")
+
+# Champs attendus par le backend (routes/auth.js) et valeur par défaut des comptes anciens
+DEFAULTS = {
+    "role": "client",
+    "walletBalance": 0,
+    "transactions": [],
+}
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+ARRAY_START = re.compile(r'[ \t\n\r]*(?:\{[ \t\n\r]*"(?P<key>[^"]+)"[ \t\n\r]*:[ \t\n\r]*)?\[[ \t\n\r]*')
+SEPARATOR = re.compile(r"[ \t\n\r]*([,\]])[ \t\n\r]*")
+
+
+def iter_array(path, key="users", chunk_size=1 << 20):
+    # Parcourir les éléments du tableau {"<key>": [...]} un par un : la mémoire reste bornée
+    # par la taille du plus gros enregistrement, pas par celle du fichier
+    raw_decode = json.JSONDecoder().raw_decode
+    with open(path, "r", encoding="utf-8") as f:
+        buf = ""
+        eof = False
+        while True:
+            m = ARRAY_START.match(buf)
+            if (m and m.end() < len(buf)) or eof:
+                break
+            more = f.read(chunk_size)
+            eof = not more
+            buf += more
+        if m is None or (m.group("key") is not None and m.group("key") != key):
+            raise ValueError(f"{path}: expected a JSON array or an object whose first key is {key!r}")
+        pos = m.end()
+        if buf.startswith("]", pos):
+            return
+        while True:
+            # Un enregistrement ; s'il est coupé par la fin du tampon, lire la suite
+            while True:
+                try:
+                    record, end = raw_decode(buf, pos)
+                    break
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    more = f.read(chunk_size)
+                    eof = not more
+                    buf = buf[pos:] + more
+                    pos = WHITESPACE.match(buf).end()
+            yield record
+            # Puis "," ou "]"
+            while True:
+                m = SEPARATOR.match(buf, end)
+                if m or eof:
+                    break
+                more = f.read(chunk_size)
+                eof = not more
+                buf = buf[end:] + more
+                end = 0
+            if m is None:
+                raise ValueError(f"{path}: expected ',' or ']' in the {key} array")
+            if m.group(1) == "]":
+                return
+            pos = m.end()
+
+
+class IdSet:
+    # Ensemble d'IDs compact : bitmap pour les IDs à 8 chiffres (format du backend),
+    # entiers base 36 pour les IDs alphanumériques majuscules à 8 caractères, chaînes pour le reste
+
+    def __init__(self):
+        self.bits = bytearray(10 ** ID_LENGTH // 8)
+        self.alnum = set()
+        self.other = set()
+        self.size = 0
+
+    def add(self, value):
+        # Renvoie False si l'ID était déjà présent (tests par méthodes de str, plus rapides qu'une regex)
+        if len(value) == ID_LENGTH and value.isascii() and value.isalnum():
+            if value.isdigit():
+                n = int(value)
+                byte, bit = n >> 3, 1 << (n & 7)
+                if self.bits[byte] & bit:
+                    return False
+                self.bits[byte] |= bit
+                self.size += 1
+                return True
+            if value == value.upper():
+                n = int(value, 36)
+                if n in self.alnum:
+                    return False
+                self.alnum.add(n)
+                self.size += 1
+                return True
+        if value in self.other:
+            return False
+        self.other.add(value)
+        self.size += 1
+        return True
+
+
+class IdAllocator:
+    # Nouveaux IDs tirés par lots, rejetés s'ils existent déjà dans le fichier ou ont déjà été attribués
+
+    def __init__(self, taken, id_format="digits", batch_size=4096, seed=None, digits_from=10 ** (ID_LENGTH - 1)):
+        self.taken = taken
+        self.id_format = id_format
+        self.digits_from = digits_from
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.batch = []
+        self.rejected = 0
+
+    def _refill(self):
+        n = self.batch_size
+        if self.id_format == "digits":
+            # Comme routes/auth.js : Math.floor(10000000 + Math.random() * 90000000) ; les IDs existants
+            # à zéros en tête (AdminUsers.jsx) restent dans le bitmap et ne sont jamais réattribués
+            self.batch = [str(x).zfill(ID_LENGTH) for x in self.rng.choices(range(self.digits_from, 10 ** ID_LENGTH), k=n)]
+        else:
+            chars = "".join(self.rng.choices(ALPHABET, k=n * ID_LENGTH))
+            self.batch = [chars[i:i + ID_LENGTH] for i in range(0, len(chars), ID_LENGTH)]
+
+    def allocate(self):
+        while True:
+            if not self.batch:
+                self._refill()
+            candidate = self.batch.pop()
+            if self.taken.add(candidate):
+                return candidate
+            self.rejected += 1
+
+
+def backfill(user, stats):
+    # Compléter les champs manquants ; "balance" (ancien champ côté front) alimente walletBalance
+    if "walletBalance" not in user and isinstance(user.get("balance"), (int, float)):
+        user["walletBalance"] = user["balance"]
+        stats["backfilled"]["walletBalance"] = stats["backfilled"].get("walletBalance", 0) + 1
+    for field, default in DEFAULTS.items():
+        if field not in user or user[field] is None:
+            user[field] = list(default) if isinstance(default, list) else default
+            stats["backfilled"][field] = stats["backfilled"].get(field, 0) + 1
+    return user
+
+
+encode_string = json.encoder.encode_basestring
+encode_compact = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# Encodage direct des feuilles, selon leur type exact (bool avant int : type(True) est bool)
+LEAVES = {
+    str: encode_string,
+    int: int.__repr__,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null",
+    float: json.JSONEncoder(ensure_ascii=False).encode,
+}
+
+
+def _pretty(value, depth):
+    # json.dumps(indent=2) passe par l'encodeur Python pur, beaucoup plus lent sur un million d'utilisateurs
+    if not value:
+        return "{}" if isinstance(value, dict) else "[]"
+    pad = "\n" + "  " * (depth + 1)
+    parts = []
+    if isinstance(value, dict):
+        for k, v in value.items():
+            leaf = LEAVES.get(type(v))
+            parts.append(f"{pad}{encode_string(str(k))}: {leaf(v) if leaf else _pretty(v, depth + 1)}")
+        return "{" + ",".join(parts) + "\n" + "  " * depth + "}"
+    for v in value:
+        leaf = LEAVES.get(type(v))
+        parts.append(pad + (leaf(v) if leaf else _pretty(v, depth + 1)))
+    return "[" + ",".join(parts) + "\n" + "  " * depth + "]"
+
+
+def format_user(user, compact=False):
+    # Même présentation que JSON.stringify({ users }, null, 2) dans routes/auth.js
+    if compact:
+        return "    " + encode_compact(user)
+    return "    " + _pretty(user, 2)
+
+
+# Valeur provisoire écrite à la place d'un ID à réattribuer, de même longueur qu'un ID final
+PLACEHOLDER = "_" * ID_LENGTH
+
+
+def migrate(path=USERS_FILE, output=None, id_format="digits", reissue=None, mapping=None,
+            dry_run=False, compact=False, seed=None):
+    # Source et cible verrouillées pendant toute la migration (partagé pour un simple essai)
+    with safe_io.locked(path, output or path, shared=dry_run):
+        return _migrate(path, output, id_format, reissue, mapping, dry_run, compact, seed)
+
+
+def _migrate(path, output, id_format, reissue, mapping, dry_run, compact, seed):
+    # Une seule lecture en flux : les IDs à réattribuer sont écrits sous forme provisoire et leur position
+    # notée ; une fois tous les IDs du fichier connus, les nouveaux IDs sont tirés et écrits à ces positions.
+    # reissue="invalid" : remplacer aussi les IDs qui n'ont pas le format choisi
+    start = time.perf_counter()
+    stats = {"users": 0, "duplicates": 0, "missing_ids": 0, "reissued": 0, "backfilled": {}}
+    valid = DIGIT_ID if id_format == "digits" else ALNUM_ID
+    taken = IdSet()
+    pending = []
+    target = output or path
+    out = safe_io.AtomicFile(target, "w+b") if not dry_run else None
+    try:
+        written = 0
+        if out:
+            written += out.write(b'{\n  "users": [')
+        for index, user in enumerate(iter_array(path)):
+            stats["users"] += 1
+            old = str(user["id"]) if user.get("id") else None
+            reason = None
+            if old is None:
+                reason = "missing"
+                stats["missing_ids"] += 1
+            elif not taken.add(old):
+                reason = "duplicate"
+                stats["duplicates"] += 1
+            elif reissue == "invalid" and not valid.fullmatch(old):
+                reason = "invalid"
+                stats["reissued"] += 1
+            if reason:
+                user["id"] = PLACEHOLDER
+            backfill(user, stats)
+            if not out:
+                if reason:
+                    pending.append((None, index, user.get("email"), old, reason))
+                continue
+            data = (("\n" if index == 0 else ",\n") + format_user(user, compact)).encode("utf-8")
+            if reason:
+                offset = data.find(f'"id":{"" if compact else " "}"{PLACEHOLDER}"'.encode()) + (6 if compact else 7)
+                pending.append((written + offset, index, user.get("email"), old, reason))
+            written += out.write(data)
+        if out:
+            out.write(b"\n  ]\n}" if stats["users"] else b"]\n}")
+
+        # Tous les IDs existants sont connus : aucun nouvel ID ne peut recouper un ID plus loin dans le fichier
+        allocator = IdAllocator(taken, id_format, batch_size=max(16, min(len(pending), 1 << 16)), seed=seed)
+        map_out = open(mapping, "w", encoding="utf-8") if mapping and not dry_run else None
+        try:
+            for offset, index, email, old, reason in pending:
+                new = allocator.allocate()
+                if out:
+                    out.seek(offset)
+                    out.write(new.encode("ascii"))
+                if map_out:
+                    map_out.write(json.dumps({"index": index, "email": email, "old": old, "new": new,
+                                              "reason": reason}, ensure_ascii=False) + "\n")
+        finally:
+            if map_out:
+                map_out.close()
+
+        if out:
+            staged = out.finish()
+            if not os.path.exists(target):
+                shutil.copymode(path, out.tmp)
+            safe_io.commit([staged])
+    except BaseException:
+        if out:
+            out.discard()
+        raise
+
+    stats["rejected_candidates"] = allocator.rejected
+    stats["seconds"] = time.perf_counter() - start
+    return stats
+
+
+def write_sample(path, count, duplicate_rate=0.01, seed=0):
+    # Fichier synthétique pour mesurer la migration (IDs à 8 chiffres, quelques doublons, champs manquants)
+    rng = random.Random(seed)
+    with safe_io.atomic_open(path) as f:
+        f.write('{\n  "users": [')
+        previous = []
+        for i in range(count):
+            if previous and rng.random() < duplicate_rate:
+                user_id = rng.choice(previous)
+            else:
+                user_id = str(rng.randrange(10 ** 7, 10 ** 8))
+                if len(previous) < 1000:
+                    previous.append(user_id)
+            user = {"id": user_id, "name": f"User {i}", "email": f"user{i}@example.com"}
+            if i % 3:
+                user["walletBalance"] = rng.randrange(0, 100000)
+                user["joined"] = "2025-12-25"
+            f.write(("\n" if i == 0 else ",\n") + format_user(user))
+        f.write("\n  ]\n}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream users.json: backfill missing fields and fix duplicate IDs")
+    parser.add_argument("path", nargs="?", default=USERS_FILE, help="users file (default: backend/data/users.json)")
+    parser.add_argument("--output", help="write the migrated file here instead of in place")
+    parser.add_argument("--id-format", choices=["digits", "alnum"], default="digits",
+                        help="format of newly allocated IDs (digits: routes/auth.js and AdminUsers.jsx, "
+                             "alnum: update_id_generator.py)")
+    parser.add_argument("--reissue-invalid", action="store_true", help="also replace IDs not in the chosen format")
+    parser.add_argument("--mapping", help="write old -> new ID reassignments to this JSONL file")
+    parser.add_argument("--compact", action="store_true", help="one user per line instead of the backend's layout")
+    parser.add_argument("--dry-run", action="store_true", help="report without writing anything")
+    parser.add_argument("--seed", type=int, help="seed for ID allocation (reproducible runs)")
+    parser.add_argument("--sample", type=int, metavar="N", help="first write a synthetic file with N users to PATH")
+    args = parser.parse_args()
+
+    if args.sample is not None:
+        if args.path == USERS_FILE:
+            parser.error("--sample needs an explicit PATH (refusing to overwrite backend/data/users.json)")
+        write_sample(args.path, args.sample)
+        print(f"Wrote {args.sample} synthetic user(s) to {args.path}")
+
+    stats = migrate(args.path, args.output, args.id_format, "invalid" if args.reissue_invalid else None,
+                    args.mapping, args.dry_run, args.compact, args.seed)
+    backfilled = ", ".join(f"{field}: {n}" for field, n in sorted(stats["backfilled"].items())) or "none"
+    print(f"{stats['users']} user(s) in {stats['seconds']:.2f} s")
+    print(f"  duplicate IDs reassigned: {stats['duplicates']}, missing IDs: {stats['missing_ids']}, "
+          f"reissued: {stats['reissued']} ({stats['rejected_candidates']} colliding candidate(s) rejected)")
+    print(f"  backfilled fields: {backfilled}")
+    if args.dry_run:
+        print("  dry run: nothing written")
+
+
+if __name__ == "__main__":
+    main()
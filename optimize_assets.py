@@ -0,0 +1,267 @@
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import safe_io
+from safe_io import ROOT
+
+# Pillow n'est nécessaire que s'il reste des images à traiter
+try:
+    from PIL import Image, features
+except ImportError:
+    Image = None
+    features = None
+
+SOURCE_DIR = os.path.join("public", "assets")
+OUTPUT_DIR = os.path.join("public", "assets", "optimized")
+# Manifeste importable depuis le JSX : import images from '../imageManifest.json'
+MANIFEST_FILE = os.path.join("src", "imageManifest.json")
+CACHE_FILE = os.path.join(ROOT, ".asset_cache.json")
+
+EXTENSIONS = (".png", ".jpg", ".jpeg")
+WIDTHS = [320, 640, 960, 1280]
+FORMATS = ["avif", "webp"]
+QUALITY = {"webp": 80, "avif": 55}
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def settings_key(widths, formats):
+    # Changer les tailles, formats ou qualités invalide le cache
+    return json.dumps({"widths": widths, "formats": formats, "quality": QUALITY}, sort_keys=True)
+
+
+def load_cache():
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_cache(cache):
+    safe_io.atomic_write(CACHE_FILE, json.dumps(cache, indent=2, sort_keys=True))
+
+
+def supported_formats(formats):
+    # AVIF demande Pillow >= 11.2 (ou pillow-avif-plugin), WebP demande libwebp
+    available = []
+    for fmt in formats:
+        if fmt == "avif":
+            try:
+                import pillow_avif  # noqa: F401
+            except ImportError:
+                pass
+        if features.check(fmt):
+            available.append(fmt)
+        else:
+            print(f"warning: this Pillow build cannot write {fmt}, skipping it")
+    return available
+
+
+def target_widths(width, widths):
+    # Jamais d'agrandissement ; la largeur d'origine sert de plus grande variante si elle est plus petite
+    chosen = [w for w in widths if w < width]
+    if not chosen or width <= max(widths):
+        chosen.append(width)
+    return sorted(set(chosen))
+
+
+def process_image(rel, digest, widths, formats):
+    # Exécuté dans un processus du pool : toutes les variantes d'une image
+    start = time.perf_counter()
+    stem = os.path.splitext(os.path.basename(rel))[0]
+    variants = []
+    staged = []
+    try:
+        with Image.open(os.path.join(ROOT, rel)) as img:
+            img.load()
+            width, height = img.size
+            mode = "RGBA" if img.mode in ("RGBA", "LA", "P") else "RGB"
+            img = img.convert(mode)
+            for w in target_widths(width, widths):
+                h = round(height * w / width)
+                resized = img if w == width else img.resize((w, h), Image.LANCZOS)
+                for fmt in formats:
+                    name = f"{stem}.{digest[:8]}.{w}w.{fmt}"
+                    out = safe_io.AtomicFile(os.path.join(ROOT, OUTPUT_DIR, name), "wb")
+                    try:
+                        resized.save(out.file, format=fmt.upper(), quality=QUALITY[fmt])
+                        size = out.tell()
+                        staged.append(out.finish())
+                    except BaseException:
+                        out.discard()
+                        raise
+                    variants.append({"format": fmt, "width": w, "height": h, "file": name, "bytes": size})
+    except BaseException:
+        safe_io.discard(staged)
+        raise
+    # Toutes les variantes de l'image renommées en un lot
+    safe_io.commit(staged)
+    return {
+        "path": rel,
+        "hash": digest,
+        "width": width,
+        "height": height,
+        "bytes": os.path.getsize(os.path.join(ROOT, rel)),
+        "variants": variants,
+        "seconds": time.perf_counter() - start,
+    }
+
+
+def find_images(source=SOURCE_DIR):
+    images = []
+    for name in sorted(os.listdir(os.path.join(ROOT, source))):
+        if name.lower().endswith(EXTENSIONS) and os.path.isfile(os.path.join(ROOT, source, name)):
+            images.append(os.path.join(source, name))
+    return images
+
+
+def public_url(rel):
+    # public/assets/x.png -> /assets/x.png (chemin servi par Vite)
+    return "/" + os.path.relpath(os.path.join(ROOT, rel), os.path.join(ROOT, "public")).replace(os.sep, "/")
+
+
+def build_manifest(entries):
+    manifest = {}
+    for entry in sorted(entries, key=lambda e: e["path"]):
+        sources = {}
+        for v in entry["variants"]:
+            sources.setdefault(v["format"], []).append({
+                "src": public_url(os.path.join(OUTPUT_DIR, v["file"])),
+                "width": v["width"],
+            })
+        # Même ordre que les <source> d'un <picture> : format le plus compact en premier
+        sources = {fmt: sources[fmt] for fmt in FORMATS if fmt in sources}
+        manifest[public_url(entry["path"])] = {
+            "width": entry["width"],
+            "height": entry["height"],
+            "sources": sources,
+            "srcset": {fmt: ", ".join(f"{s['src']} {s['width']}w" for s in items) for fmt, items in sources.items()},
+        }
+    return manifest
+
+
+def remove_stale(entries):
+    # Supprimer les variantes qui ne correspondent plus à aucune image
+    keep = {v["file"] for entry in entries for v in entry["variants"]}
+    removed = 0
+    folder = os.path.join(ROOT, OUTPUT_DIR)
+    for name in os.listdir(folder):
+        if name not in keep and not (name.startswith(".") and name.endswith(".tmp")):
+            os.remove(os.path.join(folder, name))
+            removed += 1
+    return removed
+
+
+def run(widths=WIDTHS, formats=FORMATS, workers=None, use_cache=True, force=False):
+    cache = load_cache() if use_cache else {}
+    # La clé porte sur les formats réellement écrits : une variante AVIF absente faute de support
+    # ne doit pas être considérée comme à jour le jour où Pillow sait l'écrire
+    writable = supported_formats(formats) if Image is not None else None
+    key = settings_key(widths, writable) if writable is not None else None
+    images = find_images()
+    entries = []
+    todo = []
+    for rel in images:
+        digest = file_hash(os.path.join(ROOT, rel))
+        cached = cache.get(rel)
+        outputs_present = cached and all(
+            os.path.exists(os.path.join(ROOT, OUTPUT_DIR, v["file"])) for v in cached["variants"]
+        )
+        if cached and key is None:
+            # Sans Pillow rien ne peut être réécrit : on garde les variantes produites avec les formats
+            # demandés qu'offrait la machine qui les a générées
+            written = json.loads(cached.get("settings") or "{}").get("formats") or []
+            fresh = cached.get("settings") == settings_key(widths, [fmt for fmt in formats if fmt in written])
+        else:
+            fresh = cached and cached.get("settings") == key
+        if not force and cached and cached["hash"] == digest and fresh and outputs_present:
+            entries.append(cached)
+        else:
+            todo.append((rel, digest))
+
+    processed = []
+    if todo:
+        if Image is None:
+            raise SystemExit(f"{len(todo)} image(s) need processing but Pillow is not installed (pip install Pillow)")
+        os.makedirs(os.path.join(ROOT, OUTPUT_DIR), exist_ok=True)
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(process_image, rel, digest, widths, writable) for rel, digest in todo]
+            for future in futures:
+                entry = future.result()
+                entry["settings"] = key
+                processed.append(entry)
+                cache[entry["path"]] = entry
+        entries += processed
+
+    # Les images supprimées de public/assets disparaissent du cache et du manifeste
+    for rel in list(cache):
+        if rel not in images:
+            del cache[rel]
+    removed = remove_stale(entries) if os.path.isdir(os.path.join(ROOT, OUTPUT_DIR)) else 0
+
+    manifest = build_manifest(entries)
+    safe_io.atomic_write(os.path.join(ROOT, MANIFEST_FILE), json.dumps(manifest, indent=2) + "\n")
+    if use_cache:
+        save_cache(cache)
+    return entries, processed, removed
+
+
+def report(entries, processed, removed):
+    # Gain par image : original contre la variante la plus compacte à sa largeur d'origine.
+    # Une image plus large que la plus grande taille du srcset n'a pas de telle variante : sa plus grande
+    # variante est réduite, la comparer à l'original gonflerait le gain ; elle est comptée à part
+    totals = {"full": [0, 0], "downscaled": [0, 0]}
+    processed_paths = {entry["path"] for entry in processed}
+    for entry in sorted(entries, key=lambda e: e["path"]):
+        if not entry["variants"]:
+            continue
+        widest = max(v["width"] for v in entry["variants"])
+        best = min((v for v in entry["variants"] if v["width"] == widest), key=lambda v: v["bytes"])
+        kind = "full" if widest == entry["width"] else "downscaled"
+        totals[kind][0] += entry["bytes"]
+        totals[kind][1] += best["bytes"]
+        state = f"{entry['seconds'] * 1000:.0f} ms" if entry["path"] in processed_paths else "cached"
+        note = "" if kind == "full" else f", largest variant {widest}px of {entry['width']}px"
+        print(f"  {os.path.basename(entry['path']):<40} {entry['bytes'] / 1024:>8.1f} KB -> "
+              f"{best['bytes'] / 1024:>7.1f} KB {best['format']:<4} ({len(entry['variants'])} variant(s), {state}{note})")
+    print(f"{len(entries)} image(s), {len(processed)} processed, {len(entries) - len(processed)} cached, "
+          f"{removed} stale variant(s) removed")
+    before, after = totals["full"]
+    saved = before - after
+    percent = 100 * saved / before if before else 0
+    print(f"Full-width bytes: {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+          f"({saved / 1024:.1f} KB saved, {percent:.1f}%)")
+    before, after = totals["downscaled"]
+    if before:
+        print(f"Wider than the srcset maximum: {before / 1024:.1f} KB originals -> {after / 1024:.1f} KB "
+              f"at their largest variant (smaller images, not a like-for-like saving)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Resize and recompress public/assets images into WebP/AVIF variants")
+    parser.add_argument("--widths", type=int, nargs="+", default=WIDTHS, help="srcset widths in pixels")
+    parser.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS, help="output formats")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes")
+    parser.add_argument("--no-cache", action="store_true", help="ignore and do not update .asset_cache.json")
+    parser.add_argument("--force", action="store_true", help="reprocess every image")
+    args = parser.parse_args()
+
+    # Une seule exécution à la fois : remove_stale effacerait les temporaires d'une autre
+    with safe_io.locked(os.path.join(ROOT, OUTPUT_DIR)):
+        entries, processed, removed = run(sorted(args.widths), args.formats, args.workers, not args.no_cache, args.force)
+    report(entries, processed, removed)
+
+
+if __name__ == "__main__":
+    main()
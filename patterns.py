@@ -0,0 +1,109 @@
+import re
+import time
+
+# Registre central des regex : compilées une seule fois par processus
+PATTERNS = {}
+
+# Regex compilées, partagées entre noms identiques (même motif, mêmes flags)
+_compiled = {}
+
+
+class Pattern:
+    # Regex compilée avec compteurs : correspondances, caractères parcourus, temps passé
+    # et appel le plus lent (révélateur des retours arrière des motifs .*? en DOTALL)
+
+    def __init__(self, name, regex):
+        self.name = name
+        self.regex = regex
+        self.calls = 0
+        self.matches = 0
+        self.scanned = 0
+        self.seconds = 0.0
+        self.slowest = 0.0
+
+    def sub(self, repl, string, count=0):
+        start = time.perf_counter()
+        result, n = self.regex.subn(repl, string, count=count)
+        self._record(string, n, start)
+        return result
+
+    def search(self, string):
+        start = time.perf_counter()
+        match = self.regex.search(string)
+        self._record(string, 1 if match else 0, start)
+        return match
+
+    def findall(self, string):
+        start = time.perf_counter()
+        found = self.regex.findall(string)
+        self._record(string, len(found), start)
+        return found
+
+    def finditer(self, string):
+        # Liste (et non itérateur) pour que le temps mesuré couvre tout le parcours
+        start = time.perf_counter()
+        found = list(self.regex.finditer(string))
+        self._record(string, len(found), start)
+        return found
+
+    def _record(self, string, matches, start):
+        elapsed = time.perf_counter() - start
+        self.seconds += elapsed
+        self.slowest = max(self.slowest, elapsed)
+        self.calls += 1
+        self.matches += matches
+        self.scanned += len(string)
+
+
+def register(name, pattern, flags=0):
+    # Renvoyer le Pattern déjà enregistré sous ce nom, sinon le compiler
+    if name in PATTERNS:
+        return PATTERNS[name]
+    key = (pattern, flags)
+    if key not in _compiled:
+        _compiled[key] = re.compile(pattern, flags)
+    PATTERNS[name] = Pattern(name, _compiled[key])
+    return PATTERNS[name]
+
+
+def stats():
+    return {
+        name: {"calls": p.calls, "matches": p.matches, "scanned": p.scanned,
+               "seconds": p.seconds, "slowest": p.slowest}
+        for name, p in PATTERNS.items()
+    }
+
+
+def totals():
+    # Temps et correspondances cumulés de tous les motifs (pour mesurer un appel par différence)
+    seconds = 0.0
+    matches = 0
+    for p in PATTERNS.values():
+        seconds += p.seconds
+        matches += p.matches
+    return seconds, matches
+
+
+def reset():
+    for p in PATTERNS.values():
+        p.calls = p.matches = p.scanned = 0
+        p.seconds = p.slowest = 0.0
+
+
+def merge_stats(total, other):
+    # Additionner des statistiques venant d'un autre processus
+    for name, s in other.items():
+        t = total.setdefault(name, {"calls": 0, "matches": 0, "scanned": 0, "seconds": 0.0, "slowest": 0.0})
+        for field in ("calls", "matches", "scanned", "seconds"):
+            t[field] += s[field]
+        t["slowest"] = max(t["slowest"], s["slowest"])
+    return total
+
+
+def print_stats(data=None):
+    data = stats() if data is None else data
+    rows = sorted(data.items(), key=lambda item: item[1]["seconds"], reverse=True)
+    print(f"{'pattern':<45} {'calls':>6} {'matches':>8} {'chars':>10} {'ms':>9}")
+    for name, s in rows:
+        flag = "  (never matched)" if s["calls"] and not s["matches"] else ""
+        print(f"{name:<45} {s['calls']:>6} {s['matches']:>8} {s['scanned']:>10} {s['seconds'] * 1000:>9.2f}{flag}")
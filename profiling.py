@@ -0,0 +1,127 @@
+import time
+
+import patterns
+
+
+class Timings:
+    # Mesures d'une exécution : par transformation (temps, temps regex, substitutions)
+    # et par fichier (octets lus / écrits et temps d'entrée-sortie)
+
+    def __init__(self):
+        self.transforms = {}
+        self.files = {}
+
+    def _transform_entry(self, path, name):
+        return self.transforms.setdefault(f"{path}|{name}", {
+            "path": path, "name": name, "calls": 0, "cached": 0,
+            "seconds": 0.0, "regex_seconds": 0.0, "substitutions": 0, "changed": False,
+        })
+
+    def _file_entry(self, path):
+        return self.files.setdefault(path, {
+            "read_bytes": 0, "read_seconds": 0.0, "written_bytes": 0, "write_seconds": 0.0,
+        })
+
+    def call(self, path, func, content):
+        # Appeler la transformation en mesurant le temps total et la part passée dans les regex
+        regex_before, matches_before = patterns.totals()
+        start = time.perf_counter()
+        result = func(content)
+        elapsed = time.perf_counter() - start
+        regex_after, matches_after = patterns.totals()
+
+        entry = self._transform_entry(path, func.__name__)
+        entry["calls"] += 1
+        entry["seconds"] += elapsed
+        entry["regex_seconds"] += regex_after - regex_before
+        entry["substitutions"] += matches_after - matches_before
+        entry["changed"] = entry["changed"] or result != content
+        entry["message"] = getattr(func, "message", "changed")
+        return result
+
+    def skipped(self, path, name):
+        self._transform_entry(path, name)["cached"] += 1
+
+    def read(self, path, content, seconds):
+        entry = self._file_entry(path)
+        entry["read_seconds"] += seconds
+        entry["read_bytes"] += len(content.encode("utf-8"))
+
+    def wrote(self, path, content, seconds):
+        entry = self._file_entry(path)
+        entry["write_seconds"] += seconds
+        entry["written_bytes"] += len(content.encode("utf-8"))
+
+    def to_dict(self):
+        return {"transforms": self.transforms, "files": self.files}
+
+    def merge(self, data):
+        # Ajouter les mesures d'un processus du pool
+        for key, t in data["transforms"].items():
+            entry = self._transform_entry(t["path"], t["name"])
+            for field in ("calls", "cached", "seconds", "regex_seconds", "substitutions"):
+                entry[field] += t[field]
+            entry["changed"] = entry["changed"] or t["changed"]
+            entry.setdefault("message", t.get("message"))
+        for path, f in data["files"].items():
+            entry = self._file_entry(path)
+            for field in entry:
+                entry[field] += f[field]
+
+    def summary(self, group_files=False):
+        # Une ligne par script (et par fichier) à la place des anciens print("... added!")
+        # group_files : une seule ligne par script et une seule ligne d'E/S pour tous les fichiers
+        rows = list(self.transforms.values())
+        files = self.files
+        if group_files:
+            grouped = {}
+            for t in rows:
+                g = grouped.setdefault(t["name"], dict(t, path=0, calls=0, cached=0, seconds=0.0,
+                                                        regex_seconds=0.0, substitutions=0, changed=0))
+                g["path"] += 1
+                for field in ("calls", "cached", "seconds", "regex_seconds", "substitutions"):
+                    g[field] += t[field]
+                g["changed"] += bool(t["changed"])
+            rows = [dict(g, path=f"{g['path']} file(s)") for g in grouped.values()]
+            total = {"read_bytes": 0, "read_seconds": 0.0, "written_bytes": 0, "write_seconds": 0.0}
+            for f in files.values():
+                for field in total:
+                    total[field] += f[field]
+            files = {f"{len(self.files)} file(s)": total} if self.files else {}
+
+        lines = []
+        for t in rows:
+            if t["calls"] == 0:
+                state = "skipped (cached no-op)"
+            elif group_files:
+                state = f"{t['changed']} changed"
+            else:
+                state = t["message"] if t["changed"] else "no change"
+            lines.append(
+                f"{t['name']:<28} {t['path']:<40} {t['seconds'] * 1000:>8.2f} ms "
+                f"(regex {t['regex_seconds'] * 1000:.2f} ms) {t['substitutions']:>4} sub(s)  {state}"
+            )
+        for path, f in files.items():
+            lines.append(
+                f"{'[io]':<28} {path:<40} read {f['read_bytes']} B in {f['read_seconds'] * 1000:.2f} ms, "
+                f"wrote {f['written_bytes']} B in {f['write_seconds'] * 1000:.2f} ms"
+            )
+        return lines
+
+    def collapsed_stacks(self):
+        # Format "pile;de;cadres valeur" lu par flamegraph.pl et speedscope (valeurs en µs)
+        lines = []
+        for t in self.transforms.values():
+            base = f"codemod;{t['path']};{t['name']}"
+            regex = int(t["regex_seconds"] * 1e6)
+            other = int((t["seconds"] - t["regex_seconds"]) * 1e6)
+            if regex:
+                lines.append(f"{base};regex {regex}")
+            if other:
+                lines.append(f"{base};python {other}")
+        for path, f in self.files.items():
+            if f["read_seconds"]:
+                lines.append(f"codemod;{path};read {int(f['read_seconds'] * 1e6)}")
+            if f["write_seconds"]:
+                lines.append(f"codemod;{path};write {int(f['write_seconds'] * 1e6)}")
+        return lines
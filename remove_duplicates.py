@@ -1,39 +1,28 @@
-import re
+from codemod import PROFILE, run, transform
+from jsx_index import JSXIndex
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    lines = f.readlines()
 
-# Trouver et supprimer les lignes dupliquées ID Compte
-output_lines = []
-id_compte_count = 0
-skip_until_next_div = False
-i = 0
+@transform(PROFILE, "Duplicate ID Compte fields removed!", version=2)
+def remove_duplicates(content):
+    # Un seul libellé ID Compte au plus : rien à dédoublonner, inutile de construire l'index
+    if content.count("ID Compte") < 2:
+        return content
+    index = JSXIndex(content)
 
-while i < len(lines):
-    line = lines[i]
-    
-    # Détecter les blocs ID Compte
-    if 'ID Compte' in line and '<small' in line:
-        id_compte_count += 1
-        if id_compte_count == 1:
-            # Garder le premier bloc
-            output_lines.append(line)
-            i += 1
-        else:
-            # Sauter les blocs suivants
-            # Sauter jusqu'à la fin du div
-            while i < len(lines) and '</div>' not in lines[i]:
-                i += 1
-            if i < len(lines):
-                i += 1  # Sauter aussi le </div>
-            continue
-    else:
-        output_lines.append(line)
-        i += 1
+    # Trouver les blocs ID Compte : le <div> parent de chaque libellé
+    blocks = []
+    for label in index.find_text("small", "ID Compte"):
+        block = label.parent if label.parent is not None and label.parent.tag == "div" else label
+        if block.end is not None and block not in blocks:
+            blocks.append(block)
 
-# Écrire le fichier nettoyé
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.writelines(output_lines)
+    # Garder le premier bloc, supprimer les suivants (depuis la fin)
+    for block in reversed(blocks[1:]):
+        start, end = index.line_span(block.start, block.end)
+        content = content[:start] + content[end:]
 
-print(f"Removed {id_compte_count - 1} duplicate ID Compte fields!")
+    return content
+
+
+if __name__ == "__main__":
+    run(["remove_duplicates"])
@@ -0,0 +1,81 @@
+import re
+
+from codemod import APP, run, transform
+from patterns import register
+
+IMPORT = register(
+    "remove_unused_imports.import",
+    r"^import[ \t]+(?P<clause>[^'\";]+?)[ \t]+from[ \t]+(?P<source>'[^']+'|\"[^\"]+\")(?P<semi>;?)[ \t]*\n?",
+    re.MULTILINE,
+)
+# Identifiants utilisés hors des imports (les accès de propriété obj.x ne comptent pas)
+IDENTIFIER = register("remove_unused_imports.identifier", r"(?<![\w$.])[A-Za-z_$][\w$]*")
+
+
+def parse_clause(clause):
+    # "Default, { a, b as c }" -> ("Default", None, [("a", "a"), ("b", "c")]) ; "* as ns" -> namespace
+    default = None
+    namespace = None
+    named = None
+    rest = clause.strip()
+    if "{" in rest:
+        before, _, inner = rest.partition("{")
+        inner = inner.rsplit("}", 1)[0]
+        named = []
+        for spec in inner.split(","):
+            spec = " ".join(spec.split())
+            if spec:
+                imported, _, local = spec.partition(" as ")
+                named.append((imported, local or imported))
+        rest = before
+    rest = rest.strip().rstrip(",").strip()
+    if "*" in rest:
+        before, _, ns = rest.partition("*")
+        namespace = ns.replace("as", "", 1).strip()
+        rest = before.strip().rstrip(",").strip()
+    if rest:
+        default = rest
+    return default, namespace, named
+
+
+def build_import(default, namespace, named, source, semi):
+    parts = []
+    if default:
+        parts.append(default)
+    if namespace:
+        parts.append(f"* as {namespace}")
+    if named:
+        parts.append("{ " + ", ".join(i if i == local else f"{i} as {local}" for i, local in named) + " }")
+    return f"import {', '.join(parts)} from {source}{semi}"
+
+
+def used_names(content):
+    return set(IDENTIFIER.findall(IMPORT.sub("", content)))
+
+
+def prune_imports(content, used):
+    # Retirer les liaisons d'import absentes de used (un import vidé disparaît)
+    def repl(match):
+        default, namespace, named = parse_clause(match.group("clause"))
+        kept_default = default if default in used else None
+        kept_namespace = namespace if namespace in used else None
+        kept_named = [(i, local) for i, local in named if local in used] if named is not None else None
+        if (kept_default, kept_namespace, kept_named) == (default, namespace, named):
+            return match.group(0)
+        if not kept_default and not kept_namespace and not kept_named:
+            return ""
+        newline = "\n" if match.group(0).endswith("\n") else ""
+        return build_import(kept_default, kept_namespace, kept_named, match.group("source"), match.group("semi")) + newline
+
+    return IMPORT.sub(repl, content)
+
+
+@transform(APP, "Unused imports removed!")
+def remove_unused_imports(content):
+    # Retirer les liaisons d'import jamais utilisées (signalées par no-unused-vars) ;
+    # l'usage est revérifié sur le contenu actuel, le rapport ESLint peut être plus ancien que le fichier
+    return prune_imports(content, used_names(content))
+
+
+if __name__ == "__main__":
+    run(["remove_unused_imports"])
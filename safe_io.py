@@ -0,0 +1,261 @@
+import hashlib
+import os
+import re
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager, nullcontext
+
+# Verrous consultatifs : fcntl.flock sous Linux / macOS. Sans fcntl (Windows) les verrous ne font rien,
+# les écritures restent atomiques (fichier temporaire + os.replace)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Racine du projet, partagée par les codemods et les outils de données (les scripts sont à la racine)
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Un fichier de verrou par cible, à part : la cible change d'inode à chaque os.replace
+LOCK_DIR = os.path.join(ROOT, ".locks")
+LOCK_TIMEOUT = 30.0
+LOCK_POLL = 0.05
+
+# Masque du processus, lu une fois : os.umask() ne sait que le remplacer, pas le lire sans risque entre threads
+UMASK = os.umask(0)
+os.umask(UMASK)
+
+# Verrous détenus par ce processus : chemin du verrou -> [fd, compteur, exclusif]
+_held = {}
+
+
+class ConflictError(Exception):
+    # Une cible a changé depuis sa lecture : l'écrire ferait perdre la modification d'un autre processus
+    pass
+
+
+def lock_path(path):
+    full = os.path.abspath(path)
+    digest = hashlib.sha1(full.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(LOCK_DIR, f"{os.path.basename(full)}.{digest}.lock")
+
+
+def _acquire(name, exclusive, timeout):
+    held = _held.get(name)
+    if held:
+        # Réentrant : un verrou partagé déjà détenu est converti si un verrou exclusif est demandé
+        if exclusive and not held[2]:
+            _flock(held[0], name, True, timeout)
+            held[2] = True
+        held[1] += 1
+        return
+    os.makedirs(LOCK_DIR, exist_ok=True)
+    fd = os.open(name, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        _flock(fd, name, exclusive, timeout)
+    except BaseException:
+        os.close(fd)
+        raise
+    _held[name] = [fd, 1, exclusive]
+
+
+def _flock(fd, name, exclusive, timeout):
+    if fcntl is None:
+        return
+    mode = (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            fcntl.flock(fd, mode)
+            return
+        except BlockingIOError:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{name} still locked by another process after {timeout:g} s") from None
+            time.sleep(LOCK_POLL)
+
+
+def _release(name):
+    held = _held[name]
+    held[1] -= 1
+    if held[1]:
+        return
+    del _held[name]
+    if fcntl is not None:
+        fcntl.flock(held[0], fcntl.LOCK_UN)
+    os.close(held[0])
+
+
+@contextmanager
+def locked(*paths, shared=False, timeout=LOCK_TIMEOUT):
+    # Verrous des cibles pris dans un ordre fixe : deux lots qui se recoupent ne s'interbloquent pas
+    names = sorted({lock_path(p) for p in paths})
+    taken = []
+    try:
+        for name in names:
+            _acquire(name, not shared, timeout)
+            taken.append(name)
+        yield
+    finally:
+        for name in reversed(taken):
+            _release(name)
+
+
+def relative_path(file_path):
+    # Les rapports et logs contiennent des chemins absolus d'une autre machine (C:\Users\...\TRY MY DAY\src\App.jsx) :
+    # garder le plus long suffixe qui existe dans le dépôt
+    parts = [p for p in re.split(r"[\\/]", file_path) if p]
+    for i in range(len(parts)):
+        candidate = os.path.join(*parts[i:])
+        if os.path.exists(os.path.join(ROOT, candidate)):
+            return candidate
+    return file_path
+
+
+def read_text(path):
+    # (contenu, hash des octets lus) ; fins de ligne normalisées comme open(path, "r")
+    with open(path, "rb") as f:
+        data = f.read()
+    content = data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+    return content, hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+class AtomicFile:
+    # Fichier temporaire à côté de la cible (même système de fichiers, donc os.replace atomique).
+    # Se comporte comme le fichier ouvert ; finish() le vide sur disque (fsync) avant le renommage
+
+    def __init__(self, path, mode="w", encoding="utf-8", newline=None):
+        self.path = os.path.abspath(path)
+        fd, self.tmp = tempfile.mkstemp(dir=os.path.dirname(self.path),
+                                        prefix=f".{os.path.basename(self.path)}.", suffix=".tmp")
+        self.file = open(fd, mode, encoding=None if "b" in mode else encoding, newline=None if "b" in mode else newline)
+        self.abandoned = False
+
+    def __getattr__(self, name):
+        return getattr(self.file, name)
+
+    def abandon(self):
+        # Ne pas remplacer la cible (contenu identique, par exemple)
+        self.abandoned = True
+
+    def finish(self):
+        if not self.file.closed:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+        if os.path.exists(self.path):
+            shutil.copymode(self.path, self.tmp)
+        else:
+            # mkstemp crée en 0600 : un nouveau fichier prend les droits d'un open() ordinaire (0644 sous umask 022)
+            os.chmod(self.tmp, 0o666 & ~UMASK)
+        return self.path, self.tmp
+
+    def discard(self):
+        if not self.file.closed:
+            self.file.close()
+        if os.path.exists(self.tmp):
+            os.remove(self.tmp)
+
+
+@contextmanager
+def atomic_open(path, mode="w", encoding="utf-8", newline=None, lock=True, expected=None):
+    # Écrire en flux dans un temporaire ; la cible n'est remplacée qu'à la sortie sans erreur du bloc
+    out = AtomicFile(path, mode, encoding, newline)
+    try:
+        yield out
+    except BaseException:
+        out.discard()
+        raise
+    if out.abandoned:
+        out.discard()
+        return
+    commit([out.finish()], {out.path: expected} if expected else None, lock)
+
+
+def stage(path, content, encoding="utf-8", newline=None):
+    # Contenu complet écrit et synchronisé dans un temporaire ; renvoie (cible, temporaire) pour commit()
+    out = AtomicFile(path, "wb" if isinstance(content, bytes) else "w", encoding, newline)
+    try:
+        out.write(content)
+        return out.finish()
+    except BaseException:
+        out.discard()
+        raise
+
+
+def commit(staged, expected=None, lock=True):
+    # Renommer un lot de temporaires sur leurs cibles sous verrou exclusif.
+    # expected : {cible: hash lu} ; si une cible a changé depuis, rien n'est renommé (ConflictError).
+    # Un seul fsync par dossier après tous les renommages, au lieu d'un par fichier
+    if not staged:
+        return
+    targets = [os.path.abspath(path) for path, _ in staged]
+    with locked(*targets) if lock else nullcontext():
+        if expected:
+            changed = [p for p in targets if p in expected and file_hash(p) != expected[p]]
+            if changed:
+                discard(staged)
+                raise ConflictError(f"changed by another process since it was read: {', '.join(changed)}")
+        for target, (_, tmp) in zip(targets, staged):
+            os.replace(tmp, target)
+        for folder in sorted({os.path.dirname(t) for t in targets}):
+            fsync_dir(folder)
+
+
+def discard(staged):
+    for _, tmp in staged:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+
+
+def atomic_write(path, content, encoding="utf-8", newline=None, lock=True, expected=None):
+    commit([stage(path, content, encoding, newline)], {os.path.abspath(path): expected} if expected else None, lock)
+
+
+def fsync_dir(folder):
+    # Rend le renommage durable ; impossible d'ouvrir un dossier sous Windows, on s'en passe
+    try:
+        fd = os.open(folder, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+if __name__ == "__main__":
+    # Vérification rapide : droits d'un nouveau fichier, remplacement atomique, conflit détecté
+    with tempfile.TemporaryDirectory() as folder:
+        target = os.path.join(folder, "check.json")
+        previous = os.umask(0o022)
+        UMASK = 0o022
+        try:
+            atomic_write(target, "{}", lock=False)
+        finally:
+            os.umask(previous)
+        mode = os.stat(target).st_mode & 0o777
+        assert mode == 0o644, f"new file mode {mode:o}, expected 644"
+        os.chmod(target, 0o600)
+        _, digest = read_text(target)
+        atomic_write(target, "[]", lock=False, expected=digest)
+        assert os.stat(target).st_mode & 0o777 == 0o600, "existing file mode not kept"
+        try:
+            atomic_write(target, "{}", lock=False, expected=digest)
+        except ConflictError:
+            pass
+        else:
+            raise AssertionError("stale hash not detected")
+        assert sorted(os.listdir(folder)) == ["check.json"], "temporary file left behind"
+    print("safe_io: ok")
@@ -1,18 +1,18 @@
-import re
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+USER_ID = register("shorten_id_regex.user_id", r'({user\.id \|\| [\'"]N/A[\'"])')
 
-# Utiliser regex pour trouver et remplacer le pattern de l'ID
-# Chercher spécifiquement dans la section avec l'emoji ID
-pattern = r'({user\.id \|\| [\'"]N/A[\'"])'
-replacement = r'{user.id ? user.id.slice(-8) : \'N/A\'}'
 
-content = re.sub(pattern, replacement, content)
+@transform(PROFILE, "ID display shortened successfully!")
+def shorten_id_regex(content):
+    # Utiliser regex pour trouver et remplacer le pattern de l'ID
+    # Chercher spécifiquement dans la section avec l'emoji ID
+    replacement = r'{user.id ? user.id.slice(-8) : \'N/A\'}'
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
+    content = USER_ID.sub(replacement, content)
+    return content
 
-print("ID display shortened successfully!")
+
+if __name__ == "__main__":
+    run(["shorten_id_regex"])
@@ -1,14 +1,16 @@
 import re
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+from codemod import PROFILE, run, transform
+from patterns import register
 
-# Remplacer le contenu de la carte de profil
-# Chercher et remplacer tout le Card.Body
-old_pattern = r'(<Card className="shadow-sm border-0 mb-3">\s*<Card\.Body className="text-center py-4">)(.*?)(</Card\.Body>\s*</Card>)'
+CARD = register("simplify_profile_card.card", r'(<Card className="shadow-sm border-0 mb-3">\s*<Card\.Body className="text-center py-4">)(.*?)(</Card\.Body>\s*</Card>)', re.DOTALL)
 
-new_content = r'''\1
+
+@transform(PROFILE, "Profile card simplified with icons!")
+def simplify_profile_card(content):
+    # Remplacer le contenu de la carte de profil
+    # Chercher et remplacer tout le Card.Body
+    new_content = r'''\1
                             <div className="mb-3">
                                 <i className="bi bi-person-circle" style={{ fontSize: '4rem', color: '#ff6000' }}></i>
                             </div>
@@ -24,10 +26,9 @@ new_content = r'''\1
                             </div>
                         \3'''
 
-content = re.sub(old_pattern, new_content, content, flags=re.DOTALL, count=1)
+    content = CARD.sub(new_content, content, count=1)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Profile.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Profile card simplified with icons!")
+if __name__ == "__main__":
+    run(["simplify_profile_card"])
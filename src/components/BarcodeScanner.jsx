@@ -1,8 +1,10 @@
 import React, { useEffect, useRef } from 'react';
 import { Modal, Button } from 'react-bootstrap';
 import { Html5QrcodeScanner } from 'html5-qrcode';
+import { useLanguage } from '../context/LanguageContext';
 
 const BarcodeScanner = ({ show, onHide, onScan }) => {
+    const { t } = useLanguage();
     const scannerRef = useRef(null);
 
     useEffect(() => {
@@ -52,18 +54,18 @@ const BarcodeScanner = ({ show, onHide, onScan }) => {
     return (
         <Modal show={show} onHide={onHide} centered size="md">
             <Modal.Header closeButton>
-                <Modal.Title>Scanner un Code-Barre</Modal.Title>
+                <Modal.Title>{t('scanner_un_code_barre')}</Modal.Title>
             </Modal.Header>
             <Modal.Body>
                 <div id="reader" style={{ width: '100%' }}></div>
                 <div className="mt-3 text-center text-muted small">
                     <i className="bi bi-camera me-2"></i>
-                    Placez le code-barre devant la caméra
+                    {t('placez_le_code_barre_devant_la')}
                 </div>
             </Modal.Body>
             <Modal.Footer>
                 <Button variant="secondary" onClick={onHide}>
-                    Fermer
+                    {t('fermer')}
                 </Button>
             </Modal.Footer>
         </Modal>
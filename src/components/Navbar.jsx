@@ -10,7 +10,7 @@ import { useCart } from '../context/CartContext';
 const Navigation = () => {
     const { user, logout } = useAuth();
     const { getCartCount } = useCart();
-    const { language, setLanguage } = useLanguage();
+    const { language, setLanguage, t } = useLanguage();
     const [searchTerm, setSearchTerm] = useState('');
     const [activeSidebarCat, setActiveSidebarCat] = useState('Femme');
     const [showSidebarMenu, setShowSidebarMenu] = useState(false);
@@ -57,7 +57,7 @@ const Navigation = () => {
                                 <div className="d-flex bg-light rounded-2 border p-1 search-wrapper transition-all">
                                     <Form.Control
                                         type="text"
-                                        placeholder="Que recherchez-vous aujourd'hui ?"
+                                        placeholder={t('que_recherchez_vous_aujourd_hui')}
                                         className="bg-transparent border-0 shadow-none px-3 py-1"
                                         value={searchTerm}
                                         onChange={(e) => setSearchTerm(e.target.value)}
@@ -93,24 +93,24 @@ const Navigation = () => {
                                     id="user-dropdown"
                                     className="custom-nav-dropdown border-0"
                                 >
-                                    <NavDropdown.Item as={Link} to="/profile"><i className="bi bi-person-circle me-3 text-warning"></i> Mon Profil</NavDropdown.Item>
+                                    <NavDropdown.Item as={Link} to="/profile"><i className="bi bi-person-circle me-3 text-warning"></i> {t('mon_profil')}</NavDropdown.Item>
                                     {(user.role === 'admin' || user.role === 'manager' || user.role === 'expediteur') && (
-                                        <NavDropdown.Item as={Link} to="/admin" className="fw-bold text-primary"><i className="bi bi-speedometer2 me-3"></i> Dashboard</NavDropdown.Item>
+                                        <NavDropdown.Item as={Link} to="/admin" className="fw-bold text-primary"><i className="bi bi-speedometer2 me-3"></i> {t('dashboard')}</NavDropdown.Item>
                                     )}
                                     <NavDropdown.Divider />
-                                    <NavDropdown.Item onClick={logout} className="text-danger"><i className="bi bi-box-arrow-right me-3"></i> Déconnexion</NavDropdown.Item>
+                                    <NavDropdown.Item onClick={logout} className="text-danger"><i className="bi bi-box-arrow-right me-3"></i> {t('deconnexion')}</NavDropdown.Item>
                                 </NavDropdown>
                             ) : (
                                 <Link to="/login" className="text-dark text-decoration-none d-flex align-items-center action-item px-2 py-1 transition-all">
                                     <i className="bi bi-person fs-4 me-xl-1"></i>
-                                    <span className="d-none d-xl-inline fw-bold" style={{ fontSize: '0.75rem' }}>Connexion</span>
+                                    <span className="d-none d-xl-inline fw-bold" style={{ fontSize: '0.75rem' }}>{t('connexion')}</span>
                                 </Link>
                             )}
 
                             {/* Favorites Action */}
                             <Link to="/favorites" className="text-dark text-decoration-none d-flex align-items-center action-item px-2 py-1 transition-all">
                                 <i className="bi bi-heart fs-4 me-xl-1 text-danger"></i>
-                                <span className="d-none d-xl-inline fw-bold" style={{ fontSize: '0.75rem' }}>Favoris</span>
+                                <span className="d-none d-xl-inline fw-bold" style={{ fontSize: '0.75rem' }}>{t('favoris')}</span>
                             </Link>
 
                             {/* Cart Action */}
@@ -126,7 +126,7 @@ const Navigation = () => {
                                         {getCartCount()}
                                     </Badge>
                                 </div>
-                                <span className="d-none d-xl-inline fw-bold" style={{ fontSize: '0.75rem' }}>Panier</span>
+                                <span className="d-none d-xl-inline fw-bold" style={{ fontSize: '0.75rem' }}>{t('panier')}</span>
                             </Link>
 
                             {/* Language Selector */}
@@ -161,7 +161,7 @@ const Navigation = () => {
                             <InputGroup>
                                 <Form.Control
                                     type="text"
-                                    placeholder="Que recherchez-vous ?"
+                                    placeholder={t('que_recherchez_vous')}
                                     className="bg-light border-0"
                                     value={searchTerm}
                                     onChange={(e) => setSearchTerm(e.target.value)}
@@ -184,31 +184,31 @@ const Navigation = () => {
                             style={{ cursor: 'pointer' }}
                         >
                             <i className="bi bi-list fs-6 me-2"></i>
-                            <span className="fw-bold small">TOUTES LES CATÉGORIES</span>
+                            <span className="fw-bold small">{t('toutes_les_categories_2')}</span>
                         </div>
 
                         {/* Standard Nav Links */}
                         <Link to="/shop?sort=new" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-dark text-decoration-none">
-                            NOUVEAUTÉS
+                            {t('nouveautes')}
                         </Link>
                         <Link to="/shop" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-dark text-decoration-none">
-                            MARQUES
+                            {t('marques')}
                         </Link>
                         <Link to="/shop?cat=Gifts" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-dark text-decoration-none">
-                            IDÉES CADEAUX
+                            {t('idees_cadeaux')}
                         </Link>
                         <Link to="/shop?cat=Collections" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-dark text-decoration-none">
-                            COLLECTIONS
+                            {t('collections')}
                         </Link>
                         <Link to="/shop?cat=Favorites" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-dark text-decoration-none">
-                            COUPS DE CŒUR
+                            {t('coups_de_coeur')}
                         </Link>
                         <Link to="/shop?cat=Flash" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-decoration-none" style={{ color: '#7b1fad' }}>
-                            <i className="bi bi-lightning-fill me-1"></i> OFFRES FLASH
+                            <i className="bi bi-lightning-fill me-1"></i> {t('offres_flash')}
                         </Link>
                         {/* Quick links for common categories */}
                         <Link to="/shop?cat=Best" className="nav-link-item py-2 px-3 text-uppercase small fw-bold text-danger text-decoration-none">
-                            <i className="bi bi-fire me-1"></i> MEILLEURES VENTES
+                            <i className="bi bi-fire me-1"></i> {t('meilleures_ventes')}
                         </Link>
                     </Nav>
 
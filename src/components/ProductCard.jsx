@@ -7,7 +7,7 @@ import { useLanguage } from '../context/LanguageContext';
 const ProductCard = ({ product }) => {
     const { toggleFavorite, isFavorite } = useFavorites();
     const { user } = useAuth();
-    const { NoTranslate } = useLanguage();
+    const { NoTranslate, t } = useLanguage();
     const navigate = useNavigate();
     const favorite = isFavorite(product.id);
 
@@ -18,7 +18,7 @@ const ProductCard = ({ product }) => {
         e.stopPropagation();
 
         if (!user) {
-            navigate('/register', { state: { from: `/product/${product.id}`, message: 'Inscrivez-vous pour ajouter des produits à vos favoris !' } });
+            navigate('/register', { state: { from: `/product/${product.id}`, message: t('inscrivez_vous_pour_ajouter_des') } });
             return;
         }
 
@@ -66,7 +66,7 @@ const ProductCard = ({ product }) => {
                         }}>
                         <span className="text-white">
                             <i className="bi bi-lightning-fill me-1"></i>
-                            STOCK LIMITÉ
+                            {t('stock_limite')}
                         </span>
                     </div>
                 )}
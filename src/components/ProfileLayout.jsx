@@ -2,8 +2,10 @@ import { useState } from 'react';
 import { Container, Row, Col, Card, ListGroup, Badge, Modal, Button } from 'react-bootstrap';
 import { Link, useLocation } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
+import { useLanguage } from '../context/LanguageContext';
 
 const ProfileLayout = ({ children }) => {
+    const { t } = useLanguage();
     const { user, logout, updateUser } = useAuth();
     const [showBalance, setShowBalance] = useState(false);
     const [showAvatarModal, setShowAvatarModal] = useState(false);
@@ -46,28 +48,28 @@ const ProfileLayout = ({ children }) => {
 
     const menuSections = [
         {
-            title: 'Mes Commandes',
+            title: t('mes_commandes_2'),
             items: [
-                { icon: 'bi-box-seam', label: 'Toutes mes commandes', link: '/profile/orders', badge: null },
-                { icon: 'bi-arrow-repeat', label: 'Commander encore', link: '/profile/reorder', badge: null },
+                { icon: 'bi-box-seam', label: t('toutes_mes_commandes'), link: '/profile/orders', badge: null },
+                { icon: 'bi-arrow-repeat', label: t('commander_encore'), link: '/profile/reorder', badge: null },
             ]
         },
         {
-            title: 'Portefeuille & Coupons',
+            title: t('portefeuille_coupons'),
             items: [
-                { icon: 'bi-wallet2', label: 'Mon portefeuille', link: '/profile/wallet', badge: null },
-                { icon: 'bi-ticket-perforated', label: 'Mes coupons', link: '/profile/coupons', badge: null },
+                { icon: 'bi-wallet2', label: t('mon_portefeuille'), link: '/profile/wallet', badge: null },
+                { icon: 'bi-ticket-perforated', label: t('mes_coupons'), link: '/profile/coupons', badge: null },
             ]
         },
         {
-            title: 'Mon Compte & Aide',
+            title: t('mon_compte_aide'),
             items: [
-                { icon: 'bi-person', label: 'Informations utilisateur', link: '/profile/info', badge: null },
-                { icon: 'bi-geo-alt', label: 'Mes adresses', link: '/profile/addresses', badge: null },
-                { icon: 'bi-credit-card-2-front', label: 'Cartes enregistrées', link: '/profile/cards', badge: null },
-                { icon: 'bi-shield-lock', label: 'Confidentialité', link: '/profile/privacy', badge: null },
-                { icon: 'bi-toggles', label: 'Paramètres actifs', link: '/profile/settings', badge: null },
-                { icon: 'bi-question-circle', label: 'Aide', link: '/help', badge: null },
+                { icon: 'bi-person', label: t('informations_utilisateur'), link: '/profile/info', badge: null },
+                { icon: 'bi-geo-alt', label: t('mes_adresses'), link: '/profile/addresses', badge: null },
+                { icon: 'bi-credit-card-2-front', label: t('cartes_enregistrees'), link: '/profile/cards', badge: null },
+                { icon: 'bi-shield-lock', label: t('confidentialite'), link: '/profile/privacy', badge: null },
+                { icon: 'bi-toggles', label: t('parametres_actifs'), link: '/profile/settings', badge: null },
+                { icon: 'bi-question-circle', label: t('aide'), link: '/help', badge: null },
             ]
         }
     ];
@@ -213,7 +215,7 @@ const ProfileLayout = ({ children }) => {
                                 style={{ cursor: 'pointer' }}
                             >
                                 <i className="bi bi-box-arrow-right me-2" style={{ fontSize: '1rem' }}></i>
-                                <span className="fw-bold" style={{ fontSize: '0.8rem' }}>Déconnexion</span>
+                                <span className="fw-bold" style={{ fontSize: '0.8rem' }}>{t('deconnexion')}</span>
                             </ListGroup.Item>
                         </ListGroup>
                     </Card>
@@ -230,7 +232,7 @@ const ProfileLayout = ({ children }) => {
                 <Modal.Header closeButton style={{ background: 'linear-gradient(135deg, #f39d48ff 0%, #f6ce93ff 100%)', color: 'white', border: 'none' }}>
                     <Modal.Title style={{ fontSize: '1.1rem' }}>
                         <i className="bi bi-emoji-smile me-2"></i>
-                        Choisir un avatar
+                        {t('choisir_un_avatar')}
                     </Modal.Title>
                 </Modal.Header>
                 <Modal.Body style={{ maxHeight: '400px', overflowY: 'auto' }}>
@@ -274,7 +276,7 @@ const ProfileLayout = ({ children }) => {
                 </Modal.Body>
                 <Modal.Footer style={{ border: 'none' }}>
                     <Button variant="secondary" size="sm" onClick={() => setShowAvatarModal(false)}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                 </Modal.Footer>
             </Modal>
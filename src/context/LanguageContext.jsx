@@ -1,9 +1,38 @@
-import React, { createContext, useContext, useState, useEffect } from 'react';
+import React, { createContext, useContext, useState, useEffect, useRef } from 'react';
+import shellMessages from '../locales/fr/shell.json';
 
 const LanguageContext = createContext();
 
+// Bundles written by extract_strings.py: src/locales/<code>/shell.json holds the keys of the modules in the
+// entry chunk, pages.json those of the lazy() routes. Only the French shell ships with the entry chunk.
+const bundles = import.meta.glob(['../locales/*/*.json', '!../locales/fr/shell.json'], { import: 'default' });
+
+const loadLocale = (code) => Promise.all(
+    Object.keys(bundles)
+        .filter(path => path.startsWith(`../locales/${code}/`))
+        .map(path => bundles[path]().catch(() => ({})))
+).then(parts => Object.assign({}, ...parts));
+
 export const LanguageProvider = ({ children }) => {
     const [language, setLanguage] = useState(localStorage.getItem('language') || 'FR');
+    // Other languages and namespaces are loaded on startup and fall back to French for the keys they do
+    // not translate; until they arrive, a lookup outside the shell suspends its lazy route
+    const [messages, setMessages] = useState(shellMessages);
+    const loading = useRef(null);
+
+    useEffect(() => {
+        const code = language.toLowerCase();
+        let cancelled = false;
+        const pending = Promise.all([loadLocale('fr'), code === 'fr' ? {} : loadLocale(code)])
+            .then(([french, local]) => {
+                if (!cancelled) setMessages({ ...shellMessages, ...french, ...local });
+            })
+            .finally(() => {
+                if (loading.current === pending) loading.current = null;
+            });
+        loading.current = pending;
+        return () => { cancelled = true; };
+    }, [language]);
 
     useEffect(() => {
         localStorage.setItem('language', language);
@@ -48,11 +77,20 @@ export const LanguageProvider = ({ children }) => {
         </span>
     );
 
-    // Fallback translation function for components still using it
-    const t = (key) => {
+    // Translation lookup with {name} placeholders; unknown keys fall back to their last segment
+    const t = (key, values) => {
         if (!key) return "";
-        const parts = key.split('.');
-        return parts[parts.length - 1];
+        let text = messages[key];
+        if (text === undefined && loading.current) {
+            // Key of a lazy page whose bundle is still loading: let the route's <Suspense> wait for it
+            throw loading.current;
+        }
+        if (text === undefined) {
+            const parts = key.split('.');
+            text = parts[parts.length - 1];
+        }
+        if (!values) return text;
+        return text.replace(/\{(\w+)\}/g, (match, name) => (name in values ? (values[name] ?? '') : match));
     };
 
     return (
@@ -3,8 +3,10 @@ import { useState } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Addresses = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const navigate = useNavigate();
     const [showModal, setShowModal] = useState(false);
@@ -32,15 +34,15 @@ const Addresses = () => {
         return (
             <ProfileLayout>
                 <div className="mb-4">
-                    <h3 className="fw-bold">Mes adresses</h3>
-                    <p className="text-muted">Gérez vos adresses de livraison</p>
+                    <h3 className="fw-bold">{t('mes_adresses')}</h3>
+                    <p className="text-muted">{t('gerez_vos_adresses_de_livraison')}</p>
                 </div>
                 <Container className="py-5 text-center">
                     <Alert variant="info">
-                        <Alert.Heading>Connexion requise</Alert.Heading>
-                        <p>Vous devez être connecté pour gérer vos adresses.</p>
+                        <Alert.Heading>{t('connexion_requise')}</Alert.Heading>
+                        <p>{t('vous_devez_etre_connecte_pour')}</p>
                         <Button variant="primary" onClick={() => navigate('/login')}>
-                            Se connecter
+                            {t('se_connecter')}
                         </Button>
                     </Alert>
                 </Container>
@@ -74,7 +76,7 @@ const Addresses = () => {
 
     const handleSaveAddress = () => {
         if (!formData.title || !formData.fullName || !formData.address || !formData.city) {
-            alert('Veuillez remplir tous les champs obligatoires');
+            alert(t('veuillez_remplir_tous_les_champs'));
             return;
         }
 
@@ -95,7 +97,7 @@ const Addresses = () => {
     };
 
     const handleDeleteAddress = (id) => {
-        if (window.confirm('Êtes-vous sûr de vouloir supprimer cette adresse ?')) {
+        if (window.confirm(t('etes_vous_sur_de_vouloir'))) {
             const newAddresses = addresses.filter(addr => addr.id !== id);
             saveAddresses(newAddresses);
         }
@@ -106,21 +108,21 @@ const Addresses = () => {
             <div className="d-flex justify-content-between align-items-center mb-4">
                 <h2 className="fw-bold">
                     <i className="bi bi-geo-alt-fill me-2"></i>
-                    Mes Adresses
+                    {t('mes_adresses_2')}
                 </h2>
                 <Button variant="warning" className="text-white fw-bold" onClick={() => handleOpenModal()}>
                     <i className="bi bi-plus-lg me-2"></i>
-                    Nouvelle adresse
+                    {t('nouvelle_adresse')}
                 </Button>
             </div>
 
             {addresses.length === 0 ? (
                 <div className="text-center py-5">
                     <i className="bi bi-house" style={{ fontSize: '5rem', color: '#ddd' }}></i>
-                    <h3 className="mt-4 text-muted">Aucune adresse enregistrée</h3>
-                    <p className="text-muted mb-4">Ajoutez une adresse pour faciliter vos commandes</p>
+                    <h3 className="mt-4 text-muted">{t('aucune_adresse_enregistree')}</h3>
+                    <p className="text-muted mb-4">{t('ajoutez_une_adresse_pour')}</p>
                     <Button variant="warning" className="text-white fw-bold" onClick={() => handleOpenModal()}>
-                        Ajouter une adresse
+                        {t('ajouter_une_adresse')}
                     </Button>
                 </div>
             ) : (
@@ -172,10 +174,10 @@ const Addresses = () => {
                 <Modal.Body>
                     <Form>
                         <Form.Group className="mb-3">
-                            <Form.Label>Titre de l'adresse *</Form.Label>
+                            <Form.Label>{t('titre_de_l_adresse')}</Form.Label>
                             <Form.Control
                                 type="text"
-                                placeholder="Ex: Maison, Bureau, etc."
+                                placeholder={t('ex_maison_bureau_etc')}
                                 value={formData.title}
                                 onChange={e => setFormData({ ...formData, title: e.target.value })}
                             />
@@ -184,7 +186,7 @@ const Addresses = () => {
                         <Row>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Nom complet *</Form.Label>
+                                    <Form.Label>{t('nom_complet')}</Form.Label>
                                     <Form.Control
                                         type="text"
                                         value={formData.fullName}
@@ -194,7 +196,7 @@ const Addresses = () => {
                             </Col>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Téléphone</Form.Label>
+                                    <Form.Label>{t('telephone')}</Form.Label>
                                     <Form.Control
                                         type="tel"
                                         value={formData.phone}
@@ -205,7 +207,7 @@ const Addresses = () => {
                         </Row>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Adresse complète *</Form.Label>
+                            <Form.Label>{t('adresse_complete')}</Form.Label>
                             <Form.Control
                                 as="textarea"
                                 rows={2}
@@ -217,7 +219,7 @@ const Addresses = () => {
                         <Row>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Ville *</Form.Label>
+                                    <Form.Label>{t('ville')}</Form.Label>
                                     <Form.Control
                                         type="text"
                                         value={formData.city}
@@ -227,7 +229,7 @@ const Addresses = () => {
                             </Col>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Code postal</Form.Label>
+                                    <Form.Label>{t('code_postal')}</Form.Label>
                                     <Form.Control
                                         type="text"
                                         value={formData.postalCode}
@@ -238,216 +240,216 @@ const Addresses = () => {
                         </Row>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Pays</Form.Label>
+                            <Form.Label>{t('pays')}</Form.Label>
                             <Form.Select
                                 value={formData.country}
                                 onChange={e => setFormData({ ...formData, country: e.target.value })}
                             >
-                                <option value="Afghanistan">Afghanistan</option>
-                                <option value="Afrique du Sud">Afrique du Sud</option>
-                                <option value="Albanie">Albanie</option>
-                                <option value="Algérie">Algérie</option>
-                                <option value="Allemagne">Allemagne</option>
-                                <option value="Andorre">Andorre</option>
-                                <option value="Angola">Angola</option>
-                                <option value="Antigua-et-Barbuda">Antigua-et-Barbuda</option>
-                                <option value="Arabie Saoudite">Arabie Saoudite</option>
-                                <option value="Argentine">Argentine</option>
-                                <option value="Arménie">Arménie</option>
-                                <option value="Australie">Australie</option>
-                                <option value="Autriche">Autriche</option>
-                                <option value="Azerbaïdjan">Azerbaïdjan</option>
-                                <option value="Bahamas">Bahamas</option>
-                                <option value="Bahreïn">Bahreïn</option>
-                                <option value="Bangladesh">Bangladesh</option>
-                                <option value="Barbade">Barbade</option>
-                                <option value="Belgique">Belgique</option>
-                                <option value="Belize">Belize</option>
-                                <option value="Bénin">Bénin</option>
-                                <option value="Bhoutan">Bhoutan</option>
-                                <option value="Biélorussie">Biélorussie</option>
-                                <option value="Birmanie">Birmanie</option>
-                                <option value="Bolivie">Bolivie</option>
-                                <option value="Bosnie-Herzégovine">Bosnie-Herzégovine</option>
-                                <option value="Botswana">Botswana</option>
-                                <option value="Brésil">Brésil</option>
-                                <option value="Brunei">Brunei</option>
-                                <option value="Bulgarie">Bulgarie</option>
-                                <option value="Burkina Faso">Burkina Faso</option>
-                                <option value="Burundi">Burundi</option>
-                                <option value="Cambodge">Cambodge</option>
-                                <option value="Cameroun">Cameroun</option>
-                                <option value="Canada">Canada</option>
-                                <option value="Cap-Vert">Cap-Vert</option>
-                                <option value="Chili">Chili</option>
-                                <option value="Chine">Chine</option>
-                                <option value="Chypre">Chypre</option>
-                                <option value="Colombie">Colombie</option>
-                                <option value="Comores">Comores</option>
-                                <option value="Congo">Congo</option>
-                                <option value="Corée du Nord">Corée du Nord</option>
-                                <option value="Corée du Sud">Corée du Sud</option>
-                                <option value="Costa Rica">Costa Rica</option>
-                                <option value="Côte d'Ivoire">Côte d'Ivoire</option>
-                                <option value="Croatie">Croatie</option>
-                                <option value="Cuba">Cuba</option>
-                                <option value="Danemark">Danemark</option>
-                                <option value="Djibouti">Djibouti</option>
-                                <option value="Dominique">Dominique</option>
-                                <option value="Égypte">Égypte</option>
-                                <option value="Émirats Arabes Unis">Émirats Arabes Unis</option>
-                                <option value="Équateur">Équateur</option>
-                                <option value="Érythrée">Érythrée</option>
-                                <option value="Espagne">Espagne</option>
-                                <option value="Estonie">Estonie</option>
-                                <option value="Eswatini">Eswatini</option>
-                                <option value="États-Unis">États-Unis</option>
-                                <option value="Éthiopie">Éthiopie</option>
-                                <option value="Fidji">Fidji</option>
-                                <option value="Finlande">Finlande</option>
-                                <option value="France">France</option>
-                                <option value="Gabon">Gabon</option>
-                                <option value="Gambie">Gambie</option>
-                                <option value="Géorgie">Géorgie</option>
-                                <option value="Ghana">Ghana</option>
-                                <option value="Grèce">Grèce</option>
-                                <option value="Grenade">Grenade</option>
-                                <option value="Guatemala">Guatemala</option>
-                                <option value="Guinée">Guinée</option>
-                                <option value="Guinée-Bissau">Guinée-Bissau</option>
-                                <option value="Guinée Équatoriale">Guinée Équatoriale</option>
-                                <option value="Guyana">Guyana</option>
-                                <option value="Haïti">Haïti</option>
-                                <option value="Honduras">Honduras</option>
-                                <option value="Hongrie">Hongrie</option>
-                                <option value="Inde">Inde</option>
-                                <option value="Indonésie">Indonésie</option>
-                                <option value="Irak">Irak</option>
-                                <option value="Iran">Iran</option>
-                                <option value="Irlande">Irlande</option>
-                                <option value="Islande">Islande</option>
-                                <option value="Israël">Israël</option>
-                                <option value="Italie">Italie</option>
-                                <option value="Jamaïque">Jamaïque</option>
-                                <option value="Japon">Japon</option>
-                                <option value="Jordanie">Jordanie</option>
-                                <option value="Kazakhstan">Kazakhstan</option>
-                                <option value="Kenya">Kenya</option>
-                                <option value="Kirghizistan">Kirghizistan</option>
-                                <option value="Kiribati">Kiribati</option>
-                                <option value="Koweït">Koweït</option>
-                                <option value="Laos">Laos</option>
-                                <option value="Lesotho">Lesotho</option>
-                                <option value="Lettonie">Lettonie</option>
-                                <option value="Liban">Liban</option>
-                                <option value="Liberia">Liberia</option>
-                                <option value="Libye">Libye</option>
-                                <option value="Liechtenstein">Liechtenstein</option>
-                                <option value="Lituanie">Lituanie</option>
-                                <option value="Luxembourg">Luxembourg</option>
-                                <option value="Macédoine du Nord">Macédoine du Nord</option>
-                                <option value="Madagascar">Madagascar</option>
-                                <option value="Malaisie">Malaisie</option>
-                                <option value="Malawi">Malawi</option>
-                                <option value="Maldives">Maldives</option>
-                                <option value="Mali">Mali</option>
-                                <option value="Malte">Malte</option>
-                                <option value="Maroc">Maroc</option>
-                                <option value="Marshall">Marshall</option>
-                                <option value="Maurice">Maurice</option>
-                                <option value="Mauritanie">Mauritanie</option>
-                                <option value="Mexique">Mexique</option>
-                                <option value="Micronésie">Micronésie</option>
-                                <option value="Moldavie">Moldavie</option>
-                                <option value="Monaco">Monaco</option>
-                                <option value="Mongolie">Mongolie</option>
-                                <option value="Monténégro">Monténégro</option>
-                                <option value="Mozambique">Mozambique</option>
-                                <option value="Namibie">Namibie</option>
-                                <option value="Nauru">Nauru</option>
-                                <option value="Népal">Népal</option>
-                                <option value="Nicaragua">Nicaragua</option>
-                                <option value="Niger">Niger</option>
-                                <option value="Nigeria">Nigeria</option>
-                                <option value="Norvège">Norvège</option>
-                                <option value="Nouvelle-Zélande">Nouvelle-Zélande</option>
-                                <option value="Oman">Oman</option>
-                                <option value="Ouganda">Ouganda</option>
-                                <option value="Ouzbékistan">Ouzbékistan</option>
-                                <option value="Pakistan">Pakistan</option>
-                                <option value="Palaos">Palaos</option>
-                                <option value="Palestine">Palestine</option>
-                                <option value="Panama">Panama</option>
-                                <option value="Papouasie-Nouvelle-Guinée">Papouasie-Nouvelle-Guinée</option>
-                                <option value="Paraguay">Paraguay</option>
-                                <option value="Pays-Bas">Pays-Bas</option>
-                                <option value="Pérou">Pérou</option>
-                                <option value="Philippines">Philippines</option>
-                                <option value="Pologne">Pologne</option>
-                                <option value="Portugal">Portugal</option>
-                                <option value="Qatar">Qatar</option>
-                                <option value="République Centrafricaine">République Centrafricaine</option>
-                                <option value="République Démocratique du Congo">République Démocratique du Congo</option>
-                                <option value="République Dominicaine">République Dominicaine</option>
-                                <option value="République Tchèque">République Tchèque</option>
-                                <option value="Roumanie">Roumanie</option>
-                                <option value="Royaume-Uni">Royaume-Uni</option>
-                                <option value="Russie">Russie</option>
-                                <option value="Rwanda">Rwanda</option>
-                                <option value="Saint-Christophe-et-Niévès">Saint-Christophe-et-Niévès</option>
-                                <option value="Saint-Marin">Saint-Marin</option>
-                                <option value="Saint-Vincent-et-les-Grenadines">Saint-Vincent-et-les-Grenadines</option>
-                                <option value="Sainte-Lucie">Sainte-Lucie</option>
-                                <option value="Salomon">Salomon</option>
-                                <option value="Salvador">Salvador</option>
-                                <option value="Samoa">Samoa</option>
-                                <option value="São Tomé-et-Principe">São Tomé-et-Principe</option>
-                                <option value="Sénégal">Sénégal</option>
-                                <option value="Serbie">Serbie</option>
-                                <option value="Seychelles">Seychelles</option>
-                                <option value="Sierra Leone">Sierra Leone</option>
-                                <option value="Singapour">Singapour</option>
-                                <option value="Slovaquie">Slovaquie</option>
-                                <option value="Slovénie">Slovénie</option>
-                                <option value="Somalie">Somalie</option>
-                                <option value="Soudan">Soudan</option>
-                                <option value="Soudan du Sud">Soudan du Sud</option>
-                                <option value="Sri Lanka">Sri Lanka</option>
-                                <option value="Suède">Suède</option>
-                                <option value="Suisse">Suisse</option>
-                                <option value="Suriname">Suriname</option>
-                                <option value="Syrie">Syrie</option>
-                                <option value="Tadjikistan">Tadjikistan</option>
-                                <option value="Tanzanie">Tanzanie</option>
-                                <option value="Tchad">Tchad</option>
-                                <option value="Thaïlande">Thaïlande</option>
-                                <option value="Timor Oriental">Timor Oriental</option>
-                                <option value="Togo">Togo</option>
-                                <option value="Tonga">Tonga</option>
-                                <option value="Trinité-et-Tobago">Trinité-et-Tobago</option>
-                                <option value="Tunisie">Tunisie</option>
-                                <option value="Turkménistan">Turkménistan</option>
-                                <option value="Turquie">Turquie</option>
-                                <option value="Tuvalu">Tuvalu</option>
-                                <option value="Ukraine">Ukraine</option>
-                                <option value="Uruguay">Uruguay</option>
-                                <option value="Vanuatu">Vanuatu</option>
-                                <option value="Vatican">Vatican</option>
-                                <option value="Venezuela">Venezuela</option>
-                                <option value="Viêt Nam">Viêt Nam</option>
-                                <option value="Yémen">Yémen</option>
-                                <option value="Zambie">Zambie</option>
-                                <option value="Zimbabwe">Zimbabwe</option>
+                                <option value="Afghanistan">{t('afghanistan')}</option>
+                                <option value="Afrique du Sud">{t('afrique_du_sud')}</option>
+                                <option value="Albanie">{t('albanie')}</option>
+                                <option value="Algérie">{t('algerie')}</option>
+                                <option value="Allemagne">{t('allemagne')}</option>
+                                <option value="Andorre">{t('andorre')}</option>
+                                <option value="Angola">{t('angola')}</option>
+                                <option value="Antigua-et-Barbuda">{t('antigua_et_barbuda')}</option>
+                                <option value="Arabie Saoudite">{t('arabie_saoudite')}</option>
+                                <option value="Argentine">{t('argentine')}</option>
+                                <option value="Arménie">{t('armenie')}</option>
+                                <option value="Australie">{t('australie')}</option>
+                                <option value="Autriche">{t('autriche')}</option>
+                                <option value="Azerbaïdjan">{t('azerbaidjan')}</option>
+                                <option value="Bahamas">{t('bahamas')}</option>
+                                <option value="Bahreïn">{t('bahrein')}</option>
+                                <option value="Bangladesh">{t('bangladesh')}</option>
+                                <option value="Barbade">{t('barbade')}</option>
+                                <option value="Belgique">{t('belgique')}</option>
+                                <option value="Belize">{t('belize')}</option>
+                                <option value="Bénin">{t('benin')}</option>
+                                <option value="Bhoutan">{t('bhoutan')}</option>
+                                <option value="Biélorussie">{t('bielorussie')}</option>
+                                <option value="Birmanie">{t('birmanie')}</option>
+                                <option value="Bolivie">{t('bolivie')}</option>
+                                <option value="Bosnie-Herzégovine">{t('bosnie_herzegovine')}</option>
+                                <option value="Botswana">{t('botswana')}</option>
+                                <option value="Brésil">{t('bresil')}</option>
+                                <option value="Brunei">{t('brunei')}</option>
+                                <option value="Bulgarie">{t('bulgarie')}</option>
+                                <option value="Burkina Faso">{t('burkina_faso')}</option>
+                                <option value="Burundi">{t('burundi')}</option>
+                                <option value="Cambodge">{t('cambodge')}</option>
+                                <option value="Cameroun">{t('cameroun')}</option>
+                                <option value="Canada">{t('canada')}</option>
+                                <option value="Cap-Vert">{t('cap_vert')}</option>
+                                <option value="Chili">{t('chili')}</option>
+                                <option value="Chine">{t('chine')}</option>
+                                <option value="Chypre">{t('chypre')}</option>
+                                <option value="Colombie">{t('colombie')}</option>
+                                <option value="Comores">{t('comores')}</option>
+                                <option value="Congo">{t('congo')}</option>
+                                <option value="Corée du Nord">{t('coree_du_nord')}</option>
+                                <option value="Corée du Sud">{t('coree_du_sud')}</option>
+                                <option value="Costa Rica">{t('costa_rica')}</option>
+                                <option value="Côte d'Ivoire">{t('cote_d_ivoire')}</option>
+                                <option value="Croatie">{t('croatie')}</option>
+                                <option value="Cuba">{t('cuba')}</option>
+                                <option value="Danemark">{t('danemark')}</option>
+                                <option value="Djibouti">{t('djibouti')}</option>
+                                <option value="Dominique">{t('dominique')}</option>
+                                <option value="Égypte">{t('egypte')}</option>
+                                <option value="Émirats Arabes Unis">{t('emirats_arabes_unis')}</option>
+                                <option value="Équateur">{t('equateur')}</option>
+                                <option value="Érythrée">{t('erythree')}</option>
+                                <option value="Espagne">{t('espagne')}</option>
+                                <option value="Estonie">{t('estonie')}</option>
+                                <option value="Eswatini">{t('eswatini')}</option>
+                                <option value="États-Unis">{t('etats_unis')}</option>
+                                <option value="Éthiopie">{t('ethiopie')}</option>
+                                <option value="Fidji">{t('fidji')}</option>
+                                <option value="Finlande">{t('finlande')}</option>
+                                <option value="France">{t('france')}</option>
+                                <option value="Gabon">{t('gabon')}</option>
+                                <option value="Gambie">{t('gambie')}</option>
+                                <option value="Géorgie">{t('georgie')}</option>
+                                <option value="Ghana">{t('ghana')}</option>
+                                <option value="Grèce">{t('grece')}</option>
+                                <option value="Grenade">{t('grenade')}</option>
+                                <option value="Guatemala">{t('guatemala')}</option>
+                                <option value="Guinée">{t('guinee')}</option>
+                                <option value="Guinée-Bissau">{t('guinee_bissau')}</option>
+                                <option value="Guinée Équatoriale">{t('guinee_equatoriale')}</option>
+                                <option value="Guyana">{t('guyana')}</option>
+                                <option value="Haïti">{t('haiti')}</option>
+                                <option value="Honduras">{t('honduras')}</option>
+                                <option value="Hongrie">{t('hongrie')}</option>
+                                <option value="Inde">{t('inde')}</option>
+                                <option value="Indonésie">{t('indonesie')}</option>
+                                <option value="Irak">{t('irak')}</option>
+                                <option value="Iran">{t('iran')}</option>
+                                <option value="Irlande">{t('irlande')}</option>
+                                <option value="Islande">{t('islande')}</option>
+                                <option value="Israël">{t('israel')}</option>
+                                <option value="Italie">{t('italie')}</option>
+                                <option value="Jamaïque">{t('jamaique')}</option>
+                                <option value="Japon">{t('japon')}</option>
+                                <option value="Jordanie">{t('jordanie')}</option>
+                                <option value="Kazakhstan">{t('kazakhstan')}</option>
+                                <option value="Kenya">{t('kenya')}</option>
+                                <option value="Kirghizistan">{t('kirghizistan')}</option>
+                                <option value="Kiribati">{t('kiribati')}</option>
+                                <option value="Koweït">{t('koweit')}</option>
+                                <option value="Laos">{t('laos')}</option>
+                                <option value="Lesotho">{t('lesotho')}</option>
+                                <option value="Lettonie">{t('lettonie')}</option>
+                                <option value="Liban">{t('liban')}</option>
+                                <option value="Liberia">{t('liberia')}</option>
+                                <option value="Libye">{t('libye')}</option>
+                                <option value="Liechtenstein">{t('liechtenstein')}</option>
+                                <option value="Lituanie">{t('lituanie')}</option>
+                                <option value="Luxembourg">{t('luxembourg')}</option>
+                                <option value="Macédoine du Nord">{t('macedoine_du_nord')}</option>
+                                <option value="Madagascar">{t('madagascar')}</option>
+                                <option value="Malaisie">{t('malaisie')}</option>
+                                <option value="Malawi">{t('malawi')}</option>
+                                <option value="Maldives">{t('maldives')}</option>
+                                <option value="Mali">{t('mali')}</option>
+                                <option value="Malte">{t('malte')}</option>
+                                <option value="Maroc">{t('maroc')}</option>
+                                <option value="Marshall">{t('marshall')}</option>
+                                <option value="Maurice">{t('maurice')}</option>
+                                <option value="Mauritanie">{t('mauritanie')}</option>
+                                <option value="Mexique">{t('mexique')}</option>
+                                <option value="Micronésie">{t('micronesie')}</option>
+                                <option value="Moldavie">{t('moldavie')}</option>
+                                <option value="Monaco">{t('monaco')}</option>
+                                <option value="Mongolie">{t('mongolie')}</option>
+                                <option value="Monténégro">{t('montenegro')}</option>
+                                <option value="Mozambique">{t('mozambique')}</option>
+                                <option value="Namibie">{t('namibie')}</option>
+                                <option value="Nauru">{t('nauru')}</option>
+                                <option value="Népal">{t('nepal')}</option>
+                                <option value="Nicaragua">{t('nicaragua')}</option>
+                                <option value="Niger">{t('niger')}</option>
+                                <option value="Nigeria">{t('nigeria')}</option>
+                                <option value="Norvège">{t('norvege')}</option>
+                                <option value="Nouvelle-Zélande">{t('nouvelle_zelande')}</option>
+                                <option value="Oman">{t('oman')}</option>
+                                <option value="Ouganda">{t('ouganda')}</option>
+                                <option value="Ouzbékistan">{t('ouzbekistan')}</option>
+                                <option value="Pakistan">{t('pakistan')}</option>
+                                <option value="Palaos">{t('palaos')}</option>
+                                <option value="Palestine">{t('palestine')}</option>
+                                <option value="Panama">{t('panama')}</option>
+                                <option value="Papouasie-Nouvelle-Guinée">{t('papouasie_nouvelle_guinee')}</option>
+                                <option value="Paraguay">{t('paraguay')}</option>
+                                <option value="Pays-Bas">{t('pays_bas')}</option>
+                                <option value="Pérou">{t('perou')}</option>
+                                <option value="Philippines">{t('philippines')}</option>
+                                <option value="Pologne">{t('pologne')}</option>
+                                <option value="Portugal">{t('portugal')}</option>
+                                <option value="Qatar">{t('qatar')}</option>
+                                <option value="République Centrafricaine">{t('republique_centrafricaine')}</option>
+                                <option value="République Démocratique du Congo">{t('republique_democratique_du_congo')}</option>
+                                <option value="République Dominicaine">{t('republique_dominicaine')}</option>
+                                <option value="République Tchèque">{t('republique_tcheque')}</option>
+                                <option value="Roumanie">{t('roumanie')}</option>
+                                <option value="Royaume-Uni">{t('royaume_uni')}</option>
+                                <option value="Russie">{t('russie')}</option>
+                                <option value="Rwanda">{t('rwanda')}</option>
+                                <option value="Saint-Christophe-et-Niévès">{t('saint_christophe_et_nieves')}</option>
+                                <option value="Saint-Marin">{t('saint_marin')}</option>
+                                <option value="Saint-Vincent-et-les-Grenadines">{t('saint_vincent_et_les_grenadines')}</option>
+                                <option value="Sainte-Lucie">{t('sainte_lucie')}</option>
+                                <option value="Salomon">{t('salomon')}</option>
+                                <option value="Salvador">{t('salvador')}</option>
+                                <option value="Samoa">{t('samoa')}</option>
+                                <option value="São Tomé-et-Principe">{t('sao_tome_et_principe')}</option>
+                                <option value="Sénégal">{t('senegal')}</option>
+                                <option value="Serbie">{t('serbie')}</option>
+                                <option value="Seychelles">{t('seychelles')}</option>
+                                <option value="Sierra Leone">{t('sierra_leone')}</option>
+                                <option value="Singapour">{t('singapour')}</option>
+                                <option value="Slovaquie">{t('slovaquie')}</option>
+                                <option value="Slovénie">{t('slovenie')}</option>
+                                <option value="Somalie">{t('somalie')}</option>
+                                <option value="Soudan">{t('soudan')}</option>
+                                <option value="Soudan du Sud">{t('soudan_du_sud')}</option>
+                                <option value="Sri Lanka">{t('sri_lanka')}</option>
+                                <option value="Suède">{t('suede')}</option>
+                                <option value="Suisse">{t('suisse')}</option>
+                                <option value="Suriname">{t('suriname')}</option>
+                                <option value="Syrie">{t('syrie')}</option>
+                                <option value="Tadjikistan">{t('tadjikistan')}</option>
+                                <option value="Tanzanie">{t('tanzanie')}</option>
+                                <option value="Tchad">{t('tchad')}</option>
+                                <option value="Thaïlande">{t('thailande')}</option>
+                                <option value="Timor Oriental">{t('timor_oriental')}</option>
+                                <option value="Togo">{t('togo')}</option>
+                                <option value="Tonga">{t('tonga')}</option>
+                                <option value="Trinité-et-Tobago">{t('trinite_et_tobago')}</option>
+                                <option value="Tunisie">{t('tunisie')}</option>
+                                <option value="Turkménistan">{t('turkmenistan')}</option>
+                                <option value="Turquie">{t('turquie')}</option>
+                                <option value="Tuvalu">{t('tuvalu')}</option>
+                                <option value="Ukraine">{t('ukraine')}</option>
+                                <option value="Uruguay">{t('uruguay')}</option>
+                                <option value="Vanuatu">{t('vanuatu')}</option>
+                                <option value="Vatican">{t('vatican')}</option>
+                                <option value="Venezuela">{t('venezuela')}</option>
+                                <option value="Viêt Nam">{t('viet_nam')}</option>
+                                <option value="Yémen">{t('yemen')}</option>
+                                <option value="Zambie">{t('zambie')}</option>
+                                <option value="Zimbabwe">{t('zimbabwe')}</option>
                             </Form.Select>
                         </Form.Group>
                     </Form>
                 </Modal.Body>
                 <Modal.Footer>
                     <Button variant="secondary" onClick={() => setShowModal(false)}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                     <Button variant="warning" className="text-white fw-bold" onClick={handleSaveAddress}>
-                        Enregistrer
+                        {t('enregistrer')}
                     </Button>
                 </Modal.Footer>
             </Modal>
@@ -3,8 +3,10 @@ import { useState, useEffect } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Cards = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const navigate = useNavigate();
     const [showCardModal, setShowCardModal] = useState(false);
@@ -30,10 +32,10 @@ const Cards = () => {
         return (
             <Container className="py-5 text-center">
                 <Alert variant="light" className="border">
-                    <Alert.Heading>Connexion requise</Alert.Heading>
-                    <p>Veuillez vous connecter pour accéder à vos cartes.</p>
+                    <Alert.Heading>{t('connexion_requise')}</Alert.Heading>
+                    <p>{t('veuillez_vous_connecter_pour')}</p>
                     <Button variant="warning" className="text-white" onClick={() => navigate('/login')}>
-                        Se connecter
+                        {t('se_connecter')}
                     </Button>
                 </Alert>
             </Container>
@@ -51,7 +53,7 @@ const Cards = () => {
     // Add or update card
     const handleSaveCard = () => {
         if (!cardData.cardNumber || !cardData.cardHolder || !cardData.expiryDate || !cardData.cvv) {
-            alert('Veuillez remplir tous les champs');
+            alert(t('veuillez_remplir_tous_les_champs_2'));
             return;
         }
 
@@ -96,7 +98,7 @@ const Cards = () => {
 
     // Delete card
     const handleDeleteCard = (id) => {
-        if (window.confirm('Êtes-vous sûr de vouloir supprimer cette carte ?')) {
+        if (window.confirm(t('etes_vous_sur_de_vouloir_2'))) {
             const newCards = savedCards.filter(card => card.id !== id);
             saveCards(newCards);
         }
@@ -141,17 +143,17 @@ const Cards = () => {
         <ProfileLayout>
             <h3 className="mb-4 fw-bold">
                 <i className="bi bi-credit-card me-2"></i>
-                Mes cartes bancaires
+                {t('mes_cartes_bancaires')}
             </h3>
 
             {savedCards.length === 0 ? (
                 <Card className="border-0 shadow-sm text-center p-5">
                     <i className="bi bi-credit-card" style={{ fontSize: '4rem', color: '#ddd' }}></i>
-                    <h5 className="mt-3 text-muted">Aucune carte enregistrée</h5>
-                    <p className="text-muted">Ajoutez une carte pour faciliter vos paiements</p>
+                    <h5 className="mt-3 text-muted">{t('aucune_carte_enregistree')}</h5>
+                    <p className="text-muted">{t('ajoutez_une_carte_pour_faciliter')}</p>
                     <Button variant="warning" className="text-white mt-2" onClick={() => setShowCardModal(true)}>
                         <i className="bi bi-plus-circle me-2"></i>
-                        Ajouter une carte
+                        {t('ajouter_une_carte')}
                     </Button>
                 </Card>
             ) : (
@@ -159,7 +161,7 @@ const Cards = () => {
                     <div className="mb-3">
                         <Button variant="warning" className="text-white" onClick={() => setShowCardModal(true)}>
                             <i className="bi bi-plus-circle me-2"></i>
-                            Ajouter une carte
+                            {t('ajouter_une_carte')}
                         </Button>
                     </div>
 
@@ -173,14 +175,14 @@ const Cards = () => {
                                                 <i className="bi bi-credit-card-2-front" style={{ fontSize: '2rem', color: '#ffc107' }}></i>
                                             </div>
                                             {card.isDefault && (
-                                                <Badge bg="success">Par défaut</Badge>
+                                                <Badge bg="success">{t('par_defaut')}</Badge>
                                             )}
                                         </div>
 
                                         <div className="mb-3">
                                             <h5 className="mb-1">•••• •••• •••• {card.lastFour}</h5>
                                             <p className="text-muted mb-0">{card.cardHolder}</p>
-                                            <small className="text-muted">Expire: {card.expiryDate}</small>
+                                            <small className="text-muted">{t('expire', { expiryDate: card.expiryDate })}</small>
                                         </div>
 
                                         <div className="d-flex gap-2">
@@ -190,7 +192,7 @@ const Cards = () => {
                                                     size="sm"
                                                     onClick={() => handleSetDefault(card.id)}
                                                 >
-                                                    Définir par défaut
+                                                    {t('definir_par_defaut')}
                                                 </Button>
                                             )}
                                             <Button
@@ -212,12 +214,12 @@ const Cards = () => {
             {/* Add/Edit Card Modal */}
             <Modal show={showCardModal} onHide={resetForm} centered>
                 <Modal.Header closeButton>
-                    <Modal.Title>{editingCard ? 'Modifier' : 'Ajouter'} une carte</Modal.Title>
+                    <Modal.Title>{t('une_carte', { value: editingCard ? t('modifier') : t('ajouter') })}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body>
                     <Form>
                         <Form.Group className="mb-3">
-                            <Form.Label>Numéro de carte *</Form.Label>
+                            <Form.Label>{t('numero_de_carte')}</Form.Label>
                             <Form.Control
                                 type="text"
                                 placeholder="1234 5678 9012 3456"
@@ -228,10 +230,10 @@ const Cards = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Nom du titulaire *</Form.Label>
+                            <Form.Label>{t('nom_du_titulaire')}</Form.Label>
                             <Form.Control
                                 type="text"
-                                placeholder="NOM PRENOM"
+                                placeholder={t('nom_prenom')}
                                 value={cardData.cardHolder}
                                 onChange={(e) => setCardData({ ...cardData, cardHolder: e.target.value.toUpperCase() })}
                             />
@@ -240,7 +242,7 @@ const Cards = () => {
                         <Row>
                             <Col>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Date d'expiration *</Form.Label>
+                                    <Form.Label>{t('date_d_expiration')}</Form.Label>
                                     <Form.Control
                                         type="text"
                                         placeholder="MM/AA"
@@ -273,7 +275,7 @@ const Cards = () => {
                         <Form.Group className="mb-3">
                             <Form.Check
                                 type="checkbox"
-                                label="Définir comme carte par défaut"
+                                label={t('definir_comme_carte_par_defaut')}
                                 checked={cardData.isDefault}
                                 onChange={(e) => setCardData({ ...cardData, isDefault: e.target.checked })}
                             />
@@ -282,7 +284,7 @@ const Cards = () => {
                 </Modal.Body>
                 <Modal.Footer>
                     <Button variant="secondary" onClick={resetForm}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                     <Button variant="warning" className="text-white" onClick={handleSaveCard}>
                         {editingCard ? 'Modifier' : 'Ajouter'}
@@ -2,8 +2,10 @@ import { Container, Button, Card, Row, Col, Form, Alert, Badge, InputGroup } fro
 import { useState, useEffect } from 'react';
 import { useCart } from '../context/CartContext';
 import { useNavigate } from 'react-router-dom';
+import { useLanguage } from '../context/LanguageContext';
 
 const Cart = () => {
+    const { t } = useLanguage();
     const {
         cartItems,
         savedItems,
@@ -97,7 +99,7 @@ const Cart = () => {
     // Handle coupon application
     const handleApplyCoupon = () => {
         if (!couponCode.trim()) {
-            setCouponMessage({ type: 'danger', text: 'Veuillez entrer un code promo' });
+            setCouponMessage({ type: 'danger', text: t('veuillez_entrer_un_code_promo') });
             return;
         }
 
@@ -132,10 +134,10 @@ const Cart = () => {
                 <div className="mb-4">
                     <i className="bi bi-cart-x" style={{ fontSize: '4rem', color: '#dee2e6' }}></i>
                 </div>
-                <h2>Votre panier est vide</h2>
-                <p className="text-muted mb-4">Découvrez nos produits et commencez votre shopping !</p>
+                <h2>{t('votre_panier_est_vide')}</h2>
+                <p className="text-muted mb-4">{t('decouvrez_nos_produits_et')}</p>
                 <Button variant="warning" className="text-white fw-bold px-4 py-2" onClick={() => navigate('/shop')}>
-                    Retour à la boutique
+                    {t('retour_a_la_boutique')}
                 </Button>
             </Container>
         );
@@ -145,7 +147,7 @@ const Cart = () => {
         <Container className="py-5" style={{ backgroundColor: '#f8f9fa', minHeight: '100vh' }}>
             <h3 className="mb-4 fw-bold">
                 <i className="bi bi-cart3 me-2"></i>
-                Mon Panier ({cartItems.length} {cartItems.length > 1 ? 'articles' : 'article'})
+                {t('mon_panier', { count: cartItems.length, value: cartItems.length > 1 ? t('articles') : t('article') })}
             </h3>
 
             <Row>
@@ -198,7 +200,7 @@ const Cart = () => {
                                                         {item.stock && item.stock < 10 && (
                                                             <Badge bg="warning" text="dark" className="small">
                                                                 <i className="bi bi-exclamation-triangle me-1"></i>
-                                                                Plus que {item.stock} en stock
+                                                                {t('plus_que_en_stock', { stock: item.stock })}
                                                             </Badge>
                                                         )}
                                                     </div>
@@ -209,10 +211,10 @@ const Cart = () => {
                                                             variant="link"
                                                             className="text-primary p-0 text-decoration-none small"
                                                             onClick={() => saveForLater(item.id)}
-                                                            title="Enregistrer pour plus tard"
+                                                            title={t('enregistrer_pour_plus_tard')}
                                                         >
                                                             <i className="bi bi-bookmark me-1"></i>
-                                                            Sauvegarder
+                                                            {t('sauvegarder')}
                                                         </Button>
                                                         <Button
                                                             variant="link"
@@ -220,7 +222,7 @@ const Cart = () => {
                                                             onClick={() => removeFromCart(item.id)}
                                                         >
                                                             <i className="bi bi-trash me-1"></i>
-                                                            Supprimer
+                                                            {t('supprimer')}
                                                         </Button>
                                                     </div>
                                                 </div>
@@ -251,7 +253,7 @@ const Cart = () => {
                                                             {((item.price * item.quantity)).toLocaleString()} FCFA
                                                         </span>
                                                         <small className="text-muted">
-                                                            {(item.price).toLocaleString()} FCFA / unité
+                                                            {t('fcfa_unite', { price: (item.price).toLocaleString() })}
                                                         </small>
                                                     </div>
                                                 </div>
@@ -269,7 +271,7 @@ const Cart = () => {
                             <Card.Header className="bg-light border-0">
                                 <h5 className="mb-0 fw-bold">
                                     <i className="bi bi-bookmark-fill me-2 text-primary"></i>
-                                    Enregistrés pour plus tard ({savedItems.length})
+                                    {t('enregistres_pour_plus_tard', { count: savedItems.length })}
                                 </h5>
                             </Card.Header>
                             <Card.Body>
@@ -293,7 +295,7 @@ const Cart = () => {
                                                             onClick={() => moveToCart(item.id)}
                                                         >
                                                             <i className="bi bi-cart-plus me-1"></i>
-                                                            Ajouter
+                                                            {t('ajouter')}
                                                         </Button>
                                                         <Button
                                                             size="sm"
@@ -316,11 +318,11 @@ const Cart = () => {
                         <div className="d-flex justify-content-between align-items-center mt-3">
                             <Button variant="outline-secondary" size="sm" onClick={() => navigate('/shop')}>
                                 <i className="bi bi-arrow-left me-1"></i>
-                                Continuer mes achats
+                                {t('continuer_mes_achats')}
                             </Button>
                             <Button variant="outline-danger" size="sm" onClick={clearCart}>
                                 <i className="bi bi-trash me-1"></i>
-                                Vider le panier
+                                {t('vider_le_panier')}
                             </Button>
                         </div>
                     )}
@@ -331,11 +333,11 @@ const Cart = () => {
                     <Col lg={4}>
                         <Card className="shadow-sm border-0">
                             <Card.Body className="p-4">
-                                <h4 className="fw-bold mb-4">Résumé de la commande</h4>
+                                <h4 className="fw-bold mb-4">{t('resume_de_la_commande')}</h4>
 
                                 {/* Coupon Section */}
                                 <div className="mb-4">
-                                    <label className="form-label fw-bold small">Code promo</label>
+                                    <label className="form-label fw-bold small">{t('code_promo')}</label>
                                     {appliedCoupon ? (
                                         <div className="d-flex align-items-center justify-content-between bg-success bg-opacity-10 p-2 rounded">
                                             <div>
@@ -356,17 +358,17 @@ const Cart = () => {
                                             <InputGroup>
                                                 <Form.Control
                                                     type="text"
-                                                    placeholder="Entrez le code"
+                                                    placeholder={t('entrez_le_code')}
                                                     value={couponCode}
                                                     onChange={(e) => setCouponCode(e.target.value.toUpperCase())}
                                                     onKeyPress={(e) => e.key === 'Enter' && handleApplyCoupon()}
                                                 />
                                                 <Button variant="outline-warning" onClick={handleApplyCoupon}>
-                                                    Appliquer
+                                                    {t('appliquer')}
                                                 </Button>
                                             </InputGroup>
                                             <small className="text-muted d-block mt-1">
-                                                Essayez: WELCOME10, SAVE20, FREESHIP
+                                                {t('essayez_welcome10_save20')}
                                             </small>
                                         </>
                                     )}
@@ -381,17 +383,17 @@ const Cart = () => {
 
                                 {/* Price Breakdown */}
                                 <div className="d-flex justify-content-between mb-2">
-                                    <span className="text-muted">Sous-total</span>
+                                    <span className="text-muted">{t('sous_total')}</span>
                                     <span className="fw-bold">{(getSelectedSubtotal()).toLocaleString()} FCFA</span>
                                 </div>
 
 
                                 <div className="d-flex justify-content-between mb-2">
-                                    <span className="text-muted">Livraison</span>
+                                    <span className="text-muted">{t('livraison')}</span>
                                     {getSelectedShippingCost() === 0 ? (
                                         <span className="text-success fw-bold">
                                             <i className="bi bi-check-circle me-1"></i>
-                                            Gratuite
+                                            {t('gratuite')}
                                         </span>
                                     ) : (
                                         <span className="fw-bold">{(getSelectedShippingCost()).toLocaleString()} FCFA</span>
@@ -400,7 +402,7 @@ const Cart = () => {
 
                                 {getSelectedDiscount() > 0 && (
                                     <div className="d-flex justify-content-between mb-2">
-                                        <span className="text-success">Réduction</span>
+                                        <span className="text-success">{t('reduction')}</span>
                                         <span className="text-success fw-bold">-{getSelectedDiscount().toLocaleString()} FCFA</span>
                                     </div>
                                 )}
@@ -409,7 +411,7 @@ const Cart = () => {
                                 <hr className="my-3" />
 
                                 <div className="d-flex justify-content-between mb-4 align-items-center">
-                                    <span className="h5 fw-bold mb-0">Total</span>
+                                    <span className="h5 fw-bold mb-0">{t('total')}</span>
                                     <span className="h4 text-warning fw-bold mb-0">{(getSelectedTotal()).toLocaleString()} FCFA</span>
                                 </div>
 
@@ -417,7 +419,7 @@ const Cart = () => {
                                 <div className="bg-light p-3 rounded mb-3">
                                     <small className="text-muted d-block mb-1">
                                         <i className="bi bi-truck me-2"></i>
-                                        Livraison estimée
+                                        {t('livraison_estimee')}
                                     </small>
                                     <small className="fw-bold">{getEstimatedDelivery()}</small>
                                 </div>
@@ -431,21 +433,21 @@ const Cart = () => {
                                         const hasSelectedItems = Object.values(selectedItems).some(isSelected => isSelected);
 
                                         if (!hasSelectedItems) {
-                                            alert('⚠️ Veuillez sélectionner au moins un article pour continuer');
+                                            alert(t('veuillez_selectionner_au_moins'));
                                             return;
                                         }
 
                                         navigate('/checkout');
                                     }}
                                 >
-                                    VALIDER MA COMMANDE
+                                    {t('valider_ma_commande')}
                                     <i className="bi bi-chevron-right ms-2 small"></i>
                                 </Button>
 
                                 <div className="text-center mt-3">
                                     <small className="text-muted">
                                         <i className="bi bi-lock-fill me-1"></i>
-                                        Paiement 100% Sécurisé
+                                        {t('paiement_100_securise')}
                                     </small>
                                 </div>
                             </Card.Body>
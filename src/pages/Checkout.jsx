@@ -11,11 +11,13 @@ import API_BASE_URL from '../config';
 import { loadStripe } from '@stripe/stripe-js';
 import { Elements, CardElement, useStripe, useElements } from '@stripe/react-stripe-js';
 import { PayPalScriptProvider, PayPalButtons } from "@paypal/react-paypal-js";
+import { useLanguage } from '../context/LanguageContext';
 
 // Initialize Stripe (Replace placeholder with your actual key from .env)
 const stripePromise = loadStripe(import.meta.env.VITE_STRIPE_PUBLIC_KEY || 'pk_test_TYooMQauvdEDq54NiTphI7jx');
 
 const CheckoutContent = () => {
+    const { t } = useLanguage();
     const { cartItems, getCartTotal, clearCart } = useCart();
     const { user } = useAuth();
     const { addOrder } = useData();
@@ -138,12 +140,12 @@ const CheckoutContent = () => {
     const validateAddress = () => {
         if (!selectedAddressId && (savedAddresses.length === 0 || showNewAddressForm)) {
             if (!shippingData.fullName || !shippingData.phone || !shippingData.address || !shippingData.city) {
-                alert('Veuillez remplir tous les champs obligatoires de l\'adresse');
+                alert(t('veuillez_remplir_tous_les_champs_3'));
                 return false;
             }
         }
         if (!selectedAddressId && savedAddresses.length > 0 && !showNewAddressForm) {
-            alert('Veuillez sélectionner une adresse de livraison');
+            alert(t('veuillez_selectionner_une'));
             return false;
         }
         return true;
@@ -272,10 +274,10 @@ const CheckoutContent = () => {
         return (
             <Container className="py-5 text-center">
                 <Alert variant="light" className="border">
-                    <Alert.Heading>Panier vide</Alert.Heading>
-                    <p>Votre panier est vide. Ajoutez des produits pour passer une commande.</p>
+                    <Alert.Heading>{t('panier_vide')}</Alert.Heading>
+                    <p>{t('votre_panier_est_vide_ajoutez')}</p>
                     <Button variant="warning" className="text-white" onClick={() => navigate('/shop')}>
-                        Voir la boutique
+                        {t('voir_la_boutique')}
                     </Button>
                 </Alert>
             </Container>
@@ -294,19 +296,19 @@ const CheckoutContent = () => {
                                     style={{ width: '80px', height: '80px' }}>
                                     <i className="bi bi-check-lg text-white" style={{ fontSize: '3rem' }}></i>
                                 </div>
-                                <h2 className="fw-bold mb-2">Commande confirmée !</h2>
+                                <h2 className="fw-bold mb-2">{t('commande_confirmee')}</h2>
                                 <Badge bg="warning" className="text-white px-3 py-2">
-                                    Numéro: {completedOrder.id}
+                                    {t('numero', { id: completedOrder.id })}
                                 </Badge>
                                 {/* ... Simplified for brevity, original UI was good ... */}
                             </Card.Body>
                         </Card>
                         <div className="d-flex gap-3 justify-content-center">
                             <Button variant="warning" className="text-white px-4" onClick={() => navigate('/profile/orders')}>
-                                Mes commandes
+                                {t('mes_commandes')}
                             </Button>
                             <Button variant="outline-secondary" onClick={() => navigate('/shop')}>
-                                Continuer les achats
+                                {t('continuer_les_achats')}
                             </Button>
                         </div>
                     </Col>
@@ -319,7 +321,7 @@ const CheckoutContent = () => {
         <Container className="py-4 py-lg-5" style={{ backgroundColor: '#f8f9fa', minHeight: '100vh' }}>
             <div className="mb-4 d-flex align-items-center gap-2">
                 <Button variant="link" onClick={() => navigate('/cart')} className="p-0 text-decoration-none text-muted">
-                    <i className="bi bi-arrow-left me-1"></i> Retour au panier
+                    <i className="bi bi-arrow-left me-1"></i> {t('retour_au_panier')}
                 </Button>
             </div>
 
@@ -335,7 +337,7 @@ const CheckoutContent = () => {
                     {/* ADDRESS SECTION */}
                     <div className="d-flex align-items-center mb-3">
                         <div className="bg-warning text-white rounded-circle d-flex align-items-center justify-content-center fw-bold me-3" style={{ width: '32px', height: '32px' }}>1</div>
-                        <h4 className="mb-0 fw-bold">Adresse de livraison</h4>
+                        <h4 className="mb-0 fw-bold">{t('adresse_de_livraison')}</h4>
                     </div>
 
                     <Card className="border-0 shadow-sm mb-4" style={{ borderRadius: '15px' }}>
@@ -344,9 +346,9 @@ const CheckoutContent = () => {
                             {savedAddresses.length > 0 && (
                                 <div className="mb-4">
                                     <div className="d-flex justify-content-between align-items-center mb-3">
-                                        <h6 className="fw-bold mb-0">Vos adresses</h6>
+                                        <h6 className="fw-bold mb-0">{t('vos_adresses')}</h6>
                                         <Button variant="link" className="p-0 text-warning fw-bold text-decoration-none" onClick={() => { setShowNewAddressForm(true); setSelectedAddressId(null); }}>
-                                            + Nouvelle adresse
+                                            {t('nouvelle_adresse_2')}
                                         </Button>
                                     </div>
                                     <Row className="g-3">
@@ -369,7 +371,7 @@ const CheckoutContent = () => {
                                                             style={{ borderRadius: '8px' }}
                                                             onClick={(e) => { e.stopPropagation(); handleDeleteClick(address.id); }}
                                                         >
-                                                            <i className="bi bi-trash me-2"></i> supprimer
+                                                            <i className="bi bi-trash me-2"></i> {t('supprimer_2')}
                                                         </Button>
                                                     </div>
                                                 </div>
@@ -381,31 +383,31 @@ const CheckoutContent = () => {
 
                             {(savedAddresses.length === 0 || showNewAddressForm) && (
                                 <div className="bg-light p-4 rounded-4">
-                                    <h6 className="fw-bold mb-3">Nouvelle adresse</h6>
+                                    <h6 className="fw-bold mb-3">{t('nouvelle_adresse')}</h6>
                                     <Form>
                                         <Row className="g-3">
-                                            <Col md={6}><Form.Control placeholder="Nom complet" value={shippingData.fullName} onChange={e => setShippingData({ ...shippingData, fullName: e.target.value })} /></Col>
-                                            <Col md={6}><Form.Control placeholder="Téléphone" value={shippingData.phone} onChange={e => setShippingData({ ...shippingData, phone: e.target.value })} /></Col>
-                                            <Col md={12}><Form.Control placeholder="Adresse" value={shippingData.address} onChange={e => setShippingData({ ...shippingData, address: e.target.value })} /></Col>
-                                            <Col md={6}><Form.Control placeholder="Ville" value={shippingData.city} onChange={e => setShippingData({ ...shippingData, city: e.target.value })} /></Col>
-                                            <Col md={6}><Form.Control placeholder="Code Postal" value={shippingData.postalCode} onChange={e => setShippingData({ ...shippingData, postalCode: e.target.value })} /></Col>
+                                            <Col md={6}><Form.Control placeholder={t('nom_complet_2')} value={shippingData.fullName} onChange={e => setShippingData({ ...shippingData, fullName: e.target.value })} /></Col>
+                                            <Col md={6}><Form.Control placeholder={t('telephone')} value={shippingData.phone} onChange={e => setShippingData({ ...shippingData, phone: e.target.value })} /></Col>
+                                            <Col md={12}><Form.Control placeholder={t('adresse')} value={shippingData.address} onChange={e => setShippingData({ ...shippingData, address: e.target.value })} /></Col>
+                                            <Col md={6}><Form.Control placeholder={t('ville_2')} value={shippingData.city} onChange={e => setShippingData({ ...shippingData, city: e.target.value })} /></Col>
+                                            <Col md={6}><Form.Control placeholder={t('code_postal_2')} value={shippingData.postalCode} onChange={e => setShippingData({ ...shippingData, postalCode: e.target.value })} /></Col>
                                             <Col md={12}>
                                                 <Form.Select
                                                     value={shippingData.country}
                                                     onChange={(e) => setShippingData({ ...shippingData, country: e.target.value })}
                                                     required
                                                 >
-                                                    <option value="">Sélectionnez un pays</option>
-                                                    <option value="Tchad">🇹🇩 Tchad</option>
-                                                    <option value="France">🇫🇷 France</option>
-                                                    <option value="Turquie">🇹🇷 Turquie</option>
-                                                    <option value="Canada">🇨🇦 Canada</option>
-                                                    <option value="États-Unis">🇺🇸 États-Unis</option>
-                                                    <option value="Maroc">🇲🇦 Maroc</option>
-                                                    <option value="Sénégal">🇸🇳 Sénégal</option>
-                                                    <option value="Cameroun">🇨🇲 Cameroun</option>
-                                                    <option value="Côte d'Ivoire">🇨🇮 Côte d'Ivoire</option>
-                                                    <option value="Autre">🌍 Autre pays</option>
+                                                    <option value="">{t('selectionnez_un_pays')}</option>
+                                                    <option value="Tchad">{t('tchad_2')}</option>
+                                                    <option value="France">{t('france_2')}</option>
+                                                    <option value="Turquie">{t('turquie_2')}</option>
+                                                    <option value="Canada">{t('canada_2')}</option>
+                                                    <option value="États-Unis">{t('etats_unis_2')}</option>
+                                                    <option value="Maroc">{t('maroc_2')}</option>
+                                                    <option value="Sénégal">{t('senegal_2')}</option>
+                                                    <option value="Cameroun">{t('cameroun_2')}</option>
+                                                    <option value="Côte d'Ivoire">{t('cote_d_ivoire_2')}</option>
+                                                    <option value="Autre">{t('autre_pays')}</option>
                                                 </Form.Select>
                                             </Col>
                                         </Row>
@@ -418,7 +420,7 @@ const CheckoutContent = () => {
                     {/* PAYMENT SECTION */}
                     <div className="d-flex align-items-center mb-3">
                         <div className="bg-warning text-white rounded-circle d-flex align-items-center justify-content-center fw-bold me-3" style={{ width: '32px', height: '32px' }}>2</div>
-                        <h4 className="mb-0 fw-bold">Paiement</h4>
+                        <h4 className="mb-0 fw-bold">{t('paiement')}</h4>
                     </div>
 
                     <Card className="border-0 shadow-sm mb-4" style={{ borderRadius: '15px' }}>
@@ -429,8 +431,8 @@ const CheckoutContent = () => {
                                     <div className="d-flex align-items-center">
                                         <i className="bi bi-wallet2 fs-5 me-2 text-warning"></i>
                                         <div>
-                                            <h6 className="fw-bold mb-0">Wallet</h6>
-                                            <small className="text-muted">Solde: {balance.toLocaleString()} FCFA</small>
+                                            <h6 className="fw-bold mb-0">{t('wallet')}</h6>
+                                            <small className="text-muted">{t('solde_fcfa', { balance: balance.toLocaleString() })}</small>
                                         </div>
                                     </div>
                                     <Form.Check type="radio" checked={paymentMethod === 'wallet'} readOnly />
@@ -443,8 +445,8 @@ const CheckoutContent = () => {
                                     <div className="d-flex align-items-center">
                                         <i className="bi bi-credit-card fs-5 me-2 text-primary"></i>
                                         <div>
-                                            <h6 className="fw-bold mb-0">Carte Bancaire</h6>
-                                            <small className="text-muted">Sécurisé par Stripe</small>
+                                            <h6 className="fw-bold mb-0">{t('carte_bancaire')}</h6>
+                                            <small className="text-muted">{t('securise_par_stripe')}</small>
                                         </div>
                                     </div>
                                     <Form.Check type="radio" checked={paymentMethod === 'card'} readOnly />
@@ -472,7 +474,7 @@ const CheckoutContent = () => {
                                 <div className="d-flex justify-content-between align-items-center">
                                     <div className="d-flex align-items-center">
                                         <i className="bi bi-paypal fs-5 me-2 text-primary"></i>
-                                        <h6 className="fw-bold mb-0">PayPal</h6>
+                                        <h6 className="fw-bold mb-0">{t('paypal')}</h6>
                                     </div>
                                     <Form.Check type="radio" checked={paymentMethod === 'paypal'} readOnly />
                                 </div>
@@ -485,15 +487,15 @@ const CheckoutContent = () => {
                     <div className="sticky-top" style={{ top: '100px' }}>
                         <Card className="border-0 shadow-sm" style={{ borderRadius: '20px' }}>
                             <Card.Body className="p-4 bg-white">
-                                <h5 className="fw-bold mb-4">Résumé</h5>
-                                <div className="d-flex justify-content-between mb-2"><span>Sous-total</span><span>{(getCartTotal() - 1000).toLocaleString()} FCFA</span></div>
-                                <div className="d-flex justify-content-between mb-2"><span>Livraison</span><span>1 000 FCFA</span></div>
+                                <h5 className="fw-bold mb-4">{t('resume')}</h5>
+                                <div className="d-flex justify-content-between mb-2"><span>{t('sous_total')}</span><span>{(getCartTotal() - 1000).toLocaleString()} FCFA</span></div>
+                                <div className="d-flex justify-content-between mb-2"><span>{t('livraison')}</span><span>1 000 FCFA</span></div>
                                 <div className="d-flex justify-content-between mb-2 text-success">
-                                    <span><i className="bi bi-truck me-2"></i>Livraison estimée</span>
+                                    <span><i className="bi bi-truck me-2"></i>{t('livraison_estimee')}</span>
                                     <span className="fw-bold">{estimatedDelivery}</span>
                                 </div>
                                 <hr />
-                                <div className="d-flex justify-content-between mb-4"><strong className="fs-4">Total</strong><strong className="fs-4 text-warning">{getCartTotal().toLocaleString()} FCFA</strong></div>
+                                <div className="d-flex justify-content-between mb-4"><strong className="fs-4">{t('total')}</strong><strong className="fs-4 text-warning">{getCartTotal().toLocaleString()} FCFA</strong></div>
 
                                 {paymentMethod === 'paypal' ? (
                                     <PayPalButtons
@@ -575,20 +577,20 @@ const CheckoutContent = () => {
             {/* Delete Confirmation Modal */}
             <Modal show={showDeleteModal} onHide={() => setShowDeleteModal(false)} centered>
                 <Modal.Header closeButton className="border-0 pb-0">
-                    <Modal.Title className="fs-5 fw-bold">Supprimer l'adresse</Modal.Title>
+                    <Modal.Title className="fs-5 fw-bold">{t('supprimer_l_adresse')}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body className="text-center py-4">
                     <div className="mb-3 bg-danger bg-opacity-10 text-danger rounded-circle d-inline-flex align-items-center justify-content-center" style={{ width: '60px', height: '60px' }}>
                         <i className="bi bi-trash3 fs-3"></i>
                     </div>
-                    <p className="mb-0 text-muted">Êtes-vous sûr de vouloir supprimer cette adresse ?<br />Cette action est irréversible.</p>
+                    <p className="mb-0 text-muted">{t('etes_vous_sur_de_vouloir')}<br />{t('cette_action_est_irreversible')}</p>
                 </Modal.Body>
                 <Modal.Footer className="border-0 pt-0 justify-content-center pb-4">
                     <Button variant="light" className="px-4 rounded-pill" onClick={() => setShowDeleteModal(false)}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                     <Button variant="danger" className="px-4 rounded-pill" onClick={confirmDelete}>
-                        Supprimer
+                        {t('supprimer')}
                     </Button>
                 </Modal.Footer>
             </Modal>
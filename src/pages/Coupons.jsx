@@ -3,8 +3,10 @@ import { useState } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Coupons = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const navigate = useNavigate();
 
@@ -49,7 +51,7 @@ const Coupons = () => {
 
     const handleCopyCoupon = (code) => {
         navigator.clipboard.writeText(code);
-        alert(`Code "${code}" copié dans le presse-papiers !`);
+        alert(t('code_copie_dans_le_presse', { code }));
     };
 
     const handleUseCoupon = (code) => {
@@ -76,15 +78,15 @@ const Coupons = () => {
         return (
             <ProfileLayout>
                 <div className="mb-4">
-                    <h3 className="fw-bold">Mes coupons</h3>
-                    <p className="text-muted">Gérez vos codes promo</p>
+                    <h3 className="fw-bold">{t('mes_coupons')}</h3>
+                    <p className="text-muted">{t('gerez_vos_codes_promo')}</p>
                 </div>
                 <Card className="border-0 shadow-sm text-center p-5">
                     <i className="bi bi-person-x" style={{ fontSize: '4rem', color: '#ddd' }}></i>
-                    <h5 className="mt-3">Connexion requise</h5>
-                    <p className="text-muted">Connectez-vous pour voir vos coupons</p>
+                    <h5 className="mt-3">{t('connexion_requise')}</h5>
+                    <p className="text-muted">{t('connectez_vous_pour_voir_vos')}</p>
                     <Button variant="warning" className="text-white mt-2" onClick={() => navigate('/login')}>
-                        Se connecter
+                        {t('se_connecter')}
                     </Button>
                 </Card>
             </ProfileLayout>
@@ -94,14 +96,14 @@ const Coupons = () => {
     return (
         <ProfileLayout>
             <div className="mb-4">
-                <h3 className="fw-bold">Mes coupons</h3>
-                <p className="text-muted">Utilisez vos codes promo pour économiser</p>
+                <h3 className="fw-bold">{t('mes_coupons')}</h3>
+                <p className="text-muted">{t('utilisez_vos_codes_promo_pour')}</p>
             </div>
 
             {/* Active Coupons */}
             {activeCoupons.length > 0 && (
                 <div className="mb-4">
-                    <h5 className="fw-bold mb-3">Coupons disponibles ({activeCoupons.length})</h5>
+                    <h5 className="fw-bold mb-3">{t('coupons_disponibles', { count: activeCoupons.length })}</h5>
                     <Row className="g-3">
                         {activeCoupons.map(coupon => (
                             <Col key={coupon.id} md={6} lg={4}>
@@ -121,7 +123,7 @@ const Coupons = () => {
                                         <div className="bg-white bg-opacity-25 rounded p-2 mb-2">
                                             <div className="d-flex justify-content-between align-items-center">
                                                 <div>
-                                                    <small className="opacity-75 d-block" style={{ fontSize: '0.7rem' }}>Code promo</small>
+                                                    <small className="opacity-75 d-block" style={{ fontSize: '0.7rem' }}>{t('code_promo')}</small>
                                                     <strong style={{ fontSize: '1rem', letterSpacing: '1px' }}>
                                                         {coupon.code}
                                                     </strong>
@@ -141,12 +143,12 @@ const Coupons = () => {
                                             {coupon.minAmount > 0 && (
                                                 <small className="d-block opacity-75" style={{ fontSize: '0.75rem' }}>
                                                     <i className="bi bi-info-circle me-1"></i>
-                                                    Min: {coupon.minAmount.toLocaleString()} FCFA
+                                                    {t('min_fcfa', { minAmount: coupon.minAmount.toLocaleString() })}
                                                 </small>
                                             )}
                                             <small className="d-block opacity-75" style={{ fontSize: '0.75rem' }}>
                                                 <i className="bi bi-calendar me-1"></i>
-                                                Jusqu'au {new Date(coupon.expiryDate).toLocaleDateString('fr-FR')}
+                                                {t('jusqu_au', { value: new Date(coupon.expiryDate).toLocaleDateString('fr-FR') })}
                                             </small>
                                         </div>
 
@@ -156,7 +158,7 @@ const Coupons = () => {
                                             className="w-100 fw-bold"
                                             onClick={() => handleUseCoupon(coupon.code)}
                                         >
-                                            Utiliser
+                                            {t('utiliser')}
                                         </Button>
                                     </Card.Body>
                                 </Card>
@@ -169,7 +171,7 @@ const Coupons = () => {
             {/* Used Coupons */}
             {usedCoupons.length > 0 && (
                 <div className="mb-4">
-                    <h5 className="fw-bold mb-3">Coupons utilisés ({usedCoupons.length})</h5>
+                    <h5 className="fw-bold mb-3">{t('coupons_utilises', { count: usedCoupons.length })}</h5>
                     <Row className="g-3">
                         {usedCoupons.map(coupon => (
                             <Col key={coupon.id} md={6} lg={4}>
@@ -180,10 +182,10 @@ const Coupons = () => {
                                                 <h6 className="fw-bold mb-1 text-muted">{getDiscountText(coupon)}</h6>
                                                 <small className="text-muted" style={{ fontSize: '0.8rem' }}>{coupon.description}</small>
                                             </div>
-                                            <Badge bg="secondary">Utilisé</Badge>
+                                            <Badge bg="secondary">{t('utilise')}</Badge>
                                         </div>
                                         <div className="mt-2">
-                                            <small className="text-muted" style={{ fontSize: '0.75rem' }}>Code: {coupon.code}</small>
+                                            <small className="text-muted" style={{ fontSize: '0.75rem' }}>{t('code', { code: coupon.code })}</small>
                                         </div>
                                     </Card.Body>
                                 </Card>
@@ -196,7 +198,7 @@ const Coupons = () => {
             {/* Expired Coupons */}
             {expiredCoupons.length > 0 && (
                 <div className="mb-4">
-                    <h5 className="fw-bold mb-3">Coupons expirés ({expiredCoupons.length})</h5>
+                    <h5 className="fw-bold mb-3">{t('coupons_expires', { count: expiredCoupons.length })}</h5>
                     <Row className="g-3">
                         {expiredCoupons.map(coupon => (
                             <Col key={coupon.id} md={6} lg={4}>
@@ -207,11 +209,11 @@ const Coupons = () => {
                                                 <h6 className="fw-bold mb-1 text-muted">{getDiscountText(coupon)}</h6>
                                                 <small className="text-muted" style={{ fontSize: '0.8rem' }}>{coupon.description}</small>
                                             </div>
-                                            <Badge bg="danger">Expiré</Badge>
+                                            <Badge bg="danger">{t('expire_2')}</Badge>
                                         </div>
                                         <div className="mt-2">
                                             <small className="text-muted" style={{ fontSize: '0.75rem' }}>
-                                                Code: {coupon.code} • Expiré le {new Date(coupon.expiryDate).toLocaleDateString('fr-FR')}
+                                                {t('code_expire_le', { code: coupon.code, value: new Date(coupon.expiryDate).toLocaleDateString('fr-FR') })}
                                             </small>
                                         </div>
                                     </Card.Body>
@@ -226,10 +228,10 @@ const Coupons = () => {
             {activeCoupons.length === 0 && usedCoupons.length === 0 && expiredCoupons.length === 0 && (
                 <Card className="border-0 shadow-sm text-center p-5">
                     <i className="bi bi-ticket-perforated" style={{ fontSize: '4rem', color: '#ddd' }}></i>
-                    <h5 className="mt-3">Aucun coupon disponible</h5>
-                    <p className="text-muted">Vos coupons apparaîtront ici</p>
+                    <h5 className="mt-3">{t('aucun_coupon_disponible')}</h5>
+                    <p className="text-muted">{t('vos_coupons_apparaitront_ici')}</p>
                     <Button variant="warning" className="text-white mt-2" onClick={() => navigate('/shop')}>
-                        Découvrir la boutique
+                        {t('decouvrir_la_boutique')}
                     </Button>
                 </Card>
             )}
@@ -4,8 +4,10 @@ import { useFavorites } from '../context/FavoritesContext';
 import { useData } from '../context/DataContext';
 import { useAuth } from '../context/AuthContext';
 import ProductCard from '../components/ProductCard';
+import { useLanguage } from '../context/LanguageContext';
 
 const Favorites = () => {
+    const { t } = useLanguage();
     const { favorites } = useFavorites();
     const { products } = useData();
     const { user } = useAuth();
@@ -16,10 +18,10 @@ const Favorites = () => {
         return (
             <Container className="py-5 text-center">
                 <Alert variant="light" className="border">
-                    <Alert.Heading>Connexion requise</Alert.Heading>
-                    <p>Vous devez être connecté pour voir vos favoris.</p>
+                    <Alert.Heading>{t('connexion_requise')}</Alert.Heading>
+                    <p>{t('vous_devez_etre_connecte_pour_2')}</p>
                     <Button variant="warning" className="text-white" onClick={() => navigate('/login')}>
-                        Se connecter
+                        {t('se_connecter')}
                     </Button>
                 </Alert>
             </Container>
@@ -33,16 +35,16 @@ const Favorites = () => {
         <Container className="py-5" style={{ minHeight: '70vh' }}>
             <h2 className="mb-4 fw-bold">
                 <i className="bi bi-heart-fill text-danger me-2"></i>
-                Mes Favoris ({favoriteProducts.length})
+                {t('mes_favoris', { count: favoriteProducts.length })}
             </h2>
 
             {favoriteProducts.length === 0 ? (
                 <div className="text-center py-5">
                     <i className="bi bi-heart" style={{ fontSize: '5rem', color: '#ddd' }}></i>
-                    <h3 className="mt-4 text-muted">Aucun favori pour le moment</h3>
-                    <p className="text-muted mb-4">Ajoutez des produits à vos favoris en cliquant sur le cœur ❤️</p>
+                    <h3 className="mt-4 text-muted">{t('aucun_favori_pour_le_moment')}</h3>
+                    <p className="text-muted mb-4">{t('ajoutez_des_produits_a_vos')}</p>
                     <Button variant="warning" className="text-white fw-bold" onClick={() => navigate('/shop')}>
-                        Découvrir nos produits
+                        {t('decouvrir_nos_produits')}
                     </Button>
                 </div>
             ) : (
@@ -1,8 +1,10 @@
 import { Container, Row, Col, Card, Form, Button, Accordion, InputGroup, ListGroup } from 'react-bootstrap';
 import { useState } from 'react';
 import { useData } from '../context/DataContext';
+import { useLanguage } from '../context/LanguageContext';
 
 const Help = () => {
+    const { t } = useLanguage();
     const { orders, helpQuestions, addHelpQuestion } = useData();
     const [activeTab, setActiveTab] = useState('contact');
 
@@ -34,16 +36,16 @@ const Help = () => {
     };
 
     const menuItems = [
-        { id: 'contact', label: 'Nous contacter', icon: 'bi-telephone' },
-        { id: 'tracking', label: 'Suivre une commande', icon: 'bi-box-seam' },
-        { id: 'faq', label: 'Questions fréquentes', icon: 'bi-question-circle' },
-        { id: 'community', label: 'Communauté Q&A', icon: 'bi-chat-dots' },
+        { id: 'contact', label: t('nous_contacter'), icon: 'bi-telephone' },
+        { id: 'tracking', label: t('suivre_une_commande'), icon: 'bi-box-seam' },
+        { id: 'faq', label: t('questions_frequentes'), icon: 'bi-question-circle' },
+        { id: 'community', label: t('communaute_q_a'), icon: 'bi-chat-dots' },
     ];
 
     const contactMethods = [
-        { title: 'WhatsApp', icon: 'bi-whatsapp', color: '#25D366', action: 'Discuter', link: 'https://wa.me/905461941673' },
-        { title: 'Appel Direct', icon: 'bi-telephone-fill', color: '#ff6000', action: 'Appeler', link: 'tel:+905461941673' },
-        { title: 'Email', icon: 'bi-envelope-fill', color: '#007bff', action: 'Envoyer', link: 'mailto:Trymyday235@gmail.com' }
+        { title: t('whatsapp'), icon: 'bi-whatsapp', color: '#25D366', action: 'Discuter', link: 'https://wa.me/905461941673' },
+        { title: t('appel_direct'), icon: 'bi-telephone-fill', color: '#ff6000', action: 'Appeler', link: 'tel:+905461941673' },
+        { title: t('email_3'), icon: 'bi-envelope-fill', color: '#007bff', action: 'Envoyer', link: 'mailto:Trymyday235@gmail.com' }
     ];
 
     return (
@@ -63,16 +65,16 @@ const Help = () => {
                                 <Card.Body className="p-4 position-relative">
                                     <h5 className="fw-bold mb-3 d-flex align-items-center">
                                         <i className="bi bi-patch-question me-2" style={{ color: '#ff6000' }}></i>
-                                        Besoin d'aide ?
+                                        {t('besoin_d_aide')}
                                     </h5>
-                                    <p className="small opacity-75 mb-4">Notre équipe est là pour vous accompagner immédiatement.</p>
+                                    <p className="small opacity-75 mb-4">{t('notre_equipe_est_la_pour_vous')}</p>
                                     <Button
                                         href="tel:+905461941673"
                                         variant="warning"
                                         className="w-100 rounded-pill py-2 fw-bold shadow-sm"
                                         style={{ backgroundColor: '#ff6000', borderColor: '#ff6000', color: '#fff' }}
                                     >
-                                        Appel Direct
+                                        {t('appel_direct')}
                                     </Button>
                                 </Card.Body>
                             </Card>
@@ -80,7 +82,7 @@ const Help = () => {
                             <Card className="border-0 shadow-sm" style={{ borderRadius: '20px' }}>
                                 <Card.Body className="p-2">
                                     <div className="p-3 mb-2">
-                                        <h6 className="fw-bold mb-0 text-muted text-uppercase small" style={{ letterSpacing: '1px' }}>Menu Aide</h6>
+                                        <h6 className="fw-bold mb-0 text-muted text-uppercase small" style={{ letterSpacing: '1px' }}>{t('menu_aide')}</h6>
                                     </div>
                                     <ListGroup variant="flush">
                                         {menuItems.map(item => (
@@ -114,8 +116,8 @@ const Help = () => {
                             {/* Tracking Content */}
                             {activeTab === 'tracking' && (
                                 <div className="fade-in">
-                                    <h3 className="fw-bold mb-4">Suivre mon colis</h3>
-                                    <p className="text-muted mb-5">Entrez votre numéro de commande pour connaître son avancement sans vous connecter.</p>
+                                    <h3 className="fw-bold mb-4">{t('suivre_mon_colis')}</h3>
+                                    <p className="text-muted mb-5">{t('entrez_votre_numero_de_commande')}</p>
 
                                     <div className="p-4 bg-light rounded-4 mb-4 border border-info border-opacity-10">
                                         <Form onSubmit={handleTrackOrder}>
@@ -133,7 +135,7 @@ const Help = () => {
                                                     className="px-5 fw-bold"
                                                     style={{ borderRadius: '0 15px 15px 0', backgroundColor: '#ff6000', borderColor: '#ff6000', color: '#fff' }}
                                                 >
-                                                    Chercher
+                                                    {t('chercher')}
                                                 </Button>
                                             </InputGroup>
                                         </Form>
@@ -149,20 +151,20 @@ const Help = () => {
                                                                 <i className="bi bi-box-seam text-orange fs-4"></i>
                                                             </div>
                                                             <div>
-                                                                <div className="text-muted small">Commande #{foundOrder.id}</div>
+                                                                <div className="text-muted small">{t('commande', { id: foundOrder.id })}</div>
                                                                 <div className="fw-bold fs-4" style={{ color: '#ff6000' }}>{foundOrder.status}</div>
                                                             </div>
                                                         </div>
-                                                        <div className="text-muted small">Prévu pour : {foundOrder.date}</div>
+                                                        <div className="text-muted small">{t('prevu_pour', { date: foundOrder.date })}</div>
                                                     </Col>
                                                     <Col md={4} className="text-md-end mt-3 mt-md-0">
-                                                        <Button variant="outline-dark" className="rounded-pill px-4">Plus de détails</Button>
+                                                        <Button variant="outline-dark" className="rounded-pill px-4">{t('plus_de_details')}</Button>
                                                     </Col>
                                                 </Row>
                                             ) : (
                                                 <div className="text-danger d-flex align-items-center justify-content-center py-3">
                                                     <i className="bi bi-exclamation-circle me-2 fs-4"></i>
-                                                    Commande non trouvée. Veuillez vérifier votre numéro.
+                                                    {t('commande_non_trouvee_veuillez')}
                                                 </div>
                                             )}
                                         </div>
@@ -173,26 +175,26 @@ const Help = () => {
                             {/* FAQ Content */}
                             {activeTab === 'faq' && (
                                 <div className="fade-in">
-                                    <h3 className="fw-bold mb-4">Questions fréquentes</h3>
-                                    <p className="text-muted mb-5">Tout ce que vous devez savoir pour commander sereinement.</p>
+                                    <h3 className="fw-bold mb-4">{t('questions_frequentes')}</h3>
+                                    <p className="text-muted mb-5">{t('tout_ce_que_vous_devez_savoir')}</p>
 
                                     <Accordion className="custom-help-accordion mt-4">
                                         <Accordion.Item eventKey="0" className="border-0 mb-3">
-                                            <Accordion.Header className="rounded-4">Comment payer mon panier ?</Accordion.Header>
+                                            <Accordion.Header className="rounded-4">{t('comment_payer_mon_panier')}</Accordion.Header>
                                             <Accordion.Body className="text-muted">
-                                                Vous pouvez régler vos achats via votre portefeuille électronique TRYMYDAY, par carte bancaire, ou en espèces à la livraison selon les zones.
+                                                {t('vous_pouvez_regler_vos_achats')}
                                             </Accordion.Body>
                                         </Accordion.Item>
                                         <Accordion.Item eventKey="1" className="border-0 mb-3">
-                                            <Accordion.Header className="rounded-4">Quels sont les délais de livraison ?</Accordion.Header>
+                                            <Accordion.Header className="rounded-4">{t('quels_sont_les_delais_de')}</Accordion.Header>
                                             <Accordion.Body className="text-muted">
-                                                Les livraisons standards prennent généralement entre 24h et 72h. Vous recevez une notification à chaque étape via votre centre de messages.
+                                                {t('les_livraisons_standards')}
                                             </Accordion.Body>
                                         </Accordion.Item>
                                         <Accordion.Item eventKey="2" className="border-0 mb-3">
-                                            <Accordion.Header className="rounded-4">Mes données sont-elles protégées ?</Accordion.Header>
+                                            <Accordion.Header className="rounded-4">{t('mes_donnees_sont_elles_protegees')}</Accordion.Header>
                                             <Accordion.Body className="text-muted">
-                                                Oui, la sécurité est notre priorité. Toutes les transactions sont cryptées et nous ne stockons jamais vos informations bancaires complètes.
+                                                {t('oui_la_securite_est_notre')}
                                             </Accordion.Body>
                                         </Accordion.Item>
                                     </Accordion>
@@ -203,14 +205,14 @@ const Help = () => {
                             {activeTab === 'community' && (
                                 <div className="fade-in">
                                     <div className="d-flex justify-content-between align-items-center mb-5">
-                                        <h3 className="fw-bold mb-0">Communauté Q&A</h3>
+                                        <h3 className="fw-bold mb-0">{t('communaute_q_a')}</h3>
                                         <Button
                                             variant="dark"
                                             size="sm"
                                             className="rounded-pill px-4"
                                             onClick={() => document.getElementById('q-form').scrollIntoView({ behavior: 'smooth' })}
                                         >
-                                            Poser une question
+                                            {t('poser_une_question')}
                                         </Button>
                                     </div>
 
@@ -233,20 +235,20 @@ const Help = () => {
                                         ) : (
                                             <div className="text-center py-5">
                                                 <i className="bi bi-chat-quote fs-1 opacity-25"></i>
-                                                <p className="mt-3 text-muted">Pas encore de questions publiques.</p>
+                                                <p className="mt-3 text-muted">{t('pas_encore_de_questions')}</p>
                                             </div>
                                         )}
                                     </div>
 
                                     <div id="q-form" className="p-4 p-lg-5 bg-light rounded-5 mt-5">
-                                        <h4 className="fw-bold mb-3">Votre question n'est pas listée ?</h4>
-                                        <p className="text-muted small mb-4">Posez-la nous via ce formulaire. Un admin y répondra publiquement.</p>
+                                        <h4 className="fw-bold mb-3">{t('votre_question_n_est_pas_listee')}</h4>
+                                        <p className="text-muted small mb-4">{t('posez_la_nous_via_ce_formulaire')}</p>
 
                                         <Form onSubmit={handleSubmitQuestion}>
                                             <Row>
                                                 <Col md={6} className="mb-3">
                                                     <Form.Control
-                                                        placeholder="Votre nom"
+                                                        placeholder={t('votre_nom')}
                                                         className="border-0 p-3 rounded-4"
                                                         value={userName}
                                                         onChange={(e) => setUserName(e.target.value)}
@@ -257,7 +259,7 @@ const Help = () => {
                                                     <Form.Control
                                                         as="textarea"
                                                         rows={4}
-                                                        placeholder="Votre question précise..."
+                                                        placeholder={t('votre_question_precise')}
                                                         className="border-0 p-3 rounded-4"
                                                         value={userQuestion}
                                                         onChange={(e) => setUserQuestion(e.target.value)}
@@ -266,12 +268,12 @@ const Help = () => {
                                                 </Col>
                                             </Row>
                                             <Button variant="dark" type="submit" className="w-100 py-3 rounded-4 fw-bold mt-2 shadow-sm">
-                                                Envoyer pour modération
+                                                {t('envoyer_pour_moderation')}
                                             </Button>
                                         </Form>
                                         {showSuccess && (
                                             <div className="mt-4 p-3 bg-success bg-opacity-10 text-success rounded-4 small fade-in d-flex align-items-center">
-                                                <i className="bi bi-check-circle-fill me-2"></i> Question envoyée avec succès !
+                                                <i className="bi bi-check-circle-fill me-2"></i> {t('question_envoyee_avec_succes')}
                                             </div>
                                         )}
                                     </div>
@@ -281,8 +283,8 @@ const Help = () => {
                             {/* Contact Content */}
                             {activeTab === 'contact' && (
                                 <div className="fade-in text-center py-4">
-                                    <h3 className="fw-bold mb-4">Parler à un de nos agents</h3>
-                                    <p className="text-muted mb-5">Nous sommes disponibles 6j/7 pour vous assister en direct.</p>
+                                    <h3 className="fw-bold mb-4">{t('parler_a_un_de_nos_agents')}</h3>
+                                    <p className="text-muted mb-5">{t('nous_sommes_disponibles_6j_7')}</p>
 
                                     <Row className="g-4 justify-content-center">
                                         {contactMethods.map((m, idx) => (
@@ -9,7 +9,7 @@ import ProductCard from '../components/ProductCard';
 const Home = () => {
     const { products } = useData();
     const { user } = useAuth();
-    const { NoTranslate } = useLanguage();
+    const { NoTranslate, t } = useLanguage();
     const navigate = useNavigate();
     const scrollRef = useRef(null);
 
@@ -161,13 +161,13 @@ const Home = () => {
                                         <img
                                             src="https://images.unsplash.com/photo-1591085686350-798c0f9faf7c?auto=format&fit=crop&w=1000&q=80"
                                             className="w-100 h-100 object-fit-cover"
-                                            alt="Mode Femme"
+                                            alt={t('mode_femme')}
                                             style={{ objectPosition: 'center 20%' }}
                                         />
                                         <div className="position-absolute bottom-0 start-0 w-100 p-4" style={{ background: 'linear-gradient(transparent, rgba(0,0,0,0.8))' }}>
-                                            <span className="badge bg-warning mb-2">MODE FEMME</span>
-                                            <h3 className="text-white fw-bold mb-2">ÉLÉGANCE AU FÉMININ</h3>
-                                            <Link to="/shop?cat=Femme" className="text-white text-decoration-none small fw-bold">DÉCOUVRIR →</Link>
+                                            <span className="badge bg-warning mb-2">{t('mode_femme_2')}</span>
+                                            <h3 className="text-white fw-bold mb-2">{t('elegance_au_feminin')}</h3>
+                                            <Link to="/shop?cat=Femme" className="text-white text-decoration-none small fw-bold">{t('decouvrir')}</Link>
                                         </div>
                                     </div>
                                 </Carousel.Item>
@@ -176,12 +176,12 @@ const Home = () => {
                                         <img
                                             src="https://images.unsplash.com/photo-1441986300917-64674bd600d8?auto=format&fit=crop&w=1000&q=80"
                                             className="w-100 h-100 object-fit-cover"
-                                            alt="Maison"
+                                            alt={t('maison')}
                                         />
                                         <div className="position-absolute bottom-0 start-0 w-100 p-4" style={{ background: 'linear-gradient(transparent, rgba(0,0,0,0.8))' }}>
-                                            <span className="badge bg-info mb-2">MAISON</span>
-                                            <h3 className="text-white fw-bold mb-2">DÉCO & STYLE</h3>
-                                            <Link to="/shop?cat=Maison" className="text-white text-decoration-none small fw-bold">EXPLORER →</Link>
+                                            <span className="badge bg-info mb-2">{t('maison_2')}</span>
+                                            <h3 className="text-white fw-bold mb-2">{t('deco_style')}</h3>
+                                            <Link to="/shop?cat=Maison" className="text-white text-decoration-none small fw-bold">{t('explorer')}</Link>
                                         </div>
                                     </div>
                                 </Carousel.Item>
@@ -198,13 +198,13 @@ const Home = () => {
                                         <img
                                             src="https://images.unsplash.com/photo-1552374196-1ab2a1c593e8?auto=format&fit=crop&w=1000&q=80"
                                             className="w-100 h-100 object-fit-cover"
-                                            alt="Mode Homme"
+                                            alt={t('mode_homme')}
                                             style={{ objectPosition: 'center 10%' }}
                                         />
                                         <div className="position-absolute bottom-0 start-0 w-100 p-4" style={{ background: 'linear-gradient(transparent, rgba(0,0,0,0.8))' }}>
-                                            <span className="badge bg-primary mb-2">MODE HOMME</span>
-                                            <h3 className="text-white fw-bold mb-2">STYLE MODERNE</h3>
-                                            <Link to="/shop?cat=Homme" className="text-white text-decoration-none small fw-bold">DÉCOUVRIR →</Link>
+                                            <span className="badge bg-primary mb-2">{t('mode_homme_2')}</span>
+                                            <h3 className="text-white fw-bold mb-2">{t('style_moderne')}</h3>
+                                            <Link to="/shop?cat=Homme" className="text-white text-decoration-none small fw-bold">{t('decouvrir')}</Link>
                                         </div>
                                     </div>
                                 </Carousel.Item>
@@ -213,11 +213,11 @@ const Home = () => {
                                         <img
                                             src="https://images.unsplash.com/photo-1519389950473-47ba0277781c?auto=format&fit=crop&w=1000&q=80"
                                             className="w-100 h-100 object-fit-cover"
-                                            alt="Technologie"
+                                            alt={t('technologie')}
                                         />
                                         <div className="position-absolute bottom-0 start-0 w-100 p-4" style={{ background: 'linear-gradient(transparent, rgba(0,0,0,0.8))' }}>
-                                            <span className="badge bg-info mb-2">NOUVEAUTÉS TECH</span>
-                                            <h3 className="text-white fw-bold mb-2">INNOVATION</h3>
+                                            <span className="badge bg-info mb-2">{t('nouveautes_tech')}</span>
+                                            <h3 className="text-white fw-bold mb-2">{t('innovation')}</h3>
                                             <Link to="/shop?cat=Électronique" className="text-white text-decoration-none small fw-bold">VOIR PLUS →</Link>
                                         </div>
                                     </div>
@@ -231,8 +231,8 @@ const Home = () => {
             {/* --- 4. FEATURED PRODUCTS (HORIZONTAL SLIDER STYLE) --- */}
             <Container className="mb-5 py-4 position-relative">
                 <div className="d-flex justify-content-between align-items-center mb-4">
-                    <h3 className="fw-bold mb-0 border-start border-4 border-warning ps-3" style={{ fontSize: '1.5rem' }}>Les plus aimés</h3>
-                    <Link to="/shop" className="text-warning fw-bold text-decoration-none small">Voir Tout →</Link>
+                    <h3 className="fw-bold mb-0 border-start border-4 border-warning ps-3" style={{ fontSize: '1.5rem' }}>{t('les_plus_aimes')}</h3>
+                    <Link to="/shop" className="text-warning fw-bold text-decoration-none small">{t('voir_tout')}</Link>
                 </div>
 
                 <div className="position-relative slider-wrapper px-md-2">
@@ -273,7 +273,7 @@ const Home = () => {
             {/* --- 6. BRAND CAMPAIGN BANNERS (Trendyol Style) --- */}
             <Container className="mb-5 pb-5">
                 <div className="d-flex justify-content-between align-items-center mb-4">
-                    <h3 className="fw-bold mb-0 border-start border-4 border-warning ps-3" style={{ fontSize: '1.5rem' }}>Destinations de Marques</h3>
+                    <h3 className="fw-bold mb-0 border-start border-4 border-warning ps-3" style={{ fontSize: '1.5rem' }}>{t('destinations_de_marques')}</h3>
                 </div>
                 <Row className="g-4">
                     {brandCampaigns.map((campaign, idx) => (
@@ -288,7 +288,7 @@ const Home = () => {
                                     {campaign.products.map((p, i) => (
                                         <div key={i} className="text-center">
                                             <div className="rounded-3 overflow-hidden border" style={{ width: '85px', height: '110px' }}>
-                                                <img src={p.img} alt="product" className="w-100 h-100 object-fit-cover" />
+                                                <img src={p.img} alt={t('product')} className="w-100 h-100 object-fit-cover" />
                                             </div>
                                         </div>
                                     ))}
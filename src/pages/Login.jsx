@@ -2,8 +2,10 @@ import { useState } from 'react';
 import { Container, Form, Button, Card, Alert } from 'react-bootstrap';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate, Link } from 'react-router-dom';
+import { useLanguage } from '../context/LanguageContext';
 
 const Login = () => {
+    const { t } = useLanguage();
     const [email, setEmail] = useState('');
     const [password, setPassword] = useState('');
     const { login } = useAuth();
@@ -35,13 +37,13 @@ const Login = () => {
         <Container className="d-flex justify-content-center align-items-center" style={{ minHeight: '80vh' }}>
             <Card style={{ width: '400px' }} className="shadow-lg border-0">
                 <Card.Body className="p-5">
-                    <h2 className="text-center mb-4 fw-bold">Connexion</h2>
+                    <h2 className="text-center mb-4 fw-bold">{t('connexion')}</h2>
 
                     {error && <Alert variant="danger" className="py-2 small">{error}</Alert>}
 
                     <Form onSubmit={handleSubmit}>
                         <Form.Group className="mb-3" controlId="formBasicEmail">
-                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>Adresse Email</Form.Label>
+                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>{t('adresse_email')}</Form.Label>
                             <Form.Control
                                 type="email"
                                 placeholder="votre@email.com"
@@ -54,10 +56,10 @@ const Login = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-4" controlId="formBasicPassword">
-                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>Mot de passe</Form.Label>
+                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>{t('mot_de_passe')}</Form.Label>
                             <Form.Control
                                 type="password"
-                                placeholder="Mot de passe"
+                                placeholder={t('mot_de_passe')}
                                 value={password}
                                 onChange={(e) => setPassword(e.target.value)}
                                 style={{ fontSize: '1rem', padding: '12px' }}
@@ -83,7 +85,7 @@ const Login = () => {
                     </Form>
 
                     <div className="text-center mt-3">
-                        <small className="text-muted">Pas encore de compte ? <Link to="/register" className="fw-bold text-warning">Inscription</Link></small>
+                        <small className="text-muted">{t('pas_encore_de_compte')} <Link to="/register" className="fw-bold text-warning">{t('inscription')}</Link></small>
                     </div>
                 </Card.Body>
             </Card>
@@ -3,8 +3,10 @@ import { useState } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Messages = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const navigate = useNavigate();
 
@@ -18,10 +20,10 @@ const Messages = () => {
             lastMessageTime: '2025-01-20 14:30',
             unread: 2,
             messages: [
-                { id: 1, sender: 'vendor', text: 'Bonjour ! Comment puis-je vous aider ?', time: '2025-01-20 10:00' },
-                { id: 2, sender: 'user', text: 'Bonjour, j\'ai une question sur ma commande #12345', time: '2025-01-20 10:15' },
-                { id: 3, sender: 'vendor', text: 'Bien sûr ! Laissez-moi vérifier...', time: '2025-01-20 10:16' },
-                { id: 4, sender: 'vendor', text: 'Votre commande a été expédiée !', time: '2025-01-20 14:30' }
+                { id: 1, sender: 'vendor', text: t('bonjour_comment_puis_je_vous'), time: '2025-01-20 10:00' },
+                { id: 2, sender: 'user', text: t('bonjour_j_ai_une_question_sur_ma'), time: '2025-01-20 10:15' },
+                { id: 3, sender: 'vendor', text: t('bien_sur_laissez_moi_verifier'), time: '2025-01-20 10:16' },
+                { id: 4, sender: 'vendor', text: t('votre_commande_a_ete_expediee'), time: '2025-01-20 14:30' }
             ]
         },
         {
@@ -32,8 +34,8 @@ const Messages = () => {
             lastMessageTime: '2025-01-19 16:45',
             unread: 0,
             messages: [
-                { id: 1, sender: 'vendor', text: 'Merci pour votre achat !', time: '2025-01-19 16:45' },
-                { id: 2, sender: 'user', text: 'De rien, merci à vous !', time: '2025-01-19 17:00' }
+                { id: 1, sender: 'vendor', text: t('merci_pour_votre_achat'), time: '2025-01-19 16:45' },
+                { id: 2, sender: 'user', text: t('de_rien_merci_a_vous'), time: '2025-01-19 17:00' }
             ]
         },
         {
@@ -44,8 +46,8 @@ const Messages = () => {
             lastMessageTime: '2025-01-18 11:20',
             unread: 1,
             messages: [
-                { id: 1, sender: 'user', text: 'Avez-vous ce produit en bleu ?', time: '2025-01-18 11:00' },
-                { id: 2, sender: 'vendor', text: 'Le produit est disponible en bleu également', time: '2025-01-18 11:20' }
+                { id: 1, sender: 'user', text: t('avez_vous_ce_produit_en_bleu'), time: '2025-01-18 11:00' },
+                { id: 2, sender: 'vendor', text: t('le_produit_est_disponible_en'), time: '2025-01-18 11:20' }
             ]
         }
     ]);
@@ -81,15 +83,15 @@ const Messages = () => {
         return (
             <ProfileLayout>
                 <div className="mb-4">
-                    <h3 className="fw-bold">Messages vendeur</h3>
-                    <p className="text-muted">Communiquez avec les vendeurs</p>
+                    <h3 className="fw-bold">{t('messages_vendeur')}</h3>
+                    <p className="text-muted">{t('communiquez_avec_les_vendeurs')}</p>
                 </div>
                 <Card className="border-0 shadow-sm text-center p-5">
                     <i className="bi bi-person-x" style={{ fontSize: '4rem', color: '#ddd' }}></i>
-                    <h5 className="mt-3">Connexion requise</h5>
-                    <p className="text-muted">Connectez-vous pour voir vos messages</p>
+                    <h5 className="mt-3">{t('connexion_requise')}</h5>
+                    <p className="text-muted">{t('connectez_vous_pour_voir_vos_2')}</p>
                     <Button variant="warning" className="text-white mt-2" onClick={() => navigate('/login')}>
-                        Se connecter
+                        {t('se_connecter')}
                     </Button>
                 </Card>
             </ProfileLayout>
@@ -99,8 +101,8 @@ const Messages = () => {
     return (
         <ProfileLayout>
             <div className="mb-4">
-                <h3 className="fw-bold">Messages vendeur</h3>
-                <p className="text-muted">Communiquez avec les vendeurs</p>
+                <h3 className="fw-bold">{t('messages_vendeur')}</h3>
+                <p className="text-muted">{t('communiquez_avec_les_vendeurs')}</p>
             </div>
 
             <Row>
@@ -108,13 +110,13 @@ const Messages = () => {
                 <Col md={4}>
                     <Card className="border-0 shadow-sm" style={{ height: '600px', overflowY: 'auto' }}>
                         <Card.Header className="bg-white border-bottom">
-                            <h6 className="mb-0 fw-bold">Conversations</h6>
+                            <h6 className="mb-0 fw-bold">{t('conversations')}</h6>
                         </Card.Header>
                         <ListGroup variant="flush">
                             {conversations.length === 0 ? (
                                 <div className="text-center p-4">
                                     <i className="bi bi-chat-dots" style={{ fontSize: '3rem', color: '#ddd' }}></i>
-                                    <p className="text-muted mt-3 mb-0">Aucune conversation</p>
+                                    <p className="text-muted mt-3 mb-0">{t('aucune_conversation')}</p>
                                 </div>
                             ) : (
                                 conversations.map(conv => (
@@ -162,7 +164,7 @@ const Messages = () => {
                                     </div>
                                     <div>
                                         <h6 className="mb-0 fw-bold">{selectedConversation.vendorName}</h6>
-                                        <small className="text-muted">En ligne</small>
+                                        <small className="text-muted">{t('en_ligne')}</small>
                                     </div>
                                 </div>
                             </Card.Header>
@@ -196,7 +198,7 @@ const Messages = () => {
                                     <div className="d-flex gap-2">
                                         <Form.Control
                                             type="text"
-                                            placeholder="Tapez votre message..."
+                                            placeholder={t('tapez_votre_message')}
                                             value={newMessage}
                                             onChange={(e) => setNewMessage(e.target.value)}
                                         />
@@ -211,8 +213,8 @@ const Messages = () => {
                         <Card className="border-0 shadow-sm text-center p-5" style={{ height: '600px' }}>
                             <div className="d-flex flex-column align-items-center justify-content-center h-100">
                                 <i className="bi bi-chat-text" style={{ fontSize: '5rem', color: '#ddd' }}></i>
-                                <h5 className="mt-4 text-muted">Sélectionnez une conversation</h5>
-                                <p className="text-muted">Choisissez un vendeur pour commencer à discuter</p>
+                                <h5 className="mt-4 text-muted">{t('selectionnez_une_conversation')}</h5>
+                                <p className="text-muted">{t('choisissez_un_vendeur_pour')}</p>
                             </div>
                         </Card>
                     )}
@@ -3,8 +3,10 @@ import { useParams, useNavigate } from 'react-router-dom';
 import { useData } from '../context/DataContext';
 import { useAuth } from '../context/AuthContext';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const OrderDetails = () => {
+    const { t } = useLanguage();
     const { orderId } = useParams();
     const { orders, updateOrder } = useData();
     const { user } = useAuth();
@@ -17,9 +19,9 @@ const OrderDetails = () => {
     if (!order) {
         return (
             <Container className="py-5 text-center">
-                <h3>❌ Commande introuvable</h3>
+                <h3>{t('commande_introuvable')}</h3>
                 <Button variant="warning" className="mt-3 text-white" onClick={() => navigate('/profile/orders')}>
-                    ⬅️ Retour aux commandes
+                    {t('retour_aux_commandes')}
                 </Button>
             </Container>
         );
@@ -28,9 +30,9 @@ const OrderDetails = () => {
     if (order.email !== user?.email && user?.role !== 'admin') {
         return (
             <Container className="py-5 text-center">
-                <h3>🔒 Accès non autorisé</h3>
+                <h3>{t('acces_non_autorise')}</h3>
                 <Button variant="warning" className="mt-3 text-white" onClick={() => navigate('/profile/orders')}>
-                    ⬅️ Retour aux commandes
+                    {t('retour_aux_commandes')}
                 </Button>
             </Container>
         );
@@ -49,11 +51,11 @@ const OrderDetails = () => {
             {/* Header */}
             <div className="d-flex justify-content-between align-items-center mb-4">
                 <div>
-                    <h3 className="fw-bold mb-1">Détails de la commande</h3>
-                    <p className="text-muted mb-0">Commande #{order.id}</p>
+                    <h3 className="fw-bold mb-1">{t('details_de_la_commande')}</h3>
+                    <p className="text-muted mb-0">{t('commande', { id: order.id })}</p>
                 </div>
                 <Button variant="outline-secondary" onClick={() => navigate('/profile/orders')}>
-                    ⬅️ Retour
+                    {t('retour')}
                 </Button>
             </div>
 
@@ -63,13 +65,13 @@ const OrderDetails = () => {
                     {/* Order Status */}
                     <Card className="border-0 shadow-sm mb-4">
                         <Card.Body className="p-4">
-                            <h5 className="fw-bold mb-3">Statut de la commande</h5>
+                            <h5 className="fw-bold mb-3">{t('statut_de_la_commande')}</h5>
                             {order.status === "Demande d'annulation" && (
                                 <div className="alert alert-warning border-0 shadow-sm d-flex align-items-center mb-4">
                                     <i className="bi bi-hourglass-split me-3 fs-4"></i>
                                     <div>
-                                        <div className="fw-bold">Annulation en cours</div>
-                                        <small>Votre demande d'annulation a été enregistrée. Elle attend la confirmation d'un administrateur pour que votre remboursement soit effectué.</small>
+                                        <div className="fw-bold">{t('annulation_en_cours')}</div>
+                                        <small>{t('votre_demande_d_annulation_a_ete')}</small>
                                     </div>
                                 </div>
                             )}
@@ -78,7 +80,7 @@ const OrderDetails = () => {
                                     {order.status}
                                 </Badge>
                                 <div>
-                                    <small className="text-muted d-block">Date de commande</small>
+                                    <small className="text-muted d-block">{t('date_de_commande')}</small>
                                     <strong>{order.date}</strong>
                                 </div>
                             </div>
@@ -91,13 +93,13 @@ const OrderDetails = () => {
                             <Card.Body className="p-4">
                                 <h5 className="fw-bold mb-3">
                                     <i className="bi bi-clock-history me-2"></i>
-                                    Suivi de commande
+                                    {t('suivi_de_commande')}
                                 </h5>
 
                                 {order.trackingNumber && (
                                     <div className="alert alert-info mb-3">
                                         <i className="bi bi-truck me-2"></i>
-                                        <strong>Numéro de suivi :</strong> {order.trackingNumber}
+                                        <strong>{t('numero_de_suivi')}</strong> {order.trackingNumber}
                                     </div>
                                 )}
 
@@ -144,7 +146,7 @@ const OrderDetails = () => {
                                                                 <strong>{entry.newStatus}</strong>
                                                                 {entry.oldStatus && entry.oldStatus !== entry.newStatus && (
                                                                     <small className="text-muted ms-2">
-                                                                        (de {entry.oldStatus})
+                                                                        {t('de', { oldStatus: entry.oldStatus })}
                                                                     </small>
                                                                 )}
                                                             </div>
@@ -175,7 +177,7 @@ const OrderDetails = () => {
                     {/* Order Items */}
                     <Card className="border-0 shadow-sm mb-4">
                         <Card.Body className="p-4">
-                            <h5 className="fw-bold mb-3">Articles commandés ({order.items?.length || 0})</h5>
+                            <h5 className="fw-bold mb-3">{t('articles_commandes', { count: order.items?.length || 0 })}</h5>
                             <ListGroup variant="flush">
                                 {order.items?.map((item, index) => (
                                     <ListGroup.Item key={index} className="px-0 py-3">
@@ -194,12 +196,12 @@ const OrderDetails = () => {
                                             </Col>
                                             <Col>
                                                 <h6 className="mb-1">{item.name}</h6>
-                                                <small className="text-muted">Quantité: {item.quantity}</small>
+                                                <small className="text-muted">{t('quantite', { quantity: item.quantity })}</small>
                                             </Col>
                                             <Col xs="auto">
                                                 <strong className="text-warning">{item.price.toLocaleString()} FCFA</strong>
                                                 <div className="small text-muted">
-                                                    Total: {(item.price * item.quantity).toLocaleString()} FCFA
+                                                    {t('total_fcfa', { value: (item.price * item.quantity).toLocaleString() })}
                                                 </div>
                                             </Col>
                                         </Row>
@@ -212,14 +214,14 @@ const OrderDetails = () => {
                     {/* Shipping Address */}
                     <Card className="border-0 shadow-sm mb-4">
                         <Card.Body className="p-4">
-                            <h5 className="fw-bold mb-3">Adresse de livraison</h5>
+                            <h5 className="fw-bold mb-3">{t('adresse_de_livraison')}</h5>
                             <div className="bg-light p-3 rounded">
                                 <p className="mb-1"><strong>{order.customer}</strong></p>
                                 <p className="mb-1 small">{order.shippingAddress?.address}</p>
                                 <p className="mb-1 small">{order.shippingAddress?.city}, {order.shippingAddress?.postalCode}</p>
                                 <p className="mb-1 small">{order.shippingAddress?.country}</p>
-                                <p className="mb-1 small">Tél: {order.phone}</p>
-                                <p className="mb-0 small">Email: {order.email}</p>
+                                <p className="mb-1 small">{t('tel', { phone: order.phone })}</p>
+                                <p className="mb-0 small">{t('email', { email: order.email })}</p>
                             </div>
                         </Card.Body>
                     </Card>
@@ -230,27 +232,27 @@ const OrderDetails = () => {
                     <div className="sticky-top" style={{ top: '100px', zIndex: 10, transition: 'all 0.3s ease' }}>
                         <Card className="border-0 shadow-sm mb-3">
                             <Card.Body className="p-4">
-                                <h5 className="fw-bold mb-4">Résumé de la commande</h5>
+                                <h5 className="fw-bold mb-4">{t('resume_de_la_commande')}</h5>
 
                                 <div className="d-flex justify-content-between mb-2">
-                                    <span className="text-muted">Sous-total</span>
+                                    <span className="text-muted">{t('sous_total')}</span>
                                     <span>{(order.total - (order.shippingCost || 0)).toLocaleString()} FCFA</span>
                                 </div>
 
                                 <div className="d-flex justify-content-between mb-2">
-                                    <span className="text-muted">Livraison</span>
+                                    <span className="text-muted">{t('livraison')}</span>
                                     <span>{order.shippingCost ? `${order.shippingCost.toLocaleString()} FCFA` : 'Gratuite'}</span>
                                 </div>
 
                                 <hr />
 
                                 <div className="d-flex justify-content-between mb-3">
-                                    <strong>Total</strong>
+                                    <strong>{t('total')}</strong>
                                     <strong className="text-warning fs-5">{order.total.toLocaleString()} FCFA</strong>
                                 </div>
 
                                 <div className="bg-light p-3 rounded">
-                                    <small className="text-muted d-block mb-1">Numéro de commande</small>
+                                    <small className="text-muted d-block mb-1">{t('numero_de_commande')}</small>
                                     <strong className="small">{order.id}</strong>
                                 </div>
                             </Card.Body>
@@ -264,7 +266,7 @@ const OrderDetails = () => {
                                         variant="danger"
                                         className="w-100 mb-2"
                                         onClick={() => {
-                                            if (window.confirm('Êtes-vous sûr de vouloir annuler ? L\'administrateur devra accepter l\'annulation avant que votre argent ne soit retourné sur votre compte.')) {
+                                            if (window.confirm(t('etes_vous_sur_de_vouloir_annuler'))) {
                                                 const timelineEntry = {
                                                     date: new Date().toLocaleString('fr-FR'),
                                                     oldStatus: order.status,
@@ -280,7 +282,7 @@ const OrderDetails = () => {
                                         }}
                                     >
                                         <i className="bi bi-x-circle me-2"></i>
-                                        Annuler la commande
+                                        {t('annuler_la_commande')}
                                     </Button>
                                 )}
                                 <Button
@@ -289,7 +291,7 @@ const OrderDetails = () => {
                                     onClick={() => window.print()}
                                 >
                                     <i className="bi bi-printer me-2"></i>
-                                    Imprimer
+                                    {t('imprimer')}
                                 </Button>
                                 <Button
                                     variant="outline-secondary"
@@ -297,7 +299,7 @@ const OrderDetails = () => {
                                     onClick={() => navigate('/shop')}
                                 >
                                     <i className="bi bi-shop me-2"></i>
-                                    Continuer mes achats
+                                    {t('continuer_mes_achats')}
                                 </Button>
                             </Card.Body>
                         </Card>
@@ -4,8 +4,10 @@ import { Link, useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
 import { useData } from '../context/DataContext';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Orders = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const { orders } = useData();
     const navigate = useNavigate();
@@ -25,8 +27,8 @@ const Orders = () => {
     if (!user) {
         return (
             <Container className="py-5 text-center">
-                <h3>Veuillez vous connecter pour voir vos commandes</h3>
-                <Link to="/login" className="btn btn-primary mt-3">Se connecter</Link>
+                <h3>{t('veuillez_vous_connecter_pour_2')}</h3>
+                <Link to="/login" className="btn btn-primary mt-3">{t('se_connecter')}</Link>
             </Container>
         );
     }
@@ -34,17 +36,17 @@ const Orders = () => {
     return (
         <ProfileLayout>
             <div className="mb-4">
-                <h3 className="fw-bold">Mes commandes</h3>
-                <p className="text-muted mb-0">Suivez vos commandes en cours et consultez votre historique</p>
+                <h3 className="fw-bold">{t('mes_commandes')}</h3>
+                <p className="text-muted mb-0">{t('suivez_vos_commandes_en_cours_et')}</p>
             </div>
 
             {userOrders.length === 0 ? (
                 <Card className="shadow-sm border-0 text-center p-5">
                     <i className="bi bi-box-seam" style={{ fontSize: '5rem', color: '#ddd' }}></i>
-                    <h4 className="mt-4 text-muted">Aucune commande</h4>
-                    <p className="text-muted">Vous n'avez pas encore passé de commande</p>
+                    <h4 className="mt-4 text-muted">{t('aucune_commande')}</h4>
+                    <p className="text-muted">{t('vous_n_avez_pas_encore_passe_de')}</p>
                     <Button variant="warning" className="text-white mt-3" onClick={() => navigate('/shop')}>
-                        Découvrir la boutique
+                        {t('decouvrir_la_boutique')}
                     </Button>
                 </Card>
             ) : (
@@ -56,7 +58,7 @@ const Orders = () => {
                                 <div className="d-flex justify-content-between align-items-center">
                                     <h5 className="mb-0 fw-bold">
                                         <i className="bi bi-clock-history text-warning me-2"></i>
-                                        Commandes en cours
+                                        {t('commandes_en_cours')}
                                     </h5>
                                     <Badge bg="warning" text="dark">
                                         {userOrders.filter(order => order.status !== 'Livrée' && order.status !== 'Annulée').length}
@@ -76,15 +78,15 @@ const Orders = () => {
                                                     </div>
                                                 </Col>
                                                 <Col md={3}>
-                                                    <small className="text-muted d-block">Client</small>
+                                                    <small className="text-muted d-block">{t('client')}</small>
                                                     <strong>{order.customerName}</strong>
                                                 </Col>
                                                 <Col md={2}>
-                                                    <small className="text-muted d-block">Articles</small>
-                                                    <strong>{order.items?.length || 0} article(s)</strong>
+                                                    <small className="text-muted d-block">{t('articles_2')}</small>
+                                                    <strong>{t('article_s', { count: order.items?.length || 0 })}</strong>
                                                 </Col>
                                                 <Col md={2}>
-                                                    <small className="text-muted d-block">Montant</small>
+                                                    <small className="text-muted d-block">{t('montant')}</small>
                                                     <strong className="text-success">{order.total.toLocaleString()} FCFA</strong>
                                                 </Col>
                                                 <Col md={2}>
@@ -122,7 +124,7 @@ const Orders = () => {
                                 <div className="d-flex justify-content-between align-items-center">
                                     <h5 className="mb-0 fw-bold">
                                         <i className="bi bi-clock-history text-secondary me-2"></i>
-                                        Historique des commandes
+                                        {t('historique_des_commandes')}
                                     </h5>
                                     <Badge bg="secondary">
                                         {userOrders.filter(order => order.status === 'Livrée' || order.status === 'Annulée').length}
@@ -142,20 +144,20 @@ const Orders = () => {
                                                     </div>
                                                 </Col>
                                                 <Col md={3}>
-                                                    <small className="text-muted d-block">Client</small>
+                                                    <small className="text-muted d-block">{t('client')}</small>
                                                     <strong>{order.customerName}</strong>
                                                 </Col>
                                                 <Col md={2}>
-                                                    <small className="text-muted d-block">Articles</small>
-                                                    <strong>{order.items?.length || 0} article(s)</strong>
+                                                    <small className="text-muted d-block">{t('articles_2')}</small>
+                                                    <strong>{t('article_s', { count: order.items?.length || 0 })}</strong>
                                                 </Col>
                                                 <Col md={2}>
-                                                    <small className="text-muted d-block">Montant</small>
+                                                    <small className="text-muted d-block">{t('montant')}</small>
                                                     <strong className="text-success">{order.total.toLocaleString()} FCFA</strong>
                                                 </Col>
                                                 <Col md={2}>
                                                     <Badge bg="success" className="w-100 py-2">
-                                                        Livrée
+                                                        {t('livree')}
                                                     </Badge>
                                                 </Col>
                                                 <Col md={1}>
@@ -8,8 +8,10 @@ import { useFavorites } from '../context/FavoritesContext';
 import ProductCard from '../components/ProductCard';
 
 import { toast } from 'react-toastify';
+import { useLanguage } from '../context/LanguageContext';
 
 const ProductDetails = () => {
+    const { t } = useLanguage();
     const { id } = useParams();
     const navigate = useNavigate();
     const { products, reviews, addReview, orders } = useData();
@@ -137,7 +139,7 @@ const ProductDetails = () => {
     }, [product, id]);
 
     if (!product) {
-        return <Container className="py-5 text-center mt-5"><h3>Produit non trouvé</h3></Container>;
+        return <Container className="py-5 text-center mt-5"><h3>{t('produit_non_trouve')}</h3></Container>;
     }
 
     const isClothing = ['Mode', 'Vêtements', 'Robes', 'Chemises', 'Pantalons', 'Robe Bohème Chic'].includes(product.category) || product.category.toLowerCase().includes('robe') || product.category.toLowerCase().includes('vetement');
@@ -248,7 +250,7 @@ const ProductDetails = () => {
                         style={{ color: colors.textSecondary, cursor: 'pointer', transition: 'all 0.2s' }}
                     >
                         <i className="bi bi-house-door" style={{ fontSize: '1rem' }}></i>
-                        <span>Accueil</span>
+                        <span>{t('accueil')}</span>
                     </div>
 
                     <i className="bi bi-chevron-right" style={{ color: colors.border, fontSize: '0.7rem' }}></i>
@@ -258,7 +260,7 @@ const ProductDetails = () => {
                         className="cursor-pointer hover-opacity"
                         style={{ color: colors.textSecondary, cursor: 'pointer', transition: 'all 0.2s' }}
                     >
-                        Boutique
+                        {t('boutique')}
                     </div>
 
                     <i className="bi bi-chevron-right" style={{ color: colors.border, fontSize: '0.7rem' }}></i>
@@ -394,7 +396,7 @@ const ProductDetails = () => {
                                     {product.colors && product.colors.length > 0 && (
                                         <div className="mb-2">
                                             <div className="d-flex align-items-center mb-2">
-                                                <span className="fw-bold text-dark me-2" style={{ fontSize: '0.85rem', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>Couleur:</span>
+                                                <span className="fw-bold text-dark me-2" style={{ fontSize: '0.85rem', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>{t('couleur')}</span>
                                                 <span className="text-muted" style={{ fontSize: '0.85rem', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>{selectedColor || 'Non sélectionnée'}</span>
                                             </div>
                                             <div className="d-flex flex-wrap gap-2">
@@ -474,7 +476,7 @@ const ProductDetails = () => {
                                     {(product.storageOptions || (isTech && (storageOptions && storageOptions.length > 0))) && (
                                         <div className="mb-2">
                                             <div className="d-flex align-items-center mb-2">
-                                                <span className="fw-bold text-dark me-2" style={{ fontSize: '0.85rem', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>Stockage:</span>
+                                                <span className="fw-bold text-dark me-2" style={{ fontSize: '0.85rem', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>{t('stockage')}</span>
                                                 <span className="text-muted" style={{ fontSize: '0.85rem', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>{selectedStorage || 'Non sélectionné'}</span>
                                             </div>
                                             <div className="d-flex flex-wrap gap-2">
@@ -510,7 +512,7 @@ const ProductDetails = () => {
                                     {isClothing && (
                                         <div className="d-flex align-items-center gap-2 mb-4 text-muted small">
                                             <i className="bi bi-hanger"></i>
-                                            <span>La plupart des utilisateurs recommandent de prendre votre taille habituelle.</span>
+                                            <span>{t('la_plupart_des_utilisateurs')}</span>
                                         </div>
                                     )}
 
@@ -536,7 +538,7 @@ const ProductDetails = () => {
                                             }}
                                             onClick={handleBuyNow}
                                         >
-                                            Acheter maintenant
+                                            {t('acheter_maintenant')}
                                         </Button>
                                         <Button
                                             className="flex-grow-1 py-3 fw-bold text-white border-0"
@@ -547,7 +549,7 @@ const ProductDetails = () => {
                                             }}
                                             onClick={handleAddToCart}
                                         >
-                                            Ajouter au panier
+                                            {t('ajouter_au_panier')}
                                         </Button>
 
                                     </div>
@@ -560,7 +562,7 @@ const ProductDetails = () => {
                                             </div>
                                             <div>
                                                 <div className="fw-bold text-dark" style={{ fontSize: '0.9rem' }}>
-                                                    Livraison estimée : <span className="text-success">{deliveryDate}</span>
+                                                    {t('livraison_estimee_2')} <span className="text-success">{deliveryDate}</span>
                                                 </div>
                                                 <div className="text-muted small">
                                                     {selectedCountry === "Tchad" && selectedCity === "N'Djaména" ? 'Livraison Express disponible' : 'Livraison Standard'}
@@ -575,10 +577,10 @@ const ProductDetails = () => {
                                         >
                                             <i className="bi bi-geo-alt-fill fs-5 text-danger"></i>
                                             <div className="flex-grow-1">
-                                                <div className="fw-bold text-dark" style={{ fontSize: '0.85rem' }}>Livrer à : {selectedCountry}</div>
+                                                <div className="fw-bold text-dark" style={{ fontSize: '0.85rem' }}>{t('livrer_a', { selectedCountry })}</div>
                                                 <div className="text-dark small fw-medium">{selectedCity} - {selectedDistrict}</div>
                                             </div>
-                                            <span className="fw-bold small cursor-pointer" style={{ color: colors.primary }}>Changer &gt;</span>
+                                            <span className="fw-bold small cursor-pointer" style={{ color: colors.primary }}>{t('changer')}</span>
                                         </div>
                                     </div>
 
@@ -587,18 +589,18 @@ const ProductDetails = () => {
                                     <div className="mb-4">
                                         <h6 className="fw-bold mb-3 d-flex align-items-center gap-2" style={{ fontSize: '1rem', color: colors.textMain }}>
                                             <i className="bi bi-info-circle text-primary"></i>
-                                            Caractéristiques principales :
+                                            {t('caracteristiques_principales')}
                                         </h6>
                                         <Row className="g-3">
                                             {(product.attributes && product.attributes.length > 0 ? product.attributes : [
-                                                { label: 'Coupe', value: 'Regular' },
-                                                { label: 'Matière', value: 'Polyester' },
-                                                { label: 'Doublure', value: 'Oui' },
-                                                { label: 'Col', value: 'Capuche' },
-                                                { label: 'Tissu', value: 'Tissé' },
-                                                { label: 'Couleur', value: selectedColor || 'Unie' },
-                                                { label: 'Fermeture', value: 'Éclair' },
-                                                { label: 'Motif', value: 'Uni' }
+                                                { label: t('coupe'), value: 'Regular' },
+                                                { label: t('matiere'), value: 'Polyester' },
+                                                { label: t('doublure'), value: 'Oui' },
+                                                { label: t('col'), value: 'Capuche' },
+                                                { label: t('tissu'), value: 'Tissé' },
+                                                { label: t('couleur_2'), value: selectedColor || 'Unie' },
+                                                { label: t('fermeture'), value: 'Éclair' },
+                                                { label: t('motif'), value: 'Uni' }
                                             ]).map((attr, idx) => (
                                                 <Col xs={6} md={3} key={idx}>
                                                     <div
@@ -623,15 +625,15 @@ const ProductDetails = () => {
                                         <ul className="list-unstyled d-flex flex-column gap-2 mb-0">
                                             <li className="d-flex gap-2">
                                                 <span style={{ color: colors.primary }}>•</span>
-                                                Ce produit sera expédié par <strong>TRYMYDAY</strong>.
+                                                {t('ce_produit_sera_expedie_par')} <strong>TRYMYDAY</strong>.
                                             </li>
                                             <li className="d-flex gap-2">
                                                 <span style={{ color: colors.primary }}>•</span>
-                                                Plus de 50 articles en stock au prix promotionnel.
+                                                {t('plus_de_50_articles_en_stock_au')}
                                             </li>
                                             <li className="d-flex gap-2">
                                                 <span style={{ color: colors.primary }}>•</span>
-                                                Possibilité de commander jusqu'à 10 articles maximum par commande.
+                                                {t('possibilite_de_commander_jusqu_a')}
                                             </li>
                                         </ul>
                                     </div>
@@ -662,7 +664,7 @@ const ProductDetails = () => {
                             >
                                 <div className="h-100 w-100 p-4 custom-scroll" style={{ overflowY: 'auto' }}>
                                     <div className="d-flex align-items-center justify-content-between mb-4">
-                                        <h5 className="fw-bold mb-0">Avis clients</h5>
+                                        <h5 className="fw-bold mb-0">{t('avis_clients')}</h5>
                                         <div className="d-flex gap-2">
                                             {isVerifiedBuyer && (
                                                 <Button
@@ -700,7 +702,7 @@ const ProductDetails = () => {
                                                 <Form.Control
                                                     as="textarea"
                                                     rows={2}
-                                                    placeholder="Votre avis..."
+                                                    placeholder={t('votre_avis')}
                                                     value={userComment}
                                                     onChange={(e) => setUserComment(e.target.value)}
                                                     className="border-0 bg-white mb-2 shadow-none small"
@@ -717,7 +719,7 @@ const ProductDetails = () => {
                                                         style={{ borderRadius: '8px' }}
                                                     />
                                                 </div>
-                                                <Button size="sm" type="submit" className="border-0 rounded-pill px-3 py-1 text-white" style={{ backgroundColor: colors.primary }}>Publier</Button>
+                                                <Button size="sm" type="submit" className="border-0 rounded-pill px-3 py-1 text-white" style={{ backgroundColor: colors.primary }}>{t('publier')}</Button>
                                             </Form>
                                         </div>
                                     )}
@@ -741,7 +743,7 @@ const ProductDetails = () => {
                                                                 <img
                                                                     key={imgIndex}
                                                                     src={img}
-                                                                    alt="Review"
+                                                                    alt={t('review')}
                                                                     className="rounded"
                                                                     style={{ width: '60px', height: '60px', objectFit: 'cover' }}
                                                                 />
@@ -751,7 +753,7 @@ const ProductDetails = () => {
                                                 </div>
                                             ))
                                         ) : (
-                                            <div className="text-center py-4 text-muted small">Aucun avis pour l'instant.</div>
+                                            <div className="text-center py-4 text-muted small">{t('aucun_avis_pour_l_instant')}</div>
                                         )}
                                     </div>
                                 </div>
@@ -765,14 +767,14 @@ const ProductDetails = () => {
                     similarProducts.length > 0 && (
                         <div className="mt-5 pt-4 border-top">
                             <div className="d-flex align-items-center justify-content-between mb-4">
-                                <h4 className="fw-bold mb-0" style={{ letterSpacing: '-0.5px', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>Produits Similaires</h4>
+                                <h4 className="fw-bold mb-0" style={{ letterSpacing: '-0.5px', fontFamily: '"Segoe UI", Roboto, sans-serif' }}>{t('produits_similaires')}</h4>
                                 <Button
                                     variant="link"
                                     className="text-decoration-none fw-bold"
                                     style={{ color: colors.primary, fontSize: '0.9rem' }}
                                     onClick={() => navigate('/shop')}
                                 >
-                                    Tout voir
+                                    {t('tout_voir')}
                                 </Button>
                             </div>
                             <Row xs={2} sm={3} md={4} lg={6} className="g-3">
@@ -790,10 +792,10 @@ const ProductDetails = () => {
             {/* Location Selection Modal */}
             < Modal show={showLocationModal} onHide={() => setShowLocationModal(false)} centered >
                 <Modal.Header closeButton className="border-0 pb-0">
-                    <Modal.Title className="fw-bold fs-5">Choisir votre localisation</Modal.Title>
+                    <Modal.Title className="fw-bold fs-5">{t('choisir_votre_localisation')}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body className="pt-2">
-                    <p className="text-muted small mb-4">Sélectionnez votre pays, ville et quartier pour voir la date de livraison.</p>
+                    <p className="text-muted small mb-4">{t('selectionnez_votre_pays_ville_et')}</p>
 
                     <Form>
                         <Form.Group className="mb-3">
@@ -817,7 +819,7 @@ const ProductDetails = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label className="small fw-bold text-muted">VILLE</Form.Label>
+                            <Form.Label className="small fw-bold text-muted">{t('ville_3')}</Form.Label>
                             <Form.Select
                                 value={tempCity}
                                 onChange={(e) => {
@@ -834,7 +836,7 @@ const ProductDetails = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-4">
-                            <Form.Label className="small fw-bold text-muted">QUARTIER / ZONE</Form.Label>
+                            <Form.Label className="small fw-bold text-muted">{t('quartier_zone')}</Form.Label>
                             <Form.Select
                                 value={tempDistrict}
                                 onChange={(e) => setTempDistrict(e.target.value)}
@@ -852,7 +854,7 @@ const ProductDetails = () => {
                             style={{ backgroundColor: colors.primary, borderRadius: '8px' }}
                             onClick={handleLocationSave}
                         >
-                            Appliquer
+                            {t('appliquer')}
                         </Button>
                     </Form>
                 </Modal.Body>
@@ -3,8 +3,10 @@ import { Link, useNavigate } from 'react-router-dom';
 import { useAuth } from '../context/AuthContext';
 import { useData } from '../context/DataContext';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Profile = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const { orders } = useData();
     const navigate = useNavigate();
@@ -12,8 +14,8 @@ const Profile = () => {
     if (!user) {
         return (
             <div className="py-5 text-center">
-                <h3>Veuillez vous connecter pour accéder à votre profil</h3>
-                <Link to="/login" className="btn btn-primary mt-3">Se connecter</Link>
+                <h3>{t('veuillez_vous_connecter_pour_3')}</h3>
+                <Link to="/login" className="btn btn-primary mt-3">{t('se_connecter')}</Link>
             </div>
         );
     }
@@ -23,9 +25,9 @@ const Profile = () => {
             {/* Welcome Card */}
             <Card className="border-0 shadow-sm mb-4">
                 <Card.Body className="p-4">
-                    <h4 className="mb-2">Bienvenue, {user.name} ! 👋</h4>
+                    <h4 className="mb-2">{t('bienvenue', { name: user.name })}</h4>
                     <p className="text-muted mb-0">
-                        Gerez vos commandes, vos informations personnelles et bien plus encore.
+                        {t('gerez_vos_commandes_vos')}
                     </p>
                 </Card.Body>
             </Card>
@@ -42,7 +44,7 @@ const Profile = () => {
                             <h4 className="mb-1 fw-bold">
                                 {orders.filter(o => o.email === user.email).length}
                             </h4>
-                            <small className="opacity-75">Commandes</small>
+                            <small className="opacity-75">{t('commandes')}</small>
                         </Card.Body>
                     </Card>
                 </Col>
@@ -59,7 +61,7 @@ const Profile = () => {
                                     return favs ? JSON.parse(favs).length : 0;
                                 })()}
                             </h4>
-                            <small className="opacity-75">Favoris</small>
+                            <small className="opacity-75">{t('favoris')}</small>
                         </Card.Body>
                     </Card>
                 </Col>
@@ -78,7 +80,7 @@ const Profile = () => {
                                     return parsed.filter(c => !c.used && new Date(c.expiryDate) > new Date()).length;
                                 })()}
                             </h4>
-                            <small className="opacity-75">Coupons actifs</small>
+                            <small className="opacity-75">{t('coupons_actifs')}</small>
                         </Card.Body>
                     </Card>
                 </Col>
@@ -95,7 +97,7 @@ const Profile = () => {
                                     return addresses ? JSON.parse(addresses).length : 0;
                                 })()}
                             </h4>
-                            <small className="opacity-75">Adresses</small>
+                            <small className="opacity-75">{t('adresses')}</small>
                         </Card.Body>
                     </Card>
                 </Col>
@@ -107,9 +109,9 @@ const Profile = () => {
                     <Card className="border-0 shadow-sm">
                         <Card.Header className="bg-white border-bottom p-3">
                             <div className="d-flex justify-content-between align-items-center">
-                                <h6 className="mb-0 fw-bold">Commandes récentes</h6>
+                                <h6 className="mb-0 fw-bold">{t('commandes_recentes')}</h6>
                                 <Link to="/profile/orders" className="btn btn-sm btn-outline-warning">
-                                    Voir tout
+                                    {t('voir_tout_2')}
                                 </Link>
                             </div>
                         </Card.Header>
@@ -117,7 +119,7 @@ const Profile = () => {
                             {orders.filter(o => o.email === user.email).slice(0, 3).length === 0 ? (
                                 <div className="text-center p-5">
                                     <i className="bi bi-box-seam" style={{ fontSize: '3rem', color: '#ddd' }}></i>
-                                    <p className="text-muted mt-3 mb-0">Aucune commande</p>
+                                    <p className="text-muted mt-3 mb-0">{t('aucune_commande')}</p>
                                 </div>
                             ) : (
                                 <ListGroup variant="flush">
@@ -129,8 +131,8 @@ const Profile = () => {
                                                         <i className="bi bi-box-seam text-warning" style={{ fontSize: '1.5rem' }}></i>
                                                     </div>
                                                     <div>
-                                                        <h6 className="mb-1">Commande #{order.id}</h6>
-                                                        <small className="text-muted">{order.date} • {order.items?.length || 0} article(s)</small>
+                                                        <h6 className="mb-1">{t('commande', { id: order.id })}</h6>
+                                                        <small className="text-muted">{t('article_s_2', { date: order.date, count: order.items?.length || 0 })}</small>
                                                     </div>
                                                 </div>
                                                 <div className="text-end">
@@ -149,10 +151,10 @@ const Profile = () => {
                                                                 }}
                                                                 style={{ minWidth: '120px' }}
                                                             >
-                                                                <option value="En attente">En attente</option>
-                                                                <option value="En cours">En cours</option>
-                                                                <option value="Livrée">Livrée</option>
-                                                                <option value="Annulée">Annulée</option>
+                                                                <option value="En attente">{t('en_attente')}</option>
+                                                                <option value="En cours">{t('en_cours')}</option>
+                                                                <option value="Livrée">{t('livree')}</option>
+                                                                <option value="Annulée">{t('annulee')}</option>
                                                             </select>
                                                         </div>
                                                     ) : (
@@ -2,8 +2,10 @@ import { useState } from 'react';
 import { Container, Form, Button, Card } from 'react-bootstrap';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate, Link } from 'react-router-dom';
+import { useLanguage } from '../context/LanguageContext';
 
 const Register = () => {
+    const { t } = useLanguage();
     const [name, setName] = useState('');
     const [email, setEmail] = useState('');
     const [password, setPassword] = useState('');
@@ -36,16 +38,16 @@ const Register = () => {
         <Container className="d-flex justify-content-center align-items-center" style={{ minHeight: '80vh' }}>
             <Card style={{ width: '450px' }} className="shadow-lg border-0">
                 <Card.Body className="p-5">
-                    <h2 className="text-center mb-4 fw-bold">Inscription</h2>
+                    <h2 className="text-center mb-4 fw-bold">{t('inscription')}</h2>
 
                     {error && <Alert variant="danger" className="py-2 small">{error}</Alert>}
 
                     <Form onSubmit={handleSubmit}>
                         <Form.Group className="mb-3">
-                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>Nom complet</Form.Label>
+                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>{t('nom_complet_2')}</Form.Label>
                             <Form.Control
                                 type="text"
-                                placeholder="Jean Dupont"
+                                placeholder={t('jean_dupont')}
                                 value={name}
                                 onChange={(e) => setName(e.target.value)}
                                 style={{ fontSize: '1rem', padding: '12px' }}
@@ -55,7 +57,7 @@ const Register = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>Adresse Email</Form.Label>
+                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>{t('adresse_email')}</Form.Label>
                             <Form.Control
                                 type="email"
                                 placeholder="votre@email.com"
@@ -68,10 +70,10 @@ const Register = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-4">
-                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>Mot de passe</Form.Label>
+                            <Form.Label className="fw-bold" style={{ fontSize: '1.1rem' }}>{t('mot_de_passe')}</Form.Label>
                             <Form.Control
                                 type="password"
-                                placeholder="Choisissez un mot de passe"
+                                placeholder={t('choisissez_un_mot_de_passe')}
                                 value={password}
                                 onChange={(e) => setPassword(e.target.value)}
                                 style={{ fontSize: '1rem', padding: '12px' }}
@@ -97,7 +99,7 @@ const Register = () => {
                     </Form>
 
                     <div className="text-center mt-3">
-                        <small className="text-muted">Déjà un compte ? <Link to="/login" className="fw-bold text-warning">Connexion</Link></small>
+                        <small className="text-muted">{t('deja_un_compte')} <Link to="/login" className="fw-bold text-warning">{t('connexion')}</Link></small>
                     </div>
                 </Card.Body>
             </Card>
@@ -4,8 +4,10 @@ import { useAuth } from '../context/AuthContext';
 import { useData } from '../context/DataContext';
 import { useCart } from '../context/CartContext';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const Reorder = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const { orders } = useData();
     const { addToCart } = useCart();
@@ -23,28 +25,28 @@ const Reorder = () => {
             addToCart(item);
         });
 
-        alert(`${order.items?.length} article(s) ajouté(s) au panier !`);
+        alert(t('article_s_ajoute_s_au_panier', { count: order.items?.length }));
         navigate('/cart');
     };
 
     const handleReorderItem = (item) => {
         addToCart(item);
-        alert('Article ajouté au panier !');
+        alert(t('article_ajoute_au_panier'));
     };
 
     if (!user) {
         return (
             <ProfileLayout>
                 <div className="mb-4">
-                    <h3 className="fw-bold">Commander encore</h3>
-                    <p className="text-muted">Recommandez vos articles préférés</p>
+                    <h3 className="fw-bold">{t('commander_encore')}</h3>
+                    <p className="text-muted">{t('recommandez_vos_articles')}</p>
                 </div>
                 <Card className="border-0 shadow-sm text-center p-5">
                     <i className="bi bi-person-x" style={{ fontSize: '4rem', color: '#ddd' }}></i>
-                    <h5 className="mt-3">Connexion requise</h5>
-                    <p className="text-muted">Connectez-vous pour voir vos commandes précédentes</p>
+                    <h5 className="mt-3">{t('connexion_requise')}</h5>
+                    <p className="text-muted">{t('connectez_vous_pour_voir_vos_3')}</p>
                     <Button variant="warning" className="text-white mt-2" onClick={() => navigate('/login')}>
-                        Se connecter
+                        {t('se_connecter')}
                     </Button>
                 </Card>
             </ProfileLayout>
@@ -54,17 +56,17 @@ const Reorder = () => {
     return (
         <ProfileLayout>
             <div className="mb-4">
-                <h3 className="fw-bold">Commander encore</h3>
-                <p className="text-muted">Recommandez facilement vos articles préférés</p>
+                <h3 className="fw-bold">{t('commander_encore')}</h3>
+                <p className="text-muted">{t('recommandez_facilement_vos')}</p>
             </div>
 
             {completedOrders.length === 0 ? (
                 <Card className="border-0 shadow-sm text-center p-5">
                     <i className="bi bi-box-seam" style={{ fontSize: '4rem', color: '#ddd' }}></i>
-                    <h5 className="mt-3">Aucune commande livrée</h5>
-                    <p className="text-muted">Vos commandes livrées apparaîtront ici pour que vous puissiez les recommander facilement</p>
+                    <h5 className="mt-3">{t('aucune_commande_livree')}</h5>
+                    <p className="text-muted">{t('vos_commandes_livrees')}</p>
                     <Button variant="warning" className="text-white mt-2" onClick={() => navigate('/shop')}>
-                        Découvrir la boutique
+                        {t('decouvrir_la_boutique')}
                     </Button>
                 </Card>
             ) : (
@@ -74,13 +76,13 @@ const Reorder = () => {
                             <Card.Body className="p-4">
                                 <div className="d-flex justify-content-between align-items-start mb-3">
                                     <div>
-                                        <h6 className="fw-bold mb-1">Commande #{order.id}</h6>
+                                        <h6 className="fw-bold mb-1">{t('commande', { id: order.id })}</h6>
                                         <small className="text-muted">
-                                            Livrée le {order.date} • {order.items?.length} article(s)
+                                            {t('livree_le_article_s', { date: order.date, count: order.items?.length })}
                                         </small>
                                     </div>
                                     <div className="d-flex gap-2">
-                                        <Badge bg="success">Livrée</Badge>
+                                        <Badge bg="success">{t('livree')}</Badge>
                                         <Button
                                             variant="warning"
                                             size="sm"
@@ -88,7 +90,7 @@ const Reorder = () => {
                                             onClick={() => handleReorderAll(order)}
                                         >
                                             <i className="bi bi-arrow-repeat me-1"></i>
-                                            Tout recommander
+                                            {t('tout_recommander')}
                                         </Button>
                                     </div>
                                 </div>
@@ -114,7 +116,7 @@ const Reorder = () => {
                                                     <h6 className="mb-1 small">{item.name}</h6>
                                                     <div className="d-flex justify-content-between align-items-center">
                                                         <div>
-                                                            <small className="text-muted">Qté: {item.quantity}</small>
+                                                            <small className="text-muted">{t('qte', { quantity: item.quantity })}</small>
                                                             <div className="text-warning fw-bold">{item.price.toLocaleString()} FCFA</div>
                                                         </div>
                                                         <Button
@@ -133,7 +135,7 @@ const Reorder = () => {
 
                                 <div className="mt-3 pt-3 border-top">
                                     <div className="d-flex justify-content-between">
-                                        <span className="text-muted">Total de la commande</span>
+                                        <span className="text-muted">{t('total_de_la_commande')}</span>
                                         <strong className="text-success">{order.total.toLocaleString()} FCFA</strong>
                                     </div>
                                 </div>
@@ -3,8 +3,10 @@ import { useState } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const SavedCards = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const navigate = useNavigate();
     const [showModal, setShowModal] = useState(false);
@@ -30,14 +32,14 @@ const SavedCards = () => {
         return (
             <ProfileLayout>
                 <div className="mb-4">
-                    <h3 className="fw-bold">Cartes enregistrées</h3>
-                    <p className="text-muted">Gérez vos cartes bancaires</p>
+                    <h3 className="fw-bold">{t('cartes_enregistrees')}</h3>
+                    <p className="text-muted">{t('gerez_vos_cartes_bancaires')}</p>
                 </div>
                 <Alert variant="info">
-                    <Alert.Heading>Connexion requise</Alert.Heading>
-                    <p>Vous devez être connecté pour gérer vos cartes.</p>
+                    <Alert.Heading>{t('connexion_requise')}</Alert.Heading>
+                    <p>{t('vous_devez_etre_connecte_pour_3')}</p>
                     <Button variant="primary" onClick={() => navigate('/login')}>
-                        Se connecter
+                        {t('se_connecter')}
                     </Button>
                 </Alert>
             </ProfileLayout>
@@ -68,13 +70,13 @@ const SavedCards = () => {
 
     const handleSaveCard = () => {
         if (!formData.cardName || !formData.cardNumber || !formData.expiryMonth || !formData.expiryYear) {
-            alert('Veuillez remplir tous les champs obligatoires');
+            alert(t('veuillez_remplir_tous_les_champs'));
             return;
         }
 
         // Validate card number (simple check)
         if (formData.cardNumber.replace(/\s/g, '').length !== 16) {
-            alert('Le numéro de carte doit contenir 16 chiffres');
+            alert(t('le_numero_de_carte_doit_contenir'));
             return;
         }
 
@@ -95,7 +97,7 @@ const SavedCards = () => {
     };
 
     const handleDeleteCard = (id) => {
-        if (window.confirm('Êtes-vous sûr de vouloir supprimer cette carte ?')) {
+        if (window.confirm(t('etes_vous_sur_de_vouloir_2'))) {
             const newCards = cards.filter(c => c.id !== id);
             saveCards(newCards);
         }
@@ -124,22 +126,22 @@ const SavedCards = () => {
         <ProfileLayout>
             <div className="d-flex justify-content-between align-items-center mb-4">
                 <div>
-                    <h3 className="fw-bold">Cartes enregistrées</h3>
-                    <p className="text-muted mb-0">Gérez vos moyens de paiement</p>
+                    <h3 className="fw-bold">{t('cartes_enregistrees')}</h3>
+                    <p className="text-muted mb-0">{t('gerez_vos_moyens_de_paiement')}</p>
                 </div>
                 <Button variant="warning" className="text-white fw-bold" onClick={() => handleOpenModal()}>
                     <i className="bi bi-plus-lg me-2"></i>
-                    Nouvelle carte
+                    {t('nouvelle_carte')}
                 </Button>
             </div>
 
             {cards.length === 0 ? (
                 <div className="text-center py-5">
                     <i className="bi bi-credit-card" style={{ fontSize: '5rem', color: '#ddd' }}></i>
-                    <h3 className="mt-4 text-muted">Aucune carte enregistrée</h3>
-                    <p className="text-muted mb-4">Ajoutez une carte pour faciliter vos paiements</p>
+                    <h3 className="mt-4 text-muted">{t('aucune_carte_enregistree')}</h3>
+                    <p className="text-muted mb-4">{t('ajoutez_une_carte_pour_faciliter')}</p>
                     <Button variant="warning" className="text-white fw-bold" onClick={() => handleOpenModal()}>
-                        Ajouter une carte
+                        {t('ajouter_une_carte')}
                     </Button>
                 </div>
             ) : (
@@ -183,7 +185,7 @@ const SavedCards = () => {
                                     </p>
                                     <div className="d-flex justify-content-between">
                                         <div>
-                                            <small className="opacity-75">Expire le</small>
+                                            <small className="opacity-75">{t('expire_le')}</small>
                                             <p className="mb-0 fw-bold">{card.expiryMonth}/{card.expiryYear}</p>
                                         </div>
                                     </div>
@@ -202,7 +204,7 @@ const SavedCards = () => {
                 <Modal.Body>
                     <Form>
                         <Form.Group className="mb-3">
-                            <Form.Label>Nom sur la carte *</Form.Label>
+                            <Form.Label>{t('nom_sur_la_carte')}</Form.Label>
                             <Form.Control
                                 type="text"
                                 placeholder="Ex: JEAN DUPONT"
@@ -212,7 +214,7 @@ const SavedCards = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Numéro de carte *</Form.Label>
+                            <Form.Label>{t('numero_de_carte')}</Form.Label>
                             <Form.Control
                                 type="text"
                                 placeholder="1234 5678 9012 3456"
@@ -230,7 +232,7 @@ const SavedCards = () => {
                         <Row>
                             <Col xs={4}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Mois *</Form.Label>
+                                    <Form.Label>{t('mois')}</Form.Label>
                                     <Form.Select
                                         value={formData.expiryMonth}
                                         onChange={e => setFormData({ ...formData, expiryMonth: e.target.value })}
@@ -246,7 +248,7 @@ const SavedCards = () => {
                             </Col>
                             <Col xs={4}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Année *</Form.Label>
+                                    <Form.Label>{t('annee')}</Form.Label>
                                     <Form.Select
                                         value={formData.expiryYear}
                                         onChange={e => setFormData({ ...formData, expiryYear: e.target.value })}
@@ -281,16 +283,16 @@ const SavedCards = () => {
 
                         <Alert variant="info" className="small">
                             <i className="bi bi-shield-lock me-2"></i>
-                            Vos informations sont sécurisées et cryptées
+                            {t('vos_informations_sont_securisees')}
                         </Alert>
                     </Form>
                 </Modal.Body>
                 <Modal.Footer>
                     <Button variant="secondary" onClick={() => setShowModal(false)}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                     <Button variant="warning" className="text-white fw-bold" onClick={handleSaveCard}>
-                        Enregistrer
+                        {t('enregistrer')}
                     </Button>
                 </Modal.Footer>
             </Modal>
@@ -3,8 +3,10 @@ import { useState, useEffect } from 'react';
 import { useData, CATEGORIES } from '../context/DataContext';
 import ProductCard from '../components/ProductCard';
 import { useLocation, Link } from 'react-router-dom';
+import { useLanguage } from '../context/LanguageContext';
 
 const Shop = () => {
+    const { t } = useLanguage();
     const { products } = useData();
     const location = useLocation();
 
@@ -42,7 +44,7 @@ const Shop = () => {
                     <h1 className="fw-bold mb-0 fs-2">
                         {brandFilter !== 'All' ? `Produits ${brandFilter}` : (filter === 'All' ? 'Tous nos produits' : (subFilter === 'All' ? filter : subFilter))}
                     </h1>
-                    <p className="text-muted mb-0 small">{filteredProducts.length} produits trouvés</p>
+                    <p className="text-muted mb-0 small">{t('produits_trouves', { count: filteredProducts.length })}</p>
                 </div>
 
 
@@ -58,7 +60,7 @@ const Shop = () => {
 
             {filteredProducts.length === 0 && (
                 <div className="text-center py-5">
-                    <h3 className="text-muted">Aucun produit trouvé dans cette catégorie.</h3>
+                    <h3 className="text-muted">{t('aucun_produit_trouve_dans_cette')}</h3>
                 </div>
             )}
         </Container>
@@ -3,8 +3,10 @@ import { useState } from 'react';
 import { useAuth } from '../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import ProfileLayout from '../components/ProfileLayout';
+import { useLanguage } from '../context/LanguageContext';
 
 const UserInfo = () => {
+    const { t } = useLanguage();
     const { user, updateUser } = useAuth();
     const navigate = useNavigate();
 
@@ -67,13 +69,13 @@ const UserInfo = () => {
     return (
         <ProfileLayout>
             <div className="mb-4">
-                <h3 className="fw-bold">Informations utilisateur</h3>
-                <p className="text-muted">Gérez vos informations personnelles</p>
+                <h3 className="fw-bold">{t('informations_utilisateur')}</h3>
+                <p className="text-muted">{t('gerez_vos_informations')}</p>
             </div>
 
             {showSuccess && (
                 <Alert variant="success" dismissible onClose={() => setShowSuccess(false)}>
-                    Vos informations ont été mises à jour avec succès !
+                    {t('vos_informations_ont_ete_mises_a')}
                 </Alert>
             )}
 
@@ -85,12 +87,12 @@ const UserInfo = () => {
 
             <Card className="border-0 shadow-sm mb-4">
                 <Card.Body className="p-4">
-                    <h5 className="fw-bold mb-4">Informations personnelles</h5>
+                    <h5 className="fw-bold mb-4">{t('informations_personnelles')}</h5>
                     <Form onSubmit={handleSubmit}>
                         <Row>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Nom complet *</Form.Label>
+                                    <Form.Label>{t('nom_complet')}</Form.Label>
                                     <Form.Control
                                         type="text"
                                         name="name"
@@ -102,7 +104,7 @@ const UserInfo = () => {
                             </Col>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Email *</Form.Label>
+                                    <Form.Label>{t('email_2')}</Form.Label>
                                     <Form.Control
                                         type="email"
                                         name="email"
@@ -115,7 +117,7 @@ const UserInfo = () => {
                         </Row>
 
                         <Form.Group className="mb-4">
-                            <Form.Label>Téléphone</Form.Label>
+                            <Form.Label>{t('telephone')}</Form.Label>
                             <Form.Control
                                 type="tel"
                                 name="phone"
@@ -127,44 +129,44 @@ const UserInfo = () => {
 
                         <hr className="my-4" />
 
-                        <h5 className="fw-bold mb-4">Changer le mot de passe</h5>
+                        <h5 className="fw-bold mb-4">{t('changer_le_mot_de_passe')}</h5>
                         <p className="text-muted small mb-3">
-                            Laissez ces champs vides si vous ne souhaitez pas changer votre mot de passe
+                            {t('laissez_ces_champs_vides_si_vous')}
                         </p>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Mot de passe actuel</Form.Label>
+                            <Form.Label>{t('mot_de_passe_actuel')}</Form.Label>
                             <Form.Control
                                 type="password"
                                 name="currentPassword"
                                 value={formData.currentPassword}
                                 onChange={handleChange}
-                                placeholder="Entrez votre mot de passe actuel"
+                                placeholder={t('entrez_votre_mot_de_passe_actuel')}
                             />
                         </Form.Group>
 
                         <Row>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Nouveau mot de passe</Form.Label>
+                                    <Form.Label>{t('nouveau_mot_de_passe')}</Form.Label>
                                     <Form.Control
                                         type="password"
                                         name="newPassword"
                                         value={formData.newPassword}
                                         onChange={handleChange}
-                                        placeholder="Minimum 6 caractères"
+                                        placeholder={t('minimum_6_caracteres')}
                                     />
                                 </Form.Group>
                             </Col>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label>Confirmer le nouveau mot de passe</Form.Label>
+                                    <Form.Label>{t('confirmer_le_nouveau_mot_de')}</Form.Label>
                                     <Form.Control
                                         type="password"
                                         name="confirmPassword"
                                         value={formData.confirmPassword}
                                         onChange={handleChange}
-                                        placeholder="Retapez le mot de passe"
+                                        placeholder={t('retapez_le_mot_de_passe')}
                                     />
                                 </Form.Group>
                             </Col>
@@ -172,10 +174,10 @@ const UserInfo = () => {
 
                         <div className="d-flex justify-content-between mt-4">
                             <Button variant="outline-secondary" onClick={() => navigate('/profile')}>
-                                Retour
+                                {t('retour_2')}
                             </Button>
                             <Button variant="warning" type="submit" className="text-white fw-bold px-4">
-                                Enregistrer les modifications
+                                {t('enregistrer_les_modifications')}
                             </Button>
                         </div>
                     </Form>
@@ -184,26 +186,26 @@ const UserInfo = () => {
 
             <Card className="border-0 shadow-sm">
                 <Card.Body className="p-4">
-                    <h5 className="fw-bold mb-3">Informations du compte</h5>
+                    <h5 className="fw-bold mb-3">{t('informations_du_compte')}</h5>
                     <div className="bg-light p-3 rounded">
                         <Row>
                             <Col md={6} className="mb-2">
-                                <small className="text-muted d-block">ID Utilisateur</small>
+                                <small className="text-muted d-block">{t('id_utilisateur')}</small>
                                 <strong className="small">{user?.id || 'N/A'}</strong>
                             </Col>
                             <Col md={6} className="mb-2">
-                                <small className="text-muted d-block">Date d'inscription</small>
+                                <small className="text-muted d-block">{t('date_d_inscription')}</small>
                                 <strong className="small">
                                     {user?.createdAt || new Date().toLocaleDateString('fr-FR')}
                                 </strong>
                             </Col>
                             <Col md={6}>
-                                <small className="text-muted d-block">Type de compte</small>
+                                <small className="text-muted d-block">{t('type_de_compte')}</small>
                                 <strong className="small">{user?.role === 'admin' ? 'Administrateur' : 'Client'}</strong>
                             </Col>
                             <Col md={6}>
-                                <small className="text-muted d-block">Statut</small>
-                                <strong className="small text-success">Actif</strong>
+                                <small className="text-muted d-block">{t('statut')}</small>
+                                <strong className="small text-success">{t('actif')}</strong>
                             </Col>
                         </Row>
                     </div>
@@ -4,8 +4,10 @@ import { useAuth } from '../context/AuthContext';
 import { useWallet } from '../context/WalletContext';
 import ProfileLayout from '../components/ProfileLayout';
 import API_BASE_URL from '../config';
+import { useLanguage } from '../context/LanguageContext';
 
 const Wallet = () => {
+    const { t } = useLanguage();
     const { user } = useAuth();
     const { balance, transactions, loading, fetchBalance, fetchTransactions } = useWallet();
     const [transferData, setTransferData] = useState({ toId: '', amount: '', description: '' });
@@ -28,7 +30,7 @@ const Wallet = () => {
         setTransferStatus({ type: '', message: '' });
 
         if (parseFloat(transferData.amount) > balance) {
-            setTransferStatus({ type: 'danger', message: 'Solde insuffisant pour ce transfert' });
+            setTransferStatus({ type: 'danger', message: t('solde_insuffisant_pour_ce') });
             setIsSubmitting(false);
             return;
         }
@@ -48,7 +50,7 @@ const Wallet = () => {
             const data = await response.json();
 
             if (data.success) {
-                setTransferStatus({ type: 'success', message: 'Transfert effectué avec succès !' });
+                setTransferStatus({ type: 'success', message: t('transfert_effectue_avec_succes') });
                 setTransferData({ toId: '', amount: '', description: '' });
                 setTimeout(() => {
                     setShowTransferModal(false);
@@ -60,7 +62,7 @@ const Wallet = () => {
                 setTransferStatus({ type: 'danger', message: data.message || 'Erreur lors du transfert' });
             }
         } catch (error) {
-            setTransferStatus({ type: 'danger', message: 'Impossible de contacter le serveur' });
+            setTransferStatus({ type: 'danger', message: t('impossible_de_contacter_le') });
         } finally {
             setIsSubmitting(false);
         }
@@ -70,8 +72,8 @@ const Wallet = () => {
         return (
             <div className="py-5 text-center">
                 <Alert variant="warning">
-                    <Alert.Heading>Connexion requise</Alert.Heading>
-                    <p>Veuillez vous connecter pour accéder à votre portefeuille.</p>
+                    <Alert.Heading>{t('connexion_requise')}</Alert.Heading>
+                    <p>{t('veuillez_vous_connecter_pour_4')}</p>
                 </Alert>
             </div>
         );
@@ -81,7 +83,7 @@ const Wallet = () => {
         <ProfileLayout>
             <h3 className="mb-4 fw-bold">
                 <i className="bi bi-coin me-2"></i>
-                Mon portefeuille
+                {t('mon_portefeuille')}
             </h3>
 
             <Row className="g-4">
@@ -89,13 +91,13 @@ const Wallet = () => {
                 <Col lg={4} className="order-2 order-lg-1">
                     <Card className="border-0 shadow-sm mb-4">
                         <Card.Body className="p-4 text-center">
-                            <h6 className="text-muted mb-1 small">Solde disponible</h6>
+                            <h6 className="text-muted mb-1 small">{t('solde_disponible')}</h6>
                             <h2 className="text-warning fw-bold mb-3">{balance.toLocaleString()} FCFA</h2>
 
                             <Alert variant="info" className="mb-3 text-start py-2 px-3 border-0 bg-light">
                                 <small>
                                     <i className="bi bi-info-circle me-2 text-info"></i>
-                                    Utilisez votre solde pour effectuer des achats sans carte bancaire.
+                                    {t('utilisez_votre_solde_pour')}
                                 </small>
                             </Alert>
 
@@ -106,7 +108,7 @@ const Wallet = () => {
                                 onClick={() => setShowTransferModal(true)}
                             >
                                 <i className="bi bi-send me-2"></i>
-                                Faire un transfert
+                                {t('faire_un_transfert')}
                             </Button>
                         </Card.Body>
                     </Card>
@@ -116,19 +118,19 @@ const Wallet = () => {
                 <Col lg={8} className="order-1 order-lg-2">
                     <Card className="border-0 shadow-sm">
                         <Card.Header className="bg-white p-4 text-warning">
-                            <h5 className="mb-0 fw-bold"><i className="bi bi-clock-history me-2"></i>Historique des transactions</h5>
+                            <h5 className="mb-0 fw-bold"><i className="bi bi-clock-history me-2"></i>{t('historique_des_transactions')}</h5>
                         </Card.Header>
                         <Card.Body className="p-0">
                             {loading ? (
                                 <div className="text-center p-5">
                                     <div className="spinner-border text-warning" role="status">
-                                        <span className="visually-hidden">Chargement...</span>
+                                        <span className="visually-hidden">{t('chargement')}</span>
                                     </div>
                                 </div>
                             ) : transactions.length === 0 ? (
                                 <div className="text-center p-5 text-muted">
                                     <i className="bi bi-receipt mb-3 d-block" style={{ fontSize: '3rem' }}></i>
-                                    <p>Aucune transaction pour le moment</p>
+                                    <p>{t('aucune_transaction_pour_le')}</p>
                                 </div>
                             ) : (
                                 <>
@@ -176,7 +178,7 @@ const Wallet = () => {
                                                         <div className="bg-white p-2 rounded-3 border shadow-sm" style={{ minWidth: '180px' }}>
                                                             <div className="d-flex flex-column gap-0">
                                                                 <div className="d-flex justify-content-between" style={{ fontSize: '0.75rem', opacity: 0.8 }}>
-                                                                    <span>Ancien solde:</span>
+                                                                    <span>{t('ancien_solde')}</span>
                                                                     <span>{balanceBefore.toLocaleString()} FCFA</span>
                                                                 </div>
                                                                 <div className="d-flex justify-content-between fw-bold" style={{ fontSize: '0.75rem' }}>
@@ -187,7 +189,7 @@ const Wallet = () => {
                                                                 </div>
                                                                 <hr className="my-1 opacity-25" />
                                                                 <div className="d-flex justify-content-between align-items-center">
-                                                                    <span className="fw-bold" style={{ fontSize: '0.75rem' }}>Nouveau :</span>
+                                                                    <span className="fw-bold" style={{ fontSize: '0.75rem' }}>{t('nouveau')}</span>
                                                                     <span className={`fw-bold ${isCancelled ? 'text-muted' : 'text-warning'}`} style={{ fontSize: '0.9rem' }}>
                                                                         {tx.balanceAfter.toLocaleString()} FCFA
                                                                     </span>
@@ -206,7 +208,7 @@ const Wallet = () => {
                                                 className="text-warning fw-bold text-decoration-none"
                                                 onClick={() => setVisibleTransactions(prev => prev + 10)}
                                             >
-                                                Voir plus <i className="bi bi-plus-lg ms-1"></i>
+                                                {t('voir_plus')} <i className="bi bi-plus-lg ms-1"></i>
                                             </Button>
                                         </div>
                                     )}
@@ -226,7 +228,7 @@ const Wallet = () => {
             >
                 <Modal.Header closeButton className="border-0 pb-0">
                     <Modal.Title className="fw-bold">
-                        <i className="bi bi-send me-2 text-warning"></i>Faire un transfert
+                        <i className="bi bi-send me-2 text-warning"></i>{t('faire_un_transfert')}
                     </Modal.Title>
                 </Modal.Header>
                 <Modal.Body className="p-4">
@@ -238,22 +240,22 @@ const Wallet = () => {
 
                     <Form onSubmit={handleTransfer}>
                         <Form.Group className="mb-3">
-                            <Form.Label className="small fw-bold text-muted">ID du Compte (ex: 5RMEEQUT)</Form.Label>
+                            <Form.Label className="small fw-bold text-muted">{t('id_du_compte_ex_5rmeequt')}</Form.Label>
                             <Form.Control
                                 type="text"
-                                placeholder="Saisissez l'ID du destinataire"
+                                placeholder={t('saisissez_l_id_du_destinataire')}
                                 value={transferData.toId}
                                 onChange={(e) => setTransferData({ ...transferData, toId: e.target.value })}
                                 required
                                 className="bg-light border-0"
                             />
                             <Form.Text className="text-muted small">
-                                L'ID se trouve sur le profil du destinataire.
+                                {t('l_id_se_trouve_sur_le_profil_du')}
                             </Form.Text>
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label className="small fw-bold text-muted">Montant (FCFA)</Form.Label>
+                            <Form.Label className="small fw-bold text-muted">{t('montant_fcfa')}</Form.Label>
                             <Form.Control
                                 type="number"
                                 placeholder="Ex: 5000"
@@ -266,11 +268,11 @@ const Wallet = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-4">
-                            <Form.Label className="small fw-bold text-muted">Description (Optionnel)</Form.Label>
+                            <Form.Label className="small fw-bold text-muted">{t('description_optionnel')}</Form.Label>
                             <Form.Control
                                 as="textarea"
                                 rows={2}
-                                placeholder="Ex: Pour le déjeuner"
+                                placeholder={t('ex_pour_le_dejeuner')}
                                 value={transferData.description}
                                 onChange={(e) => setTransferData({ ...transferData, description: e.target.value })}
                                 className="bg-light border-0"
@@ -2,8 +2,10 @@ import { Row, Col, Card } from 'react-bootstrap';
 import { useData } from '../../context/DataContext';
 import { useAuth } from '../../context/AuthContext';
 import { useWallet } from '../../context/WalletContext';
+import { useLanguage } from '../../context/LanguageContext';
 
 const AdminDashboard = () => {
+    const { t } = useLanguage();
     const { products, orders, users } = useData();
     const { user: authUser } = useAuth();
     const { balance } = useWallet();
@@ -42,19 +44,19 @@ const AdminDashboard = () => {
     const netProfit = grossMargin - totalExpenses;
 
     const stats = [
-        !isExpediteur && { label: 'Total Produits', value: products.length, gradient: 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)' },
-        { label: 'Commandes', value: displayOrders.filter(o => o.status !== 'Annulée').length, gradient: 'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)' },
-        isManager && { label: 'Mon Solde', value: (balance || 0).toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #ffd700 0%, #ffed4e 100%)' },
-        (!isManager && !isExpediteur) && { label: 'Clients', value: (users || []).length, gradient: 'linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)' },
-        (!isManager && !isExpediteur) && { label: 'Chiffre d\'Affaires', value: totalRevenue.toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #fa709a 0%, #fee140 100%)' },
-        (!isManager && !isExpediteur) && { label: 'Marge Brute', value: grossMargin.toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #84fab0 0%, #8fd3f4 100%)' },
-        (!isManager && !isExpediteur) && { label: 'Charges Fixes', value: totalExpenses.toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #f093fb 0%, #f5576c 100%)' },
-        (!isManager && !isExpediteur) && { label: 'Bénéfice Net', value: netProfit.toLocaleString() + ' FCFA', gradient: netProfit >= 0 ? 'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)' : 'linear-gradient(135deg, #ff0844 0%, #ffb199 100%)' },
+        !isExpediteur && { label: t('total_produits'), value: products.length, gradient: 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)' },
+        { label: t('commandes'), value: displayOrders.filter(o => o.status !== 'Annulée').length, gradient: 'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)' },
+        isManager && { label: t('mon_solde'), value: (balance || 0).toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #ffd700 0%, #ffed4e 100%)' },
+        (!isManager && !isExpediteur) && { label: t('clients'), value: (users || []).length, gradient: 'linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)' },
+        (!isManager && !isExpediteur) && { label: t('chiffre_d_affaires'), value: totalRevenue.toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #fa709a 0%, #fee140 100%)' },
+        (!isManager && !isExpediteur) && { label: t('marge_brute'), value: grossMargin.toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #84fab0 0%, #8fd3f4 100%)' },
+        (!isManager && !isExpediteur) && { label: t('charges_fixes'), value: totalExpenses.toLocaleString() + ' FCFA', gradient: 'linear-gradient(135deg, #f093fb 0%, #f5576c 100%)' },
+        (!isManager && !isExpediteur) && { label: t('benefice_net'), value: netProfit.toLocaleString() + ' FCFA', gradient: netProfit >= 0 ? 'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)' : 'linear-gradient(135deg, #ff0844 0%, #ffb199 100%)' },
     ].filter(Boolean);
 
     return (
         <div>
-            <h2 className="mb-4">Vue d'ensemble</h2>
+            <h2 className="mb-4">{t('vue_d_ensemble')}</h2>
             <Row className="g-3">
                 {stats.map((stat, idx) => (
                     <Col key={idx} md={3}>
@@ -73,10 +75,10 @@ const AdminDashboard = () => {
                 <Card className="border-0 shadow-sm mt-4 bg-danger text-white">
                     <Card.Body className="d-flex justify-content-between align-items-center">
                         <div>
-                            <h5 className="mb-1"><i className="bi bi-exclamation-octagon-fill me-2"></i>Demandes d'annulation</h5>
-                            <p className="mb-0">Il y a {displayOrders.filter(o => o.status === "Demande d'annulation").length} demande(s) d'annulation en attente de votre confirmation.</p>
+                            <h5 className="mb-1"><i className="bi bi-exclamation-octagon-fill me-2"></i>{t('demandes_d_annulation')}</h5>
+                            <p className="mb-0">{t('il_y_a')} {displayOrders.filter(o => o.status === "Demande d'annulation").length} {t('demande_s_d_annulation_en')}</p>
                         </div>
-                        <a href="/admin/orders" className="btn btn-light btn-sm fw-bold">Voir et Gérer</a>
+                        <a href="/admin/orders" className="btn btn-light btn-sm fw-bold">{t('voir_et_gerer')}</a>
                     </Card.Body>
                 </Card>
             )}
@@ -86,7 +88,7 @@ const AdminDashboard = () => {
                 <div className="d-flex justify-content-between align-items-center mb-3">
                     <h4 className="mb-0">
                         <i className="bi bi-clock-history text-warning me-2"></i>
-                        Commandes en cours
+                        {t('commandes_en_cours')}
                     </h4>
                     <span className="badge bg-warning text-dark">
                         {displayOrders.filter(o => o.status !== 'Livrée' && o.status !== 'Livré' && o.status !== 'Annulée').length}
@@ -97,19 +99,19 @@ const AdminDashboard = () => {
                         <thead className="table-light">
                             <tr>
                                 <th>ID</th>
-                                <th>Client</th>
-                                <th>ID Client</th>
-                                <th>Téléphone</th>
-                                <th>Date</th>
-                                <th>Montant</th>
-                                <th>Status</th>
+                                <th>{t('client')}</th>
+                                <th>{t('id_client')}</th>
+                                <th>{t('telephone')}</th>
+                                <th>{t('date')}</th>
+                                <th>{t('montant')}</th>
+                                <th>{t('status')}</th>
                             </tr>
                         </thead>
                         <tbody>
                             {displayOrders.filter(o => o.status !== 'Livrée' && o.status !== 'Livré' && o.status !== 'Annulée').slice(0, 5).length === 0 ? (
                                 <tr>
                                     <td colSpan="7" className="text-center text-muted py-4">
-                                        Aucune commande en cours
+                                        {t('aucune_commande_en_cours')}
                                     </td>
                                 </tr>
                             ) : (
@@ -144,7 +146,7 @@ const AdminDashboard = () => {
                 <div className="d-flex justify-content-between align-items-center mb-3">
                     <h4 className="mb-0">
                         <i className="bi bi-check-circle text-success me-2"></i>
-                        Commandes livrées
+                        {t('commandes_livrees')}
                     </h4>
                     <span className="badge bg-success">
                         {displayOrders.filter(o => o.status === 'Livrée' || o.status === 'Livré').length}
@@ -155,19 +157,19 @@ const AdminDashboard = () => {
                         <thead className="table-light">
                             <tr>
                                 <th>ID</th>
-                                <th>Client</th>
-                                <th>ID Client</th>
-                                <th>Téléphone</th>
-                                <th>Date</th>
-                                <th>Montant</th>
-                                <th>Status</th>
+                                <th>{t('client')}</th>
+                                <th>{t('id_client')}</th>
+                                <th>{t('telephone')}</th>
+                                <th>{t('date')}</th>
+                                <th>{t('montant')}</th>
+                                <th>{t('status')}</th>
                             </tr>
                         </thead>
                         <tbody className="table-success table-success-subtle">
                             {displayOrders.filter(o => o.status === 'Livrée' || o.status === 'Livré').slice(0, 5).length === 0 ? (
                                 <tr>
                                     <td colSpan="7" className="text-center text-muted py-4">
-                                        Aucune commande livrée
+                                        {t('aucune_commande_livree')}
                                     </td>
                                 </tr>
                             ) : (
@@ -181,7 +183,7 @@ const AdminDashboard = () => {
                                         <td className="fw-bold text-success">{order.total.toLocaleString()} FCFA</td>
                                         <td>
                                             <span className="badge bg-success">
-                                                Livrée
+                                                {t('livree')}
                                             </span>
                                         </td>
                                     </tr>
@@ -3,8 +3,10 @@ import { Row, Col, Card, Table, Button, Modal, Form, Badge } from 'react-bootstr
 import { useData } from '../../context/DataContext';
 import { useAuth } from '../../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
+import { useLanguage } from '../../context/LanguageContext';
 
 const AdminFinance = () => {
+    const { t } = useLanguage();
     const { expenses, addExpense, deleteExpense, updateExpense, orders, products } = useData();
     const { user } = useAuth();
     const navigate = useNavigate();
@@ -75,14 +77,14 @@ const AdminFinance = () => {
     return (
         <div className="p-1">
             <div className="d-flex justify-content-between align-items-center mb-4">
-                <h2 className="mb-0">Gestion Financière</h2>
+                <h2 className="mb-0">{t('gestion_financiere')}</h2>
                 <Button
                     variant="primary"
                     onClick={() => handleShow()}
                     className="d-flex align-items-center"
                     style={{ background: '#ef9c52ff', borderColor: '#ef9c52ff' }}
                 >
-                    <i className="bi bi-plus-lg me-2"></i> Ajouter une dépense
+                    <i className="bi bi-plus-lg me-2"></i> {t('ajouter_une_depense')}
                 </Button>
             </div>
 
@@ -90,7 +92,7 @@ const AdminFinance = () => {
                 <Col md={3}>
                     <Card className="border-0 shadow-sm text-white" style={{ background: 'linear-gradient(135deg, #fa709a 0%, #fee140 100%)' }}>
                         <Card.Body>
-                            <h6 className="opacity-90">Chiffre d'Affaires</h6>
+                            <h6 className="opacity-90">{t('chiffre_d_affaires')}</h6>
                             <h3 className="fw-bold mb-0">{totalRevenue.toLocaleString()} FCFA</h3>
                         </Card.Body>
                     </Card>
@@ -98,7 +100,7 @@ const AdminFinance = () => {
                 <Col md={3}>
                     <Card className="border-0 shadow-sm text-white" style={{ background: 'linear-gradient(135deg, #84fab0 0%, #8fd3f4 100%)' }}>
                         <Card.Body>
-                            <h6 className="opacity-90">Investissement</h6>
+                            <h6 className="opacity-90">{t('investissement')}</h6>
                             <h3 className="fw-bold mb-0">{grossProfit.toLocaleString()} FCFA</h3>
                         </Card.Body>
                     </Card>
@@ -106,7 +108,7 @@ const AdminFinance = () => {
                 <Col md={3}>
                     <Card className="border-0 shadow-sm text-white" style={{ background: 'linear-gradient(135deg, #f093fb 0%, #f5576c 100%)' }}>
                         <Card.Body>
-                            <h6 className="opacity-90">Charges Fixes</h6>
+                            <h6 className="opacity-90">{t('charges_fixes')}</h6>
                             <h3 className="fw-bold mb-0">{totalExpenses.toLocaleString()} FCFA</h3>
                         </Card.Body>
                     </Card>
@@ -114,7 +116,7 @@ const AdminFinance = () => {
                 <Col md={3}>
                     <Card className="border-0 shadow-sm text-white" style={{ background: netProfit >= 0 ? 'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)' : 'linear-gradient(135deg, #ff0844 0%, #ffb199 100%)' }}>
                         <Card.Body>
-                            <h6 className="opacity-90">Bénéfice Net</h6>
+                            <h6 className="opacity-90">{t('benefice_net')}</h6>
                             <h3 className="fw-bold mb-0">{netProfit.toLocaleString()} FCFA</h3>
                         </Card.Body>
                     </Card>
@@ -123,25 +125,25 @@ const AdminFinance = () => {
 
             <Card className="border-0 shadow-sm">
                 <Card.Header className="bg-white border-0 py-3">
-                    <h5 className="mb-0">Historique des Dépenses</h5>
+                    <h5 className="mb-0">{t('historique_des_depenses')}</h5>
                 </Card.Header>
                 <Card.Body className="p-0">
                     <div className="table-responsive">
                         <Table hover className="align-middle mb-0">
                             <thead className="bg-light text-muted small text-uppercase">
                                 <tr>
-                                    <th className="ps-4">Date</th>
-                                    <th>Description</th>
-                                    <th>Catégorie</th>
-                                    <th>Montant</th>
-                                    <th className="text-end pe-4">Actions</th>
+                                    <th className="ps-4">{t('date')}</th>
+                                    <th>{t('description')}</th>
+                                    <th>{t('categorie')}</th>
+                                    <th>{t('montant')}</th>
+                                    <th className="text-end pe-4">{t('actions')}</th>
                                 </tr>
                             </thead>
                             <tbody>
                                 {expenses.length === 0 ? (
                                     <tr>
                                         <td colSpan="5" className="text-center py-5 text-muted">
-                                            Aucune dépense enregistrée
+                                            {t('aucune_depense_enregistree')}
                                         </td>
                                     </tr>
                                 ) : (
@@ -189,10 +191,10 @@ const AdminFinance = () => {
                 <Form onSubmit={handleSubmit}>
                     <Modal.Body className="pt-4">
                         <Form.Group className="mb-3">
-                            <Form.Label className="small fw-bold text-muted text-uppercase">Description</Form.Label>
+                            <Form.Label className="small fw-bold text-muted text-uppercase">{t('description')}</Form.Label>
                             <Form.Control
                                 type="text"
-                                placeholder="ex: Facture électricité, Achat stock..."
+                                placeholder={t('ex_facture_electricite_achat')}
                                 value={formData.description}
                                 onChange={(e) => setFormData({ ...formData, description: e.target.value })}
                                 required
@@ -201,7 +203,7 @@ const AdminFinance = () => {
                         <Row>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label className="small fw-bold text-muted text-uppercase">Montant (FCFA)</Form.Label>
+                                    <Form.Label className="small fw-bold text-muted text-uppercase">{t('montant_fcfa')}</Form.Label>
                                     <Form.Control
                                         type="number"
                                         step="0.01"
@@ -214,7 +216,7 @@ const AdminFinance = () => {
                             </Col>
                             <Col md={6}>
                                 <Form.Group className="mb-3">
-                                    <Form.Label className="small fw-bold text-muted text-uppercase">Date</Form.Label>
+                                    <Form.Label className="small fw-bold text-muted text-uppercase">{t('date')}</Form.Label>
                                     <Form.Control
                                         type="date"
                                         value={formData.date}
@@ -225,7 +227,7 @@ const AdminFinance = () => {
                             </Col>
                         </Row>
                         <Form.Group className="mb-3">
-                            <Form.Label className="small fw-bold text-muted text-uppercase">Catégorie</Form.Label>
+                            <Form.Label className="small fw-bold text-muted text-uppercase">{t('categorie')}</Form.Label>
                             <Form.Select
                                 value={formData.category}
                                 onChange={(e) => setFormData({ ...formData, category: e.target.value })}
@@ -237,7 +239,7 @@ const AdminFinance = () => {
                         </Form.Group>
                     </Modal.Body>
                     <Modal.Footer className="border-0 pt-0">
-                        <Button variant="light" onClick={handleClose}>Annuler</Button>
+                        <Button variant="light" onClick={handleClose}>{t('annuler')}</Button>
                         <Button variant="primary" type="submit" style={{ background: '#ef9c52ff', borderColor: '#ef9c52ff' }}>
                             {editingExpense ? 'Mettre à jour' : 'Enregistrer'}
                         </Button>
@@ -1,27 +1,29 @@
 import { Link, Outlet, useLocation } from 'react-router-dom';
 import { Container, Row, Col, ListGroup, Card } from 'react-bootstrap';
 import { useAuth } from '../../context/AuthContext';
+import { useLanguage } from '../../context/LanguageContext';
 
 const AdminLayout = () => {
+    const { t } = useLanguage();
     const location = useLocation();
 
     let menuItems = [
-        { path: '/admin', label: 'Dashboard', icon: 'bi-speedometer2' },
-        { path: '/admin/products', label: 'Produits', icon: 'bi-box-seam' },
-        { path: '/admin/orders', label: 'Commandes', icon: 'bi-cart-check' },
-        { path: '/admin/users', label: 'Clients', icon: 'bi-people' },
-        { path: '/admin/finance', label: 'Finance', icon: 'bi-bar-chart-line' },
-        { path: '/admin/wallet', label: 'Wallet', icon: 'bi-wallet2' },
-        { path: '/admin/support', label: 'Support', icon: 'bi-question-square' },
+        { path: '/admin', label: t('dashboard'), icon: 'bi-speedometer2' },
+        { path: '/admin/products', label: t('produits'), icon: 'bi-box-seam' },
+        { path: '/admin/orders', label: t('commandes'), icon: 'bi-cart-check' },
+        { path: '/admin/users', label: t('clients'), icon: 'bi-people' },
+        { path: '/admin/finance', label: t('finance'), icon: 'bi-bar-chart-line' },
+        { path: '/admin/wallet', label: t('wallet'), icon: 'bi-wallet2' },
+        { path: '/admin/support', label: t('support'), icon: 'bi-question-square' },
     ];
 
     const { user } = useAuth();
 
     if (user?.role === 'manager') {
-        menuItems = menuItems.filter(item => item.label !== 'Clients' && item.label !== 'Finance');
+        menuItems = menuItems.filter(item => item.path !== '/admin/users' && item.path !== '/admin/finance');
     } else if (user?.role === 'expediteur') {
         menuItems = menuItems.filter(item =>
-            item.label === 'Dashboard' || item.label === 'Commandes'
+            item.path === '/admin' || item.path === '/admin/orders'
         );
     }
 
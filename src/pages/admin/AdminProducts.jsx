@@ -5,8 +5,10 @@ import { useAuth } from '../../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
 import Barcode from 'react-barcode';
 import BarcodeScanner from '../../components/BarcodeScanner';
+import { useLanguage } from '../../context/LanguageContext';
 
 const AdminProducts = () => {
+    const { t } = useLanguage();
     const { products, addProduct, deleteProduct, updateProduct } = useData();
     const { user } = useAuth();
     const isManager = user?.role === 'manager';
@@ -160,7 +162,7 @@ const AdminProducts = () => {
         if (success) {
             alert(isEditing ? 'Produit modifié avec succès !' : 'Produit ajouté avec succès !');
         } else {
-            alert('Erreur lors de l\'enregistrement du produit sur le serveur.');
+            alert(t('erreur_lors_de_l_enregistrement'));
         }
 
         setShowModal(false);
@@ -269,7 +271,7 @@ const AdminProducts = () => {
             setColors([...colors, newColor]);
             setNewColor({ name: '', hex: '#000000', images: [] });
         } else {
-            alert('Veuillez entrer un nom et une couleur.');
+            alert(t('veuillez_entrer_un_nom_et_une'));
         }
     };
 
@@ -321,8 +323,8 @@ const AdminProducts = () => {
     return (
         <div>
             <div className="d-flex justify-content-between align-items-center mb-4">
-                <h2>Gestion des Produits</h2>
-                <Button onClick={openAdd}>+ Nouveau Produit</Button>
+                <h2>{t('gestion_des_produits')}</h2>
+                <Button onClick={openAdd}>{t('nouveau_produit')}</Button>
             </div>
 
             <div className="bg-white p-3 rounded shadow-sm mb-4 border">
@@ -333,7 +335,7 @@ const AdminProducts = () => {
                                 <i className="bi bi-search text-muted"></i>
                             </InputGroup.Text>
                             <Form.Control
-                                placeholder="Rechercher par nom, description ou code-barre..."
+                                placeholder={t('rechercher_par_nom_description')}
                                 className="border-start-0"
                                 value={searchTerm}
                                 onChange={(e) => setSearchTerm(e.target.value)}
@@ -343,7 +345,7 @@ const AdminProducts = () => {
                                 className="border-start-0"
                                 style={{ borderLeft: 'none' }}
                                 onClick={() => setShowSearchScanner(true)}
-                                title="Scanner un produit"
+                                title={t('scanner_un_produit')}
                             >
                                 <i className="bi bi-camera"></i>
                             </Button>
@@ -354,7 +356,7 @@ const AdminProducts = () => {
                             value={categoryFilter}
                             onChange={(e) => setCategoryFilter(e.target.value)}
                         >
-                            <option value="all">Toutes les catégories</option>
+                            <option value="all">{t('toutes_les_categories')}</option>
                             {Object.keys(CATEGORIES).map(cat => (
                                 <option key={cat} value={cat}>{cat}</option>
                             ))}
@@ -362,7 +364,7 @@ const AdminProducts = () => {
                     </Col>
                     <Col md={2}>
                         <div className="text-muted small text-end mt-2">
-                            {filteredProducts.length} produits trouvés
+                            {t('produits_trouves', { count: filteredProducts.length })}
                         </div>
                     </Col>
                 </Row>
@@ -372,13 +374,13 @@ const AdminProducts = () => {
                 <Table hover responsive className="mb-0 align-middle">
                     <thead className="bg-light">
                         <tr>
-                            <th className="ps-3" style={{ width: '80px' }}>Image</th>
-                            <th>Produit</th>
-                            <th>Catégorie</th>
-                            <th>Prix Vente</th>
-                            <th>Stock</th>
-                            <th style={{ width: '150px' }}>Code-Barre</th>
-                            <th className="text-end pe-3">Actions</th>
+                            <th className="ps-3" style={{ width: '80px' }}>{t('image')}</th>
+                            <th>{t('produit')}</th>
+                            <th>{t('categorie')}</th>
+                            <th>{t('prix_vente')}</th>
+                            <th>{t('stock')}</th>
+                            <th style={{ width: '150px' }}>{t('code_barre')}</th>
+                            <th className="text-end pe-3">{t('actions')}</th>
                         </tr>
                     </thead>
                     <tbody>
@@ -406,7 +408,7 @@ const AdminProducts = () => {
                                 <td>
                                     <div className={product.stock < 10 ? 'text-danger fw-bold' : 'text-success'}>
                                         <i className={`bi bi-circle-fill me-1`} style={{ fontSize: '0.5rem' }}></i>
-                                        {product.stock} en stock
+                                        {t('en_stock', { stock: product.stock })}
                                     </div>
                                 </td>
                                 <td>
@@ -416,29 +418,29 @@ const AdminProducts = () => {
                                             <small className="text-muted" style={{ fontSize: '0.65rem' }}>{product.barcode}</small>
                                         </div>
                                     ) : (
-                                        <small className="text-muted fst-italic">Non défini</small>
+                                        <small className="text-muted fst-italic">{t('non_defini')}</small>
                                     )}
                                 </td>
                                 <td className="text-end pe-3">
                                     <Button size="sm" variant="outline-primary" className="me-2 rounded-pill px-3" onClick={() => openEdit(product)}>
-                                        <i className="bi bi-pencil me-1"></i> Modif
+                                        <i className="bi bi-pencil me-1"></i> {t('modif')}
                                     </Button>
                                     <Button
                                         size="sm"
                                         variant="outline-danger"
                                         className="rounded-pill px-3"
                                         onClick={async () => {
-                                            if (window.confirm(`Êtes-vous sûr de vouloir supprimer "${product.name}" ?`)) {
+                                            if (window.confirm(t('etes_vous_sur_de_vouloir_3', { name: product.name }))) {
                                                 const success = await deleteProduct(product.id);
                                                 if (success) {
-                                                    alert('Produit supprimé !');
+                                                    alert(t('produit_supprime'));
                                                 } else {
-                                                    alert('Erreur lors de la suppression du produit.');
+                                                    alert(t('erreur_lors_de_la_suppression_du'));
                                                 }
                                             }
                                         }}
                                     >
-                                        <i className="bi bi-trash me-1"></i> Suppr
+                                        <i className="bi bi-trash me-1"></i> {t('suppr')}
                                     </Button>
                                 </td>
                             </tr>
@@ -449,7 +451,7 @@ const AdminProducts = () => {
                 {filteredProducts.length > showLimit && (
                     <div className="p-3 text-center border-top bg-light">
                         <Button variant="link" onClick={() => setShowLimit(prev => prev + 10)} className="text-decoration-none fw-bold">
-                            Afficher plus de produits ({filteredProducts.length - showLimit} restants)
+                            {t('afficher_plus_de_produits', { value: filteredProducts.length - showLimit })}
                         </Button>
                     </div>
                 )}
@@ -463,7 +465,7 @@ const AdminProducts = () => {
                     <Row>
                         <Col md={6}>
                             <Form.Group className="mb-3">
-                                <Form.Label>Nom du produit</Form.Label>
+                                <Form.Label>{t('nom_du_produit')}</Form.Label>
                                 <Form.Control
                                     type="text"
                                     value={currentProduct.name}
@@ -473,10 +475,10 @@ const AdminProducts = () => {
                             <Row>
                                 <Col md={6}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>Marque</Form.Label>
+                                        <Form.Label>{t('marque')}</Form.Label>
                                         <Form.Control
                                             type="text"
-                                            placeholder="ex: Zara, Apple..."
+                                            placeholder={t('ex_zara_apple')}
                                             value={currentProduct.brand}
                                             onChange={e => setCurrentProduct({ ...currentProduct, brand: e.target.value })}
                                         />
@@ -484,10 +486,10 @@ const AdminProducts = () => {
                                 </Col>
                                 <Col md={6}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>Collection</Form.Label>
+                                        <Form.Label>{t('collection')}</Form.Label>
                                         <Form.Control
                                             type="text"
-                                            placeholder="ex: Été 2024"
+                                            placeholder={t('ex_ete_2024')}
                                             value={currentProduct.collection}
                                             onChange={e => setCurrentProduct({ ...currentProduct, collection: e.target.value })}
                                         />
@@ -497,10 +499,10 @@ const AdminProducts = () => {
                             <Row>
                                 <Col md={6}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>SKU / Référence</Form.Label>
+                                        <Form.Label>{t('sku_reference')}</Form.Label>
                                         <Form.Control
                                             type="text"
-                                            placeholder="Code unique"
+                                            placeholder={t('code_unique')}
                                             value={currentProduct.sku}
                                             onChange={e => setCurrentProduct({ ...currentProduct, sku: e.target.value })}
                                         />
@@ -508,10 +510,10 @@ const AdminProducts = () => {
                                 </Col>
                                 <Col md={6}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>Tags (Mots-clés)</Form.Label>
+                                        <Form.Label>{t('tags_mots_cles')}</Form.Label>
                                         <Form.Control
                                             type="text"
-                                            placeholder="ex: casual, fête, vintage"
+                                            placeholder={t('ex_casual_fete_vintage')}
                                             value={currentProduct.tags}
                                             onChange={e => setCurrentProduct({ ...currentProduct, tags: e.target.value })}
                                         />
@@ -521,11 +523,11 @@ const AdminProducts = () => {
                             <Row>
                                 <Col md={12}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>Code-Barre EAN-13</Form.Label>
+                                        <Form.Label>{t('code_barre_ean_13')}</Form.Label>
                                         <InputGroup>
                                             <Form.Control
                                                 type="text"
-                                                placeholder="Code-barre auto ou manuel"
+                                                placeholder={t('code_barre_auto_ou_manuel')}
                                                 value={currentProduct.barcode}
                                                 onChange={e => setCurrentProduct({ ...currentProduct, barcode: e.target.value })}
                                                 maxLength="13"
@@ -533,26 +535,26 @@ const AdminProducts = () => {
                                             <Button
                                                 variant="outline-primary"
                                                 onClick={() => setShowScanner(true)}
-                                                title="Scanner avec la caméra"
+                                                title={t('scanner_avec_la_camera')}
                                             >
                                                 <i className="bi bi-camera"></i>
                                             </Button>
                                             <Button
                                                 variant="outline-warning"
                                                 onClick={() => setCurrentProduct({ ...currentProduct, barcode: generateEAN13() })}
-                                                title="Générer code-barre automatique"
+                                                title={t('generer_code_barre_automatique')}
                                             >
-                                                <i className="bi bi-upc-scan"></i> Générer
+                                                <i className="bi bi-upc-scan"></i> {t('generer')}
                                             </Button>
                                         </InputGroup>
                                         <Form.Text className="text-muted small">
-                                            13 chiffres - Cliquez sur le bouton pour générer automatiquement
+                                            {t('13_chiffres_cliquez_sur_le')}
                                         </Form.Text>
                                     </Form.Group>
                                 </Col>
                             </Row>
                             <Form.Group className="mb-3">
-                                <Form.Label>Catégorie</Form.Label>
+                                <Form.Label>{t('categorie')}</Form.Label>
                                 <Form.Select
                                     value={currentProduct.category}
                                     onChange={e => {
@@ -571,7 +573,7 @@ const AdminProducts = () => {
                                 </Form.Select>
                             </Form.Group>
                             <Form.Group className="mb-3">
-                                <Form.Label>Sous-Catégorie</Form.Label>
+                                <Form.Label>{t('sous_categorie')}</Form.Label>
                                 <Form.Select
                                     value={currentProduct.subcategory}
                                     onChange={e => setCurrentProduct({ ...currentProduct, subcategory: e.target.value })}
@@ -588,7 +590,7 @@ const AdminProducts = () => {
                             <Row>
                                 <Col md={4}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>Prix Vente (FCFA)</Form.Label>
+                                        <Form.Label>{t('prix_vente_fcfa')}</Form.Label>
                                         <Form.Control
                                             type="number"
                                             value={currentProduct.price}
@@ -598,7 +600,7 @@ const AdminProducts = () => {
                                 </Col>
                                 <Col md={8}>
                                     <Form.Group className="mb-3">
-                                        <Form.Label>Stock</Form.Label>
+                                        <Form.Label>{t('stock')}</Form.Label>
                                         <Form.Control
                                             type="number"
                                             value={currentProduct.stock}
@@ -611,9 +613,9 @@ const AdminProducts = () => {
                         <Col md={6}>
                             <Form.Group className="mb-3">
                                 <Form.Label className="d-flex justify-content-between align-items-center">
-                                    <span>Images du produit</span>
+                                    <span>{t('images_du_produit')}</span>
                                     <Badge bg="info" className="ms-2">
-                                        {currentProduct.images?.length || 0} image(s)
+                                        {t('image_s', { count: currentProduct.images?.length || 0 })}
                                     </Badge>
                                 </Form.Label>
 
@@ -623,13 +625,13 @@ const AdminProducts = () => {
                                             variant={imageSource === 'upload' ? 'primary' : 'outline-primary'}
                                             onClick={() => setImageSource('upload')}
                                         >
-                                            <i className="bi bi-upload me-1"></i> Charger
+                                            <i className="bi bi-upload me-1"></i> {t('charger')}
                                         </Button>
                                         <Button
                                             variant={imageSource === 'url' ? 'primary' : 'outline-primary'}
                                             onClick={() => setImageSource('url')}
                                         >
-                                            <i className="bi bi-link-45deg me-1"></i> Lien URL
+                                            <i className="bi bi-link-45deg me-1"></i> {t('lien_url')}
                                         </Button>
                                     </div>
 
@@ -649,7 +651,7 @@ const AdminProducts = () => {
                                                 onChange={e => setNewImageUrl(e.target.value)}
                                                 onKeyDown={e => e.key === 'Enter' && (e.preventDefault(), addImage())}
                                             />
-                                            <Button variant="outline-secondary" onClick={addImage}>Ajouter</Button>
+                                            <Button variant="outline-secondary" onClick={addImage}>{t('ajouter')}</Button>
                                         </div>
                                     )}
                                 </div>
@@ -662,7 +664,7 @@ const AdminProducts = () => {
                                                     <div className="position-relative border rounded p-1 bg-white shadow-sm">
                                                         <img
                                                             src={img}
-                                                            alt="preview"
+                                                            alt={t('preview')}
                                                             style={{ width: '100%', height: '80px', objectFit: 'cover' }}
                                                             className="rounded"
                                                         />
@@ -671,7 +673,7 @@ const AdminProducts = () => {
                                                                 className="position-absolute top-0 start-0 bg-primary text-white p-1 rounded-end"
                                                                 style={{ fontSize: '0.6rem', fontWeight: 'bold' }}
                                                             >
-                                                                PRINCIPALE
+                                                                {t('principale')}
                                                             </div>
                                                         )}
                                                         <Button
@@ -690,7 +692,7 @@ const AdminProducts = () => {
                                     ) : (
                                         <div className="text-center py-4">
                                             <i className="bi bi-images text-muted" style={{ fontSize: '2rem' }}></i>
-                                            <p className="text-muted small mt-2">Aucune image ajoutée.</p>
+                                            <p className="text-muted small mt-2">{t('aucune_image_ajoutee')}</p>
                                         </div>
                                     )}
                                 </div>
@@ -698,20 +700,20 @@ const AdminProducts = () => {
 
                             {/* Main Color Section - Moved Here */}
                             <div className="p-3 bg-light rounded mb-3 border">
-                                <h6 className="small fw-bold text-muted mb-2">Couleur des images principales</h6>
+                                <h6 className="small fw-bold text-muted mb-2">{t('couleur_des_images_principales')}</h6>
                                 <Row className="g-2">
                                     <Col md={7}>
-                                        <Form.Label className="small">Nom de la couleur</Form.Label>
+                                        <Form.Label className="small">{t('nom_de_la_couleur')}</Form.Label>
                                         <Form.Control
                                             type="text"
                                             size="sm"
-                                            placeholder="ex: Original, Noir..."
+                                            placeholder={t('ex_original_noir')}
                                             value={mainColor.name}
                                             onChange={e => setMainColor({ ...mainColor, name: e.target.value })}
                                         />
                                     </Col>
                                     <Col md={5}>
-                                        <Form.Label className="small">Code Hex</Form.Label>
+                                        <Form.Label className="small">{t('code_hex')}</Form.Label>
                                         <Form.Control
                                             type="color"
                                             size="sm"
@@ -727,20 +729,20 @@ const AdminProducts = () => {
 
                     {/* Color Variants Section */}
                     <div className="mb-4 border-top pt-3">
-                        <h5 className="mb-3">Variantes de Couleur</h5>
+                        <h5 className="mb-3">{t('variantes_de_couleur')}</h5>
                         <Row className="align-items-start g-2 mb-3 bg-light p-3 rounded">
                             <Col md={3}>
-                                <Form.Label className="small">Nom (ex: Rouge)</Form.Label>
+                                <Form.Label className="small">{t('nom_ex_rouge')}</Form.Label>
                                 <Form.Control
                                     type="text"
                                     size="sm"
-                                    placeholder="Nom"
+                                    placeholder={t('nom')}
                                     value={newColor.name}
                                     onChange={e => setNewColor({ ...newColor, name: e.target.value })}
                                 />
                             </Col>
                             <Col md={2}>
-                                <Form.Label className="small">Couleur</Form.Label>
+                                <Form.Label className="small">{t('couleur_2')}</Form.Label>
                                 <Form.Control
                                     type="color"
                                     size="sm"
@@ -752,17 +754,17 @@ const AdminProducts = () => {
                             <Col md={7}>
                                 <div className="border p-2 rounded bg-white">
                                     <Form.Label className="small d-flex justify-content-between">
-                                        <span>Images pour {newColor.name || 'cette variante'}</span>
+                                        <span>{t('images_pour', { name: newColor.name || t('cette_variante') })}</span>
                                         <Badge bg="secondary">{newColor.images?.length || 0}</Badge>
                                     </Form.Label>
                                     <div className="d-flex gap-2 mb-2">
                                         <div className="btn-group btn-group-sm">
-                                            <Button variant={colorImageSource === 'upload' ? 'secondary' : 'outline-secondary'} onClick={() => setColorImageSource('upload')}>Upload</Button>
+                                            <Button variant={colorImageSource === 'upload' ? 'secondary' : 'outline-secondary'} onClick={() => setColorImageSource('upload')}>{t('upload')}</Button>
                                             <Button variant={colorImageSource === 'url' ? 'secondary' : 'outline-secondary'} onClick={() => setColorImageSource('url')}>URL</Button>
                                         </div>
                                         {colorImageSource === 'url' ? (
                                             <div className="d-flex gap-1 flex-grow-1">
-                                                <Form.Control size="sm" type="text" placeholder="URL image" value={newColorImageUrl} onChange={e => setNewColorImageUrl(e.target.value)} onKeyDown={e => e.key === 'Enter' && (e.preventDefault(), addColorImage())} />
+                                                <Form.Control size="sm" type="text" placeholder={t('url_image')} value={newColorImageUrl} onChange={e => setNewColorImageUrl(e.target.value)} onKeyDown={e => e.key === 'Enter' && (e.preventDefault(), addColorImage())} />
                                                 <Button size="sm" variant="outline-dark" onClick={addColorImage}>+</Button>
                                             </div>
                                         ) : (
@@ -778,10 +780,10 @@ const AdminProducts = () => {
                                                 </div>
                                             </div>
                                         ))}
-                                        {(!newColor.images || newColor.images.length === 0) && <div className="text-muted small fst-italic p-2">Aucune image</div>}
+                                        {(!newColor.images || newColor.images.length === 0) && <div className="text-muted small fst-italic p-2">{t('aucune_image')}</div>}
                                     </div>
                                     <div className="mt-2 text-end">
-                                        <Button variant="dark" size="sm" onClick={addColor}>Ajouter la variante</Button>
+                                        <Button variant="dark" size="sm" onClick={addColor}>{t('ajouter_la_variante')}</Button>
                                     </div>
                                 </div>
                             </Col>
@@ -804,19 +806,19 @@ const AdminProducts = () => {
                                                     <img key={imgIdx} src={img} alt="" className="h-100 rounded border" style={{ width: '30px', objectFit: 'cover' }} />
                                                 ))
                                             ) : (
-                                                <span className="text-muted small" style={{ fontSize: '0.7rem' }}>Sans images</span>
+                                                <span className="text-muted small" style={{ fontSize: '0.7rem' }}>{t('sans_images')}</span>
                                             )}
                                         </div>
                                     </div>
                                 ))}
                             </div>
                         ) : (
-                            <p className="text-muted small fst-italic">Aucune variante de couleur définie.</p>
+                            <p className="text-muted small fst-italic">{t('aucune_variante_de_couleur')}</p>
                         )}
                     </div>
 
                     <Form.Group className="mb-3">
-                        <Form.Label>Description</Form.Label>
+                        <Form.Label>{t('description')}</Form.Label>
                         <Form.Control
                             as="textarea"
                             rows={3}
@@ -830,9 +832,9 @@ const AdminProducts = () => {
                         <div className="mb-4 border-top pt-3">
                             <h5 className="mb-3 d-flex align-items-center gap-2">
                                 <i className="bi bi-rulers text-primary"></i>
-                                Tailles / Pointures Disponibles
+                                {t('tailles_pointures_disponibles')}
                             </h5>
-                            <p className="text-muted small mb-3">Sélectionnez les tailles qui seront proposées au client.</p>
+                            <p className="text-muted small mb-3">{t('selectionnez_les_tailles_qui')}</p>
 
                             <div className="d-flex flex-wrap gap-2 mb-3">
                                 {(getTemplateKey(currentProduct.category) === 'Shoes' ? SIZE_PRESETS.Shoes : SIZE_PRESETS.Clothing).map(size => (
@@ -850,7 +852,7 @@ const AdminProducts = () => {
 
                             <InputGroup size="sm" style={{ maxWidth: '300px' }}>
                                 <Form.Control
-                                    placeholder="Ajouter une taille perso..."
+                                    placeholder={t('ajouter_une_taille_perso')}
                                     id="customSizeInput"
                                     onKeyPress={(e) => {
                                         if (e.key === 'Enter') {
@@ -864,7 +866,7 @@ const AdminProducts = () => {
                                     if (input.value) toggleSize(input.value.toUpperCase());
                                     input.value = '';
                                 }}>
-                                    Ajouter
+                                    {t('ajouter')}
                                 </Button>
                             </InputGroup>
                         </div>
@@ -874,13 +876,13 @@ const AdminProducts = () => {
                     <div className="mb-4 border-top pt-3">
                         <h5 className="mb-3 d-flex align-items-center gap-2">
                             <i className="bi bi-list-stars text-primary"></i>
-                            Détails & Spécifications
+                            {t('details_specifications')}
                         </h5>
 
                         {/* Template Fields based on Category */}
                         {getTemplateKey(currentProduct.category) && (
                             <div className="p-3 bg-light rounded mb-3 border">
-                                <h6 className="small fw-bold text-muted mb-3 border-bottom pb-2">CHAMPS RECOMMANDÉS POUR {currentProduct.category.toUpperCase()}</h6>
+                                <h6 className="small fw-bold text-muted mb-3 border-bottom pb-2">{t('champs_recommandes_pour', { category: currentProduct.category.toUpperCase() })}</h6>
                                 <Row className="g-3">
                                     {ATTRIBUTE_TEMPLATES[getTemplateKey(currentProduct.category)].map(field => (
                                         <Col md={6} key={field}>
@@ -902,13 +904,13 @@ const AdminProducts = () => {
                         )}
 
                         <div className="bg-white border rounded p-3">
-                            <h6 className="small fw-bold text-muted mb-3">AUTRES DÉTAILS PERSONNALISÉS</h6>
+                            <h6 className="small fw-bold text-muted mb-3">{t('autres_details_personnalises')}</h6>
                             <Row className="g-2 mb-3 align-items-end">
                                 <Col md={5}>
                                     <Form.Control
                                         size="sm"
                                         type="text"
-                                        placeholder="Libellé (ex: Garantie)"
+                                        placeholder={t('libelle_ex_garantie')}
                                         value={newAttribute.label}
                                         onChange={e => setNewAttribute({ ...newAttribute, label: e.target.value })}
                                     />
@@ -917,7 +919,7 @@ const AdminProducts = () => {
                                     <Form.Control
                                         size="sm"
                                         type="text"
-                                        placeholder="Valeur (ex: 2 ans)"
+                                        placeholder={t('valeur_ex_2_ans')}
                                         value={newAttribute.value}
                                         onChange={e => setNewAttribute({ ...newAttribute, value: e.target.value })}
                                     />
@@ -958,8 +960,8 @@ const AdminProducts = () => {
                     </div>
                 </Modal.Body>
                 <Modal.Footer>
-                    <Button variant="secondary" onClick={() => setShowModal(false)}>Annuler</Button>
-                    <Button variant="primary" onClick={handleSave}>Enregistrer</Button>
+                    <Button variant="secondary" onClick={() => setShowModal(false)}>{t('annuler')}</Button>
+                    <Button variant="primary" onClick={handleSave}>{t('enregistrer')}</Button>
                 </Modal.Footer>
             </Modal>
             {/* Barcode Scanner Modal for new/edit */}
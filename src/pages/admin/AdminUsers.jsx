@@ -3,6 +3,7 @@ import { Table, Button, Modal, Form, Badge, Row, Col, InputGroup } from 'react-b
 import { useData } from '../../context/DataContext';
 import { useAuth } from '../../context/AuthContext';
 import { useNavigate } from 'react-router-dom';
+import { useLanguage } from '../../context/LanguageContext';
 
 // Fonction pour générer un ID unique (identique à AuthContext)
 const generateUserId = () => {
@@ -15,6 +16,7 @@ const generateUserId = () => {
 };
 
 const AdminUsers = () => {
+    const { t } = useLanguage();
     const { users, setUsers, adminUpdateUser, adminDeleteUser, adminAddUser } = useData();
     const { user } = useAuth();
     const navigate = useNavigate();
@@ -69,7 +71,7 @@ const AdminUsers = () => {
     // Save user (create or update)
     const handleSave = async () => {
         if (!formData.name || !formData.email) {
-            alert('Veuillez remplir tous les champs obligatoires');
+            alert(t('veuillez_remplir_tous_les_champs'));
             return;
         }
 
@@ -83,20 +85,20 @@ const AdminUsers = () => {
             });
 
             if (success) {
-                alert('Utilisateur modifié avec succès !');
+                alert(t('utilisateur_modifie_avec_succes'));
             } else {
-                alert('Erreur lors de la modification de l\'utilisateur');
+                alert(t('erreur_lors_de_la_modification'));
             }
         } else {
             // Create new user
             if (!formData.password) {
-                alert('Le mot de passe est obligatoire pour un nouveau compte');
+                alert(t('le_mot_de_passe_est_obligatoire'));
                 return;
             }
 
             // Check if email already exists (case-insensitive)
             if (users.some(u => u.email.toLowerCase() === formData.email.toLowerCase())) {
-                alert('Cet email est déjà utilisé');
+                alert(t('cet_email_est_deja_utilise'));
                 return;
             }
 
@@ -112,9 +114,9 @@ const AdminUsers = () => {
 
             const success = await adminAddUser(newUser);
             if (success) {
-                alert('Utilisateur créé avec succès !');
+                alert(t('utilisateur_cree_avec_succes'));
             } else {
-                alert('Erreur lors de la création de l\'utilisateur');
+                alert(t('erreur_lors_de_la_creation_de_l'));
             }
         }
 
@@ -124,16 +126,16 @@ const AdminUsers = () => {
     // Delete user
     const handleDelete = async (user) => {
         if (user.email.toLowerCase() === 'trymyday235@gmail.com') {
-            alert('Impossible de supprimer le compte administrateur principal !');
+            alert(t('impossible_de_supprimer_le'));
             return;
         }
 
-        if (window.confirm(`Êtes-vous sûr de vouloir supprimer ${user.name || user.email} ?`)) {
+        if (window.confirm(t('etes_vous_sur_de_vouloir_4', { value: user.name || user.email }))) {
             const success = await adminDeleteUser(user.email);
             if (success) {
-                alert('Utilisateur supprimé avec succès !');
+                alert(t('utilisateur_supprime_avec_succes'));
             } else {
-                alert('Erreur lors de la suppression de l\'utilisateur');
+                alert(t('erreur_lors_de_la_suppression_de'));
             }
         }
     };
@@ -141,10 +143,10 @@ const AdminUsers = () => {
     return (
         <div>
             <div className="d-flex justify-content-between align-items-center mb-4">
-                <h4 className="mb-0">Gestion des Clients</h4>
+                <h4 className="mb-0">{t('gestion_des_clients')}</h4>
                 <Button variant="primary" onClick={handleCreate}>
                     <i className="bi bi-plus-circle me-2"></i>
-                    Nouveau Client
+                    {t('nouveau_client')}
                 </Button>
             </div>
 
@@ -156,7 +158,7 @@ const AdminUsers = () => {
                             <i className="bi bi-search"></i>
                         </InputGroup.Text>
                         <Form.Control
-                            placeholder="Rechercher par nom ou email..."
+                            placeholder={t('rechercher_par_nom_ou_email')}
                             value={searchTerm}
                             onChange={(e) => setSearchTerm(e.target.value)}
                         />
@@ -164,11 +166,11 @@ const AdminUsers = () => {
                 </Col>
                 <Col md={3}>
                     <Form.Select value={roleFilter} onChange={(e) => setRoleFilter(e.target.value)}>
-                        <option value="all">Tous les rôles</option>
-                        <option value="client">Clients</option>
-                        <option value="admin">Administrateurs</option>
-                        <option value="manager">Managers</option>
-                        <option value="expediteur">Expéditeurs</option>
+                        <option value="all">{t('tous_les_roles')}</option>
+                        <option value="client">{t('clients')}</option>
+                        <option value="admin">{t('administrateurs')}</option>
+                        <option value="manager">{t('managers')}</option>
+                        <option value="expediteur">{t('expediteurs')}</option>
                     </Form.Select>
                 </Col>
             </Row>
@@ -177,18 +179,18 @@ const AdminUsers = () => {
             {filteredUsers.length === 0 ? (
                 <div className="text-center text-muted py-5">
                     <i className="bi bi-people" style={{ fontSize: '3rem' }}></i>
-                    <p className="mt-3">Aucun utilisateur trouvé</p>
+                    <p className="mt-3">{t('aucun_utilisateur_trouve')}</p>
                 </div>
             ) : (
                 <Table hover responsive>
                     <thead className="table-light">
                         <tr>
                             <th>ID</th>
-                            <th>Nom</th>
-                            <th>Email</th>
-                            <th>Rôle</th>
-                            <th>Inscrit le</th>
-                            <th>Actions</th>
+                            <th>{t('nom')}</th>
+                            <th>{t('email_3')}</th>
+                            <th>{t('role')}</th>
+                            <th>{t('inscrit_le')}</th>
+                            <th>{t('actions')}</th>
                         </tr>
                     </thead>
                     <tbody>
@@ -244,17 +246,17 @@ const AdminUsers = () => {
                 <Modal.Body>
                     <Form>
                         <Form.Group className="mb-3">
-                            <Form.Label>Nom complet *</Form.Label>
+                            <Form.Label>{t('nom_complet')}</Form.Label>
                             <Form.Control
                                 type="text"
-                                placeholder="Jean Dupont"
+                                placeholder={t('jean_dupont')}
                                 value={formData.name}
                                 onChange={(e) => setFormData({ ...formData, name: e.target.value })}
                             />
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Email *</Form.Label>
+                            <Form.Label>{t('email_2')}</Form.Label>
                             <Form.Control
                                 type="email"
                                 placeholder="jean@example.com"
@@ -264,14 +266,14 @@ const AdminUsers = () => {
                             />
                             {editingUser && (
                                 <Form.Text className="text-muted">
-                                    L'email ne peut pas être modifié
+                                    {t('l_email_ne_peut_pas_etre_modifie')}
                                 </Form.Text>
                             )}
                         </Form.Group>
 
                         <Form.Group className="mb-3">
                             <Form.Label>
-                                Mot de passe {!editingUser && '*'}
+                                {t('mot_de_passe_2', { value: !editingUser && '*' })}
                             </Form.Label>
                             <Form.Control
                                 type="password"
@@ -282,21 +284,21 @@ const AdminUsers = () => {
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Rôle *</Form.Label>
+                            <Form.Label>{t('role_2')}</Form.Label>
                             <Form.Select
                                 value={formData.role}
                                 onChange={(e) => setFormData({ ...formData, role: e.target.value })}
                             >
-                                <option value="client">Client</option>
-                                <option value="manager">Manager</option>
-                                <option value="expediteur">Expéditeur</option>
+                                <option value="client">{t('client')}</option>
+                                <option value="manager">{t('manager')}</option>
+                                <option value="expediteur">{t('expediteur')}</option>
                             </Form.Select>
                         </Form.Group>
                     </Form>
                 </Modal.Body>
                 <Modal.Footer>
                     <Button variant="secondary" onClick={() => setShowModal(false)}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                     <Button variant="primary" onClick={handleSave}>
                         {editingUser ? 'Modifier' : 'Créer'}
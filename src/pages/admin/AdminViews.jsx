@@ -5,8 +5,10 @@ import { useAuth } from '../../context/AuthContext';
 import Barcode from 'react-barcode';
 import BarcodeScanner from '../../components/BarcodeScanner';
 import API_BASE_URL from '../../config';
+import { useLanguage } from '../../context/LanguageContext';
 
 export const AdminOrders = () => {
+    const { t } = useLanguage();
     const { orders } = useData();
     const { user } = useAuth();
     const isManager = user?.role === 'manager';
@@ -166,16 +168,16 @@ export const AdminOrders = () => {
                 trackingNumber: trackingNumber
             });
 
-            alert('Statut mis à jour avec succès !');
+            alert(t('statut_mis_a_jour_avec_succes'));
             setShowModal(false);
         } catch (error) {
             console.error('Error updating status:', error);
-            alert('Erreur lors de la mise à jour du statut.');
+            alert(t('erreur_lors_de_la_mise_a_jour_du'));
         }
     };
 
     const handleApproveCancellation = async (order) => {
-        if (!window.confirm(`Approuver l'annulation de la commande #${order.id} et rembourser ${order.total.toLocaleString()} FCFA ?`)) return;
+        if (!window.confirm(t('approuver_l_annulation_de_la', { id: order.id, total: order.total.toLocaleString() }))) return;
 
         // 1. Update order status
         const timestamp = new Date().toLocaleString('fr-FR');
@@ -219,19 +221,19 @@ export const AdminOrders = () => {
                 console.log('✅ Refund processed successfully:', data.newBalance);
             } else {
                 console.error('❌ Failed to process refund:', data.message);
-                alert(`⚠️ Le statut de la commande a été mis à jour, mais le remboursement a échoué : ${data.message}`);
+                alert(t('le_statut_de_la_commande_a_ete', { message: data.message }));
             }
         } catch (error) {
             console.error('❌ Error calling refund API:', error);
-            alert('⚠️ Erreur lors de la communication avec le serveur pour le remboursement.');
+            alert(t('erreur_lors_de_la_communication'));
         }
 
-        alert(`✅ Commande #${order.id} annulée et remboursement effectué.`);
+        alert(t('commande_annulee_et', { id: order.id }));
         window.location.reload();
     };
 
     const handleRefuseCancellation = async (order) => {
-        if (!window.confirm(`Refuser la demande d'annulation pour la commande #${order.id} ?`)) return;
+        if (!window.confirm(t('refuser_la_demande_d_annulation', { id: order.id }))) return;
 
         const timestamp = new Date().toLocaleString('fr-FR');
         const timelineEntry = {
@@ -258,7 +260,7 @@ export const AdminOrders = () => {
         // Send Email
         await sendEmailNotification(order, 'En cours de préparation', 'Demande d\'annulation refusée par Trymyday.');
 
-        alert(`❌ Demande d'annulation refusée. Le statut est passé à "En cours de préparation".`);
+        alert(t('demande_d_annulation_refusee_le'));
         window.location.reload();
     };
 
@@ -298,7 +300,7 @@ export const AdminOrders = () => {
                 <Col>
                     <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)' }}>
                         <Card.Body className="text-center p-2 text-white">
-                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>Total</div>
+                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('total')}</div>
                             <h6 className="mb-0 fw-bold">{stats.total}</h6>
                         </Card.Body>
                     </Card>
@@ -306,7 +308,7 @@ export const AdminOrders = () => {
                 <Col>
                     <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #f093fb 0%, #f5576c 100%)' }}>
                         <Card.Body className="text-center p-2 text-white">
-                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>En attente</div>
+                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('en_attente')}</div>
                             <h6 className="mb-0 fw-bold">{stats.pending}</h6>
                         </Card.Body>
                     </Card>
@@ -314,7 +316,7 @@ export const AdminOrders = () => {
                 <Col>
                     <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #ffecd2 0%, #fcb69f 100%)' }}>
                         <Card.Body className="text-center p-2 text-white">
-                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>Préparation</div>
+                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('preparation')}</div>
                             <h6 className="mb-0 fw-bold">{stats.inProgress}</h6>
                         </Card.Body>
                     </Card>
@@ -322,7 +324,7 @@ export const AdminOrders = () => {
                 <Col>
                     <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #a8edea 0%, #fed6e3 100%)' }}>
                         <Card.Body className="text-center p-2 text-white">
-                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>En route</div>
+                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('en_route')}</div>
                             <h6 className="mb-0 fw-bold">{stats.shipping}</h6>
                         </Card.Body>
                     </Card>
@@ -330,7 +332,7 @@ export const AdminOrders = () => {
                 <Col>
                     <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #4facfe 0%, #00f2fe 100%)' }}>
                         <Card.Body className="text-center p-2 text-white">
-                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>Livrées</div>
+                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('livrees')}</div>
                             <h6 className="mb-0 fw-bold">{stats.delivered}</h6>
                         </Card.Body>
                     </Card>
@@ -338,7 +340,7 @@ export const AdminOrders = () => {
                 <Col>
                     <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #fa709a 0%, #fee140 100%)' }}>
                         <Card.Body className="text-center p-2 text-white">
-                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>Annulées</div>
+                            <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('annulees')}</div>
                             <h6 className="mb-0 fw-bold">{stats.cancelled}</h6>
                         </Card.Body>
                     </Card>
@@ -347,7 +349,7 @@ export const AdminOrders = () => {
                     <Col>
                         <Card className="border-0 shadow-sm" style={{ background: 'linear-gradient(135deg, #43e97b 0%, #38f9d7 100%)' }}>
                             <Card.Body className="text-center p-2 text-white">
-                                <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>Revenu Total</div>
+                                <div style={{ fontSize: '0.65rem', opacity: 0.9 }}>{t('revenu_total')}</div>
                                 <h6 className="mb-0 fw-bold">{stats.totalRevenue.toLocaleString()} FCFA</h6>
                             </Card.Body>
                         </Card>
@@ -356,7 +358,7 @@ export const AdminOrders = () => {
             </Row>
 
             {/* Header */}
-            <h5 className="mb-3 mt-3">Gestion des Commandes</h5>
+            <h5 className="mb-3 mt-3">{t('gestion_des_commandes')}</h5>
 
             {/* Search and Filter */}
             <Row className="mb-4">
@@ -366,14 +368,14 @@ export const AdminOrders = () => {
                             <i className="bi bi-search"></i>
                         </InputGroup.Text>
                         <Form.Control
-                            placeholder="Scanner le code-barre ou rechercher..."
+                            placeholder={t('scanner_le_code_barre_ou')}
                             value={searchTerm}
                             onChange={(e) => handleSearchChange(e.target.value)}
                         />
                         <Button
                             variant="outline-primary"
                             onClick={() => setShowScanner(true)}
-                            title="Scanner le code-barre"
+                            title={t('scanner_le_code_barre')}
                         >
                             <i className="bi bi-camera"></i>
                         </Button>
@@ -381,18 +383,18 @@ export const AdminOrders = () => {
                 </Col>
                 <Col md={3}>
                     <Form.Select value={statusFilter} onChange={(e) => setStatusFilter(e.target.value)}>
-                        <option value="all">Tous les statuts</option>
-                        <option value="En attente">En attente</option>
-                        <option value="En cours de préparation">En préparation</option>
-                        <option value="En route">En route</option>
-                        <option value="Livrée">Livrée</option>
-                        <option value="Annulée">Annulée</option>
+                        <option value="all">{t('tous_les_statuts')}</option>
+                        <option value="En attente">{t('en_attente')}</option>
+                        <option value="En cours de préparation">{t('en_preparation')}</option>
+                        <option value="En route">{t('en_route')}</option>
+                        <option value="Livrée">{t('livree')}</option>
+                        <option value="Annulée">{t('annulee')}</option>
                     </Form.Select>
                 </Col>
                 <Col md={2}>
                     <Button variant="success" onClick={exportToCSV} className="w-100" size="sm">
                         <i className="bi bi-download me-1"></i>
-                        Exporter
+                        {t('exporter')}
                     </Button>
                 </Col>
             </Row>
@@ -402,7 +404,7 @@ export const AdminOrders = () => {
                 <div className="mb-4">
                     <h6 className="text-danger fw-bold mb-3">
                         <i className="bi bi-exclamation-triangle-fill me-2"></i>
-                        Demandes d'annulation en attente
+                        {t('demandes_d_annulation_en_attente')}
                     </h6>
                     <Row className="g-3">
                         {orders.filter(o => o.status === "Demande d'annulation").map(order => (
@@ -411,7 +413,7 @@ export const AdminOrders = () => {
                                     <Card.Body className="p-3">
                                         <div className="d-flex justify-content-between align-items-start mb-2">
                                             <div>
-                                                <div className="fw-bold">Commande #{order.id}</div>
+                                                <div className="fw-bold">{t('commande', { id: order.id })}</div>
                                                 <small className="text-muted">{order.customerName || order.customer}</small>
                                             </div>
                                             <div className="fw-bold text-danger">{order.total.toLocaleString()} FCFA</div>
@@ -423,7 +425,7 @@ export const AdminOrders = () => {
                                                 className="flex-grow-1"
                                                 onClick={() => handleApproveCancellation(order)}
                                             >
-                                                <i className="bi bi-check-circle me-1"></i> Approuver
+                                                <i className="bi bi-check-circle me-1"></i> {t('approuver')}
                                             </Button>
                                             <Button
                                                 variant="outline-secondary"
@@ -431,7 +433,7 @@ export const AdminOrders = () => {
                                                 className="flex-grow-1"
                                                 onClick={() => handleRefuseCancellation(order)}
                                             >
-                                                <i className="bi bi-x-circle me-1"></i> Refuser
+                                                <i className="bi bi-x-circle me-1"></i> {t('refuser')}
                                             </Button>
                                         </div>
                                     </Card.Body>
@@ -446,22 +448,22 @@ export const AdminOrders = () => {
             {filteredOrders.length === 0 ? (
                 <div className="text-center text-muted py-5">
                     <i className="bi bi-inbox" style={{ fontSize: '3rem' }}></i>
-                    <p className="mt-3">Aucune commande trouvée</p>
+                    <p className="mt-3">{t('aucune_commande_trouvee')}</p>
                 </div>
             ) : (
                 <Table hover responsive>
                     <thead className="table-light">
                         <tr>
                             <th>ID</th>
-                            <th>Nom</th>
-                            <th>ID Client</th>
-                            <th>Téléphone</th>
-                            <th>Date</th>
-                            <th>Montant</th>
-                            <th>Suivi</th>
-                            <th>Statut</th>
-                            <th>Imprimer</th>
-                            <th>Actions</th>
+                            <th>{t('nom')}</th>
+                            <th>{t('id_client')}</th>
+                            <th>{t('telephone')}</th>
+                            <th>{t('date')}</th>
+                            <th>{t('montant')}</th>
+                            <th>{t('suivi')}</th>
+                            <th>{t('statut')}</th>
+                            <th>{t('imprimer')}</th>
+                            <th>{t('actions')}</th>
                         </tr>
                     </thead>
                     <tbody>
@@ -503,7 +505,7 @@ export const AdminOrders = () => {
                                         variant="outline-dark"
                                         size="sm"
                                         onClick={() => handlePrintSlip(order)}
-                                        title="Imprimer la fiche"
+                                        title={t('imprimer_la_fiche')}
                                     >
                                         <i className="bi bi-printer"></i>
                                     </Button>
@@ -537,59 +539,59 @@ export const AdminOrders = () => {
             {/* Status Change Modal */}
             <Modal show={showModal} onHide={() => setShowModal(false)} size="lg">
                 <Modal.Header closeButton>
-                    <Modal.Title>Modifier le statut - Commande #{selectedOrder?.id}</Modal.Title>
+                    <Modal.Title>{t('modifier_le_statut_commande', { id: selectedOrder?.id })}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body>
                     <Form>
                         <Form.Group className="mb-3">
-                            <Form.Label>Statut actuel</Form.Label>
+                            <Form.Label>{t('statut_actuel')}</Form.Label>
                             <Form.Control value={selectedOrder?.status || ''} disabled />
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Nouveau statut *</Form.Label>
+                            <Form.Label>{t('nouveau_statut')}</Form.Label>
                             <Form.Select id="newStatus" defaultValue={selectedOrder?.status}>
-                                <option value="En attente">En attente</option>
-                                <option value="En cours de préparation">En cours de préparation</option>
-                                <option value="En route">En route</option>
-                                <option value="Livrée">Livrée</option>
-                                <option value="Annulée">Annulée</option>
+                                <option value="En attente">{t('en_attente')}</option>
+                                <option value="En cours de préparation">{t('en_cours_de_preparation')}</option>
+                                <option value="En route">{t('en_route')}</option>
+                                <option value="Livrée">{t('livree')}</option>
+                                <option value="Annulée">{t('annulee')}</option>
                             </Form.Select>
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Numéro de suivi</Form.Label>
+                            <Form.Label>{t('numero_de_suivi_2')}</Form.Label>
                             <Form.Control
                                 placeholder="Ex: DHL123456789"
                                 value={trackingNumber}
                                 onChange={(e) => setTrackingNumber(e.target.value)}
                             />
                             <Form.Text className="text-muted">
-                                Optionnel - Le client pourra suivre sa commande
+                                {t('optionnel_le_client_pourra')}
                             </Form.Text>
                         </Form.Group>
 
                         <Form.Group className="mb-3">
-                            <Form.Label>Note pour le client</Form.Label>
+                            <Form.Label>{t('note_pour_le_client')}</Form.Label>
                             <Form.Control
                                 as="textarea"
                                 rows={3}
-                                placeholder="Ex: Votre colis est en cours de préparation..."
+                                placeholder={t('ex_votre_colis_est_en_cours_de')}
                                 value={statusNote}
                                 onChange={(e) => setStatusNote(e.target.value)}
                             />
                             <Form.Text className="text-muted">
-                                Cette note sera visible par le client dans l'historique de sa commande
+                                {t('cette_note_sera_visible_par_le')}
                             </Form.Text>
                         </Form.Group>
                     </Form>
                 </Modal.Body>
                 <Modal.Footer>
                     <Button variant="secondary" onClick={() => setShowModal(false)}>
-                        Annuler
+                        {t('annuler')}
                     </Button>
                     <Button variant="primary" onClick={saveStatusChange}>
-                        Enregistrer
+                        {t('enregistrer')}
                     </Button>
                 </Modal.Footer>
             </Modal>
@@ -597,7 +599,7 @@ export const AdminOrders = () => {
             {/* Order Details Modal */}
             <Modal show={showDetailsModal} onHide={() => setShowDetailsModal(false)} size="lg" centered>
                 <Modal.Header closeButton className="border-0">
-                    <Modal.Title className="fw-bold">Détails Commande #{detailsOrder?.id}</Modal.Title>
+                    <Modal.Title className="fw-bold">{t('details_commande', { id: detailsOrder?.id })}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body className="pt-0">
                     {detailsOrder && (
@@ -605,7 +607,7 @@ export const AdminOrders = () => {
                             {/* Status and Summary Header */}
                             <div className="bg-light p-3 rounded-3 d-flex justify-content-between align-items-center">
                                 <div>
-                                    <div className="text-muted small mb-1">Date de commande</div>
+                                    <div className="text-muted small mb-1">{t('date_de_commande')}</div>
                                     <div className="fw-bold">{detailsOrder.date}</div>
                                 </div>
                                 <div className="text-end">
@@ -618,29 +620,29 @@ export const AdminOrders = () => {
                                         {detailsOrder.status}
                                     </Badge>
                                     <div className="mt-1 fw-bold text-success fs-5">
-                                        Total: {detailsOrder.total.toLocaleString()} FCFA
+                                        {t('total_fcfa_2', { total: detailsOrder.total.toLocaleString() })}
                                     </div>
                                 </div>
                             </div>
 
                             {/* Customer Info */}
                             <div>
-                                <h6 className="fw-bold border-bottom pb-2 mb-3">Informations Client</h6>
+                                <h6 className="fw-bold border-bottom pb-2 mb-3">{t('informations_client')}</h6>
                                 <Row className="g-3">
                                     <Col sm={6}>
-                                        <div className="text-muted small">Nom :</div>
+                                        <div className="text-muted small">{t('nom_2')}</div>
                                         <div className="fw-medium">{detailsOrder.customerName || detailsOrder.customer || 'N/A'}</div>
                                     </Col>
                                     <Col sm={6}>
-                                        <div className="text-muted small">Téléphone :</div>
+                                        <div className="text-muted small">{t('telephone_2')}</div>
                                         <div className="fw-medium">{detailsOrder.phone || 'N/A'}</div>
                                     </Col>
                                     <Col sm={6}>
-                                        <div className="text-muted small">Email :</div>
+                                        <div className="text-muted small">{t('email_4')}</div>
                                         <div className="fw-medium">{detailsOrder.email || 'N/A'}</div>
                                     </Col>
                                     <Col sm={6}>
-                                        <div className="text-muted small">ID Client :</div>
+                                        <div className="text-muted small">{t('id_client_2')}</div>
                                         <div className="fw-medium">{(() => {
                                             // Chercher l'utilisateur à partir de l'email
                                             const users = JSON.parse(localStorage.getItem('users') || '[]');
@@ -649,7 +651,7 @@ export const AdminOrders = () => {
                                         })()}</div>
                                     </Col>
                                     <Col sm={12}>
-                                        <div className="text-muted small">Adresse de livraison :</div>
+                                        <div className="text-muted small">{t('adresse_de_livraison_2')}</div>
                                         <div className="fw-medium bg-light p-2 rounded mt-1">
                                             {detailsOrder.shippingAddress ? (
                                                 <>
@@ -660,7 +662,7 @@ export const AdminOrders = () => {
                                                     {detailsOrder.shippingAddress.phone || detailsOrder.phone}
                                                 </>
                                             ) : (
-                                                <span className="text-muted fst-italic">Adresse non disponible</span>
+                                                <span className="text-muted fst-italic">{t('adresse_non_disponible')}</span>
                                             )}
                                         </div>
                                     </Col>
@@ -669,7 +671,7 @@ export const AdminOrders = () => {
 
                             {/* Items List */}
                             <div>
-                                <h6 className="fw-bold border-bottom pb-2 mb-3">Articles ({detailsOrder.items?.length || 0})</h6>
+                                <h6 className="fw-bold border-bottom pb-2 mb-3">{t('articles_3', { count: detailsOrder.items?.length || 0 })}</h6>
                                 <div className="d-flex flex-column gap-3">
                                     {detailsOrder.items?.map((item, idx) => (
                                         <div key={idx} className="d-flex align-items-center border-bottom pb-3 last-border-0">
@@ -679,8 +681,8 @@ export const AdminOrders = () => {
                                             <div className="flex-grow-1">
                                                 <div className="fw-bold text-truncate" style={{ maxWidth: '300px' }}>{item.name}</div>
                                                 <div className="text-muted small">
-                                                    Prix u. : {parseFloat(item.price).toLocaleString()} FCFA
-                                                    {item.size && <span className="ms-2 badge bg-light text-dark border">Taille: {item.size}</span>}
+                                                    {t('prix_u_fcfa', { value: parseFloat(item.price).toLocaleString() })}
+                                                    {item.size && <span className="ms-2 badge bg-light text-dark border">{t('taille', { size: item.size })}</span>}
                                                     {item.color && (
                                                         <span className="ms-1 d-inline-block border rounded-circle"
                                                             style={{ width: '10px', height: '10px', backgroundColor: item.color }}
@@ -702,9 +704,9 @@ export const AdminOrders = () => {
                 </Modal.Body>
                 <Modal.Footer className="border-0">
                     <Button variant="outline-dark" onClick={() => handlePrintSlip(detailsOrder)}>
-                        <i className="bi bi-printer me-2"></i>Imprimer la fiche
+                        <i className="bi bi-printer me-2"></i>{t('imprimer_la_fiche')}
                     </Button>
-                    <Button variant="light" onClick={() => setShowDetailsModal(false)}>Fermer</Button>
+                    <Button variant="light" onClick={() => setShowDetailsModal(false)}>{t('fermer')}</Button>
                 </Modal.Footer>
             </Modal>
             {/* Barcode Scanner Modal */}
@@ -718,18 +720,19 @@ export const AdminOrders = () => {
 };
 
 export const AdminUsers = () => {
+    const { t } = useLanguage();
     const { users } = useData();
     return (
         <div>
-            <h2 className="mb-4">Gestion des Clients</h2>
+            <h2 className="mb-4">{t('gestion_des_clients')}</h2>
             <Table hover responsive>
                 <thead>
                     <tr>
                         <th>ID</th>
-                        <th>Nom</th>
-                        <th>Email</th>
-                        <th>Rôle</th>
-                        <th>Inscrit le</th>
+                        <th>{t('nom')}</th>
+                        <th>{t('email_3')}</th>
+                        <th>{t('role')}</th>
+                        <th>{t('inscrit_le')}</th>
                     </tr>
                 </thead>
                 <tbody>
@@ -752,6 +755,7 @@ export const AdminUsers = () => {
     );
 };
 export const AdminSupport = () => {
+    const { t } = useLanguage();
     const { helpQuestions, updateHelpQuestion, deleteHelpQuestion } = useData();
     const [selectedQ, setSelectedQ] = useState(null);
     const [answerText, setAnswerText] = useState('');
@@ -782,10 +786,10 @@ export const AdminSupport = () => {
     return (
         <div>
             <div className="d-flex justify-content-between align-items-center mb-4">
-                <h2 className="mb-0 fw-bold">Support & Communauté</h2>
+                <h2 className="mb-0 fw-bold">{t('support_communaute')}</h2>
                 {pendingCount > 0 && (
                     <Badge bg="danger" pill className="px-3 py-2">
-                        {pendingCount} Question{pendingCount > 1 ? 's' : ''} en attente
+                        {t('question_en_attente', { pendingCount, value: pendingCount > 1 ? 's' : '' })}
                     </Badge>
                 )}
             </div>
@@ -793,18 +797,18 @@ export const AdminSupport = () => {
             <Table hover responsive className="align-middle">
                 <thead className="table-light">
                     <tr>
-                        <th>Date</th>
-                        <th>Utilisateur</th>
-                        <th>Question</th>
-                        <th>Statut</th>
-                        <th>Réponse</th>
-                        <th className="text-end">Actions</th>
+                        <th>{t('date')}</th>
+                        <th>{t('utilisateur')}</th>
+                        <th>{t('question')}</th>
+                        <th>{t('statut')}</th>
+                        <th>{t('reponse')}</th>
+                        <th className="text-end">{t('actions')}</th>
                     </tr>
                 </thead>
                 <tbody>
                     {helpQuestions.length === 0 ? (
                         <tr>
-                            <td colSpan="6" className="text-center py-5 text-muted">Aucune question pour le moment.</td>
+                            <td colSpan="6" className="text-center py-5 text-muted">{t('aucune_question_pour_le_moment')}</td>
                         </tr>
                     ) : (
                         helpQuestions.map(q => (
@@ -828,7 +832,7 @@ export const AdminSupport = () => {
                                     {q.answer ? (
                                         <div className="text-truncate small text-muted" title={q.answer}>{q.answer}</div>
                                     ) : (
-                                        <span className="fst-italic text-danger small">Pas encore de réponse</span>
+                                        <span className="fst-italic text-danger small">{t('pas_encore_de_reponse')}</span>
                                     )}
                                 </td>
                                 <td className="text-end">
@@ -838,12 +842,12 @@ export const AdminSupport = () => {
                                         className="me-2"
                                         onClick={() => handleAnswer(q)}
                                     >
-                                        <i className="bi bi-chat-left-dots me-1"></i> Répondre
+                                        <i className="bi bi-chat-left-dots me-1"></i> {t('repondre')}
                                     </Button>
                                     <Button
                                         variant="outline-danger"
                                         size="sm"
-                                        onClick={() => { if (window.confirm('Supprimer cette question ?')) deleteHelpQuestion(q.id) }}
+                                        onClick={() => { if (window.confirm(t('supprimer_cette_question'))) deleteHelpQuestion(q.id) }}
                                     >
                                         <i className="bi bi-trash"></i>
                                     </Button>
@@ -857,32 +861,32 @@ export const AdminSupport = () => {
             {/* Answer Modal */}
             <Modal show={showAnswerModal} onHide={() => setShowAnswerModal(false)} centered>
                 <Modal.Header closeButton className="border-0">
-                    <Modal.Title className="fw-bold">Répondre à la question</Modal.Title>
+                    <Modal.Title className="fw-bold">{t('repondre_a_la_question')}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body className="pt-0">
                     <div className="mb-4">
-                        <label className="text-muted small mb-1">Question de {selectedQ?.userName} :</label>
+                        <label className="text-muted small mb-1">{t('question_de', { userName: selectedQ?.userName })}</label>
                         <div className="p-3 bg-light rounded-3 fw-medium">{selectedQ?.question}</div>
                     </div>
                     <Form.Group>
-                        <label className="fw-bold mb-2">Votre Réponse</label>
+                        <label className="fw-bold mb-2">{t('votre_reponse')}</label>
                         <Form.Control
                             as="textarea"
                             rows={5}
-                            placeholder="Écrivez votre réponse ici..."
+                            placeholder={t('ecrivez_votre_reponse_ici')}
                             value={answerText}
                             onChange={(e) => setAnswerText(e.target.value)}
                             className="rounded-3"
                         />
                         <Form.Text className="text-muted">
-                            En enregistrant, la question sera automatiquement approuvée et visible par tous.
+                            {t('en_enregistrant_la_question_sera')}
                         </Form.Text>
                     </Form.Group>
                 </Modal.Body>
                 <Modal.Footer className="border-0">
-                    <Button variant="light" onClick={() => setShowAnswerModal(false)}>Fermer</Button>
+                    <Button variant="light" onClick={() => setShowAnswerModal(false)}>{t('fermer')}</Button>
                     <Button variant="primary" onClick={saveAnswer} disabled={!answerText.trim()}>
-                        Enregistrer et Approuver
+                        {t('enregistrer_et_approuver')}
                     </Button>
                 </Modal.Footer>
             </Modal>
@@ -4,8 +4,10 @@ import { useAuth } from '../../context/AuthContext';
 import { useWallet } from '../../context/WalletContext';
 import { useNavigate } from 'react-router-dom';
 import API_BASE_URL from '../../config';
+import { useLanguage } from '../../context/LanguageContext';
 
 const AdminWalletManagement = () => {
+    const { t: translate } = useLanguage();
     const { user: authUser } = useAuth();
     const navigate = useNavigate();
 
@@ -51,7 +53,7 @@ const AdminWalletManagement = () => {
             setTransactions(sortedTransactions);
         } catch (error) {
             console.error('Error fetching localStorage data:', error);
-            setMessage({ type: 'danger', text: 'Erreur lors du chargement des données locales' });
+            setMessage({ type: 'danger', text: translate('erreur_lors_du_chargement_des') });
         } finally {
             setLoading(false);
         }
@@ -61,11 +63,11 @@ const AdminWalletManagement = () => {
     const handleVirementWallet = async () => {
         const targetUser = isIdVirement ? foundUser : selectedUser;
         if (!targetUser || !virementAmount || parseFloat(virementAmount) <= 0) {
-            setMessage({ type: 'danger', text: 'Veuillez remplir tous les champs correctement' });
+            setMessage({ type: 'danger', text: translate('veuillez_remplir_tous_les_champs_4') });
             return;
         }
 
-        if (!window.confirm(`Êtes-vous sûr de vouloir effectuer un virement de ${parseFloat(virementAmount).toLocaleString()} FCFA à ${targetUser.name} (${targetUser.id}) ?`)) {
+        if (!window.confirm(translate('etes_vous_sur_de_vouloir_5', { value: parseFloat(virementAmount).toLocaleString(), name: targetUser.name, id: targetUser.id }))) {
             return;
         }
 
@@ -75,7 +77,7 @@ const AdminWalletManagement = () => {
             const targetEmail = isIdVirement ? (foundUser?.email) : selectedUser?.email;
 
             if (isManager && targetEmail === authUser.email) {
-                setMessage({ type: 'danger', text: 'Vous ne pouvez pas vous envoyer des fonds à vous-même' });
+                setMessage({ type: 'danger', text: translate('vous_ne_pouvez_pas_vous_envoyer') });
                 setIsProcessing(false);
                 return;
             }
@@ -146,7 +148,7 @@ const AdminWalletManagement = () => {
             handleCloseModal();
             fetchData();
         } catch (error) {
-            setMessage({ type: 'danger', text: 'Erreur lors de la mise à jour du solde : ' + error.message });
+            setMessage({ type: 'danger', text: translate('erreur_lors_de_la_mise_a_jour_du_2') + error.message });
             handleCloseModal();
             console.error(error);
         } finally {
@@ -156,7 +158,7 @@ const AdminWalletManagement = () => {
 
     // Undo a transaction
     const handleUndoTransaction = (transactionId) => {
-        if (!window.confirm("Êtes-vous sûr de vouloir annuler cette transaction ? Le montant sera déduit du solde de l'utilisateur.")) {
+        if (!window.confirm(translate('etes_vous_sur_de_vouloir_annuler_2'))) {
             return;
         }
 
@@ -165,7 +167,7 @@ const AdminWalletManagement = () => {
             const txIndex = localTransactions.findIndex(tx => tx.id === transactionId);
 
             if (txIndex === -1) {
-                setMessage({ type: 'danger', text: 'Transaction introuvable' });
+                setMessage({ type: 'danger', text: translate('transaction_introuvable') });
                 return;
             }
 
@@ -189,10 +191,10 @@ const AdminWalletManagement = () => {
             };
             localStorage.setItem('wallet_transactions', JSON.stringify(localTransactions));
 
-            setMessage({ type: 'success', text: 'Transaction marquée comme annulée' });
+            setMessage({ type: 'success', text: translate('transaction_marquee_comme') });
             fetchData();
         } catch (error) {
-            setMessage({ type: 'danger', text: 'Erreur lors de l\'annulation' });
+            setMessage({ type: 'danger', text: translate('erreur_lors_de_l_annulation') });
             console.error(error);
         }
     };
@@ -262,7 +264,7 @@ const AdminWalletManagement = () => {
     // Export transactions to CSV
     const exportTransactionsCSV = () => {
         if (transactions.length === 0) {
-            setMessage({ type: 'warning', text: 'Aucune transaction à exporter' });
+            setMessage({ type: 'warning', text: translate('aucune_transaction_a_exporter') });
             return;
         }
 
@@ -306,11 +308,11 @@ const AdminWalletManagement = () => {
                 <div>
                     <h3 className="fw-bold mb-0">
                         <i className="bi bi-wallet2 me-2 text-warning"></i>
-                        Gestion des Portefeuilles
+                        {translate('gestion_des_portefeuilles')}
                     </h3>
                     {isManager && (
                         <p className="text-muted small mb-0 mt-1 d-none d-md-block">
-                            Gérez les soldes clients en utilisant votre solde de manager.
+                            {translate('gerez_les_soldes_clients_en')}
                         </p>
                     )}
                 </div>
@@ -319,7 +321,7 @@ const AdminWalletManagement = () => {
                     {isManager && (
                         <div className="d-flex align-items-center bg-white border border-info-subtle shadow-sm px-3 py-2 rounded-3">
                             <div className="me-3">
-                                <div className="text-muted" style={{ fontSize: '0.6rem', fontWeight: '800', textTransform: 'uppercase', letterSpacing: '0.5px' }}>SOLDE MANAGER</div>
+                                <div className="text-muted" style={{ fontSize: '0.6rem', fontWeight: '800', textTransform: 'uppercase', letterSpacing: '0.5px' }}>{translate('solde_manager')}</div>
                                 <div className="fw-bold text-dark fs-5">{managerBalance.toLocaleString()} FCFA</div>
                             </div>
                             <div className="bg-info-subtle p-2 rounded-circle text-info">
@@ -329,7 +331,7 @@ const AdminWalletManagement = () => {
                     )}
 
                     <Badge bg="dark" className="px-3 py-2 fs-6 shadow-sm" style={{ borderRadius: '8px' }}>
-                        {users.length} Clients
+                        {translate('clients_2', { count: users.length })}
                     </Badge>
                 </div>
             </div>
@@ -345,7 +347,7 @@ const AdminWalletManagement = () => {
                 <Col xs={12}>
                     <div className="d-flex justify-content-between align-items-center bg-white p-3 rounded-3 shadow-sm border">
                         <div className="d-flex align-items-center gap-3">
-                            <h5 className="mb-0 fw-bold text-muted">Actions Rapides</h5>
+                            <h5 className="mb-0 fw-bold text-muted">{translate('actions_rapides')}</h5>
                             <Button
                                 variant="warning"
                                 className="text-white fw-bold px-4"
@@ -356,7 +358,7 @@ const AdminWalletManagement = () => {
                                 }}
                             >
                                 <i className="bi bi-person-badge me-2"></i>
-                                Virement par ID
+                                {translate('virement_par_id')}
                             </Button>
                         </div>
                         <div className="d-flex gap-2">
@@ -366,17 +368,17 @@ const AdminWalletManagement = () => {
                                 style={{ borderRadius: '8px', cursor: 'pointer', border: '1px solid #dee2e6', width: 'auto' }}
                                 className="bg-white text-muted fw-bold shadow-sm"
                             >
-                                <option value="month">Ce mois</option>
-                                <option value="3months">3 mois</option>
-                                <option value="6months">6 mois</option>
-                                <option value="year">Cette année</option>
-                                <option value="all">Tout l'historique</option>
+                                <option value="month">{translate('ce_mois')}</option>
+                                <option value="3months">{translate('3_mois')}</option>
+                                <option value="6months">{translate('6_mois')}</option>
+                                <option value="year">{translate('cette_annee')}</option>
+                                <option value="all">{translate('tout_l_historique')}</option>
                             </Form.Select>
                             <div className="position-relative" style={{ minWidth: '300px' }}>
                                 <i className="bi bi-search position-absolute top-50 start-0 translate-middle-y ms-3 text-muted"></i>
                                 <Form.Control
                                     type="text"
-                                    placeholder="Rechercher transaction (ID, Nom, Montant)..."
+                                    placeholder={translate('rechercher_transaction_id_nom')}
                                     className="ps-5 border bg-light"
                                     style={{ borderRadius: '8px' }}
                                     value={txSearchTerm}
@@ -401,20 +403,20 @@ const AdminWalletManagement = () => {
                 <Col xs={12}>
                     <Card className="border-0 shadow-sm overflow-hidden" style={{ borderRadius: '15px' }}>
                         <Card.Header className="bg-white p-3 border-bottom-0">
-                            <h5 className="mb-0 fw-bold">Historique des Transactions</h5>
+                            <h5 className="mb-0 fw-bold">{translate('historique_des_transactions_2')}</h5>
                         </Card.Header>
                         <Card.Body className="p-0">
                             <div className="table-responsive">
                                 <Table hover className="align-middle mb-0">
                                     <thead className="bg-light text-muted small text-uppercase">
                                         <tr>
-                                            <th className="ps-4">Date</th>
-                                            <th>Utilisateur</th>
-                                            <th>Type</th>
-                                            <th>Description</th>
-                                            <th>Montant</th>
-                                            <th>Solde Après</th>
-                                            <th className="text-end pe-4">Actions</th>
+                                            <th className="ps-4">{translate('date')}</th>
+                                            <th>{translate('utilisateur')}</th>
+                                            <th>{translate('type')}</th>
+                                            <th>{translate('description')}</th>
+                                            <th>{translate('montant')}</th>
+                                            <th>{translate('solde_apres')}</th>
+                                            <th className="text-end pe-4">{translate('actions')}</th>
                                         </tr>
                                     </thead>
                                     <tbody>
@@ -463,7 +465,7 @@ const AdminWalletManagement = () => {
                                                                     variant="light"
                                                                     size="sm"
                                                                     className="btn-sm-square border"
-                                                                    title="Voir l'historique de ce client"
+                                                                    title={translate('voir_l_historique_de_ce_client')}
                                                                     onClick={() => setTxSearchTerm(u?.id || tx.userId)}
                                                                 >
                                                                     <i className="bi bi-clock-history text-primary"></i>
@@ -474,7 +476,7 @@ const AdminWalletManagement = () => {
                                                                         size="sm"
                                                                         className="btn-sm-square border"
                                                                         onClick={() => handleUndoTransaction(tx.id)}
-                                                                        title="Annuler cette transaction"
+                                                                        title={translate('annuler_cette_transaction')}
                                                                     >
                                                                         <i className="bi bi-x-lg text-danger"></i>
                                                                     </Button>
@@ -488,7 +490,7 @@ const AdminWalletManagement = () => {
                                             <tr>
                                                 <td colSpan="6" className="text-center p-5 text-muted">
                                                     <i className="bi bi-search fs-1 d-block mb-3 opacity-25"></i>
-                                                    Aucune transaction trouvée pour "{txSearchTerm}"
+                                                    {translate('aucune_transaction_trouvee_pour', { txSearchTerm })}
                                                 </td>
                                             </tr>
                                         )}
@@ -503,14 +505,14 @@ const AdminWalletManagement = () => {
             {/* Virement Modal */}
             <Modal show={showVirementModal} onHide={handleCloseModal} centered>
                 <Modal.Header closeButton className="border-0 pb-0">
-                    <Modal.Title className="fw-bold">Faire un Virement</Modal.Title>
+                    <Modal.Title className="fw-bold">{translate('faire_un_virement')}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body className="pt-3">
                     {(selectedUser || isIdVirement) && (
                         <>
                             {isIdVirement && !foundUser && (
                                 <Form.Group className="mb-4">
-                                    <Form.Label className="small fw-bold text-muted">ID DU CLIENT</Form.Label>
+                                    <Form.Label className="small fw-bold text-muted">{translate('id_du_client')}</Form.Label>
                                     <div className="position-relative">
                                         <i className="bi bi-person-badge position-absolute top-50 start-0 translate-middle-y ms-3 text-muted"></i>
                                         <Form.Control
@@ -525,7 +527,7 @@ const AdminWalletManagement = () => {
                                     </div>
                                     {directUserId && !foundUser && (
                                         <small className="text-danger mt-1 d-block animate__animated animate__shakeX">
-                                            Aucun client trouvé avec cet ID
+                                            {translate('aucun_client_trouve_avec_cet_id')}
                                         </small>
                                     )}
                                 </Form.Group>
@@ -542,7 +544,7 @@ const AdminWalletManagement = () => {
                                             <Badge bg="warning" text="dark" className="small">ID: {(isIdVirement ? foundUser.id : selectedUser.id)}</Badge>
                                         </div>
                                         <div className="mt-1">
-                                            <small className="fw-bold text-dark">Solde actuel: {((isIdVirement ? foundUser.balance : selectedUser.balance) || 0).toLocaleString()} FCFA</small>
+                                            <small className="fw-bold text-dark">{translate('solde_actuel_fcfa', { value: ((isIdVirement ? foundUser.balance : selectedUser.balance) || 0).toLocaleString() })}</small>
                                         </div>
                                     </div>
                                     {isIdVirement && (
@@ -556,7 +558,7 @@ const AdminWalletManagement = () => {
                             {(selectedUser || foundUser) && (
                                 <Form>
                                     <Form.Group className="mb-3">
-                                        <Form.Label className="small fw-bold text-muted">MONTANT DU VIREMENT (FCFA)</Form.Label>
+                                        <Form.Label className="small fw-bold text-muted">{translate('montant_du_virement_fcfa')}</Form.Label>
                                         <Form.Control
                                             type="number"
                                             placeholder="0.00"
@@ -571,10 +573,10 @@ const AdminWalletManagement = () => {
                                     </Form.Group>
 
                                     <Form.Group className="mb-0">
-                                        <Form.Label className="small fw-bold text-muted">DESCRIPTION</Form.Label>
+                                        <Form.Label className="small fw-bold text-muted">{translate('description_2')}</Form.Label>
                                         <Form.Control
                                             type="text"
-                                            placeholder="Ex: Récompense fidélité"
+                                            placeholder={translate('ex_recompense_fidelite')}
                                             className="py-2 border-0 bg-light"
                                             style={{ borderRadius: '10px' }}
                                             value={virementDescription}
@@ -588,7 +590,7 @@ const AdminWalletManagement = () => {
                 </Modal.Body>
                 <Modal.Footer className="border-0 pt-0">
                     <Button variant="light" className="fw-bold" onClick={handleCloseModal} style={{ borderRadius: '10px' }} disabled={isProcessing}>
-                        Annuler
+                        {translate('annuler')}
                     </Button>
                     {(selectedUser || foundUser) && (
                         <Button
@@ -612,7 +614,7 @@ const AdminWalletManagement = () => {
             {/* Transaction Details Modal */}
             <Modal show={!!selectedTransaction} onHide={() => setSelectedTransaction(null)} centered>
                 <Modal.Header closeButton className="border-0">
-                    <Modal.Title className="fw-bold">Détails de la Transaction</Modal.Title>
+                    <Modal.Title className="fw-bold">{translate('details_de_la_transaction')}</Modal.Title>
                 </Modal.Header>
                 <Modal.Body>
                     {selectedTransaction && (() => {
@@ -632,7 +634,7 @@ const AdminWalletManagement = () => {
                                 </div>
 
                                 <div className="bg-light p-3 rounded-3">
-                                    <h6 className="fw-bold text-muted small text-uppercase mb-3">Informations Client</h6>
+                                    <h6 className="fw-bold text-muted small text-uppercase mb-3">{translate('informations_client')}</h6>
                                     <div className="d-flex align-items-center">
                                         <div className="bg-white rounded-circle d-flex align-items-center justify-content-center me-3 border shadow-sm" style={{ width: '48px', height: '48px', fontSize: '1.5rem' }}>
                                             {u?.avatar || '👤'}
@@ -646,9 +648,9 @@ const AdminWalletManagement = () => {
                                 </div>
 
                                 <div className="border rounded-3 p-3">
-                                    <h6 className="fw-bold text-muted small text-uppercase mb-3">Détails</h6>
+                                    <h6 className="fw-bold text-muted small text-uppercase mb-3">{translate('details')}</h6>
                                     <div className="d-flex justify-content-between mb-2">
-                                        <span className="text-muted">Date</span>
+                                        <span className="text-muted">{translate('date')}</span>
                                         <span className="fw-medium">
                                             {new Date(selectedTransaction.date).toLocaleDateString('fr-FR', {
                                                 weekday: 'long', day: 'numeric', month: 'long', year: 'numeric',
@@ -657,11 +659,11 @@ const AdminWalletManagement = () => {
                                         </span>
                                     </div>
                                     <div className="d-flex justify-content-between mb-2">
-                                        <span className="text-muted">Description</span>
+                                        <span className="text-muted">{translate('description')}</span>
                                         <span className="fw-medium text-end" style={{ maxWidth: '60%' }}>{selectedTransaction.description}</span>
                                     </div>
                                     <div className="d-flex justify-content-between">
-                                        <span className="text-muted">Solde après tx</span>
+                                        <span className="text-muted">{translate('solde_apres_tx')}</span>
                                         <span className="fw-bold text-dark">{(selectedTransaction.balanceAfter || 0).toLocaleString()} FCFA</span>
                                     </div>
                                 </div>
@@ -669,7 +671,7 @@ const AdminWalletManagement = () => {
                                 {selectedTransaction.status === 'cancelled' && (
                                     <Alert variant="secondary" className="mb-0 small">
                                         <i className="bi bi-info-circle me-2"></i>
-                                        Cette transaction a été annulée le {new Date(selectedTransaction.cancelledAt).toLocaleDateString('fr-FR')}.
+                                        {translate('cette_transaction_a_ete_annulee', { value: new Date(selectedTransaction.cancelledAt).toLocaleDateString('fr-FR') })}
                                     </Alert>
                                 )}
                             </div>
@@ -677,7 +679,7 @@ const AdminWalletManagement = () => {
                     })()}
                 </Modal.Body>
                 <Modal.Footer className="border-0">
-                    <Button variant="light" onClick={() => setSelectedTransaction(null)}>Fermer</Button>
+                    <Button variant="light" onClick={() => setSelectedTransaction(null)}>{translate('fermer')}</Button>
                 </Modal.Footer>
             </Modal>
         </Container>
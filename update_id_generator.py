@@ -1,12 +1,13 @@
-import re
+from codemod import AUTH_CONTEXT, run, transform
+from patterns import register
 
-# Lire le fichier
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\context\AuthContext.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+GENERATE_USER_ID = register("update_id_generator.generate_user_id", r"const generateUserId = \(\) => \{[^}]+\};")
 
-# Remplacer la fonction generateUserId pour créer un ID avec mélange de chiffres et lettres
-old_function = r"const generateUserId = \(\) => \{[^}]+\};"
-new_function = """const generateUserId = () => {
+
+@transform(AUTH_CONTEXT, "ID generator updated to create mixed alphanumeric IDs!")
+def update_id_generator(content):
+    # Remplacer la fonction generateUserId pour créer un ID avec mélange de chiffres et lettres
+    new_function = """const generateUserId = () => {
         const chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789';
         let id = '';
         for (let i = 0; i < 8; i++) {
@@ -15,10 +16,9 @@ new_function = """const generateUserId = () => {
         return id;
     };"""
 
-content = re.sub(old_function, new_function, content)
+    content = GENERATE_USER_ID.sub(new_function, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\context\AuthContext.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("ID generator updated to create mixed alphanumeric IDs!")
+if __name__ == "__main__":
+    run(["update_id_generator"])
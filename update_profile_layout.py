@@ -1,25 +1,27 @@
 import re
 
-# Lire le fichier ProfileLayout.jsx
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\components\ProfileLayout.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
-
-# Ajouter l'import useState si nécessaire
-if 'useState' not in content:
-    content = content.replace(
-        "import { Container, Row, Col, Card, ListGroup, Badge } from 'react-bootstrap';",
-        "import { useState } from 'react';\nimport { Container, Row, Col, Card, ListGroup, Badge } from 'react-bootstrap';"
-    )
-
-# Ajouter le state showBalance après la déclaration du composant
-pattern = r"(const ProfileLayout = \(\{ children \}\) => \{\s*const \{ user, logout \} = useAuth\(\);)"
-replacement = r"\1\n    const [showBalance, setShowBalance] = useState(false);"
-content = re.sub(pattern, replacement, content)
-
-# Remplacer l'ancienne carte de profil par la nouvelle avec layout horizontal
-old_card = r'<Card className="shadow-sm border-0 mb-3">.*?<Card\.Body className="text-center py-4">.*?</Card\.Body>\s*</Card>'
-
-new_card = '''<Card className="shadow-sm border-0 mb-3">
+from codemod import PROFILE_LAYOUT, run, transform
+from patterns import register
+
+COMPONENT_START = register("update_profile_layout.component_start", r"(const ProfileLayout = \(\{ children \}\) => \{\s*const \{ user, logout \} = useAuth\(\);)")
+OLD_CARD = register("update_profile_layout.old_card", r'<Card className="shadow-sm border-0 mb-3">.*?<Card\.Body className="text-center py-4">.*?</Card\.Body>\s*</Card>', re.DOTALL)
+
+
+@transform(PROFILE_LAYOUT, "ProfileLayout.jsx updated with new profile card!")
+def update_profile_layout(content):
+    # Ajouter l'import useState si nécessaire
+    if 'useState' not in content:
+        content = content.replace(
+            "import { Container, Row, Col, Card, ListGroup, Badge } from 'react-bootstrap';",
+            "import { useState } from 'react';\nimport { Container, Row, Col, Card, ListGroup, Badge } from 'react-bootstrap';"
+        )
+
+    # Ajouter le state showBalance après la déclaration du composant
+    replacement = r"\1\n    const [showBalance, setShowBalance] = useState(false);"
+    content = COMPONENT_START.sub(replacement, content)
+
+    # Remplacer l'ancienne carte de profil par la nouvelle avec layout horizontal
+    new_card = '''<Card className="shadow-sm border-0 mb-3">
                         <Card.Body className="py-3 px-3">
                             <div className="d-flex align-items-start">
                                 <div className="me-3" style={{ fontSize: '3rem' }}>👤</div>
@@ -50,10 +52,9 @@ new_card = '''<Card className="shadow-sm border-0 mb-3">
                         </Card.Body>
                     </Card>'''
 
-content = re.sub(old_card, new_card, content, flags=re.DOTALL)
+    content = OLD_CARD.sub(new_card, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\components\ProfileLayout.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("ProfileLayout.jsx updated with new profile card!")
+if __name__ == "__main__":
+    run(["update_profile_layout"])
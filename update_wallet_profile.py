@@ -1,18 +1,20 @@
 import re
 
-# Lire le fichier Wallet.jsx
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Wallet.jsx", "r", encoding="utf-8") as f:
-    content = f.read()
+from codemod import WALLET, run, transform
+from patterns import register
 
-# Ajouter le state showBalance après la déclaration du composant
-pattern = r"(const Wallet = \(\) => \{\s*const \{ user, logout \} = useAuth\(\);)"
-replacement = r"\1\n    const [showBalance, setShowBalance] = useState(false);"
-content = re.sub(pattern, replacement, content)
+COMPONENT_START = register("update_wallet_profile.component_start", r"(const Wallet = \(\) => \{\s*const \{ user, logout \} = useAuth\(\);)")
+OLD_CARD = register("update_wallet_profile.old_card", r'<Card className="shadow-sm border-0 mb-3">\s*<Card\.Body className="text-center py-4">.*?</Card\.Body>\s*</Card>', re.DOTALL)
 
-# Remplacer l'ancienne carte de profil par la nouvelle
-old_card = r'<Card className="shadow-sm border-0 mb-3">\s*<Card\.Body className="text-center py-4">.*?</Card\.Body>\s*</Card>'
 
-new_card = '''<Card className="shadow-sm border-0 mb-3">
+@transform(WALLET, "Wallet.jsx updated with new profile card!")
+def update_wallet_profile(content):
+    # Ajouter le state showBalance après la déclaration du composant
+    replacement = r"\1\n    const [showBalance, setShowBalance] = useState(false);"
+    content = COMPONENT_START.sub(replacement, content)
+
+    # Remplacer l'ancienne carte de profil par la nouvelle
+    new_card = '''<Card className="shadow-sm border-0 mb-3">
                         <Card.Body className="py-3 px-3">
                             <div className="d-flex align-items-start">
                                 <div className="me-3" style={{ fontSize: '3rem' }}>👤</div>
@@ -43,10 +45,9 @@ new_card = '''<Card className="shadow-sm border-0 mb-3">
                         </Card.Body>
                     </Card>'''
 
-content = re.sub(old_card, new_card, content, flags=re.DOTALL)
+    content = OLD_CARD.sub(new_card, content)
+    return content
 
-# Écrire le fichier modifié
-with open(r"c:\Users\USER\OneDrive\Bureau\TRY MY DAY\src\pages\Wallet.jsx", "w", encoding="utf-8") as f:
-    f.write(content)
 
-print("Wallet.jsx updated with new profile card!")
+if __name__ == "__main__":
+    run(["update_wallet_profile"])
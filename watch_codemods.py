@@ -0,0 +1,144 @@
+import argparse
+import os
+import time
+
+import safe_io
+from check_convergence import not_idempotent, synthetic_inputs
+from codemod import (
+    CHAIN, ROOT, apply_transforms, get_transform, load_cache, read_file, save_cache, write_file,
+)
+from profiling import Timings
+
+# Dossiers surveillés
+WATCHED = [
+    os.path.join("src", "pages"),
+    os.path.join("src", "components"),
+    os.path.join("src", "context"),
+]
+
+# Transformations appliquées par défaut à chaque sauvegarde de leur fichier cible (toutes idempotentes :
+# watchable() écarte celles qui réinséreraient leur contenu à chaque sauvegarde)
+DEFAULT_NAMES = CHAIN + ["update_profile_layout", "update_wallet_profile"]
+
+
+def watchable(names):
+    # Écarter les transformations non idempotentes sur leur fichier cible ou sur les pages synthétiques
+    inputs = synthetic_inputs()
+    for name in names:
+        target = get_transform(name).target
+        try:
+            inputs[target] = read_file(target)
+        except FileNotFoundError:
+            pass
+    refused = not_idempotent(names, inputs)
+    for name, labels in sorted(refused.items()):
+        print(f"not watching {name}: not idempotent on {', '.join(labels)}")
+    return [name for name in names if name not in refused]
+
+
+class Watcher:
+    # Processus long : les regex restent compilées, les contenus et le cache restent en mémoire
+
+    def __init__(self, names, dirs=WATCHED, debounce=0.3, interval=0.1):
+        self.dirs = dirs
+        self.debounce = debounce
+        self.interval = interval
+        self.by_target = {}
+        for name in names:
+            func = get_transform(name)
+            self.by_target.setdefault(os.path.normpath(func.target), []).append(func)
+        self.cache = load_cache()
+        # Dernier contenu connu de chaque fichier cible (pour ignorer nos propres écritures)
+        self.contents = {}
+        self.stats = self.snapshot()
+
+    def snapshot(self):
+        stats = {}
+        for folder in self.dirs:
+            for dirpath, _, filenames in os.walk(os.path.join(ROOT, folder)):
+                for filename in filenames:
+                    if filename.endswith((".jsx", ".js")):
+                        full = os.path.join(dirpath, filename)
+                        try:
+                            st = os.stat(full)
+                        except FileNotFoundError:
+                            continue
+                        stats[os.path.relpath(full, ROOT)] = (st.st_mtime_ns, st.st_size)
+        return stats
+
+    def poll(self):
+        current = self.snapshot()
+        changed = {path for path, st in current.items() if self.stats.get(path) != st}
+        self.stats = current
+        return changed
+
+    def handle(self, paths):
+        # Réappliquer uniquement les transformations qui visent les fichiers modifiés
+        for path in sorted(paths):
+            funcs = self.by_target.get(os.path.normpath(path))
+            if not funcs:
+                continue
+            # Une erreur sur un fichier (supprimé pendant l'attente, transformation qui lève) n'arrête pas la surveillance
+            try:
+                self.handle_file(path, funcs)
+            except safe_io.ConflictError:
+                print(f"{path}: saved again while the transforms ran, left for the next pass")
+            except Exception as e:
+                print(f"{path}: {type(e).__name__}: {e}")
+
+    def handle_file(self, path, funcs):
+        content, digest = safe_io.read_text(os.path.join(ROOT, path))
+        if self.contents.get(path) == content:
+            return
+        timings = Timings()
+        result = apply_transforms(funcs, content, self.cache, timings=timings, path=path)
+        if result != content:
+            # Écriture refusée si l'utilisateur a sauvegardé entre la lecture et maintenant
+            write_file(path, result, expected=digest)
+            st = os.stat(os.path.join(ROOT, path))
+            self.stats[path] = (st.st_mtime_ns, st.st_size)
+        self.contents[path] = result
+        for line in timings.summary():
+            print(line)
+
+    def run(self):
+        print(f"Watching {', '.join(self.dirs)} for {len(self.by_target)} target file(s) (Ctrl+C to stop)")
+        pending = set()
+        last_change = 0.0
+        try:
+            while True:
+                changed = self.poll()
+                now = time.monotonic()
+                if changed:
+                    # Regrouper les sauvegardes rapprochées
+                    pending |= changed
+                    last_change = now
+                elif pending and now - last_change >= self.debounce:
+                    self.handle(pending)
+                    pending.clear()
+                time.sleep(self.interval)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            save_cache(self.cache)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-apply codemods whenever their target file is saved")
+    parser.add_argument("names", nargs="*", help="transforms to keep applied (default: the usual chain and card updates)")
+    parser.add_argument("--debounce", type=float, default=0.3, help="seconds of quiet before re-applying")
+    parser.add_argument("--interval", type=float, default=0.1, help="polling interval in seconds")
+    parser.add_argument("--initial", action="store_true", help="apply the transforms once at startup")
+    args = parser.parse_args()
+
+    names = watchable(args.names or DEFAULT_NAMES)
+    if not names:
+        raise SystemExit("nothing to watch")
+    watcher = Watcher(names, debounce=args.debounce, interval=args.interval)
+    if args.initial:
+        watcher.handle(watcher.by_target)
+    watcher.run()
+
+
+if __name__ == "__main__":
+    main()